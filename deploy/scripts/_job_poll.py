@@ -0,0 +1,207 @@
+"""Watch several long-running Fabric jobs with one adaptive polling loop.
+
+Pipeline runs take anywhere from a minute to six hours, and a workspace name is
+released by Fabric in seconds to minutes. Polling either at a fixed interval
+spends API quota during the long middle of a run, or notices the end late.
+``poll_jobs`` probes every watched job from one loop on the caller's thread:
+each job is probed again after ``PollSchedule.interval`` seconds, which starts
+short and grows geometrically while nothing changes, and drops back to the
+initial interval whenever the job's status or one of its activities moves.
+
+A probe is a zero-argument callable that performs one status read and returns a
+``JobState``. Status and activity transitions are streamed to the
+``on_update``/``on_activity`` callbacks as soon as they are observed, and a
+failed job ends the wait at once rather than after the slowest sibling.
+
+The ``sleep`` and ``clock`` hooks are injectable so tests run without real delays.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable, Mapping
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+DEFAULT_INITIAL_POLL_SECONDS = 5.0
+DEFAULT_MAX_POLL_SECONDS = 30.0
+DEFAULT_POLL_GROWTH = 1.5
+
+
+class PollTimeout(TimeoutError):
+    """Raised when watched jobs are still running after the wait budget."""
+
+    def __init__(self, pending: list[Hashable], timeout_seconds: float) -> None:
+        super().__init__(
+            f"{len(pending)} job(s) did not finish within {timeout_seconds:g}s: "
+            + ", ".join(str(key) for key in pending)
+        )
+        self.pending = pending
+
+
+@dataclass(frozen=True)
+class PollSchedule:
+    """Geometric back-off between probes of one job.
+
+    ``interval(n)`` is the wait after the ``n``-th consecutive probe that saw
+    no change: ``initial_seconds * growth ** n``, capped at ``max_seconds``.
+    """
+
+    initial_seconds: float = DEFAULT_INITIAL_POLL_SECONDS
+    max_seconds: float = DEFAULT_MAX_POLL_SECONDS
+    growth: float = DEFAULT_POLL_GROWTH
+
+    def __post_init__(self) -> None:
+        if self.initial_seconds < 0 or self.max_seconds < self.initial_seconds:
+            raise ValueError(
+                "poll intervals must satisfy 0 <= initial_seconds <= max_seconds"
+            )
+        if self.growth < 1:
+            raise ValueError("poll growth must be >= 1")
+
+    def interval(self, unchanged_polls: int) -> float:
+        if self.initial_seconds == 0:
+            return 0.0
+        # Stop multiplying once capped so a six-hour wait cannot overflow.
+        delay = self.initial_seconds
+        for _ in range(unchanged_polls):
+            delay *= self.growth
+            if delay >= self.max_seconds:
+                return self.max_seconds
+        return min(delay, self.max_seconds)
+
+
+@dataclass(frozen=True)
+class JobState:
+    """One probe's view of a job.
+
+    ``terminal`` ends the job's wait; ``failed`` (with ``terminal``) ends every
+    job's wait. ``activities`` maps an activity name to its latest status.
+    """
+
+    status: str
+    payload: Any = None
+    terminal: bool = False
+    failed: bool = False
+    activities: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class JobUpdate:
+    """A job's status changed (``previous`` is ``None`` on first observation)."""
+
+    key: Hashable
+    status: str
+    previous: str | None
+    polls: int
+    elapsed_seconds: float
+
+
+@dataclass(frozen=True)
+class ActivityUpdate:
+    """One activity inside a job changed status."""
+
+    key: Hashable
+    activity: str
+    status: str
+    previous: str | None
+
+
+def poll_jobs(
+    probes: Mapping[K, Callable[[], JobState]],
+    *,
+    timeout_seconds: float,
+    schedule: PollSchedule | None = None,
+    on_update: Callable[[JobUpdate], None] | None = None,
+    on_activity: Callable[[ActivityUpdate], None] | None = None,
+    sleep: Callable[[float], None] | None = None,
+    clock: Callable[[], float] | None = None,
+) -> dict[K, JobState]:
+    """Probe every job until all are terminal, one fails, or time runs out.
+
+    Returns the terminal ``JobState`` per key in input order; when a job
+    fails, the result holds only the jobs that had finished by then, so the
+    caller can report the failure without waiting for the others. A probe that
+    raises ends the wait with that exception. Raises ``PollTimeout`` once
+    ``timeout_seconds`` have passed with jobs still running; the last probe of
+    each job happens at or after the deadline, never silently before it (a
+    zero timeout probes each job exactly once).
+    ``sleep``/``clock`` default to ``time.sleep``/``time.monotonic``.
+    """
+
+    if timeout_seconds < 0:
+        raise ValueError("timeout_seconds must be non-negative")
+    schedule = schedule or PollSchedule()
+    sleeper = sleep if sleep is not None else time.sleep
+    now = clock if clock is not None else time.monotonic
+
+    start = current = now()
+    deadline = start + timeout_seconds
+    last: dict[K, JobState] = {}
+    polls: dict[K, int] = dict.fromkeys(probes, 0)
+    unchanged: dict[K, int] = dict.fromkeys(probes, 0)
+    next_due: dict[K, float] = dict.fromkeys(probes, start)
+    finished: dict[K, JobState] = {}
+
+    while True:
+        probed: list[K] = []
+        for key, probe in probes.items():
+            if key in finished or next_due[key] > current:
+                continue
+            state = probe()
+            polls[key] += 1
+            previous = last.get(key)
+            last[key] = state
+            changed = _report(
+                key, state, previous, polls[key], current - start, on_update, on_activity
+            )
+            if state.terminal:
+                finished[key] = state
+                if state.failed:
+                    return {k: finished[k] for k in probes if k in finished}
+                continue
+            unchanged[key] = 0 if changed else unchanged[key] + 1
+            probed.append(key)
+        if len(finished) == len(probes):
+            return {key: finished[key] for key in probes}
+
+        current = now()
+        if current >= deadline:
+            raise PollTimeout(
+                [key for key in probes if key not in finished], timeout_seconds
+            )
+        for key in probed:
+            next_due[key] = min(current + schedule.interval(unchanged[key]), deadline)
+        wake = min(next_due[key] for key in probes if key not in finished)
+        if wake > current:
+            sleeper(wake - current)
+            current = wake
+
+
+def _report(
+    key: Hashable,
+    state: JobState,
+    previous: JobState | None,
+    polls: int,
+    elapsed: float,
+    on_update: Callable[[JobUpdate], None] | None,
+    on_activity: Callable[[ActivityUpdate], None] | None,
+) -> bool:
+    """Emit status/activity transitions and return whether anything moved."""
+
+    changed = False
+    previous_status = previous.status if previous is not None else None
+    if state.status != previous_status:
+        changed = True
+        if on_update is not None:
+            on_update(JobUpdate(key, state.status, previous_status, polls, elapsed))
+    seen = previous.activities if previous is not None else {}
+    for activity, status in state.activities.items():
+        if seen.get(activity) == status:
+            continue
+        changed = True
+        if on_activity is not None:
+            on_activity(ActivityUpdate(key, activity, status, seen.get(activity)))
+    return changed
@@ -0,0 +1,373 @@
+"""Split KQL source scripts into commands and diff them against a live database.
+
+The source scripts under ``fabric/kql_database`` are each one
+``.execute database script`` batch of control commands. Re-running every
+command on each deploy is safe but not free: ``.create-or-alter
+materialized-view`` in particular can make Kusto rebuild a view over a large
+table. ``plan_schema_changes`` compares each source command with the matching
+entity in ``.show database schema as csl script`` and keeps only those that are
+missing or differ, in source order (the numbered scripts are already in
+dependency order: tables, mappings, functions, materialized views).
+
+Entities are compared semantically rather than textually, because Kusto echoes
+its own canonical form:
+
+- tables: every source column must exist live with the same type
+  (``.create-merge`` never drops columns, so extra live columns are fine);
+- ingestion mappings: the same column/path pairs (and datatype, when the live
+  mapping records one);
+- functions: folder, docstring, parameters and body;
+- materialized views: source table and query.
+
+Comments and whitespace are ignored throughout. Commands the live schema cannot
+confirm (policies and anything unrecognised) are always re-applied; they are
+cheap and idempotent.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Kusto accepts several spellings for the same scalar type.
+_TYPE_ALIASES = {
+    "boolean": "bool",
+    "date": "datetime",
+    "double": "real",
+    "int32": "int",
+    "int64": "long",
+    "time": "timespan",
+    "uniqueid": "guid",
+}
+_EXECUTE_SCRIPT = re.compile(r"^\.execute\s+database\s+script\b", re.IGNORECASE)
+_TABLE = re.compile(r"^\.create(?:-merge)?\s+table\s+\[?'?(\w+)'?\]?\s*\(", re.IGNORECASE)
+_MAPPING = re.compile(
+    r"^\.create(?:-or-alter)?\s+table\s+\[?'?(\w+)'?\]?\s+ingestion\s+(\w+)\s+"
+    r"mapping\s+['\"]([^'\"]+)['\"]",
+    re.IGNORECASE,
+)
+_FUNCTION = re.compile(
+    r"^\.create(?:-or-alter)?\s+function\s+"
+    r"(?:with\s*\((?P<props>(?:[^()\"]|\"[^\"]*\")*)\)\s*)?"
+    r"(?P<name>\w+)\s*(?P<rest>\(.*)$",
+    re.IGNORECASE | re.DOTALL,
+)
+_VIEW = re.compile(
+    r"^\.create(?:-or-alter|-if-not-exists)?\s+(?:async\s+)?materialized-view\s+"
+    r"(?:with\s*\((?:[^()\"]|\"[^\"]*\")*\)\s*)?(?P<name>\w+)\s+on\s+"
+    r"(?:table|materialized-view)\s+(?P<source>\w+)\s*\{(?P<query>.*)\}\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_POLICY = re.compile(
+    r"^\.alter(?:-merge)?\s+table\s+\[?'?(\w+)'?\]?\s+policy\s+(\w+)", re.IGNORECASE
+)
+_PROPERTY = re.compile(r"(\w+)\s*=\s*(\"[^\"]*\"|'[^']*'|[^,\s]+)")
+
+# Kinds whose live counterpart can be compared; other commands always apply.
+DIFFABLE_KINDS = frozenset({"table", "mapping", "function", "materialized-view"})
+
+
+@dataclass(frozen=True)
+class KqlCommand:
+    """One control command from a source script."""
+
+    kind: str
+    name: str
+    text: str
+    source: str = ""
+
+    @property
+    def key(self) -> tuple[str, str]:
+        return self.kind, self.name.casefold()
+
+
+@dataclass(frozen=True)
+class KqlChange:
+    """A source command the plan will run, and why.
+
+    ``action`` is ``"create"`` (absent live), ``"alter"`` (differs from the live
+    entity) or ``"reapply"`` (a kind the live schema cannot confirm).
+    """
+
+    action: str
+    command: KqlCommand
+
+
+def split_kql_commands(scripts: Iterable[Path]) -> list[KqlCommand]:
+    """Return every control command in ``scripts``, in file and source order."""
+
+    commands: list[KqlCommand] = []
+    for script in scripts:
+        for text in _command_texts(script.read_text(encoding="utf-8")):
+            commands.append(classify_command(text, source=script.name))
+    return commands
+
+
+def classify_command(text: str, *, source: str = "") -> KqlCommand:
+    """Identify the entity a single control command defines."""
+
+    if match := _MAPPING.match(text):
+        table, mapping_kind, name = match.groups()
+        return KqlCommand("mapping", f"{table}.{mapping_kind.lower()}.{name}", text, source)
+    if match := _TABLE.match(text):
+        return KqlCommand("table", match.group(1), text, source)
+    if match := _FUNCTION.match(text):
+        return KqlCommand("function", match.group("name"), text, source)
+    if match := _VIEW.match(text):
+        return KqlCommand("materialized-view", match.group("name"), text, source)
+    if match := _POLICY.match(text):
+        table, policy = match.groups()
+        return KqlCommand("policy", f"{table}.{policy.lower()}", text, source)
+    return KqlCommand("command", text.splitlines()[0], text, source)
+
+
+def parse_live_schema(script_rows: Iterable[str]) -> dict[tuple[str, str], KqlCommand]:
+    """Index ``.show database schema as csl script`` rows by entity."""
+
+    live: dict[tuple[str, str], KqlCommand] = {}
+    for row in script_rows:
+        for text in _command_texts(str(row)):
+            command = classify_command(text)
+            if command.kind in DIFFABLE_KINDS:
+                live[command.key] = command
+    return live
+
+
+def plan_schema_changes(
+    commands: Iterable[KqlCommand],
+    live: Mapping[tuple[str, str], KqlCommand],
+) -> list[KqlChange]:
+    """Keep the commands whose entity is missing or different live, in order."""
+
+    changes: list[KqlChange] = []
+    for command in commands:
+        if command.kind not in DIFFABLE_KINDS:
+            changes.append(KqlChange("reapply", command))
+            continue
+        current = live.get(command.key)
+        if current is None:
+            changes.append(KqlChange("create", command))
+        elif not _matches(command, current):
+            changes.append(KqlChange("alter", command))
+    return changes
+
+
+def build_change_script(changes: Iterable[KqlChange]) -> str:
+    """Build one ``ThrowOnErrors`` batch from the planned commands."""
+
+    parts = [".execute database script with (ThrowOnErrors=true) <|"]
+    for change in changes:
+        parts.append("")
+        parts.append(change.command.text)
+    return "\n".join(parts).rstrip() + "\n"
+
+
+def _matches(source: KqlCommand, live: KqlCommand) -> bool:
+    try:
+        if source.kind == "table":
+            wanted = _table_columns(source.text)
+            present = _table_columns(live.text)
+            return all(present.get(column) == kind for column, kind in wanted.items())
+        if source.kind == "mapping":
+            return _mapping_matches(_mapping_items(source.text), _mapping_items(live.text))
+        if source.kind == "function":
+            return _function_signature(source.text) == _function_signature(live.text)
+        if source.kind == "materialized-view":
+            return _view_signature(source.text) == _view_signature(live.text)
+    except (ValueError, TypeError, KeyError):
+        # Anything we cannot parse is treated as changed, never as current.
+        return False
+    return False
+
+
+def _table_columns(text: str) -> dict[str, str]:
+    body = _strip_comments(text)
+    start = body.index("(")
+    depth = 0
+    for index in range(start, len(body)):
+        if body[index] == "(":
+            depth += 1
+        elif body[index] == ")":
+            depth -= 1
+            if depth == 0:
+                break
+    else:
+        raise ValueError("unterminated table column list")
+    columns: dict[str, str] = {}
+    for declaration in body[start + 1 : index].split(","):
+        if not declaration.strip():
+            continue
+        name, _, kind = declaration.partition(":")
+        name = name.strip().strip("[]").strip("'\"")
+        kind = kind.strip().lower()
+        columns[name] = _TYPE_ALIASES.get(kind, kind)
+    return columns
+
+
+def _mapping_items(text: str) -> list[tuple[str, str, str]]:
+    fenced = re.search(r"```\s*(.*?)\s*```", text, re.DOTALL)
+    if fenced is not None:
+        raw = fenced.group(1)
+    else:
+        quoted = re.search(r"'(\[.*\])'\s*$", text, re.DOTALL)
+        if quoted is None:
+            raise ValueError("mapping has no JSON body")
+        raw = quoted.group(1)
+    items: list[tuple[str, str, str]] = []
+    for item in json.loads(raw):
+        fields = {key.lower(): value for key, value in item.items()}
+        properties = {
+            key.lower(): value
+            for key, value in (fields.get("properties") or {}).items()
+        }
+        path = fields.get("path") or properties.get("path") or ""
+        datatype = str(fields.get("datatype") or "").lower()
+        items.append(
+            (str(fields["column"]), str(path), _TYPE_ALIASES.get(datatype, datatype))
+        )
+    return sorted(items)
+
+
+def _mapping_matches(
+    source: list[tuple[str, str, str]], live: list[tuple[str, str, str]]
+) -> bool:
+    if len(source) != len(live):
+        return False
+    return all(
+        s_column == l_column
+        and s_path == l_path
+        and (not l_type or s_type == l_type)
+        for (s_column, s_path, s_type), (l_column, l_path, l_type) in zip(
+            source, live, strict=True
+        )
+    )
+
+
+def _function_signature(text: str) -> tuple[str, str, str, str]:
+    match = _FUNCTION.match(_strip_comments(text))
+    if match is None:
+        raise ValueError("unparsed function")
+    properties = _properties(match.group("props") or "")
+    return (
+        match.group("name").casefold(),
+        properties.get("folder", ""),
+        properties.get("docstring", ""),
+        _squash(match.group("rest")),
+    )
+
+
+def _view_signature(text: str) -> tuple[str, str, str]:
+    match = _VIEW.match(_strip_comments(text))
+    if match is None:
+        raise ValueError("unparsed materialized view")
+    return (
+        match.group("name").casefold(),
+        match.group("source").casefold(),
+        _squash(match.group("query")),
+    )
+
+
+def _properties(text: str) -> dict[str, str]:
+    return {
+        key.lower(): value.strip("\"'")
+        for key, value in _PROPERTY.findall(text)
+    }
+
+
+def _squash(text: str) -> str:
+    """Collapse whitespace, including around punctuation, for comparison."""
+
+    text = re.sub(r"\s+", " ", text).strip()
+    return re.sub(r"\s*([(){}\[\],;|=:<>])\s*", r"\1", text)
+
+
+def _strip_comments(text: str) -> str:
+    """Drop ``//`` comments outside string literals."""
+
+    lines = []
+    for line in text.splitlines():
+        quote: str | None = None
+        for index, char in enumerate(line):
+            if quote is not None:
+                if char == quote:
+                    quote = None
+            elif char in "\"'":
+                quote = char
+            elif line.startswith("//", index):
+                line = line[:index]
+                break
+        lines.append(line.rstrip())
+    return "\n".join(lines)
+
+
+def _command_texts(script: str) -> list[str]:
+    """Split a script into control commands.
+
+    A command starts at a line beginning with ``.`` outside any bracket, brace
+    or fenced (```) block; ``.execute database script`` headers and
+    top-level comments are dropped.
+    """
+
+    commands: list[str] = []
+    current: list[str] | None = None
+    depth = 0
+    fenced = False
+
+    def flush() -> None:
+        if current:
+            commands.append("\n".join(current).strip())
+
+    for line in script.splitlines():
+        stripped = line.strip()
+        if not fenced and depth == 0:
+            if not stripped or stripped.startswith("//"):
+                continue
+            if stripped.startswith("."):
+                flush()
+                current = None if _EXECUTE_SCRIPT.match(stripped) else [line]
+                if current is None:
+                    continue
+                depth, fenced = _scan(line, depth, fenced)
+                continue
+        if current is not None:
+            current.append(line)
+            depth, fenced = _scan(line, depth, fenced)
+    flush()
+    return commands
+
+
+def _scan(line: str, depth: int, fenced: bool) -> tuple[int, bool]:
+    """Track bracket depth and fenced blocks across one line."""
+
+    if line.strip().startswith("```"):
+        return depth, not fenced
+    if fenced:
+        return depth, fenced
+    quote: str | None = None
+    for index, char in enumerate(line):
+        if quote is not None:
+            if char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif line.startswith("//", index):
+            break
+        elif char in "({":
+            depth += 1
+        elif char in ")}":
+            depth = max(0, depth - 1)
+    return depth, fenced
+
+
+def live_script_rows(table: Any) -> list[str]:
+    """Read the script column from a ``csl script`` Kusto result table."""
+
+    rows = [row.to_dict() for row in table]
+    return [
+        str(row.get("DatabaseSchemaScript", next(iter(row.values()), "")))
+        for row in rows
+    ]
@@ -0,0 +1,263 @@
+"""Poll many Fabric long-running operations concurrently.
+
+Fabric answers slow item calls such as ``getDefinition`` with ``202 Accepted``,
+an operation ``Location`` and a ``Retry-After`` hint. Polling those one item at
+a time makes a workspace export take the sum of every item's wait.
+``run_operations`` keeps up to ``max_in_flight`` requests running on a small
+thread pool, schedules each operation's next poll from its own
+``Retry-After``, and pauses every request when Fabric throttles the caller with
+``429`` so the tenant's request budget is shared rather than hammered. Waiting
+happens in the scheduler, never in a worker, so an operation between polls
+holds no thread.
+
+An operation is any zero-argument callable that performs one request per call
+and returns either its final value or ``Pending(retry_after)``;
+``FabricOperation`` implements that for the standard Fabric LRO contract.
+
+The ``sleep`` and ``clock`` hooks are injectable so tests run without real delays.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from collections.abc import Callable, Hashable, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from deploy.scripts._retry import FABRIC_RETRY, RetryPolicy, record_throttle
+
+if TYPE_CHECKING:
+    import requests
+
+T = TypeVar("T")
+K = TypeVar("K", bound=Hashable)
+
+# Concurrent requests across every operation in one `run_operations` call.
+DEFAULT_MAX_IN_FLIGHT = 8
+# Poll interval used when Fabric omits (or garbles) ``Retry-After``.
+DEFAULT_POLL_SECONDS = 2.0
+DEFAULT_MAX_POLLS = 60
+_FAILED_STATUSES = frozenset({"Failed", "Cancelled"})
+
+
+@dataclass(frozen=True)
+class Pending:
+    """Returned by an operation step that must be polled again later."""
+
+    retry_after: float
+
+
+class Throttled(Exception):
+    """Raised by an operation step when Fabric answered ``429 Too Many Requests``."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"throttled; retry after {retry_after:g}s")
+        self.retry_after = retry_after
+
+
+class OperationTimeout(TimeoutError):
+    """Raised when an operation is still pending after its poll budget."""
+
+
+@dataclass(frozen=True)
+class OperationProgress:
+    """One state change reported to a ``run_operations`` progress callback.
+
+    ``state`` is ``"pending"``, ``"throttled"``, ``"succeeded"`` or
+    ``"failed"``; ``completed``/``total`` count finished operations.
+    """
+
+    key: Hashable
+    state: str
+    polls: int
+    completed: int
+    total: int
+
+
+ProgressCallback = Callable[[OperationProgress], None]
+
+
+def _retry_after(response: Any, default: float) -> float:
+    """Parse a ``Retry-After`` header in seconds, falling back to ``default``."""
+
+    try:
+        return max(0.0, float(response.headers.get("Retry-After", default)))
+    except (TypeError, ValueError):
+        return default
+
+
+class FabricOperation(Generic[T]):
+    """Drive one Fabric request through the ``202 Accepted`` LRO contract.
+
+    The first call issues the request; a ``200``/``201`` finishes immediately,
+    a ``202`` records the operation ``Location``. Later calls poll that
+    location until ``Succeeded`` (then read ``<location>/result``) or a
+    terminal failure. ``result`` maps the final JSON payload to the value the
+    caller wants, e.g. ``lambda payload: payload["definition"]``.
+
+    Each request goes through ``retry`` for 5xx and dropped connections; a
+    ``429`` is left to the scheduler, which pauses every operation.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session,
+        method: str,
+        url: str,
+        *,
+        name: str = "Operation",
+        result: Callable[[Any], T] = lambda payload: payload,
+        poll_seconds: float = DEFAULT_POLL_SECONDS,
+        retry: RetryPolicy = FABRIC_RETRY,
+    ) -> None:
+        self.session = session
+        self.method = method
+        self.url = url
+        self.name = name
+        self.result = result
+        self.poll_seconds = poll_seconds
+        self.retry = retry
+        self.operation_url: str | None = None
+
+    def __call__(self) -> T | Pending:
+        if self.operation_url is None:
+            return self._start()
+        return self._poll(self.operation_url)
+
+    def _send(self, method: str, url: str) -> requests.Response:
+        def send() -> requests.Response:
+            response = self.session.request(method, url)
+            if response.status_code != 429:
+                response.raise_for_status()
+            return response
+
+        response = self.retry.call(send, endpoint=url)
+        if response.status_code == 429:
+            retry_after = _retry_after(response, self.poll_seconds)
+            record_throttle(url, retry_after)
+            raise Throttled(retry_after)
+        return response
+
+    def _start(self) -> T | Pending:
+        response = self._send(self.method, self.url)
+        if response.status_code != 202:
+            return self.result(response.json())
+        self.operation_url = response.headers["Location"]
+        return Pending(_retry_after(response, self.poll_seconds))
+
+    def _poll(self, operation_url: str) -> T | Pending:
+        poll = self._send("GET", operation_url)
+        status = poll.json().get("status")
+        if status == "Succeeded":
+            result = self._send("GET", f"{operation_url}/result")
+            return self.result(result.json())
+        if status in _FAILED_STATUSES:
+            raise RuntimeError(f"{self.name} {status}: {poll.text}")
+        return Pending(_retry_after(poll, self.poll_seconds))
+
+
+def run_operations(
+    operations: Mapping[K, Callable[[], T | Pending]],
+    *,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    max_polls: int = DEFAULT_MAX_POLLS,
+    on_progress: ProgressCallback | None = None,
+    sleep: Callable[[float], None] | None = None,
+    clock: Callable[[], float] | None = None,
+) -> dict[K, T]:
+    """Run every operation to completion and return results keyed like the input.
+
+    Each operation is stepped on a worker thread whenever it is due: at once
+    for its first request, then ``retry_after`` seconds after each
+    ``Pending``. A ``Throttled`` step pauses *all* new requests until its
+    ``Retry-After`` has passed and is retried without losing its place. A step
+    that raises fails the whole run (after in-flight requests drain), and an
+    operation still pending after ``max_polls`` polls raises
+    ``OperationTimeout``. ``on_progress`` is always called on the caller's
+    thread. ``sleep``/``clock`` default to ``time.sleep``/``time.monotonic``.
+    """
+
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be >= 1")
+    if max_polls < 1:
+        raise ValueError("max_polls must be >= 1")
+
+    sleeper = sleep if sleep is not None else time.sleep
+    now = clock if clock is not None else time.monotonic
+    total = len(operations)
+    results: dict[K, T] = {}
+    polls: dict[K, int] = dict.fromkeys(operations, 0)
+    start = now()
+    # (due time, tie-breaker, key); the tie-breaker keeps input order stable.
+    due: list[tuple[float, int, K]] = [
+        (start, index, key) for index, key in enumerate(operations)
+    ]
+    sequence = len(due)
+    paused_until = start
+    in_flight: dict[Future[T | Pending], K] = {}
+
+    def report(key: K, state: str) -> None:
+        if on_progress is not None:
+            on_progress(
+                OperationProgress(key, state, polls[key], len(results), total)
+            )
+
+    def reschedule(key: K, at: float) -> None:
+        nonlocal sequence
+        polls[key] += 1
+        if polls[key] > max_polls:
+            name = getattr(operations[key], "name", "Operation")
+            raise OperationTimeout(
+                f"{name} did not complete for {key} after {max_polls} polls"
+            )
+        heapq.heappush(due, (at, sequence, key))
+        sequence += 1
+
+    if not operations:
+        return {}
+    pool = ThreadPoolExecutor(max_workers=min(max_in_flight, total))
+    try:
+        while due or in_flight:
+            current = now()
+            while (
+                due
+                and len(in_flight) < max_in_flight
+                and due[0][0] <= current
+                and paused_until <= current
+            ):
+                key = heapq.heappop(due)[2]
+                in_flight[pool.submit(operations[key])] = key
+            next_due = max(due[0][0], paused_until) if due else None
+            if not in_flight:
+                if next_due is not None:
+                    sleeper(max(0.0, next_due - now()))
+                continue
+            timeout = (
+                None
+                if next_due is None or len(in_flight) >= max_in_flight
+                else max(0.0, next_due - now())
+            )
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                key = in_flight.pop(future)
+                try:
+                    outcome = future.result()
+                except Throttled as exc:
+                    paused_until = max(paused_until, now() + exc.retry_after)
+                    reschedule(key, paused_until)
+                    report(key, "throttled")
+                    continue
+                except BaseException:
+                    report(key, "failed")
+                    raise
+                if isinstance(outcome, Pending):
+                    reschedule(key, now() + outcome.retry_after)
+                    report(key, "pending")
+                else:
+                    results[key] = outcome
+                    report(key, "succeeded")
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+    return {key: results[key] for key in operations}
@@ -16,6 +16,8 @@ variables, e.g. ``for error in errors: console.error(error)``::
 from __future__ import annotations
 
 import sys
+from collections.abc import Mapping
+from typing import Any
 
 _INDENT = "    "
 _DETAIL_INDENT = "        "
@@ -43,3 +45,29 @@ def error(message: str) -> None:
     """Print an error to stderr."""
 
     print(f"{_INDENT}ERROR: {message}", file=sys.stderr)
+
+
+def retry_summary(metrics: Mapping[str, Any]) -> None:
+    """Print per-endpoint retry counts (`_retry.EndpointStats`) if any retried.
+
+    Endpoints that never retried, throttled or failed are left out so a clean
+    deploy prints nothing.
+    """
+
+    noisy = {
+        endpoint: stats
+        for endpoint, stats in sorted(metrics.items())
+        if stats.retries or stats.failures or stats.circuit_opened
+    }
+    if not noisy:
+        return
+    info("Retry summary")
+    for endpoint, stats in noisy.items():
+        line = (
+            f"{endpoint}: {stats.calls} call(s), {stats.retries} retried "
+            f"({stats.throttled} throttled), {stats.failures} failed, "
+            f"{stats.waited_seconds:.1f}s waiting"
+        )
+        if stats.circuit_opened:
+            line += f", circuit opened {stats.circuit_opened}x"
+        detail(line)
@@ -1,4 +1,4 @@
-"""Lightweight retry for transient deploy failures.
+"""Retry policies for transient deploy failures.
 
 A *cold* ``az account get-access-token`` call intermittently times out (surfacing
 as ``ClientAuthenticationError`` / ``CredentialUnavailableError``, or
@@ -7,17 +7,72 @@ occasionally return a transient 5xx/429 or drop the connection. ``retry_call``
 re-attempts a callable a few times with exponential backoff so a single transient
 failure doesn't abort a deploy.
 
-The ``sleep`` hook is injectable so tests run without real delays.
+``RetryPolicy`` is the adaptive variant used for Fabric REST traffic, where
+several deploy steps throttle against the same tenant budget:
+
+* ``classify_error`` separates throttling (429/503, honoring ``Retry-After``),
+  operator-login cold starts and dropped connections (retried) from other 4xx
+  responses and programming errors (raised immediately);
+* waits use decorrelated jitter so parallel callers do not retry in lockstep;
+* a per-host ``TokenBucket`` paces requests, and a per-host ``CircuitBreaker``
+  fails fast after repeated failures instead of queueing more doomed calls;
+* every retry is counted per endpoint. When ``RETRY_METRICS_ENV`` names a file,
+  a sub-script appends its counts there on exit so ``retail-setup deploy`` can
+  print one summary across all of its steps (see ``_output.retry_summary``).
+
+The ``sleep`` and ``clock`` hooks are injectable so tests run without real delays.
 """
 
 from __future__ import annotations
 
+import atexit
+import json
+import os
+import random
+import threading
 import time
-from collections.abc import Callable
-from typing import TypeVar
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
 
 T = TypeVar("T")
 
+# Environment variable naming the JSON-lines file that sub-scripts append
+# their per-endpoint retry counts to when the process exits.
+RETRY_METRICS_ENV = "RETAIL_SETUP_RETRY_METRICS"
+
+# Error kinds produced by `classify_error`. Every kind except FATAL is retried.
+THROTTLED = "throttled"
+UNAVAILABLE = "unavailable"
+AUTH = "auth"
+TRANSIENT = "transient"
+FATAL = "fatal"
+
+# Credential errors raised while a cold operator login warms up. Matched by
+# class name so classification does not import the optional Azure SDKs.
+_AUTH_ERROR_NAMES = frozenset(
+    {
+        "ClientAuthenticationError",
+        "CredentialUnavailableError",
+        "KustoAuthenticationError",
+    }
+)
+# Connection-level failures from requests/urllib3/azure-core, also by name.
+_TRANSIENT_ERROR_NAMES = frozenset(
+    {
+        "ConnectionError",
+        "ConnectTimeout",
+        "ReadTimeout",
+        "Timeout",
+        "ChunkedEncodingError",
+        "ServiceRequestError",
+        "ServiceResponseError",
+    }
+)
+_TRANSIENT_STATUSES = frozenset({408, 500, 502, 504})
+
 
 def retry_call(
     func: Callable[[], T],
@@ -53,3 +108,390 @@ def retry_call(
             sleeper(wait)
             wait *= backoff
     raise AssertionError("unreachable")  # pragma: no cover
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised without calling out when a host's circuit breaker is open."""
+
+
+@dataclass(frozen=True)
+class RetryDecision:
+    """How `RetryPolicy` should treat one failure.
+
+    ``retry_after`` is the server-requested wait in seconds, if any.
+    """
+
+    kind: str
+    retry_after: float | None = None
+
+    @property
+    def retryable(self) -> bool:
+        return self.kind != FATAL
+
+
+def _status_code(exc: BaseException) -> int | None:
+    """Return the HTTP status carried by a requests or azure-core error."""
+
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is None:
+        status = getattr(exc, "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def _header_retry_after(exc: BaseException) -> float | None:
+    headers = getattr(getattr(exc, "response", None), "headers", None) or {}
+    try:
+        value = headers.get("Retry-After")
+    except AttributeError:
+        return None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def classify_error(exc: BaseException) -> RetryDecision:
+    """Classify an exception raised by a Fabric, Power BI, or Kusto call."""
+
+    status = _status_code(exc)
+    if status == 429:
+        return RetryDecision(THROTTLED, _header_retry_after(exc))
+    if status == 503:
+        return RetryDecision(UNAVAILABLE, _header_retry_after(exc))
+    if status in _TRANSIENT_STATUSES:
+        return RetryDecision(TRANSIENT)
+    if status is not None:
+        return RetryDecision(FATAL)
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if names & _AUTH_ERROR_NAMES:
+        return RetryDecision(AUTH)
+    if names & _TRANSIENT_ERROR_NAMES or isinstance(
+        exc, (ConnectionError, TimeoutError)
+    ):
+        return RetryDecision(TRANSIENT)
+    return RetryDecision(FATAL)
+
+
+class TokenBucket:
+    """Thread-safe token bucket pacing requests to ``rate`` per second."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        *,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock if clock is not None else time.monotonic
+        self._tokens = capacity
+        self._updated = self._clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait to use it."""
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class CircuitBreaker:
+    """Open after ``failure_threshold`` consecutive failures; probe after a cooldown.
+
+    While open, `before_call` raises `CircuitOpenError`. Once ``reset_seconds``
+    have passed a single half-open probe is allowed through: success closes
+    the circuit, failure re-opens it for another cooldown. A probe that ends
+    any other way (a non-retryable error, an interrupt) is released by
+    `release_probe`, so the next call after the cooldown may probe again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        clock: Callable[[], float] | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._clock = clock if clock is not None else time.monotonic
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    def before_call(self, endpoint: str) -> bool:
+        """Admit a call; return True when it is the half-open probe."""
+
+        with self._lock:
+            if self._opened_at is None:
+                return False
+            remaining = self._opened_at + self.reset_seconds - self._clock()
+            if remaining > 0 or self._probing:
+                raise CircuitOpenError(
+                    f"Circuit open for {endpoint} after {self._failures} "
+                    f"consecutive failures; retry in {max(remaining, 0):.0f}s."
+                )
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def release_probe(self) -> None:
+        """Let another probe through if the current one recorded no outcome."""
+
+        with self._lock:
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; return True when this failure opened the circuit."""
+
+        with self._lock:
+            self._failures += 1
+            was_open = self._opened_at is not None and not self._probing
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._probing = False
+                return not was_open
+            return False
+
+
+@dataclass
+class EndpointStats:
+    """Retry counts for one endpoint (a host, or a host plus path prefix)."""
+
+    calls: int = 0
+    retries: int = 0
+    throttled: int = 0
+    failures: int = 0
+    circuit_opened: int = 0
+    waited_seconds: float = 0.0
+
+    def merge(self, other: EndpointStats) -> None:
+        self.calls += other.calls
+        self.retries += other.retries
+        self.throttled += other.throttled
+        self.failures += other.failures
+        self.circuit_opened += other.circuit_opened
+        self.waited_seconds += other.waited_seconds
+
+
+_metrics: dict[str, EndpointStats] = {}
+_metrics_lock = threading.Lock()
+_flush_registered = False
+
+
+def _record(endpoint: str, **counts: float) -> None:
+    global _flush_registered
+    with _metrics_lock:
+        stats = _metrics.setdefault(endpoint, EndpointStats())
+        for name, value in counts.items():
+            setattr(stats, name, getattr(stats, name) + value)
+        if not _flush_registered and os.environ.get(RETRY_METRICS_ENV):
+            atexit.register(flush_retry_metrics)
+            _flush_registered = True
+
+
+def record_throttle(endpoint: str, waited_seconds: float) -> None:
+    """Count a 429 handled outside `RetryPolicy` (e.g. by the LRO scheduler)."""
+
+    _record(
+        endpoint_key(endpoint), retries=1, throttled=1, waited_seconds=waited_seconds
+    )
+
+
+def retry_metrics() -> dict[str, EndpointStats]:
+    """Return a snapshot of this process's per-endpoint retry counts."""
+
+    with _metrics_lock:
+        return {
+            endpoint: EndpointStats(**asdict(stats))
+            for endpoint, stats in _metrics.items()
+        }
+
+
+def flush_retry_metrics(path: Path | None = None) -> None:
+    """Append this process's counts to ``path`` (default: ``RETRY_METRICS_ENV``)."""
+
+    target = path or (
+        Path(os.environ[RETRY_METRICS_ENV]) if os.environ.get(RETRY_METRICS_ENV) else None
+    )
+    snapshot = retry_metrics()
+    if target is None or not snapshot:
+        return
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with target.open("a", encoding="utf-8") as handle:
+        for endpoint, stats in sorted(snapshot.items()):
+            handle.write(json.dumps({"endpoint": endpoint, **asdict(stats)}) + "\n")
+    with _metrics_lock:
+        _metrics.clear()
+
+
+def load_retry_metrics(lines: Iterable[str]) -> dict[str, EndpointStats]:
+    """Merge JSON-lines records written by `flush_retry_metrics` per endpoint."""
+
+    merged: dict[str, EndpointStats] = {}
+    for line in lines:
+        if not line.strip():
+            continue
+        record: dict[str, Any] = json.loads(line)
+        endpoint = str(record.pop("endpoint"))
+        merged.setdefault(endpoint, EndpointStats()).merge(EndpointStats(**record))
+    return merged
+
+
+def endpoint_key(endpoint: str) -> str:
+    """Reduce a URL to the host that shares a throttling budget."""
+
+    return urlsplit(endpoint).netloc or endpoint
+
+
+class RetryPolicy:
+    """Adaptive retry with classification, jitter, pacing and circuit breaking.
+
+    ``call`` retries failures `classify_error` deems transient, up to
+    ``attempts`` calls. A server ``Retry-After`` is honored as the minimum
+    wait; otherwise the wait is decorrelated jitter between ``base_delay`` and
+    three times the previous wait, capped at ``max_delay``. Token buckets and
+    breakers are per host and shared by every thread using the policy.
+    """
+
+    def __init__(
+        self,
+        *,
+        attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        rate_per_second: float | None = None,
+        burst: float = 10.0,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        classify: Callable[[BaseException], RetryDecision] = classify_error,
+        sleep: Callable[[float], None] | None = None,
+        clock: Callable[[], float] | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be >= 1")
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.classify = classify
+        self._sleep = sleep
+        self._clock = clock if clock is not None else time.monotonic
+        self._rng = rng or random.Random()
+        self._buckets: dict[str, TokenBucket] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        host = endpoint_key(endpoint)
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(
+                    failure_threshold=self.failure_threshold,
+                    reset_seconds=self.reset_seconds,
+                    clock=self._clock,
+                )
+            return self._breakers[host]
+
+    def _bucket(self, host: str) -> TokenBucket | None:
+        if self.rate_per_second is None:
+            return None
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(
+                    self.rate_per_second, self.burst, clock=self._clock
+                )
+            return self._buckets[host]
+
+    def _wait(self, seconds: float) -> None:
+        if seconds > 0:
+            (self._sleep if self._sleep is not None else time.sleep)(seconds)
+
+    def call(
+        self,
+        func: Callable[[], T],
+        *,
+        endpoint: str,
+        on_retry: Callable[[int, BaseException, float], None] | None = None,
+    ) -> T:
+        """Call ``func`` for ``endpoint`` (a URL or host), retrying per policy.
+
+        ``on_retry`` is called with the 1-based attempt, the exception and the
+        chosen wait before each retry. Raises `CircuitOpenError` without
+        calling ``func`` while the host's breaker is open.
+        """
+
+        host = endpoint_key(endpoint)
+        breaker = self.breaker(host)
+        bucket = self._bucket(host)
+        previous = self.base_delay
+        for attempt in range(1, self.attempts + 1):
+            probe = breaker.before_call(host)
+            if bucket is not None:
+                self._wait(bucket.reserve())
+            _record(host, calls=1)
+            try:
+                result = func()
+            except Exception as exc:
+                decision = self.classify(exc)
+                # A non-retryable 4xx says nothing about the host's health.
+                if decision.retryable and breaker.record_failure():
+                    _record(host, circuit_opened=1)
+                if not decision.retryable or attempt == self.attempts:
+                    _record(host, failures=1)
+                    raise
+                previous = min(
+                    self.max_delay,
+                    self._rng.uniform(self.base_delay, previous * 3),
+                )
+                wait = max(previous, decision.retry_after or 0.0)
+                _record(
+                    host,
+                    retries=1,
+                    throttled=int(decision.kind == THROTTLED),
+                    waited_seconds=wait,
+                )
+                if on_retry is not None:
+                    on_retry(attempt, exc, wait)
+                self._wait(wait)
+                continue
+            else:
+                breaker.record_success()
+                return result
+            finally:
+                # A probe that recorded no outcome (a non-retryable error or an
+                # interrupt) must not leave the breaker half-open for good.
+                if probe:
+                    breaker.release_probe()
+        raise AssertionError("unreachable")  # pragma: no cover
+
+
+# Shared policy for Fabric / Power BI REST traffic within one process, so every
+# caller draws on the same per-host pacing and circuit state.
+FABRIC_RETRY = RetryPolicy(rate_per_second=20.0, burst=20.0)
@@ -4,19 +4,19 @@ Fabric releases a deleted workspace's display name asynchronously. Recreating
 immediately with the same name can race the still-draining old workspace, so
 `retail-setup deploy --recreate` used to insert a blind fixed-duration sleep
 between the destroy and the apply. This module replaces that sleep with a
-bounded poll of the same Fabric REST API the rest of the deploy framework
-uses, authenticated with the operator credential selected by ``auth_mode``
-(never silently substituting a different login, e.g. Azure CLI when
-``azure_powershell`` is configured).
+bounded, backing-off poll (``_job_poll``) of the same Fabric REST API the rest
+of the deploy framework uses, authenticated with the operator credential
+selected by ``auth_mode`` (never silently substituting a different login, e.g.
+Azure CLI when ``azure_powershell`` is configured).
 """
 
 from __future__ import annotations
 
-import time
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from deploy.scripts._auth import build_credential
+from deploy.scripts._job_poll import JobState, PollSchedule, PollTimeout, poll_jobs
 
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
@@ -24,10 +24,11 @@ if TYPE_CHECKING:
 FABRIC_API = "https://api.fabric.microsoft.com/v1"
 FABRIC_SCOPE = "https://api.fabric.microsoft.com/.default"
 
-# Bounded wait for Fabric to release a deleted workspace's display name, and
-# how often to re-check while waiting.
+# Bounded wait for Fabric to release a deleted workspace's display name, the
+# first re-check delay, and the longest delay the re-checks back off to.
 DEFAULT_TIMEOUT_SECONDS = 180
-DEFAULT_POLL_INTERVAL_SECONDS = 10
+DEFAULT_POLL_INTERVAL_SECONDS = 5
+DEFAULT_MAX_POLL_INTERVAL_SECONDS = 30
 
 # A callable with the subset of `requests.get`'s signature this module uses.
 HttpGet = Callable[..., Any]
@@ -122,29 +123,43 @@ def wait_for_workspace_absence(
     tenant_id: str | None = None,
     credential: TokenCredential | None = None,
     timeout_seconds: int = DEFAULT_TIMEOUT_SECONDS,
-    poll_interval_seconds: int = DEFAULT_POLL_INTERVAL_SECONDS,
-    sleep: Callable[[float], None] = time.sleep,
-    clock: Callable[[], float] = time.monotonic,
+    poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_INTERVAL_SECONDS,
+    sleep: Callable[[float], None] | None = None,
+    clock: Callable[[], float] | None = None,
     http_get: HttpGet | None = None,
 ) -> None:
     """Block until ``workspace_name`` no longer appears in the tenant's workspaces.
 
     Builds the operator credential via the shared `build_credential` helper
     (or uses an injected `credential`, e.g. for tests) so the selected
-    ``auth_mode`` is always honored. Raises `WorkspaceDeletionTimeout` if the
-    name is still present after `timeout_seconds`.
+    ``auth_mode`` is always honored. Re-checks start every
+    `poll_interval_seconds` and back off towards `max_poll_interval_seconds`.
+    Raises `WorkspaceDeletionTimeout` if the name is still present after
+    `timeout_seconds`.
     """
 
     credential = credential or build_credential(auth_mode, tenant_id=tenant_id)
     http_get = http_get or _default_http_get
     target = workspace_name.casefold()
-    deadline = clock() + timeout_seconds
-    while True:
-        if target not in _list_workspace_names(credential, http_get):
-            return
-        if clock() >= deadline:
-            raise WorkspaceDeletionTimeout(
-                f"Workspace {workspace_name!r} still present after {timeout_seconds}s; "
-                "Fabric has not finished releasing the name."
-            )
-        sleep(poll_interval_seconds)
+
+    def probe() -> JobState:
+        present = target in _list_workspace_names(credential, http_get)
+        return JobState("present" if present else "absent", terminal=not present)
+
+    try:
+        poll_jobs(
+            {workspace_name: probe},
+            timeout_seconds=timeout_seconds,
+            schedule=PollSchedule(
+                initial_seconds=poll_interval_seconds,
+                max_seconds=max(poll_interval_seconds, max_poll_interval_seconds),
+            ),
+            sleep=sleep,
+            clock=clock,
+        )
+    except PollTimeout:
+        raise WorkspaceDeletionTimeout(
+            f"Workspace {workspace_name!r} still present after {timeout_seconds}s; "
+            "Fabric has not finished releasing the name."
+        ) from None
@@ -16,6 +16,14 @@ from typing import TYPE_CHECKING, Any
 
 from deploy.scripts import _output as console
 from deploy.scripts._auth import AUTH_MODES, build_credential
+from deploy.scripts._kql_schema import (
+    KqlChange,
+    build_change_script,
+    live_script_rows,
+    parse_live_schema,
+    plan_schema_changes,
+    split_kql_commands,
+)
 
 if TYPE_CHECKING:
     from azure.core.credentials import TokenCredential
@@ -24,6 +32,7 @@ REPO_ROOT = Path(__file__).resolve().parents[2]
 KQL_SOURCE_DIR = REPO_ROOT / "fabric" / "kql_database"
 FABRIC_SCOPE = "https://api.fabric.microsoft.com/.default"
 FABRIC_API = "https://api.fabric.microsoft.com/v1"
+LIVE_SCHEMA_COMMAND = ".show database schema as csl script"
 
 
 def collect_kql_scripts(
@@ -172,29 +181,24 @@ def _summarize_result(table: Any) -> None:
         console.detail(f"[{row.get('CommandType', '')}] {first_line} -> {reason}")
 
 
-def apply_to_database(
-    *,
-    script: str,
+def _connect(
     workspace_id: str,
     kql_database_id: str,
-    kql_database_name: str | None = None,
-    auth_mode: str = "azure_cli",
-    tenant_id: str | None = None,
-    credential: TokenCredential | None = None,
-) -> int:
-    """Resolve the KQL database and apply the combined script. Returns row count."""
-
-    credential = _credential(
-        credential,
-        auth_mode=auth_mode,
-        tenant_id=tenant_id,
-    )
+    kql_database_name: str | None,
+    credential: TokenCredential,
+) -> tuple[str, str]:
     query_uri, resolved_name = resolve_kql_database(
         workspace_id, kql_database_id, credential
     )
-    database_name = kql_database_name or resolved_name
-    console.info(f"Applying KQL to '{database_name}' @ {query_uri}")
+    return query_uri, kql_database_name or resolved_name
 
+
+def _execute(
+    query_uri: str,
+    database_name: str,
+    script: str,
+    credential: TokenCredential,
+) -> Any:
     from deploy.scripts._retry import retry_call
 
     # The Kusto SDK acquires the token inside execute_mgmt; a cold az token can
@@ -208,7 +212,7 @@ def apply_to_database(
     except ModuleNotFoundError:
         retry_on = ()
 
-    response = retry_call(
+    return retry_call(
         lambda: execute_database_script(query_uri, database_name, script, credential),
         retry_on=retry_on,
         on_retry=lambda n, exc: console.warn(
@@ -216,11 +220,97 @@ def apply_to_database(
         ),
     )
 
+
+def apply_to_database(
+    *,
+    script: str,
+    workspace_id: str,
+    kql_database_id: str,
+    kql_database_name: str | None = None,
+    auth_mode: str = "azure_cli",
+    tenant_id: str | None = None,
+    credential: TokenCredential | None = None,
+) -> int:
+    """Resolve the KQL database and apply the combined script. Returns row count."""
+
+    credential = _credential(
+        credential,
+        auth_mode=auth_mode,
+        tenant_id=tenant_id,
+    )
+    query_uri, database_name = _connect(
+        workspace_id, kql_database_id, kql_database_name, credential
+    )
+    console.info(f"Applying KQL to '{database_name}' @ {query_uri}")
+
+    response = _execute(query_uri, database_name, script, credential)
     table = response.primary_results[0]
     _summarize_result(table)
     return len(table)
 
 
+def _print_plan(changes: list[KqlChange], total: int) -> None:
+    """Print the planned commands, new and altered entities first."""
+
+    counts = {
+        action: sum(change.action == action for change in changes)
+        for action in ("create", "alter", "reapply")
+    }
+    console.info(
+        f"KQL plan: {counts['create']} to create, {counts['alter']} to alter, "
+        f"{counts['reapply']} to re-apply, {total - len(changes)} unchanged."
+    )
+    for change in changes:
+        if change.action != "reapply":
+            command = change.command
+            console.detail(
+                f"[{change.action}] {command.kind} {command.name} ({command.source})"
+            )
+
+
+def apply_schema_diff(
+    *,
+    scripts: list[Path],
+    workspace_id: str,
+    kql_database_id: str,
+    kql_database_name: str | None = None,
+    auth_mode: str = "azure_cli",
+    tenant_id: str | None = None,
+    credential: TokenCredential | None = None,
+    plan_only: bool = False,
+) -> list[KqlChange]:
+    """Apply only the source commands that differ from the live schema.
+
+    The live schema is read once with ``.show database schema as csl script``.
+    The plan is printed before anything runs; with ``plan_only`` nothing is
+    applied. Returns the planned changes.
+    """
+
+    credential = _credential(
+        credential,
+        auth_mode=auth_mode,
+        tenant_id=tenant_id,
+    )
+    query_uri, database_name = _connect(
+        workspace_id, kql_database_id, kql_database_name, credential
+    )
+    console.info(f"Diffing KQL against '{database_name}' @ {query_uri}")
+
+    live_response = _execute(query_uri, database_name, LIVE_SCHEMA_COMMAND, credential)
+    live = parse_live_schema(live_script_rows(live_response.primary_results[0]))
+    commands = split_kql_commands(scripts)
+    changes = plan_schema_changes(commands, live)
+    _print_plan(changes, len(commands))
+    if plan_only or not changes:
+        return changes
+
+    response = _execute(
+        query_uri, database_name, build_change_script(changes), credential
+    )
+    _summarize_result(response.primary_results[0])
+    return changes
+
+
 def main() -> int:
     """Write a combined KQL script and optionally execute it against the database."""
 
@@ -236,6 +326,16 @@ def main() -> int:
         action="store_true",
         help="Apply the script to the Fabric Eventhouse KQL database.",
     )
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="With --execute, apply only commands that differ from the live schema.",
+    )
+    parser.add_argument(
+        "--plan",
+        action="store_true",
+        help="Print the commands that differ from the live schema; apply nothing.",
+    )
     parser.add_argument(
         "--environment",
         help="Read workspace/database ids from deploy/.generated/<env>/terraform-output.json.",
@@ -287,22 +387,27 @@ def main() -> int:
             validation,
             args.profile,
         ).kql_scripts
-    if args.execute and not args.environment and not args.profile:
+    if args.diff and not args.execute:
+        raise SystemExit("--diff applies changes; combine it with --execute")
+    if args.plan and args.execute:
+        raise SystemExit("--plan applies nothing; drop --execute or use --diff")
+    live = args.execute or args.plan
+    flag = "--execute" if args.execute else "--plan"
+    if live and not args.environment and not args.profile:
         raise SystemExit(
-            "--execute requires --environment or --profile so KQL selection "
+            f"{flag} requires --environment or --profile so KQL selection "
             "cannot bypass the deployment inventory"
         )
-    if args.execute and not selected_scripts:
+    if live and not selected_scripts:
         raise SystemExit("selected deployment profile does not include Eventhouse KQL")
 
-    script = build_database_script(
-        collect_kql_scripts(args.source_dir, selected_scripts)
-    )
+    scripts = collect_kql_scripts(args.source_dir, selected_scripts)
+    script = build_database_script(scripts)
     args.output.parent.mkdir(parents=True, exist_ok=True)
     args.output.write_text(script, encoding="utf-8")
     console.info(f"Wrote combined KQL script to {args.output}")
 
-    if not args.execute:
+    if not live:
         return 0
 
     workspace_id = args.workspace_id
@@ -343,21 +448,24 @@ def main() -> int:
         tenant_id = config.tenant_id
     if not workspace_id or not kql_database_id:
         raise SystemExit(
-            "--execute requires --workspace-id and --kql-database-id, or "
+            f"{flag} requires --workspace-id and --kql-database-id, or "
             "--environment with generated Terraform outputs."
         )
 
-    apply_to_database(
-        script=script,
-        workspace_id=str(workspace_id),
-        kql_database_id=str(kql_database_id),
-        kql_database_name=kql_database_name and str(kql_database_name),
-        auth_mode=(
+    target = {
+        "workspace_id": str(workspace_id),
+        "kql_database_id": str(kql_database_id),
+        "kql_database_name": kql_database_name and str(kql_database_name),
+        "auth_mode": (
             args.auth_mode
             or (config.auth_mode if config is not None else "azure_cli")
         ),
-        tenant_id=tenant_id and str(tenant_id),
-    )
+        "tenant_id": tenant_id and str(tenant_id),
+    }
+    if args.plan or args.diff:
+        apply_schema_diff(scripts=scripts, plan_only=args.plan, **target)
+    else:
+        apply_to_database(script=script, **target)
     return 0
 
 
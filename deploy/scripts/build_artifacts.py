@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import shutil
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import date
 from pathlib import Path
 from typing import Any, Literal
@@ -166,6 +167,11 @@ STREAM_NOTEBOOKS = [
 # the "Setup" workspace folder (alongside those notebooks) rather than the
 # general "Pipelines" folder.
 SETUP_PIPELINE = "setup-pipeline"
+# Per-item content fingerprints from the last build, written at the output root.
+# fabric-cicd only publishes `.platform` item folders, so the file is ignored by
+# publish but lets a later incremental build (and the operator) see exactly which
+# items changed.
+BUILD_MANIFEST = ".build-manifest.json"
 
 
 @dataclass(frozen=True)
@@ -188,12 +194,16 @@ class BuildResult:
     preview_boundary: str
     manual_boundary: str
     staged_items: list[str]
+    incremental: bool = False
+    changed_items: tuple[str, ...] = ()
+    unchanged_items: tuple[str, ...] = ()
+    removed_items: tuple[str, ...] = ()
 
     def to_dict(self) -> dict[str, Any]:
         """Return the durable, secret-free artifact inventory."""
 
         return {
-            "schema_version": "1.0.0",
+            "schema_version": "1.1.0",
             "profile": {
                 "name": self.profile,
                 "support_status": self.profile_support_status,
@@ -220,6 +230,12 @@ class BuildResult:
                 "manual": self.manual_boundary,
             },
             "staged_items": list(self.staged_items),
+            "build": {
+                "incremental": self.incremental,
+                "changed": list(self.changed_items),
+                "unchanged": list(self.unchanged_items),
+                "removed": list(self.removed_items),
+            },
         }
 
 
@@ -731,8 +747,43 @@ def build_workspace(
         "post-ontology",
     ] = "all",
     report_default_date: date | None = None,
+    incremental: bool = False,
 ) -> BuildResult:
-    """Build a fabric-cicd workspace folder from repository source assets."""
+    """Build a fabric-cicd workspace folder from repository source assets.
+
+    A full build replaces ``output_dir``. An ``incremental`` build stages into a
+    scratch sibling folder, then swaps in only the item folders whose content
+    fingerprint differs from what ``output_dir`` already holds; unchanged item
+    folders are left untouched and the result lists changed, unchanged, and
+    removed items for the publish step.
+    """
+
+    if incremental:
+        staging_dir = output_dir.parent / f".{output_dir.name}.staging"
+        try:
+            result = build_workspace(
+                repo_root,
+                staging_dir,
+                profile,
+                lakehouse_name,
+                kql_database_name,
+                semantic_model_name,
+                report_name,
+                publication_phase,
+                report_default_date,
+            )
+            changed, unchanged, removed = _sync_staged_items(staging_dir, output_dir)
+        finally:
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+        return replace(
+            result,
+            output_dir=output_dir,
+            incremental=True,
+            changed_items=changed,
+            unchanged_items=unchanged,
+            removed_items=removed,
+        )
 
     if isinstance(profile, str):
         manifest, validation = load_repository_manifest(repo_root)
@@ -904,6 +955,11 @@ def build_workspace(
         )
     if not canonical_profile:
         expected_item_count = len(item_dirs)
+    fingerprints = {
+        item_dir.relative_to(output_dir).as_posix(): _item_fingerprint(item_dir)
+        for item_dir in item_dirs
+    }
+    _write_build_manifest(output_dir, fingerprints)
     return BuildResult(
         output_dir=output_dir,
         profile=profile.deployment_name,
@@ -927,9 +983,85 @@ def build_workspace(
         preview_boundary=profile.boundaries.preview,
         manual_boundary=profile.boundaries.manual,
         staged_items=sorted(staged_items),
+        changed_items=tuple(fingerprints),
     )
 
 
+def _item_fingerprint(item_dir: Path) -> str:
+    """SHA-256 over every staged file's relative path and bytes.
+
+    Staging is a pure function of the source files, render values, and the
+    selected profile, so fingerprinting the staged item captures all of them
+    without each stager having to declare its inputs.
+    """
+
+    digest = hashlib.sha256()
+    files = sorted(
+        (path for path in item_dir.rglob("*") if path.is_file()),
+        key=lambda path: path.relative_to(item_dir).as_posix(),
+    )
+    for path in files:
+        content = path.read_bytes()
+        relative = path.relative_to(item_dir).as_posix()
+        digest.update(f"{relative}\0{len(content)}\0".encode())
+        digest.update(content)
+    return digest.hexdigest()
+
+
+def _write_build_manifest(output_dir: Path, fingerprints: dict[str, str]) -> None:
+    (output_dir / BUILD_MANIFEST).write_text(
+        json.dumps({"items": fingerprints}, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+    )
+
+
+def _sync_staged_items(
+    staging_dir: Path,
+    output_dir: Path,
+) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+    """Move changed items from ``staging_dir`` into ``output_dir``.
+
+    The existing output is fingerprinted afresh rather than trusted from its
+    manifest, so a hand-edited or half-written item folder is always replaced.
+    Returns the ``(changed, unchanged, removed)`` item paths relative to the
+    output root.
+    """
+
+    fingerprints: dict[str, str] = json.loads(
+        (staging_dir / BUILD_MANIFEST).read_text(encoding="utf-8")
+    )["items"]
+    existing = (
+        {
+            platform_path.parent.relative_to(output_dir).as_posix(): platform_path.parent
+            for platform_path in output_dir.rglob(".platform")
+        }
+        if output_dir.is_dir()
+        else {}
+    )
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / ".gitkeep").touch()
+    removed = tuple(sorted(set(existing) - set(fingerprints)))
+    for relative in removed:
+        shutil.rmtree(existing[relative])
+        parent = existing[relative].parent
+        if parent != output_dir and not any(parent.iterdir()):
+            parent.rmdir()
+    changed: list[str] = []
+    unchanged: list[str] = []
+    for relative, fingerprint in fingerprints.items():
+        if relative in existing and _item_fingerprint(existing[relative]) == fingerprint:
+            unchanged.append(relative)
+            continue
+        destination = output_dir / relative
+        if destination.exists():
+            shutil.rmtree(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(staging_dir / relative, destination)
+        changed.append(relative)
+    _write_build_manifest(output_dir, fingerprints)
+    return tuple(changed), tuple(unchanged), removed
+
+
 def _selected_notebooks(groups: list[str]) -> list[str]:
     selected: list[str] = []
     for group in groups:
@@ -1059,6 +1191,14 @@ def main() -> int:
             "sets staged report date slicers."
         ),
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Replace only item folders whose staged content changed; unchanged "
+            "folders are left byte-identical."
+        ),
+    )
     args = parser.parse_args()
     if args.notebook_groups:
         parser.error(
@@ -1083,6 +1223,7 @@ def main() -> int:
         args.report_name,
         args.publication_phase,
         report_default_date,
+        incremental=args.incremental,
     )
     console.info(
         f"Staged {len(result.staged_items)}/{result.expected_item_count} items "
@@ -1093,6 +1234,12 @@ def main() -> int:
         "Workspace folders: "
         + (", ".join(result.workspace_folders) or "(workspace root only)")
     )
+    if result.incremental:
+        console.detail(
+            f"Incremental build: {len(result.changed_items)} changed, "
+            f"{len(result.unchanged_items)} unchanged, "
+            f"{len(result.removed_items)} removed"
+        )
     if args.inventory_output is not None:
         inventory_path = args.inventory_output
         if not inventory_path.is_absolute():
@@ -18,17 +18,27 @@ from __future__ import annotations
 import argparse
 import base64
 import json
+import os
 import time
+from collections.abc import Callable, Iterable
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from deploy.scripts._auth import AUTH_MODES, build_credential
+from deploy.scripts._lro import (
+    DEFAULT_MAX_IN_FLIGHT,
+    FabricOperation,
+    ProgressCallback,
+    run_operations,
+)
 from deploy.scripts.fabric_runtime import paginated_get
 
 if TYPE_CHECKING:
     import requests
     from azure.core.credentials import TokenCredential
 
+T = TypeVar("T")
+
 FABRIC_API = "https://api.fabric.microsoft.com/v1"
 FABRIC_SCOPE = "https://api.fabric.microsoft.com/.default"
 REPO_ROOT = Path(__file__).resolve().parents[2]
@@ -105,29 +115,67 @@ def get_definition(
 ) -> dict[str, Any]:
     """Fetch an item definition, transparently handling the long-running operation."""
 
-    response = session.post(
-        f"{FABRIC_API}/workspaces/{workspace_id}/items/{item_id}/getDefinition"
+    return get_definitions(
+        session,
+        workspace_id,
+        [item_id],
+        poll_seconds=poll_seconds,
+        max_polls=max_polls,
+    )[item_id]
+
+
+def get_definitions(
+    session: requests.Session,
+    workspace_id: str,
+    item_ids: Iterable[str],
+    *,
+    poll_seconds: int = 2,
+    max_polls: int = 60,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    on_progress: ProgressCallback | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Fetch several item definitions with their operations polled concurrently.
+
+    Each ``getDefinition`` honors its own ``Retry-After``, so the batch takes
+    about as long as its slowest item rather than the sum of them.
+    """
+
+    operations = {
+        item_id: _definition_operation(
+            session,
+            workspace_id,
+            item_id,
+            lambda payload: payload["definition"],
+            poll_seconds=poll_seconds,
+        )
+        for item_id in item_ids
+    }
+    return run_operations(
+        operations,
+        max_in_flight=max_in_flight,
+        max_polls=max_polls,
+        on_progress=on_progress,
+    )
+
+
+def _definition_operation(
+    session: requests.Session,
+    workspace_id: str,
+    item_id: str,
+    result: Callable[[Any], T],
+    *,
+    poll_seconds: float = 2,
+) -> FabricOperation[T]:
+    """Build the ``getDefinition`` operation for one item."""
+
+    return FabricOperation(
+        session,
+        "POST",
+        f"{FABRIC_API}/workspaces/{workspace_id}/items/{item_id}/getDefinition",
+        name="getDefinition",
+        result=result,
+        poll_seconds=poll_seconds,
     )
-    if response.status_code == 200:
-        return response.json()["definition"]
-    if response.status_code != 202:
-        response.raise_for_status()
-
-    operation_url = response.headers["Location"]
-    retry_after = int(response.headers.get("Retry-After", poll_seconds))
-    for _ in range(max_polls):
-        time.sleep(retry_after)
-        poll = session.get(operation_url)
-        poll.raise_for_status()
-        status = poll.json().get("status")
-        if status == "Succeeded":
-            result = session.get(f"{operation_url}/result")
-            result.raise_for_status()
-            return result.json()["definition"]
-        if status in {"Failed", "Cancelled"}:
-            raise RuntimeError(f"getDefinition {status}: {poll.text}")
-        retry_after = int(poll.headers.get("Retry-After", poll_seconds))
-    raise TimeoutError(f"getDefinition did not complete for item {item_id}")
 
 
 def write_item(
@@ -135,26 +183,58 @@ def write_item(
 ) -> Path:
     """Write a fetched definition as a ``<name>.<ItemType>`` source item folder."""
 
+    return _write_item(output_dir, display_name, item_type, definition)[0]
+
+
+def _write_item(
+    output_dir: Path, display_name: str, item_type: str, definition: dict[str, Any]
+) -> tuple[Path, int, int]:
+    """Write an item folder; return it with its written and unchanged part counts.
+
+    Each part is decoded and written on its own, so only one decoded part is
+    held at a time, and a part whose bytes already match the file on disk is
+    not rewritten (keeping mtimes, and therefore drift reviews, quiet).
+    """
+
     item_dir = output_dir / f"{display_name}.{item_type}"
     item_dir.mkdir(parents=True, exist_ok=True)
+    written = unchanged = 0
     for part in definition["parts"]:
-        decoded = base64.b64decode(part["payload"])
-        part_path = item_dir / part["path"]
-        part_path.parent.mkdir(parents=True, exist_ok=True)
-        # Re-serialize JSON parts with stable indentation; keep others verbatim.
-        name = Path(part["path"]).name
-        if part["path"].endswith(_JSON_PART_SUFFIXES) or name in _JSON_PART_NAMES:
-            try:
-                parsed = json.loads(decoded.decode("utf-8"))
-                part_path.write_text(
-                    json.dumps(parsed, indent=2, ensure_ascii=False) + "\n",
-                    encoding="utf-8",
-                )
-                continue
-            except (UnicodeDecodeError, json.JSONDecodeError):
-                pass
-        part_path.write_bytes(decoded)
-    return item_dir
+        if _write_part(item_dir / part["path"], _part_content(part)):
+            written += 1
+        else:
+            unchanged += 1
+    return item_dir, written, unchanged
+
+
+def _part_content(part: dict[str, Any]) -> bytes:
+    """Decode one definition part into the bytes stored in source control."""
+
+    decoded = base64.b64decode(part["payload"])
+    # Re-serialize JSON parts with stable indentation; keep others verbatim.
+    name = Path(part["path"]).name
+    if part["path"].endswith(_JSON_PART_SUFFIXES) or name in _JSON_PART_NAMES:
+        try:
+            parsed = json.loads(decoded.decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return decoded
+        text = json.dumps(parsed, indent=2, ensure_ascii=False) + "\n"
+        # Match ``Path.write_text``'s platform newline translation.
+        return text.replace("\n", os.linesep).encode("utf-8")
+    return decoded
+
+
+def _write_part(path: Path, content: bytes) -> bool:
+    """Write ``content`` unless ``path`` already holds exactly these bytes."""
+
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+    return True
 
 
 def export_items(
@@ -165,8 +245,18 @@ def export_items(
     *,
     auth_mode: str = "azure_cli",
     tenant_id: str | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    on_progress: ProgressCallback | None = None,
+    on_written: Callable[[Path, int, int], None] | None = None,
 ) -> list[Path]:
-    """Export all items of ``item_type`` from a workspace into item folders."""
+    """Export all items of ``item_type`` from a workspace into item folders.
+
+    Definitions are fetched concurrently (at most ``max_in_flight`` requests
+    at a time) and each item folder is written by the worker that fetched it,
+    as soon as its definition arrives, so definitions are never accumulated.
+    ``on_written(item_dir, written_files, unchanged_files)`` is then called
+    per item in display-name order, the order of the returned folders.
+    """
 
     session = build_session(
         credential,
@@ -174,15 +264,58 @@ def export_items(
         tenant_id=tenant_id,
     )
     workspace_id = find_workspace_id(session, workspace_name)
-    written: list[Path] = []
-    for item in list_items(session, workspace_id, item_type):
-        definition = get_definition(session, workspace_id, str(item["id"]))
-        written.append(
-            write_item(output_dir, str(item["displayName"]), item_type, definition)
+    items = list_items(session, workspace_id, item_type)
+    operations = {
+        str(item["id"]): _definition_operation(
+            session,
+            workspace_id,
+            str(item["id"]),
+            lambda payload, name=str(item["displayName"]): _write_item(
+                output_dir, name, item_type, payload["definition"]
+            ),
         )
+        for item in items
+    }
+    results = run_operations(
+        operations,
+        max_in_flight=max_in_flight,
+        on_progress=on_progress,
+    )
+    written: list[Path] = []
+    for item_dir, written_files, unchanged_files in results.values():
+        if on_written is not None:
+            on_written(item_dir, written_files, unchanged_files)
+        written.append(item_dir)
     return written
 
 
+class ExportTally:
+    """Count exported items and files for the end-of-run summary."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.items = 0
+        self.written_files = 0
+        self.unchanged_files = 0
+
+    def __call__(self, item_dir: Path, written: int, unchanged: int) -> None:
+        _ = item_dir
+        self.items += 1
+        self.written_files += written
+        self.unchanged_files += unchanged
+
+    def summary(self) -> str:
+        """One line with throughput and how many files actually changed."""
+
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        return (
+            f"{self.items} item(s) in {elapsed:.1f}s "
+            f"({self.items / elapsed:.1f} items/s); "
+            f"{self.written_files} file(s) written, "
+            f"{self.unchanged_files} unchanged"
+        )
+
+
 def main() -> int:
     """Export Fabric items of a type into source-control item folders."""
 
@@ -210,18 +343,30 @@ def main() -> int:
         "--tenant-id",
         help="Entra tenant passed to the selected operator credential.",
     )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="Concurrent getDefinition requests (default: %(default)s).",
+    )
     args = parser.parse_args()
+    if args.max_in_flight < 1:
+        parser.error("--max-in-flight must be >= 1")
 
+    tally = ExportTally()
     written = export_items(
         args.workspace_name,
         args.item_type,
         args.output_dir,
         auth_mode=args.auth_mode,
         tenant_id=args.tenant_id,
+        max_in_flight=args.max_in_flight,
+        on_written=tally,
     )
     print(f"Exported {len(written)} {args.item_type} item(s) to {args.output_dir}")
     for item in written:
         print(f"  {item.name}")
+    print(tally.summary())
     return 0
 
 
@@ -11,11 +11,14 @@ Example:
 from __future__ import annotations
 
 import argparse
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from deploy.scripts._auth import AUTH_MODES
+from deploy.scripts._lro import DEFAULT_MAX_IN_FLIGHT
 from deploy.scripts.export_items import (
+    ExportTally,
     build_session,
     export_items,
     find_workspace_id,
@@ -63,6 +66,8 @@ def export_pipelines(
     *,
     auth_mode: str = "azure_cli",
     tenant_id: str | None = None,
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    on_written: Callable[[Path, int, int], None] | None = None,
 ) -> list[Path]:
     """Export all DataPipeline items from a workspace into item folders."""
 
@@ -73,6 +78,8 @@ def export_pipelines(
         credential,
         auth_mode=auth_mode,
         tenant_id=tenant_id,
+        max_in_flight=max_in_flight,
+        on_written=on_written,
     )
 
 
@@ -98,17 +105,29 @@ def main() -> int:
         "--tenant-id",
         help="Entra tenant passed to the selected operator credential.",
     )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_IN_FLIGHT,
+        help="Concurrent getDefinition requests (default: %(default)s).",
+    )
     args = parser.parse_args()
+    if args.max_in_flight < 1:
+        parser.error("--max-in-flight must be >= 1")
 
+    tally = ExportTally()
     written = export_pipelines(
         args.workspace_name,
         args.output_dir,
         auth_mode=args.auth_mode,
         tenant_id=args.tenant_id,
+        max_in_flight=args.max_in_flight,
+        on_written=tally,
     )
     print(f"Exported {len(written)} pipeline(s) to {args.output_dir}")
     for item in written:
         print(f"  {item.name}")
+    print(tally.summary())
     return 0
 
 
@@ -8,6 +8,8 @@ import json
 from pathlib import PurePosixPath
 from typing import TYPE_CHECKING, Any
 
+from deploy.scripts._retry import FABRIC_RETRY, RetryPolicy
+
 if TYPE_CHECKING:
     import requests
 
@@ -23,14 +25,29 @@ class FabricDefinitionError(ValueError):
     """Raised when a Fabric item definition is malformed or unsafe to inspect."""
 
 
+def _get_json(
+    session: requests.Session, url: str, params: dict[str, Any] | None
+) -> Any:
+    response = (
+        session.get(url) if params is None else session.get(url, params=params)
+    )
+    response.raise_for_status()
+    return response.json()
+
+
 def paginated_get(
     session: requests.Session,
     url: str,
     *,
     params: dict[str, Any] | None = None,
     max_pages: int = _MAX_PAGES,
+    retry: RetryPolicy = FABRIC_RETRY,
 ) -> list[dict[str, Any]]:
-    """Exhaust a Fabric ``value`` collection, failing closed on malformed loops."""
+    """Exhaust a Fabric ``value`` collection, failing closed on malformed loops.
+
+    Each page request goes through ``retry``, so a throttled or dropped page
+    is re-requested instead of failing the whole listing.
+    """
 
     if max_pages < 1:
         raise ValueError("max_pages must be positive")
@@ -43,12 +60,10 @@ def paginated_get(
     values: list[dict[str, Any]] = []
 
     for _ in range(max_pages):
-        if next_params is None:
-            response = session.get(next_url)
-        else:
-            response = session.get(next_url, params=next_params)
-        response.raise_for_status()
-        payload = response.json()
+        payload = retry.call(
+            lambda url=next_url, params=next_params: _get_json(session, url, params),
+            endpoint=next_url,
+        )
         if not isinstance(payload, dict) or not isinstance(payload.get("value"), list):
             raise FabricPaginationError(
                 "Fabric collection response did not contain an array named 'value'."
@@ -12,13 +12,24 @@ from __future__ import annotations
 
 import argparse
 import json
-import time
-from datetime import UTC, datetime
+import re
+from collections.abc import Callable, Hashable, Iterable, Mapping
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 from deploy.scripts import _output as console
 from deploy.scripts._auth import AUTH_MODES
+from deploy.scripts._job_poll import (
+    DEFAULT_INITIAL_POLL_SECONDS,
+    DEFAULT_MAX_POLL_SECONDS,
+    ActivityUpdate,
+    JobState,
+    JobUpdate,
+    PollSchedule,
+    PollTimeout,
+    poll_jobs,
+)
 from deploy.scripts.export_items import build_session, list_items
 from deploy.scripts.fabric_runtime import paginated_get
 
@@ -31,6 +42,13 @@ _IN_PROGRESS_STATUSES = frozenset({"NotStarted", "InProgress"})
 _FAILED_STATUSES = frozenset({"Failed", "Cancelled", "Deduped", "Skipped"})
 _SUCCESS_STATUS = "Completed"
 _KNOWN_STATUSES = _IN_PROGRESS_STATUSES | _FAILED_STATUSES | {_SUCCESS_STATUS}
+_JOB_INSTANCE_URL = re.compile(
+    r"/workspaces/([^/]+)/items/[^/]+/jobs/instances/([^/?]+)"
+)
+_EPOCH = "1970-01-01T00:00:00Z"
+DEFAULT_TIMEOUT_SECONDS = 21600
+
+K = TypeVar("K", bound=Hashable)
 
 
 class PipelineRunError(RuntimeError):
@@ -83,8 +101,10 @@ def wait_for_pipeline_run(
     location: str,
     *,
     pipeline_id: str | None = None,
-    timeout_seconds: float = 21600,
-    poll_interval_seconds: float = 15,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = DEFAULT_INITIAL_POLL_SECONDS,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_SECONDS,
+    on_activity: Callable[[ActivityUpdate], None] | None = None,
 ) -> str:
     """Poll the returned job URL until the exact run reaches ``Completed``."""
 
@@ -94,6 +114,8 @@ def wait_for_pipeline_run(
         pipeline_id=pipeline_id,
         timeout_seconds=timeout_seconds,
         poll_interval_seconds=poll_interval_seconds,
+        max_poll_interval_seconds=max_poll_interval_seconds,
+        on_activity=on_activity,
     )
     return str(payload["status"])
 
@@ -103,20 +125,112 @@ def wait_for_pipeline_job(
     location: str,
     *,
     pipeline_id: str | None = None,
-    timeout_seconds: float = 21600,
-    poll_interval_seconds: float = 15,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = DEFAULT_INITIAL_POLL_SECONDS,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_SECONDS,
+    on_activity: Callable[[ActivityUpdate], None] | None = None,
 ) -> dict[str, object]:
     """Poll one exact job URL and return its terminal-success payload."""
 
-    if not location:
+    payloads = wait_for_pipeline_jobs(
+        session,
+        {location: location},
+        pipeline_ids={location: pipeline_id} if pipeline_id else None,
+        timeout_seconds=timeout_seconds,
+        poll_interval_seconds=poll_interval_seconds,
+        max_poll_interval_seconds=max_poll_interval_seconds,
+        on_activity=on_activity,
+    )
+    return payloads[location]
+
+
+def wait_for_pipeline_jobs(
+    session: requests.Session,
+    locations: Mapping[K, str],
+    *,
+    pipeline_ids: Mapping[K, str | None] | None = None,
+    timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+    poll_interval_seconds: float = DEFAULT_INITIAL_POLL_SECONDS,
+    max_poll_interval_seconds: float = DEFAULT_MAX_POLL_SECONDS,
+    on_update: Callable[[JobUpdate], None] | None = None,
+    on_activity: Callable[[ActivityUpdate], None] | None = None,
+    sleep: Callable[[float], None] | None = None,
+    clock: Callable[[], float] | None = None,
+) -> dict[K, dict[str, object]]:
+    """Watch several exact job URLs in one loop until every run completes.
+
+    Polling starts every ``poll_interval_seconds`` and backs off towards
+    ``max_poll_interval_seconds`` while a run's status and activities stay
+    unchanged (see ``_job_poll``). Activity runs are only queried when
+    ``on_activity`` is given, so plain waits cost one request per poll. The
+    first run to fail raises ``PipelineRunError`` without waiting for the rest.
+    """
+
+    if not locations or not all(locations.values()):
         raise PipelineRunError(
             "Fabric did not return a job-instance Location; run status is unknown."
         )
     if timeout_seconds <= 0 or poll_interval_seconds < 0:
         raise ValueError("pipeline wait timeout must be positive and interval non-negative")
+    schedule = PollSchedule(
+        initial_seconds=poll_interval_seconds,
+        max_seconds=max(poll_interval_seconds, max_poll_interval_seconds),
+    )
+    pipeline_ids = pipeline_ids or {}
+    probes = {
+        key: _job_probe(
+            session,
+            location,
+            pipeline_ids.get(key),
+            activities=on_activity is not None,
+        )
+        for key, location in locations.items()
+    }
+    try:
+        states = poll_jobs(
+            probes,
+            timeout_seconds=timeout_seconds,
+            schedule=schedule,
+            on_update=on_update,
+            on_activity=on_activity,
+            sleep=sleep,
+            clock=clock,
+        )
+    except PollTimeout as exc:
+        raise PipelineRunError(
+            f"Pipeline run(s) {_quote_keys(exc.pending)} did not complete within "
+            f"{timeout_seconds:g} seconds."
+        ) from exc
+    for key, state in states.items():
+        if state.failed:
+            running = [other for other in locations if other not in states]
+            still_running = (
+                f"; still running: {_quote_keys(running)}" if running else ""
+            )
+            raise PipelineRunError(
+                f"Pipeline run {key!r} reached terminal status "
+                f"{state.status!r}{still_running}."
+            )
+    return {key: states[key].payload for key in locations}
+
+
+def _quote_keys(keys: Iterable[object]) -> str:
+    return ", ".join(repr(key) for key in keys)
+
+
+def _job_probe(
+    session: requests.Session,
+    location: str,
+    pipeline_id: str | None,
+    *,
+    activities: bool,
+) -> Callable[[], JobState]:
+    """Return a probe that reads one job instance (and optionally its activities)."""
 
-    deadline = time.monotonic() + timeout_seconds
-    while True:
+    activity_url = _activity_runs_url(location) if activities else None
+
+    def probe() -> JobState:
+        nonlocal activity_url
         response = session.get(location)
         response.raise_for_status()
         payload = response.json()
@@ -124,21 +238,66 @@ def wait_for_pipeline_job(
             raise PipelineRunError("Pipeline run returned a non-object job payload.")
         status = payload.get("status")
         _validate_job_correlation(payload, location, pipeline_id)
-        if status == _SUCCESS_STATUS:
-            return payload
-        if status in _FAILED_STATUSES:
-            raise PipelineRunError(
-                f"Pipeline run reached terminal status {status!r}."
-            )
-        if status not in _IN_PROGRESS_STATUSES:
+        if status not in _KNOWN_STATUSES:
             raise PipelineRunError(
                 f"Pipeline run returned unknown status {status!r}."
             )
-        if time.monotonic() >= deadline:
-            raise PipelineRunError(
-                f"Pipeline run did not complete within {timeout_seconds:g} seconds."
-            )
-        time.sleep(poll_interval_seconds)
+        activity_statuses: dict[str, str] = {}
+        if activity_url is not None:
+            try:
+                activity_statuses = _activity_statuses(session, activity_url, payload)
+            except Exception:  # noqa: BLE001 — activity detail is best-effort
+                # The job status stays authoritative; stop spending requests
+                # on an activity query this run does not support.
+                activity_url = None
+        return JobState(
+            status=str(status),
+            payload=payload,
+            terminal=status not in _IN_PROGRESS_STATUSES,
+            failed=status in _FAILED_STATUSES,
+            activities=activity_statuses,
+        )
+
+    return probe
+
+
+def _activity_runs_url(location: str) -> str | None:
+    """Map a job-instance URL to its pipeline ``queryactivityruns`` endpoint."""
+
+    match = _JOB_INSTANCE_URL.search(location)
+    if match is None:
+        return None
+    workspace_id, job_id = match.groups()
+    return (
+        f"{FABRIC_API}/workspaces/{workspace_id}/datapipelines/pipelineruns/"
+        f"{job_id}/queryactivityruns"
+    )
+
+
+def _activity_statuses(
+    session: requests.Session,
+    url: str,
+    payload: dict[str, object],
+) -> dict[str, str]:
+    """Return the latest status of each activity that ran in a pipeline job."""
+
+    started = payload.get("startTimeUtc") or _EPOCH
+    response = session.post(
+        url,
+        json={
+            "lastUpdatedAfter": started,
+            "lastUpdatedBefore": (datetime.now(UTC) + timedelta(days=1)).isoformat(),
+            "orderBy": [{"orderBy": "ActivityRunStart", "order": "ASC"}],
+        },
+    )
+    response.raise_for_status()
+    statuses: dict[str, str] = {}
+    for run in response.json().get("value", []):
+        name = run.get("activityName")
+        if name:
+            # Ordered by start, so a re-run (e.g. inside ForEach) wins.
+            statuses[str(name)] = str(run.get("status"))
+    return statuses
 
 
 def list_pipeline_runs(
@@ -207,11 +366,16 @@ def _parse_job_time(value: object) -> datetime | None:
 
 
 def main() -> int:
-    """Start an on-demand run of a named Fabric pipeline."""
+    """Start on-demand runs of named Fabric pipelines, optionally waiting on all."""
 
     parser = argparse.ArgumentParser(description="Run a Fabric Data Pipeline on demand")
     parser.add_argument("--environment", required=True)
-    parser.add_argument("--pipeline", required=True, help="Pipeline display name.")
+    parser.add_argument(
+        "--pipeline",
+        required=True,
+        action="append",
+        help="Pipeline display name; repeat to start and watch several runs at once.",
+    )
     parser.add_argument(
         "--auth-mode",
         choices=AUTH_MODES,
@@ -225,19 +389,25 @@ def main() -> int:
     parser.add_argument(
         "--wait",
         action="store_true",
-        help="Wait for the exact started run to reach terminal success.",
+        help="Wait for the exact started runs to reach terminal success.",
     )
     parser.add_argument(
         "--timeout-seconds",
         type=float,
-        default=21600,
+        default=DEFAULT_TIMEOUT_SECONDS,
         help="Maximum wait for a terminal pipeline state.",
     )
     parser.add_argument(
         "--poll-interval-seconds",
         type=float,
-        default=15,
-        help="Delay between job-instance status requests.",
+        default=DEFAULT_INITIAL_POLL_SECONDS,
+        help="Initial delay between job-instance status requests.",
+    )
+    parser.add_argument(
+        "--max-poll-interval-seconds",
+        type=float,
+        default=DEFAULT_MAX_POLL_SECONDS,
+        help="Longest delay the poller backs off to while a run is unchanged.",
     )
     args = parser.parse_args()
 
@@ -269,29 +439,50 @@ def main() -> int:
         auth_mode=args.auth_mode or config.auth_mode,
         tenant_id=tenant_id,
     )
-    pipeline_id = find_pipeline_id(session, workspace_id, args.pipeline)
-    location = run_pipeline(session, workspace_id, pipeline_id)
-    console.info(f"Started pipeline run for {args.pipeline!r} ({pipeline_id}).")
-    if location:
-        console.detail(f"Track the run at: {location}")
+    names = list(dict.fromkeys(args.pipeline))
+    pipeline_ids: dict[str, str] = {}
+    locations: dict[str, str] = {}
+    for name in names:
+        pipeline_ids[name] = find_pipeline_id(session, workspace_id, name)
+        location = run_pipeline(session, workspace_id, pipeline_ids[name])
+        console.info(f"Started pipeline run for {name!r} ({pipeline_ids[name]}).")
+        if location:
+            console.detail(f"Track the run at: {location}")
+        locations[name] = location or ""
     if args.wait:
         try:
-            status = wait_for_pipeline_run(
+            payloads = wait_for_pipeline_jobs(
                 session,
-                location or "",
-                pipeline_id=pipeline_id,
+                locations,
+                pipeline_ids=pipeline_ids,
                 timeout_seconds=args.timeout_seconds,
                 poll_interval_seconds=args.poll_interval_seconds,
+                max_poll_interval_seconds=args.max_poll_interval_seconds,
+                on_update=_print_job_update,
+                on_activity=_print_activity_update,
             )
         except PipelineRunError as exc:
             console.error(str(exc))
             return 1
-        console.info(
-            f"Pipeline run for {args.pipeline!r} reached terminal success "
-            f"({status})."
-        )
+        for name, payload in payloads.items():
+            console.info(
+                f"Pipeline run for {name!r} reached terminal success "
+                f"({payload['status']})."
+            )
     return 0
 
 
+def _print_job_update(update: JobUpdate) -> None:
+    if update.previous is not None:
+        console.detail(
+            f"{update.key}: {update.previous} -> {update.status} "
+            f"after {update.elapsed_seconds:.0f}s"
+        )
+
+
+def _print_activity_update(update: ActivityUpdate) -> None:
+    console.detail(f"{update.key} / {update.activity}: {update.status}")
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
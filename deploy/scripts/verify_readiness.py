@@ -14,7 +14,17 @@ import os
 import re
 import struct
 import tempfile
+import threading
 from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import ExitStack
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -41,20 +51,22 @@ from deploy.scripts.fabric_runtime import (
 )
 from deploy.scripts.profile_preflight import selected_notebook_names
 from deploy.scripts.run_pipeline import (
+    DEFAULT_INITIAL_POLL_SECONDS,
     latest_pipeline_run,
     list_pipeline_runs,
     run_pipeline,
-    wait_for_pipeline_job,
+    wait_for_pipeline_jobs,
 )
 
 if TYPE_CHECKING:
-    from azure.core.credentials import TokenCredential
+    from azure.core.credentials import AccessToken, TokenCredential
     from retail_setup.contracts import ResolvedProfile, SolutionManifest
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 REPORT_SCHEMA_VERSION = "1.0.0"
 REPORT_NAME = "readiness-report.json"
 SQL_SCOPE = "https://database.windows.net/.default"
+SQL_DRIVERS = ("ODBC Driver 18 for SQL Server", "ODBC Driver 17 for SQL Server")
 
 CheckStatus = Literal["PASS", "FAIL", "UNKNOWN", "SKIPPED"]
 OverallStatus = Literal["SUCCEEDED", "FAILED", "DEGRADED"]
@@ -63,6 +75,9 @@ _SETUP_MAX_AGE = timedelta(days=7)
 _MODEL_MAX_AGE = timedelta(days=7)
 _STREAM_MAX_AGE = timedelta(minutes=30)
 _FUTURE_SKEW = timedelta(minutes=5)
+_TOKEN_REFRESH_SKEW = timedelta(minutes=5)
+_DEFAULT_MAX_WORKERS = 8
+_PREFETCH_STEP = "definitions.prefetch"
 _CORRELATION_SKEW = timedelta(minutes=5)
 _MAX_EVIDENCE_STRING = 300
 _MAX_EVIDENCE_ITEMS = 25
@@ -174,6 +189,23 @@ class CheckResult:
         }
 
 
+@dataclass(frozen=True)
+class ReadinessStep:
+    """One scheduled check, or an internal prerequisite when ``category`` is None.
+
+    ``definitions`` declares the ``(item_type, display_name)`` definitions the
+    check reads; they are prefetched in parallel before the check runs.
+    """
+
+    key: str
+    function: Callable[[], Any]
+    category: str | None = None
+    selected: bool = True
+    required: bool = False
+    depends_on: tuple[str, ...] = ()
+    definitions: tuple[tuple[str, str], ...] = ()
+
+
 @dataclass
 class ReadinessContext:
     """Resolved local inputs and target identities for one verification."""
@@ -203,13 +235,13 @@ class ReadinessAdapter(Protocol):
 
     def list_pipeline_runs(self, pipeline_id: str) -> list[dict[str, object]]: ...
 
-    def trigger_pipeline(
+    def trigger_pipelines(
         self,
-        pipeline_id: str,
+        pipeline_ids: Sequence[str],
         *,
         timeout_seconds: float,
         poll_interval_seconds: float,
-    ) -> dict[str, object]: ...
+    ) -> dict[str, dict[str, object]]: ...
 
     def setup_signal(self) -> dict[str, Any] | None: ...
 
@@ -925,7 +957,12 @@ def _safe_exception_summary(exc: Exception) -> str:
 
 
 class ReadinessRunner:
-    """Evaluate the fixed readiness taxonomy for one resolved profile."""
+    """Evaluate the fixed readiness taxonomy for one resolved profile.
+
+    Checks are registered with their inputs and dependencies, then run on a
+    bounded thread pool as soon as those dependencies finish. Results keep
+    registration order, so reports do not depend on scheduling.
+    """
 
     def __init__(
         self,
@@ -935,8 +972,11 @@ class ReadinessRunner:
         run_pipeline_requested: bool = False,
         defer_post_ontology: bool = False,
         timeout_seconds: float = 21600,
-        poll_interval_seconds: float = 15,
+        poll_interval_seconds: float = DEFAULT_INITIAL_POLL_SECONDS,
+        max_workers: int = _DEFAULT_MAX_WORKERS,
     ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
         self.context = context
         self.adapter = adapter
         self.profile = context.config.profile
@@ -944,6 +984,7 @@ class ReadinessRunner:
         self.defer_post_ontology = defer_post_ontology
         self.timeout_seconds = timeout_seconds
         self.poll_interval_seconds = poll_interval_seconds
+        self.max_workers = max_workers
         self.checks: list[CheckResult] = []
         self.items: list[dict[str, Any]] = []
         self.item_index: dict[tuple[str, str], dict[str, Any]] = {}
@@ -951,6 +992,10 @@ class ReadinessRunner:
         self.kql_inventory: KqlInventory | None = None
         self.pipeline_evidence: dict[str, dict[str, Any]] = {}
         self.trigger_error: Exception | None = None
+        self._steps: list[ReadinessStep] = []
+        self._definition_errors: dict[str, Exception] = {}
+        self._kql_inventory_error: Exception | None = None
+        self._definitions_lock = threading.Lock()
 
     def run(self) -> list[CheckResult]:
         """Run all 26 checks; unselected capabilities are explicit SKIPPED rows."""
@@ -996,8 +1041,10 @@ class ReadinessRunner:
             function=lambda: self._item_inventory(manual_items),
         )
 
+        trigger_dependencies: tuple[str, ...] = ()
         if self.run_pipeline_requested:
-            self._trigger_profile_pipeline()
+            self._prerequisite("pipeline.trigger", self._trigger_profile_pipeline)
+            trigger_dependencies = ("pipeline.trigger",)
 
         self._check(
             "bindings.notebooks",
@@ -1005,6 +1052,10 @@ class ReadinessRunner:
             selected=bool(self.profile.notebook_groups),
             required=True,
             function=self._notebook_bindings,
+            definitions=[
+                ("Notebook", name)
+                for name in selected_notebook_names(self.profile)
+            ],
         )
         self._check(
             "bindings.pipelines",
@@ -1012,6 +1063,10 @@ class ReadinessRunner:
             selected=bool(self.profile.pipeline_refs),
             required=True,
             function=self._pipeline_bindings,
+            definitions=[
+                ("DataPipeline", Path(reference).stem)
+                for reference in self.profile.pipeline_refs
+            ],
         )
         self._check(
             "bindings.semantic_model",
@@ -1019,6 +1074,9 @@ class ReadinessRunner:
             selected=self.profile.selects("asset.semantic-model"),
             required=True,
             function=self._semantic_model_binding,
+            definitions=[
+                ("SemanticModel", self.context.config.powerbi.semantic_model_name)
+            ],
         )
         self._check(
             "bindings.report",
@@ -1026,6 +1084,7 @@ class ReadinessRunner:
             selected=self.profile.selects("asset.report"),
             required=True,
             function=self._report_binding,
+            definitions=[("Report", self.context.config.powerbi.report_name)],
         )
         self._check(
             "bindings.queryset",
@@ -1033,6 +1092,7 @@ class ReadinessRunner:
             selected=self.profile.selects("asset.kql-queryset"),
             required=True,
             function=self._queryset_binding,
+            definitions=[("KQLQueryset", "retail_querysets")],
         )
         self._check(
             "bindings.data_agents",
@@ -1043,6 +1103,7 @@ class ReadinessRunner:
             ),
             required=False,
             function=self._data_agent_bindings,
+            definitions=[("DataAgent", name) for name in self._data_agent_names()],
         )
         self._check(
             "taskflow.bindings",
@@ -1061,9 +1122,15 @@ class ReadinessRunner:
             selected=bool(self._source_schedule_paths()),
             required=True,
             function=self._schedule_bindings,
+            definitions=[
+                ("DataPipeline", path.parent.stem)
+                for path in self._source_schedule_paths()
+            ],
         )
-        self._run_pipeline_checks()
+        self._run_pipeline_checks(trigger_dependencies)
         self._run_freshness_checks()
+        self._register_definition_prefetch()
+        self._execute_steps()
         validate_readiness_contract(
             self.context.manifest,
             self.profile,
@@ -1084,21 +1151,133 @@ class ReadinessRunner:
         selected: bool,
         required: bool,
         function: Any,
+        depends_on: tuple[str, ...] = (),
+        definitions: list[tuple[str, str]] | None = None,
     ) -> None:
-        if not selected:
-            self.checks.append(
-                CheckResult(
-                    check_id,
-                    category,
-                    selected=False,
-                    required=False,
-                    status="SKIPPED",
-                    summary="Capability is not selected by the resolved profile.",
-                )
+        """Register one reportable check; it runs in :meth:`_execute_steps`."""
+
+        declared = tuple(definitions or ()) if selected else ()
+        dependencies = depends_on if selected else ()
+        if declared:
+            dependencies = (*dependencies, _PREFETCH_STEP)
+        self._steps.append(
+            ReadinessStep(
+                check_id,
+                function,
+                category=category,
+                selected=selected,
+                required=required,
+                depends_on=dependencies,
+                definitions=declared,
+            )
+        )
+
+    def _prerequisite(
+        self,
+        key: str,
+        function: Callable[[], None],
+        *,
+        depends_on: tuple[str, ...] = (),
+    ) -> None:
+        """Register an internal step that produces shared state for checks."""
+
+        self._steps.append(ReadinessStep(key, function, depends_on=depends_on))
+
+    def _register_definition_prefetch(self) -> None:
+        wanted = tuple(
+            dict.fromkeys(
+                key for step in self._steps for key in step.definitions
             )
+        )
+        self._prerequisite(
+            _PREFETCH_STEP,
+            lambda: self._prefetch_definitions(wanted),
+        )
+
+    def _prefetch_definitions(self, wanted: tuple[tuple[str, str], ...]) -> None:
+        item_ids = [
+            str(self.item_index[key].get("id", ""))
+            for key in wanted
+            if key in self.item_index
+        ]
+        pending = [
+            item_id for item_id in dict.fromkeys(item_ids)
+            if item_id and item_id not in self.definitions
+        ]
+        if not pending:
             return
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(pending)),
+            thread_name_prefix="readiness-definition",
+        ) as pool:
+            futures = {
+                pool.submit(self.adapter.get_definition, item_id): item_id
+                for item_id in pending
+            }
+            for future in as_completed(futures):
+                item_id = futures[future]
+                try:
+                    definition = future.result()
+                except Exception as exc:
+                    self._definition_errors[item_id] = exc
+                else:
+                    with self._definitions_lock:
+                        self.definitions[item_id] = definition
+
+    def _execute_steps(self) -> None:
+        steps = {step.key: step for step in self._steps}
+        unknown = {
+            dependency
+            for step in self._steps
+            for dependency in step.depends_on
+        } - steps.keys()
+        if unknown:
+            raise ValueError(
+                f"readiness steps depend on unregistered steps: {sorted(unknown)}"
+            )
+        finished: set[str] = set()
+        results: dict[str, CheckResult] = {}
+        pending = list(self._steps)
+        running: dict[Future[CheckResult | None], ReadinessStep] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="readiness-check",
+        ) as pool:
+            while pending or running:
+                ready = [
+                    step for step in pending if finished.issuperset(step.depends_on)
+                ]
+                for step in ready:
+                    pending.remove(step)
+                    running[pool.submit(self._evaluate, step)] = step
+                if not running:
+                    raise ValueError("readiness step dependencies are cyclic")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step = running.pop(future)
+                    result = future.result()
+                    if result is not None:
+                        results[step.key] = result
+                    finished.add(step.key)
+        self.checks.extend(
+            results[step.key] for step in self._steps if step.key in results
+        )
+
+    def _evaluate(self, step: ReadinessStep) -> CheckResult | None:
+        if step.category is None:
+            step.function()
+            return None
+        if not step.selected:
+            return CheckResult(
+                step.key,
+                step.category,
+                selected=False,
+                required=False,
+                status="SKIPPED",
+                summary="Capability is not selected by the resolved profile.",
+            )
         try:
-            observation = function()
+            observation = step.function()
             if not isinstance(observation, Observation):
                 raise TypeError("check did not return an Observation")
             status: CheckStatus = "PASS"
@@ -1120,17 +1299,15 @@ class ReadinessRunner:
             summary = _safe_exception_summary(exc)
             evidence = {"error_type": type(exc).__name__}
             freshness = None
-        self.checks.append(
-            CheckResult(
-                check_id,
-                category,
-                selected=True,
-                required=required,
-                status=status,
-                summary=summary,
-                evidence=evidence,
-                freshness=freshness,
-            )
+        return CheckResult(
+            step.key,
+            step.category,
+            selected=True,
+            required=step.required,
+            status=status,
+            summary=summary,
+            evidence=evidence,
+            freshness=freshness,
         )
 
     def _target_identities(self) -> Observation:
@@ -1191,9 +1368,27 @@ class ReadinessRunner:
     def _definition(self, item_type: str, display_name: str) -> dict[str, Any]:
         item = self._item(item_type, display_name)
         item_id = str(item.get("id", ""))
-        if item_id not in self.definitions:
-            self.definitions[item_id] = self.adapter.get_definition(item_id)
-        return self.definitions[item_id]
+        if item_id in self._definition_errors:
+            raise self._definition_errors[item_id]
+        with self._definitions_lock:
+            cached = self.definitions.get(item_id)
+        if cached is not None:
+            return cached
+        # Fetch outside the lock so one miss does not stall every other lookup;
+        # two checks racing on the same item at worst fetch it twice.
+        definition = self.adapter.get_definition(item_id)
+        with self._definitions_lock:
+            return self.definitions.setdefault(item_id, definition)
+
+    def _data_agent_names(self) -> list[str]:
+        return [
+            path.stem
+            for path in sorted(
+                (self.context.repo_root / "fabric" / "data-agents").glob(
+                    "*.DataAgent"
+                )
+            )
+        ]
 
     def _notebook_bindings(self) -> Observation:
         errors: list[str] = []
@@ -1324,14 +1519,7 @@ class ReadinessRunner:
         ]
         expected_artifacts.update(str(item.get("id", "")) for item in ontology)
         errors: list[str] = []
-        names = [
-            path.stem
-            for path in sorted(
-                (self.context.repo_root / "fabric" / "data-agents").glob(
-                    "*.DataAgent"
-                )
-            )
-        ]
+        names = self._data_agent_names()
         for name in names:
             errors.extend(
                 f"{name}: {error}"
@@ -1400,6 +1588,13 @@ class ReadinessRunner:
             self.context.repo_root,
             self.profile.kql_scripts,
         )
+        inventory_dependencies: tuple[str, ...] = ()
+        if selected:
+            self._prerequisite(
+                "kql.inventory",
+                lambda: self._load_kql_inventory(expected.tables),
+            )
+            inventory_dependencies = ("kql.inventory",)
         for check_id, attribute in (
             ("kql.tables", "tables"),
             ("kql.functions", "functions"),
@@ -1416,14 +1611,23 @@ class ReadinessRunner:
                     getattr(expected, attribute),
                     expected.tables,
                 ),
+                depends_on=inventory_dependencies,
             )
 
+    def _load_kql_inventory(self, expected_tables: frozenset[str]) -> None:
+        try:
+            self.kql_inventory = self.adapter.get_kql_inventory(expected_tables)
+        except Exception as exc:
+            self._kql_inventory_error = exc
+
     def _kql_set_check(
         self,
         attribute: str,
         expected: frozenset[str],
         expected_tables: frozenset[str],
     ) -> Observation:
+        if self._kql_inventory_error is not None:
+            raise self._kql_inventory_error
         if self.kql_inventory is None:
             self.kql_inventory = self.adapter.get_kql_inventory(expected_tables)
         observed = getattr(self.kql_inventory, attribute)
@@ -1482,18 +1686,19 @@ class ReadinessRunner:
         name = Path(reference).stem
         try:
             item = self._item("DataPipeline", name)
-            payload = self.adapter.trigger_pipeline(
-                str(item.get("id", "")),
+            pipeline_id = str(item.get("id", ""))
+            payload = self.adapter.trigger_pipelines(
+                [pipeline_id],
                 timeout_seconds=self.timeout_seconds,
                 poll_interval_seconds=self.poll_interval_seconds,
-            )
+            )[pipeline_id]
             evidence = normalize_job_evidence(payload)
             validate_terminal_job_evidence(evidence)
             self.pipeline_evidence[name] = evidence
         except Exception as exc:
             self.trigger_error = exc
 
-    def _run_pipeline_checks(self) -> None:
+    def _run_pipeline_checks(self, depends_on: tuple[str, ...] = ()) -> None:
         self._check(
             "pipelines.post_deploy",
             "pipeline",
@@ -1503,6 +1708,7 @@ class ReadinessRunner:
                 self.profile.post_deploy_pipeline_ref,
                 "setup-pipeline-gate",
             ),
+            depends_on=depends_on,
         )
         self._check(
             "pipelines.reporting_gate",
@@ -1513,6 +1719,7 @@ class ReadinessRunner:
                 self.profile.reporting_gate_pipeline_ref,
                 "required-ml-reporting-gate",
             ),
+            depends_on=depends_on,
         )
         self._check(
             "pipelines.post_reporting",
@@ -1520,6 +1727,7 @@ class ReadinessRunner:
             selected=bool(self.profile.post_reporting_pipeline_refs),
             required=False,
             function=self._post_reporting_pipeline_check,
+            depends_on=depends_on,
         )
 
     def _pipeline_check(
@@ -1608,8 +1816,18 @@ class ReadinessRunner:
         return None
 
     def _run_freshness_checks(self) -> None:
-        if not self.context.observed_at_fixed:
-            self.context.observed_at = datetime.now(UTC)
+        # Freshness correlates against pipeline evidence, so the observation
+        # clock starts only after every pipeline check has finished.
+        self._prerequisite(
+            "freshness.observed_at",
+            self._start_freshness_clock,
+            depends_on=(
+                "pipelines.post_deploy",
+                "pipelines.reporting_gate",
+                "pipelines.post_reporting",
+            ),
+        )
+        depends_on = ("freshness.observed_at",)
         streaming = self.profile.selects("asset.stream-events")
         ml_required = "ml-required" in self.profile.notebook_groups
         ml_optional = "ml-optional" in self.profile.notebook_groups
@@ -1620,6 +1838,7 @@ class ReadinessRunner:
             selected="setup" in self.profile.notebook_groups,
             required=True,
             function=self._setup_freshness,
+            depends_on=depends_on,
         )
         self._check(
             "freshness.watermarks",
@@ -1627,6 +1846,7 @@ class ReadinessRunner:
             selected=streaming,
             required=False,
             function=self._watermark_freshness,
+            depends_on=depends_on,
         )
         self._check(
             "freshness.eventhouse_ingestion",
@@ -1634,6 +1854,7 @@ class ReadinessRunner:
             selected=streaming,
             required=False,
             function=self._eventhouse_freshness,
+            depends_on=depends_on,
         )
         self._check(
             "freshness.checkpoint",
@@ -1641,6 +1862,7 @@ class ReadinessRunner:
             selected=streaming,
             required=False,
             function=self._checkpoint_freshness,
+            depends_on=depends_on,
         )
         self._check(
             "freshness.models.required",
@@ -1648,6 +1870,7 @@ class ReadinessRunner:
             selected=ml_required,
             required=True,
             function=lambda: self._model_freshness("required"),
+            depends_on=depends_on,
         )
         self._check(
             "freshness.models.optional",
@@ -1655,6 +1878,7 @@ class ReadinessRunner:
             selected=ml_optional,
             required=False,
             function=lambda: self._model_freshness("optional"),
+            depends_on=depends_on,
         )
         self._check(
             "freshness.models.experimental",
@@ -1662,6 +1886,7 @@ class ReadinessRunner:
             selected=ml_experimental,
             required=False,
             function=lambda: self._model_freshness("experimental"),
+            depends_on=depends_on,
         )
         self._check(
             "freshness.alerts",
@@ -1669,8 +1894,13 @@ class ReadinessRunner:
             selected=self.profile.selects("asset.activator-rules"),
             required=False,
             function=self._alert_freshness,
+            depends_on=depends_on,
         )
 
+    def _start_freshness_clock(self) -> None:
+        if not self.context.observed_at_fixed:
+            self.context.observed_at = datetime.now(UTC)
+
     def _setup_freshness(self) -> Observation:
         signal = self.adapter.setup_signal()
         if not signal:
@@ -1982,8 +2212,53 @@ def checkpoint_signal_from_rows(
     }
 
 
+def kql_inventory_from_schema(
+    schema_rows: list[dict[str, Any]],
+    mapping_rows: list[dict[str, Any]],
+    expected_tables: frozenset[str],
+    *,
+    database_name: str | None = None,
+) -> KqlInventory:
+    """Parse one database-schema and one database-mapping response."""
+
+    databases: dict[str, Any] = {}
+    for row in schema_rows:
+        payload = row.get("DatabaseSchema")
+        if isinstance(payload, str):
+            payload = json.loads(payload)
+        if isinstance(payload, dict):
+            databases.update(payload.get("Databases") or {})
+    if database_name is not None and database_name in databases:
+        databases = {database_name: databases[database_name]}
+    tables: set[str] = set()
+    functions: set[str] = set()
+    materialized_views: set[str] = set()
+    for database in databases.values():
+        tables.update(database.get("Tables") or {})
+        functions.update(database.get("Functions") or {})
+        materialized_views.update(database.get("MaterializedViews") or {})
+    mappings = {
+        f"{row.get('Table')}/{row.get('Name')}"
+        for row in mapping_rows
+        if row.get("Table") in expected_tables
+        and row.get("Name")
+        and str(row.get("Kind", "Json")).lower() == "json"
+    }
+    return KqlInventory(
+        tables=frozenset(tables),
+        functions=frozenset(functions),
+        materialized_views=frozenset(materialized_views),
+        mappings=frozenset(mappings),
+    )
+
+
 class FabricReadinessAdapter:
-    """Real Fabric REST, Kusto, and Lakehouse SQL adapter."""
+    """Real Fabric REST, Kusto, and Lakehouse SQL adapter.
+
+    One Kusto client and one Lakehouse SQL connection are opened lazily and
+    reused for the adapter lifetime; call :meth:`close` (or use the adapter as
+    a context manager) to release them.
+    """
 
     def __init__(
         self,
@@ -2002,6 +2277,31 @@ class FabricReadinessAdapter:
         self.fabric = build_session(self.credential)
         self._query_uri: str | None = None
         self._database_name: str | None = None
+        self._kusto_client: Any | None = None
+        self._sql_server: str | None = None
+        self._sql_driver: str | None = None
+        self._sql_token: AccessToken | None = None
+        self._sql_connection: Any | None = None
+        # Checks run concurrently; lazy setup and the single SQL connection
+        # are serialized, while Kusto queries share one thread-safe client.
+        self._lock = threading.RLock()
+
+    def __enter__(self) -> FabricReadinessAdapter:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the pooled Kusto client and SQL endpoint connection."""
+
+        with self._lock:
+            client, self._kusto_client = self._kusto_client, None
+            connection, self._sql_connection = self._sql_connection, None
+        if client is not None:
+            client.close()
+        if connection is not None:
+            connection.close()
 
     def list_items(self) -> list[dict[str, Any]]:
         return paginated_get(
@@ -2022,39 +2322,21 @@ class FabricReadinessAdapter:
         return taskflow.get_taskflow(pbi, cluster, self.workspace_id)
 
     def get_kql_inventory(self, expected_tables: frozenset[str]) -> KqlInventory:
-        tables = self._names(
-            self._execute_kql(".show tables | project name=TableName", management=True),
-            "name",
-        )
-        functions = self._names(
-            self._execute_kql(
-                ".show functions | project name=Name",
-                management=True,
-            ),
-            "name",
+        _query_uri, database_name = self._resolve_kql()
+        escaped = database_name.replace("'", "\\'")
+        schema_rows = self._execute_kql(
+            ".show database schema as json",
+            management=True,
         )
-        materialized_views = self._names(
-            self._execute_kql(
-                ".show materialized-views | project name=Name",
-                management=True,
-            ),
-            "name",
+        mapping_rows = self._execute_kql(
+            f".show database ['{escaped}'] ingestion json mappings",
+            management=True,
         )
-        mappings: set[str] = set()
-        for table in sorted(expected_tables):
-            rows = self._execute_kql(
-                f".show table {table} ingestion json mappings",
-                management=True,
-            )
-            for row in rows:
-                name = row.get("Name") or row.get("MappingName")
-                if name:
-                    mappings.add(f"{table}/{name}")
-        return KqlInventory(
-            tables=frozenset(tables),
-            functions=frozenset(functions),
-            materialized_views=frozenset(materialized_views),
-            mappings=frozenset(mappings),
+        return kql_inventory_from_schema(
+            schema_rows,
+            mapping_rows,
+            expected_tables,
+            database_name=database_name,
         )
 
     def list_pipeline_runs(self, pipeline_id: str) -> list[dict[str, object]]:
@@ -2064,26 +2346,34 @@ class FabricReadinessAdapter:
             pipeline_id,
         )
 
-    def trigger_pipeline(
+    def trigger_pipelines(
         self,
-        pipeline_id: str,
+        pipeline_ids: Sequence[str],
         *,
         timeout_seconds: float,
         poll_interval_seconds: float,
-    ) -> dict[str, object]:
-        location = run_pipeline(self.fabric, self.workspace_id, pipeline_id)
-        payload = wait_for_pipeline_job(
+    ) -> dict[str, dict[str, object]]:
+        """Start every pipeline, then watch all runs from one polling loop."""
+
+        locations = {
+            pipeline_id: run_pipeline(self.fabric, self.workspace_id, pipeline_id) or ""
+            for pipeline_id in pipeline_ids
+        }
+        payloads = wait_for_pipeline_jobs(
             self.fabric,
-            location or "",
-            pipeline_id=pipeline_id,
+            locations,
+            pipeline_ids={pipeline_id: pipeline_id for pipeline_id in pipeline_ids},
             timeout_seconds=timeout_seconds,
             poll_interval_seconds=poll_interval_seconds,
         )
-        correlated = dict(payload)
-        if not correlated.get("id"):
-            correlated["id"] = (location or "").rstrip("/").rsplit("/", 1)[-1]
-        if not correlated.get("itemId"):
-            correlated["itemId"] = pipeline_id
+        correlated: dict[str, dict[str, object]] = {}
+        for pipeline_id, payload in payloads.items():
+            run = dict(payload)
+            if not run.get("id"):
+                run["id"] = locations[pipeline_id].rstrip("/").rsplit("/", 1)[-1]
+            if not run.get("itemId"):
+                run["itemId"] = pipeline_id
+            correlated[pipeline_id] = run
         return correlated
 
     def setup_signal(self) -> dict[str, Any] | None:
@@ -2210,13 +2500,28 @@ class FabricReadinessAdapter:
         }
 
     def _resolve_kql(self) -> tuple[str, str]:
-        if self._query_uri is None or self._database_name is None:
-            self._query_uri, self._database_name = resolve_kql_database(
-                self.workspace_id,
-                str(self.outputs["kql_database_id"]),
-                self.credential,
-            )
-        return self._query_uri, self._database_name
+        with self._lock:
+            if self._query_uri is None or self._database_name is None:
+                self._query_uri, self._database_name = resolve_kql_database(
+                    self.workspace_id,
+                    str(self.outputs["kql_database_id"]),
+                    self.credential,
+                )
+            return self._query_uri, self._database_name
+
+    def _kusto(self) -> Any:
+        with self._lock:
+            if self._kusto_client is None:
+                from azure.kusto.data import KustoClient, KustoConnectionStringBuilder
+
+                query_uri, _database_name = self._resolve_kql()
+                kcsb = KustoConnectionStringBuilder.with_azure_token_credential(
+                    query_uri,
+                    self.credential,
+                )
+                # The SDK caches the bearer token per client until it expires.
+                self._kusto_client = KustoClient(kcsb)
+            return self._kusto_client
 
     def _execute_kql(
         self,
@@ -2224,24 +2529,50 @@ class FabricReadinessAdapter:
         *,
         management: bool = False,
     ) -> list[dict[str, Any]]:
-        from azure.kusto.data import KustoClient, KustoConnectionStringBuilder
-
-        query_uri, database_name = self._resolve_kql()
-        kcsb = KustoConnectionStringBuilder.with_azure_token_credential(
-            query_uri,
-            self.credential,
-        )
-        with KustoClient(kcsb) as client:
-            response = (
-                client.execute_mgmt(database_name, query)
-                if management
-                else client.execute(database_name, query)
-            )
+        _query_uri, database_name = self._resolve_kql()
+        client = self._kusto()
+        response = (
+            client.execute_mgmt(database_name, query)
+            if management
+            else client.execute(database_name, query)
+        )
         if not response.primary_results:
             return []
         return [row.to_dict() for row in response.primary_results[0]]
 
-    def _execute_sql(self, query: str) -> list[dict[str, Any]]:
+    def _sql_endpoint(self, pyodbc: Any) -> tuple[str, str]:
+        if self._sql_server is None or self._sql_driver is None:
+            response = self.fabric.get(
+                f"{FABRIC_API}/workspaces/{self.workspace_id}/lakehouses/"
+                f"{self.outputs['lakehouse_id']}"
+            )
+            response.raise_for_status()
+            properties = response.json().get("properties", {}).get(
+                "sqlEndpointProperties",
+                {},
+            )
+            server = str(properties.get("connectionString", "")).strip()
+            if not server:
+                raise EvidenceUnknown("Lakehouse SQL endpoint connection is unavailable")
+            installed = set(pyodbc.drivers())
+            driver = next(
+                (candidate for candidate in SQL_DRIVERS if candidate in installed),
+                None,
+            )
+            if driver is None:
+                raise EvidenceUnknown("No supported SQL Server ODBC driver is installed")
+            self._sql_server, self._sql_driver = server, driver
+        return self._sql_server, self._sql_driver
+
+    def _sql_token_fresh(self) -> bool:
+        if self._sql_token is None:
+            return False
+        expires_at = datetime.fromtimestamp(self._sql_token.expires_on, UTC)
+        return datetime.now(UTC) + _TOKEN_REFRESH_SKEW < expires_at
+
+    def _sql(self) -> Any:
+        if self._sql_connection is not None and self._sql_token_fresh():
+            return self._sql_connection
         try:
             import pyodbc
         except ImportError as exc:
@@ -2249,33 +2580,17 @@ class FabricReadinessAdapter:
                 "pyodbc is required for Lakehouse freshness checks"
             ) from exc
 
-        response = self.fabric.get(
-            f"{FABRIC_API}/workspaces/{self.workspace_id}/lakehouses/"
-            f"{self.outputs['lakehouse_id']}"
-        )
-        response.raise_for_status()
-        properties = response.json().get("properties", {}).get(
-            "sqlEndpointProperties",
-            {},
-        )
-        server = str(properties.get("connectionString", "")).strip()
-        if not server:
-            raise EvidenceUnknown("Lakehouse SQL endpoint connection is unavailable")
-        driver = next(
-            (
-                candidate
-                for candidate in (
-                    "ODBC Driver 18 for SQL Server",
-                    "ODBC Driver 17 for SQL Server",
-                )
-                if candidate in pyodbc.drivers()
-            ),
-            None,
-        )
-        if driver is None:
-            raise EvidenceUnknown("No supported SQL Server ODBC driver is installed")
-        token = self.credential.get_token(SQL_SCOPE).token
-        token_bytes = token.encode("utf-16-le")
+        server, driver = self._sql_endpoint(pyodbc)
+        if self._sql_connection is not None:
+            self._sql_connection.close()
+            self._sql_connection = None
+        token = (
+            self._sql_token
+            if self._sql_token is not None and self._sql_token_fresh()
+            else self.credential.get_token(SQL_SCOPE)
+        )
+        self._sql_token = token
+        token_bytes = token.token.encode("utf-16-le")
         access_token = struct.pack(
             f"<I{len(token_bytes)}s",
             len(token_bytes),
@@ -2286,26 +2601,25 @@ class FabricReadinessAdapter:
             f"Database={self.context.config.lakehouse.name};"
             "Encrypt=Yes;TrustServerCertificate=No"
         )
-        with pyodbc.connect(
+        self._sql_connection = pyodbc.connect(
             connection,
             attrs_before={1256: access_token},
             timeout=60,
-        ) as conn:
-            cursor = conn.cursor()
-            cursor.execute(query)
-            columns = [str(column[0]) for column in cursor.description]
-            return [
-                dict(zip(columns, row, strict=True))
-                for row in cursor.fetchall()
-            ]
+        )
+        return self._sql_connection
 
-    @staticmethod
-    def _names(rows: list[dict[str, Any]], key: str) -> set[str]:
-        return {
-            str(row[key])
-            for row in rows
-            if row.get(key) not in (None, "")
-        }
+    def _execute_sql(self, query: str) -> list[dict[str, Any]]:
+        with self._lock:
+            cursor = self._sql().cursor()
+            try:
+                cursor.execute(query)
+                columns = [str(column[0]) for column in cursor.description]
+                return [
+                    dict(zip(columns, row, strict=True))
+                    for row in cursor.fetchall()
+                ]
+            finally:
+                cursor.close()
 
 
 def _identifier(value: Any) -> str:
@@ -2433,7 +2747,8 @@ def verify_environment(
     run_pipeline_requested: bool = False,
     defer_post_ontology: bool = False,
     timeout_seconds: float = 21600,
-    poll_interval_seconds: float = 15,
+    poll_interval_seconds: float = DEFAULT_INITIAL_POLL_SECONDS,
+    max_workers: int = _DEFAULT_MAX_WORKERS,
     adapter: ReadinessAdapter | None = None,
     observed_at: datetime | None = None,
 ) -> tuple[dict[str, Any], Path]:
@@ -2456,15 +2771,17 @@ def verify_environment(
             "--defer-post-ontology is valid only for a profile that selects "
             "the post-ontology Data Agent boundary"
         )
-    live_adapter = adapter or FabricReadinessAdapter(context)
-    checks = ReadinessRunner(
-        context,
-        live_adapter,
-        run_pipeline_requested=run_pipeline_requested,
-        defer_post_ontology=defer_post_ontology,
-        timeout_seconds=timeout_seconds,
-        poll_interval_seconds=poll_interval_seconds,
-    ).run()
+    with ExitStack() as stack:
+        live_adapter = adapter or stack.enter_context(FabricReadinessAdapter(context))
+        checks = ReadinessRunner(
+            context,
+            live_adapter,
+            run_pipeline_requested=run_pipeline_requested,
+            defer_post_ontology=defer_post_ontology,
+            timeout_seconds=timeout_seconds,
+            poll_interval_seconds=poll_interval_seconds,
+            max_workers=max_workers,
+        ).run()
     report = build_report(
         context,
         checks,
@@ -2516,10 +2833,23 @@ def main(argv: list[str] | None = None) -> int:
         ),
     )
     parser.add_argument("--timeout-seconds", type=float, default=21600)
-    parser.add_argument("--poll-interval-seconds", type=float, default=15)
+    parser.add_argument(
+        "--poll-interval-seconds",
+        type=float,
+        default=DEFAULT_INITIAL_POLL_SECONDS,
+        help="Initial pipeline status poll interval; it backs off while unchanged.",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=_DEFAULT_MAX_WORKERS,
+        help="Maximum concurrent checks and definition fetches.",
+    )
     args = parser.parse_args(argv)
     if args.timeout_seconds <= 0 or args.poll_interval_seconds < 0:
         parser.error("timeout must be positive and poll interval non-negative")
+    if args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
     try:
         report, path = verify_environment(
             args.repo_root.resolve(),
@@ -2528,6 +2858,7 @@ def main(argv: list[str] | None = None) -> int:
             defer_post_ontology=args.defer_post_ontology,
             timeout_seconds=args.timeout_seconds,
             poll_interval_seconds=args.poll_interval_seconds,
+            max_workers=args.max_workers,
         )
     except ReadinessUsageError as exc:
         parser.error(str(exc))
@@ -10,7 +10,10 @@ from pathlib import Path
 DEFAULT_REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(DEFAULT_REPO_ROOT / "utility" / "src"))
 
-from retail_setup.contracts import load_repository_manifest  # noqa: E402
+from retail_setup.contracts import (  # noqa: E402
+    load_repository_manifest,
+    source_parse_timings,
+)
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -23,6 +26,11 @@ def main(argv: list[str] | None = None) -> int:
         default=DEFAULT_REPO_ROOT,
         help="Repository root containing contracts/retail-demo.json.",
     )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report per-source parse timings (and cache hits) on stderr.",
+    )
     args = parser.parse_args(argv)
     repo_root = args.repo_root.resolve()
     _manifest, repository = load_repository_manifest(repo_root)
@@ -53,8 +61,30 @@ def main(argv: list[str] | None = None) -> int:
             sort_keys=True,
         )
     )
+    if args.timings:
+        _print_timings(repo_root)
     return 0
 
 
+def _print_timings(repo_root: Path) -> None:
+    timings = source_parse_timings()
+    hits = sum(timing.cached for timing in timings)
+    total = sum(timing.seconds for timing in timings)
+    print(
+        f"{len(timings)} source parses ({hits} cached) in {total * 1000:.1f} ms",
+        file=sys.stderr,
+    )
+    for timing in sorted(timings, key=lambda timing: timing.seconds, reverse=True):
+        path = Path(timing.path)
+        if path.is_relative_to(repo_root):
+            path = path.relative_to(repo_root)
+        print(
+            f"{timing.seconds * 1000:9.2f} ms  "
+            f"{'cached' if timing.cached else 'parsed':6}  "
+            f"{timing.parser}  {path.as_posix()}",
+            file=sys.stderr,
+        )
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
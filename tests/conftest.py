@@ -0,0 +1,14 @@
+"""Shared pytest configuration for the repository-level test suite."""
+
+import pytest
+from retail_setup.contracts.source_cache import use_memory_only_source_cache
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep cached source parses in memory, out of the developer's ~/.cache.
+
+    Some test modules validate the manifest at import time, so this runs before
+    collection rather than as a fixture. Tests that exercise the persistent
+    cache point source_cache.CACHE_DIR_ENV at their own tmp_path.
+    """
+    config.add_cleanup(use_memory_only_source_cache())
@@ -419,3 +419,177 @@ def test_summarize_result_falls_back_without_columns(capsys) -> None:
     apply_kql._summarize_result(table)
 
     assert "KQL applied: 7 command(s)." in capsys.readouterr().out
+
+
+_DIFF_SOURCE = """\
+// header comment
+.execute database script with (ContinueOnErrors=true) <|
+
+.create-merge table receipts (
+    id: string,  // receipt id
+    total: real
+)
+
+.alter table receipts policy streamingingestion enable
+
+.create-or-alter table receipts ingestion json mapping 'EventMapping'
+```
+[
+  {"column":"id","path":"$.payload.id","datatype":"string"},
+  {"column":"total","path":"$.payload.total","datatype":"real"}
+]
+```
+
+.create-or-alter function with (folder = "sales") fn_totals()
+{
+    receipts | summarize sum(total)
+}
+
+.create-or-alter materialized-view mv_totals on table receipts
+{
+    receipts
+    | summarize total = sum(total) by id  // bounded by id
+}
+
+.create-merge table refunds (id: string)
+"""
+
+# Kusto's canonical echo of the same schema, with one function edited.
+_LIVE_SCHEMA = [
+    ".create-merge table receipts (['id']:string, ['total']:real, note:string) "
+    'with (folder = "")',
+    '.create-or-alter table receipts ingestion json mapping "EventMapping" '
+    '\'[{"column":"id","path":"$.payload.id","datatype":"","transform":null},'
+    '{"column":"total","path":"$.payload.total","datatype":"","transform":null}]\'',
+    '.create-or-alter function with (folder = "sales", docstring = "", '
+    'skipvalidation = "true") fn_totals() { receipts | summarize max(total) }',
+    '.create materialized-view with (Folder = "") mv_totals on table receipts '
+    "{ receipts\n| summarize total = sum(total) by id }",
+]
+
+
+def _diff_scripts(tmp_path: Path) -> list[Path]:
+    tmp_path.mkdir(parents=True, exist_ok=True)
+    script = tmp_path / "01-schema.kql"
+    script.write_text(_DIFF_SOURCE, encoding="utf-8")
+    return [script]
+
+
+def test_main_rejects_plan_combined_with_execute(monkeypatch) -> None:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["apply_kql", "--plan", "--execute", "--profile", "standard"],
+    )
+    monkeypatch.setattr(
+        apply_kql,
+        "apply_schema_diff",
+        lambda **_kwargs: pytest.fail("--plan --execute must not apply a diff"),
+    )
+    monkeypatch.setattr(
+        apply_kql,
+        "apply_to_database",
+        lambda **_kwargs: pytest.fail("--plan --execute must not apply a script"),
+    )
+
+    with pytest.raises(SystemExit, match="--plan applies nothing"):
+        apply_kql.main()
+
+
+def test_schema_plan_keeps_only_missing_changed_and_unverifiable_commands(
+    tmp_path: Path,
+) -> None:
+    from deploy.scripts import _kql_schema
+
+    commands = _kql_schema.split_kql_commands(_diff_scripts(tmp_path))
+    changes = _kql_schema.plan_schema_changes(
+        commands, _kql_schema.parse_live_schema(_LIVE_SCHEMA)
+    )
+
+    assert [command.kind for command in commands] == [
+        "table",
+        "policy",
+        "mapping",
+        "function",
+        "materialized-view",
+        "table",
+    ]
+    assert [(change.action, change.command.name) for change in changes] == [
+        ("reapply", "receipts.streamingingestion"),
+        ("alter", "fn_totals"),
+        ("create", "refunds"),
+    ]
+    script = _kql_schema.build_change_script(changes)
+    assert script.startswith(".execute database script with (ThrowOnErrors=true) <|")
+    assert "materialized-view" not in script
+
+
+def test_schema_plan_alters_a_table_missing_a_source_column(tmp_path: Path) -> None:
+    from deploy.scripts import _kql_schema
+
+    commands = _kql_schema.split_kql_commands(_diff_scripts(tmp_path))
+    live = _kql_schema.parse_live_schema(
+        [".create-merge table receipts (id:string)", *_LIVE_SCHEMA[1:]]
+    )
+
+    changes = _kql_schema.plan_schema_changes(commands, live)
+
+    assert ("alter", "receipts") in [
+        (change.action, change.command.name) for change in changes
+    ]
+
+
+def test_repo_kql_source_splits_into_recognised_commands() -> None:
+    from deploy.scripts import _kql_schema
+
+    commands = _kql_schema.split_kql_commands(apply_kql.collect_kql_scripts())
+    live = _kql_schema.parse_live_schema(command.text for command in commands)
+
+    assert commands
+    assert all(command.kind != "command" for command in commands)
+    assert {change.action for change in _kql_schema.plan_schema_changes(commands, live)} <= {
+        "reapply"
+    }
+
+
+def test_apply_schema_diff_plans_before_applying_only_changes(
+    monkeypatch, tmp_path: Path, capsys
+) -> None:
+    monkeypatch.setattr(apply_kql, "_credential", lambda *_a, **_k: object())
+    monkeypatch.setattr(
+        apply_kql,
+        "resolve_kql_database",
+        lambda *_args: ("https://cluster", "retail_kql"),
+    )
+    scripts_run: list[str] = []
+
+    def fake_execute(_query_uri, _database_name, script, _credential):
+        scripts_run.append(script)
+        rows = (
+            [{"DatabaseSchemaScript": row} for row in _LIVE_SCHEMA]
+            if script == apply_kql.LIVE_SCHEMA_COMMAND
+            else [{"Result": "Completed", "CommandText": "", "CommandType": ""}]
+        )
+
+        class _Response:
+            primary_results = [_FakeTable(rows)]
+
+        return _Response()
+
+    monkeypatch.setattr(apply_kql, "execute_database_script", fake_execute)
+    scripts = _diff_scripts(tmp_path)
+
+    planned = apply_kql.apply_schema_diff(
+        scripts=scripts, workspace_id="ws", kql_database_id="db", plan_only=True
+    )
+    assert scripts_run == [apply_kql.LIVE_SCHEMA_COMMAND]
+    output = capsys.readouterr().out
+    assert "1 to create, 1 to alter, 1 to re-apply, 3 unchanged" in output
+    assert "[alter] function fn_totals (01-schema.kql)" in output
+
+    applied = apply_kql.apply_schema_diff(
+        scripts=scripts, workspace_id="ws", kql_database_id="db"
+    )
+    assert applied == planned
+    assert "fn_totals" in scripts_run[-1]
+    assert "mv_totals" not in scripts_run[-1]
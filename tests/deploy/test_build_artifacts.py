@@ -810,3 +810,53 @@ def test_build_workspace_threads_custom_lakehouse_name_to_setup_notebooks(
         assert lh_meta["default_lakehouse_name"] == "custom_lh", (
             f"{name}: expected 'custom_lh', got {lh_meta['default_lakehouse_name']!r}"
         )
+
+
+def test_incremental_build_replaces_only_changed_items(tmp_path: Path) -> None:
+    source_root = tmp_path / "repo"
+    _write_rendered_setup(source_root)
+    output = tmp_path / "workspace"
+    full = build_artifacts.build_workspace(source_root, output, _profile("core"))
+    lakehouse = output / "retail_lakehouse.Lakehouse" / ".platform"
+    lakehouse_before = lakehouse.stat().st_mtime_ns
+    stray = output / "Setup" / "obsolete.Notebook"
+    stray.mkdir()
+    (stray / ".platform").write_text("{}", encoding="utf-8")
+    _write_json(
+        source_root / "utility" / "out" / "setup-01-seed-dictionaries.ipynb",
+        {"metadata": {}, "cells": [{"cell_type": "raw"}], "nbformat": 4},
+    )
+
+    result = build_artifacts.build_workspace(
+        source_root, output, _profile("core"), incremental=True
+    )
+
+    assert len(full.changed_items) == 5
+    assert result.output_dir == output
+    assert result.changed_items == ("Setup/setup-01-seed-dictionaries.Notebook",)
+    assert len(result.unchanged_items) == 4
+    assert result.removed_items == ("Setup/obsolete.Notebook",)
+    assert lakehouse.stat().st_mtime_ns == lakehouse_before
+    assert not stray.exists()
+    assert not (tmp_path / ".workspace.staging").exists()
+    manifest = json.loads((output / build_artifacts.BUILD_MANIFEST).read_text())
+    assert sorted(manifest["items"]) == sorted(
+        result.changed_items + result.unchanged_items
+    )
+    assert result.to_dict()["build"]["changed"] == list(result.changed_items)
+
+
+def test_incremental_build_keeps_output_when_staging_fails(tmp_path: Path) -> None:
+    source_root = tmp_path / "repo"
+    _write_rendered_setup(source_root)
+    output = tmp_path / "workspace"
+    build_artifacts.build_workspace(source_root, output, _profile("core"))
+    (source_root / "utility" / "out" / "setup-01-seed-dictionaries.ipynb").unlink()
+
+    with pytest.raises(FileNotFoundError):
+        build_artifacts.build_workspace(
+            source_root, output, _profile("core"), incremental=True
+        )
+
+    assert (output / "Setup" / "setup-01-seed-dictionaries.Notebook").is_dir()
+    assert not (tmp_path / ".workspace.staging").exists()
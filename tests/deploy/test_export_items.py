@@ -176,3 +176,82 @@ def test_list_items_filters_by_type_and_sorts() -> None:
 
     assert session.params == {"type": "DataAgent"}
     assert [item["displayName"] for item in items] == ["a-agent", "b-agent"]
+
+
+def test_write_item_leaves_unchanged_parts_untouched(tmp_path: Path) -> None:
+    definition = {
+        "parts": [
+            {"path": ".platform", "payload": _b64({"metadata": {"type": "DataAgent"}})},
+            {"path": "Files/Config/data_agent.json", "payload": _b64({"v": 1})},
+        ]
+    }
+    item_dir, written, unchanged = export_items._write_item(
+        tmp_path, "agent", "DataAgent", definition
+    )
+    platform = item_dir / ".platform"
+    platform_mtime = platform.stat().st_mtime_ns
+    definition["parts"][1]["payload"] = _b64({"v": 2})
+
+    _, rewritten, kept = export_items._write_item(
+        tmp_path, "agent", "DataAgent", definition
+    )
+
+    assert (written, unchanged) == (2, 0)
+    assert (rewritten, kept) == (1, 1)
+    assert platform.stat().st_mtime_ns == platform_mtime
+    config = item_dir / "Files/Config/data_agent.json"
+    assert json.loads(config.read_text(encoding="utf-8")) == {"v": 2}
+
+
+def test_export_items_writes_each_item_as_its_definition_arrives(
+    monkeypatch, tmp_path: Path
+) -> None:
+    class _Response:
+        status_code = 200
+        headers: dict[str, str] = {}
+
+        def __init__(self, payload: dict) -> None:
+            self._payload = payload
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict:
+            return self._payload
+
+    class _Session:
+        def request(self, method: str, url: str) -> _Response:
+            item_id = url.rsplit("/", 2)[-2]
+            payload = _b64({"pipeline": item_id})
+            return _Response(
+                {"definition": {"parts": [{"path": "pipeline-content.json", "payload": payload}]}}
+            )
+
+    monkeypatch.setattr(export_items, "build_session", lambda *a, **k: _Session())
+    monkeypatch.setattr(export_items, "find_workspace_id", lambda *_a: "ws")
+    monkeypatch.setattr(
+        export_items,
+        "list_items",
+        lambda *_a: [
+            {"id": "b-id", "displayName": "alpha"},
+            {"id": "a-id", "displayName": "beta"},
+        ],
+    )
+    tally = export_items.ExportTally()
+
+    written = export_items.export_items(
+        "Retail Demo", "DataPipeline", tmp_path, on_written=tally
+    )
+
+    assert [path.name for path in written] == [
+        "alpha.DataPipeline",
+        "beta.DataPipeline",
+    ]
+    content = json.loads(
+        (tmp_path / "beta.DataPipeline" / "pipeline-content.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    assert content == {"pipeline": "a-id"}
+    assert (tally.items, tally.written_files, tally.unchanged_files) == (2, 2, 0)
+    assert "items/s" in tally.summary()
@@ -0,0 +1,165 @@
+"""Tests for the shared adaptive job poller."""
+
+from __future__ import annotations
+
+import pytest
+
+from deploy.scripts._job_poll import (
+    JobState,
+    PollSchedule,
+    PollTimeout,
+    poll_jobs,
+)
+
+
+class _Clock:
+    """A fake monotonic clock that only advances when the poller sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _scripted(clock: _Clock, states: list[JobState], calls: list[float]):
+    remaining = list(states)
+
+    def probe() -> JobState:
+        calls.append(clock.now)
+        return remaining.pop(0)
+
+    return probe
+
+
+RUNNING = JobState("InProgress")
+
+
+def test_schedule_grows_geometrically_up_to_its_cap() -> None:
+    schedule = PollSchedule(initial_seconds=2, max_seconds=10, growth=2)
+
+    assert [schedule.interval(n) for n in range(5)] == [2, 4, 8, 10, 10]
+    assert schedule.interval(10_000) == 10
+    with pytest.raises(ValueError, match="initial_seconds <= max_seconds"):
+        PollSchedule(initial_seconds=5, max_seconds=1)
+
+
+def test_unchanged_job_backs_off_and_a_change_resets_the_interval() -> None:
+    clock = _Clock()
+    calls: list[float] = []
+    states = [
+        RUNNING,
+        RUNNING,
+        RUNNING,
+        JobState("InProgress", activities={"load": "InProgress"}),
+        JobState("Completed", payload="done", terminal=True),
+    ]
+
+    results = poll_jobs(
+        {"setup": _scripted(clock, states, calls)},
+        timeout_seconds=600,
+        schedule=PollSchedule(initial_seconds=1, max_seconds=60, growth=2),
+        sleep=clock.sleep,
+        clock=clock,
+    )
+
+    assert results["setup"].payload == "done"
+    # Waits of 1, 2, 4 while unchanged, then 1 again after the activity moved.
+    assert calls == [0, 1, 3, 7, 8]
+
+
+def test_several_jobs_share_one_loop_and_stream_transitions() -> None:
+    clock = _Clock()
+    calls: dict[str, list[float]] = {"setup": [], "streaming": []}
+    probes = {
+        "setup": _scripted(
+            clock,
+            [
+                JobState("NotStarted"),
+                JobState("InProgress", activities={"dims": "InProgress"}),
+                JobState(
+                    "Completed",
+                    terminal=True,
+                    activities={"dims": "Succeeded"},
+                ),
+            ],
+            calls["setup"],
+        ),
+        "streaming": _scripted(
+            clock,
+            [RUNNING, JobState("Completed", terminal=True)],
+            calls["streaming"],
+        ),
+    }
+    statuses: list[tuple[object, str | None, str]] = []
+    activities: list[tuple[object, str, str]] = []
+
+    results = poll_jobs(
+        probes,
+        timeout_seconds=600,
+        schedule=PollSchedule(initial_seconds=5, max_seconds=5),
+        on_update=lambda u: statuses.append((u.key, u.previous, u.status)),
+        on_activity=lambda u: activities.append((u.key, u.activity, u.status)),
+        sleep=clock.sleep,
+        clock=clock,
+    )
+
+    assert list(results) == ["setup", "streaming"]
+    assert calls == {"setup": [0, 5, 10], "streaming": [0, 5]}
+    assert statuses == [
+        ("setup", None, "NotStarted"),
+        ("streaming", None, "InProgress"),
+        ("setup", "NotStarted", "InProgress"),
+        ("streaming", "InProgress", "Completed"),
+        ("setup", "InProgress", "Completed"),
+    ]
+    assert activities == [
+        ("setup", "dims", "InProgress"),
+        ("setup", "dims", "Succeeded"),
+    ]
+
+
+def test_a_failed_job_ends_the_wait_without_the_slow_sibling() -> None:
+    clock = _Clock()
+    slow_calls: list[float] = []
+    probes = {
+        "slow": _scripted(clock, [RUNNING] * 10, slow_calls),
+        "ml": _scripted(
+            clock,
+            [RUNNING, JobState("Failed", terminal=True, failed=True)],
+            [],
+        ),
+    }
+
+    results = poll_jobs(
+        probes,
+        timeout_seconds=600,
+        schedule=PollSchedule(initial_seconds=5, max_seconds=5),
+        sleep=clock.sleep,
+        clock=clock,
+    )
+
+    assert list(results) == ["ml"]
+    assert results["ml"].failed
+    assert len(slow_calls) == 2
+
+
+def test_jobs_still_running_at_the_deadline_time_out() -> None:
+    clock = _Clock()
+    calls: list[float] = []
+
+    with pytest.raises(PollTimeout, match="setup") as raised:
+        poll_jobs(
+            {"setup": _scripted(clock, [RUNNING] * 10, calls)},
+            timeout_seconds=10,
+            schedule=PollSchedule(initial_seconds=4, max_seconds=4),
+            sleep=clock.sleep,
+            clock=clock,
+        )
+
+    assert raised.value.pending == ["setup"]
+    # The last probe lands on the deadline instead of sleeping past it.
+    assert calls == [0, 4, 8, 10]
@@ -0,0 +1,193 @@
+"""Tests for the shared Fabric long-running-operation poller."""
+
+from __future__ import annotations
+
+import base64
+import json
+import threading
+
+import pytest
+
+from deploy.scripts import export_items
+from deploy.scripts._lro import (
+    OperationTimeout,
+    Pending,
+    Throttled,
+    run_operations,
+)
+
+
+class _Clock:
+    """A fake monotonic clock that only advances when the poller sleeps."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def _scripted(clock: _Clock, steps: list[object], calls: list[float]):
+    remaining = list(steps)
+
+    def step() -> object:
+        calls.append(clock.now)
+        outcome = remaining.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+    return step
+
+
+def test_operations_wait_for_the_slowest_retry_after_not_their_sum() -> None:
+    clock = _Clock()
+    calls: dict[str, list[float]] = {"a": [], "b": [], "c": []}
+    operations = {
+        "a": _scripted(clock, [Pending(5), "A"], calls["a"]),
+        "b": _scripted(clock, [Pending(3), Pending(3), "B"], calls["b"]),
+        "c": _scripted(clock, ["C"], calls["c"]),
+    }
+    progress: list[tuple[object, str]] = []
+
+    results = run_operations(
+        operations,
+        sleep=clock.sleep,
+        clock=clock,
+        on_progress=lambda event: progress.append((event.key, event.state)),
+    )
+
+    assert list(results.items()) == [("a", "A"), ("b", "B"), ("c", "C")]
+    assert calls == {"a": [0, 5], "b": [0, 3, 6], "c": [0]}
+    assert clock.now == 6
+    assert progress.count(("a", "succeeded")) == 1
+    assert progress.count(("b", "pending")) == 2
+
+
+def test_throttling_pauses_every_operation_until_retry_after() -> None:
+    clock = _Clock()
+    calls: dict[str, list[float]] = {"a": [], "b": []}
+    operations = {
+        "a": _scripted(clock, [Throttled(4), "A"], calls["a"]),
+        "b": _scripted(clock, [Pending(1), "B"], calls["b"]),
+    }
+
+    results = run_operations(operations, sleep=clock.sleep, clock=clock)
+
+    assert results == {"a": "A", "b": "B"}
+    assert calls == {"a": [0, 4], "b": [0, 4]}
+
+
+def test_in_flight_requests_never_exceed_the_budget() -> None:
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+    release = threading.Barrier(2)
+
+    def step() -> str:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        release.wait(timeout=5)
+        with lock:
+            active["now"] -= 1
+        return "done"
+
+    results = run_operations({index: step for index in range(6)}, max_in_flight=2)
+
+    assert results == dict.fromkeys(range(6), "done")
+    assert active["peak"] == 2
+
+
+def test_operation_still_pending_after_its_poll_budget_times_out() -> None:
+    clock = _Clock()
+
+    with pytest.raises(OperationTimeout, match="did not complete for item-1"):
+        run_operations(
+            {"item-1": lambda: Pending(0)},
+            max_polls=2,
+            sleep=clock.sleep,
+            clock=clock,
+        )
+
+
+class _Response:
+    def __init__(
+        self, status_code: int, payload: object, headers: dict[str, str] | None = None
+    ) -> None:
+        self.status_code = status_code
+        self._payload = payload
+        self.headers = headers or {}
+        self.text = json.dumps(payload)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self) -> object:
+        return self._payload
+
+
+class _Session:
+    def __init__(self, responses: dict[tuple[str, str], list[_Response]]) -> None:
+        self._responses = responses
+        self._lock = threading.Lock()
+        self.calls: list[tuple[str, str]] = []
+
+    def request(self, method: str, url: str) -> _Response:
+        with self._lock:
+            self.calls.append((method, url))
+            return self._responses[(method, url)].pop(0)
+
+    def get(self, url: str) -> _Response:
+        return self.request("GET", url)
+
+
+def _definition(name: str) -> dict:
+    payload = base64.b64encode(name.encode("utf-8")).decode("ascii")
+    return {"definition": {"parts": [{"path": "x", "payload": payload}]}}
+
+
+def test_get_definitions_follows_each_items_operation() -> None:
+    items = f"{export_items.FABRIC_API}/workspaces/ws/items"
+    operation = "https://api.fabric.microsoft.com/v1/operations/op-b"
+    session = _Session(
+        {
+            ("POST", f"{items}/a/getDefinition"): [_Response(200, _definition("a"))],
+            ("POST", f"{items}/b/getDefinition"): [
+                _Response(202, {}, {"Location": operation, "Retry-After": "0"})
+            ],
+            ("GET", operation): [
+                _Response(200, {"status": "Running"}, {"Retry-After": "0"}),
+                _Response(429, {}, {"Retry-After": "0"}),
+                _Response(200, {"status": "Succeeded"}),
+            ],
+            ("GET", f"{operation}/result"): [_Response(200, _definition("b"))],
+        }
+    )
+
+    definitions = export_items.get_definitions(session, "ws", ["a", "b"])
+
+    assert definitions == {
+        "a": _definition("a")["definition"],
+        "b": _definition("b")["definition"],
+    }
+    assert session.calls.count(("GET", operation)) == 3
+
+
+def test_get_definition_surfaces_a_failed_operation() -> None:
+    items = f"{export_items.FABRIC_API}/workspaces/ws/items"
+    operation = "https://api.fabric.microsoft.com/v1/operations/op-a"
+    session = _Session(
+        {
+            ("POST", f"{items}/a/getDefinition"): [
+                _Response(202, {}, {"Location": operation, "Retry-After": "0"})
+            ],
+            ("GET", operation): [_Response(200, {"status": "Failed"})],
+        }
+    )
+
+    with pytest.raises(RuntimeError, match="getDefinition Failed"):
+        export_items.get_definition(session, "ws", "a")
@@ -23,3 +23,30 @@ def test_warn_and_error_go_to_stderr(capsys) -> None:
     assert captured.out == ""
     assert "! careful" in captured.err
     assert "ERROR: broke" in captured.err
+
+
+def test_retry_summary_lists_only_endpoints_that_retried(capsys) -> None:
+    from deploy.scripts._retry import EndpointStats
+
+    console.retry_summary(
+        {
+            "api.powerbi.com": EndpointStats(calls=4),
+            "api.fabric.microsoft.com": EndpointStats(
+                calls=9, retries=3, throttled=2, waited_seconds=12.5, circuit_opened=1
+            ),
+        }
+    )
+
+    assert capsys.readouterr().out == (
+        "    - Retry summary\n"
+        "        api.fabric.microsoft.com: 9 call(s), 3 retried (2 throttled), "
+        "0 failed, 12.5s waiting, circuit opened 1x\n"
+    )
+
+
+def test_retry_summary_is_silent_for_a_clean_deploy(capsys) -> None:
+    from deploy.scripts._retry import EndpointStats
+
+    console.retry_summary({"api.fabric.microsoft.com": EndpointStats(calls=5)})
+
+    assert capsys.readouterr().out == ""
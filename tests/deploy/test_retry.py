@@ -2,9 +2,23 @@
 
 from __future__ import annotations
 
+import json
+import random
+
 import pytest
 
-from deploy.scripts._retry import retry_call
+from deploy.scripts import _retry
+from deploy.scripts._retry import (
+    AUTH,
+    FATAL,
+    THROTTLED,
+    TRANSIENT,
+    CircuitOpenError,
+    RetryPolicy,
+    TokenBucket,
+    classify_error,
+    retry_call,
+)
 
 
 class _Boom(Exception):
@@ -72,3 +86,206 @@ def test_does_not_retry_unlisted_exceptions() -> None:
 def test_rejects_zero_attempts() -> None:
     with pytest.raises(ValueError):
         retry_call(lambda: 1, attempts=0)
+
+
+class _HttpError(Exception):
+    def __init__(self, status: int, retry_after: str | None = None) -> None:
+        super().__init__(f"HTTP {status}")
+        headers = {"Retry-After": retry_after} if retry_after else {}
+        self.response = type("Response", (), {"status_code": status, "headers": headers})()
+
+
+class ClientAuthenticationError(Exception):
+    """Stands in for the azure-core class, matched by name."""
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def _isolated_metrics(monkeypatch) -> None:
+    monkeypatch.setattr(_retry, "_metrics", {})
+    monkeypatch.delenv(_retry.RETRY_METRICS_ENV, raising=False)
+
+
+@pytest.mark.parametrize(
+    ("exc", "kind", "retry_after"),
+    [
+        (_HttpError(429, "7"), THROTTLED, 7.0),
+        (_HttpError(503), "unavailable", None),
+        (_HttpError(502), TRANSIENT, None),
+        (_HttpError(404), FATAL, None),
+        (ClientAuthenticationError("cold az"), AUTH, None),
+        (ConnectionResetError("dropped"), TRANSIENT, None),
+        (ValueError("bug"), FATAL, None),
+    ],
+)
+def test_classify_error(exc: BaseException, kind: str, retry_after: float | None) -> None:
+    decision = classify_error(exc)
+
+    assert decision.kind == kind
+    assert decision.retry_after == retry_after
+    assert decision.retryable is (kind != FATAL)
+
+
+def test_policy_honors_retry_after_and_records_endpoint_metrics() -> None:
+    clock = _Clock()
+    failures = [_HttpError(429, "30"), _HttpError(502)]
+
+    def flaky() -> str:
+        if failures:
+            raise failures.pop(0)
+        return "ok"
+
+    policy = RetryPolicy(
+        base_delay=1.0, sleep=clock.sleep, clock=clock, rng=random.Random(0)
+    )
+    waits: list[float] = []
+
+    result = policy.call(
+        flaky,
+        endpoint="https://api.fabric.microsoft.com/v1/workspaces",
+        on_retry=lambda _n, _exc, wait: waits.append(wait),
+    )
+
+    assert result == "ok"
+    assert waits[0] >= 30
+    assert 1.0 <= waits[1] <= 90
+    stats = _retry.retry_metrics()["api.fabric.microsoft.com"]
+    assert (stats.calls, stats.retries, stats.throttled, stats.failures) == (3, 2, 1, 0)
+
+
+def test_policy_raises_non_retryable_errors_immediately() -> None:
+    calls = {"n": 0}
+
+    def missing() -> None:
+        calls["n"] += 1
+        raise _HttpError(404)
+
+    policy = RetryPolicy(sleep=lambda _w: pytest.fail("must not wait"))
+
+    with pytest.raises(_HttpError):
+        policy.call(missing, endpoint="https://api.fabric.microsoft.com/v1/items")
+    assert calls["n"] == 1
+    assert not policy.breaker("api.fabric.microsoft.com").is_open
+
+
+def test_circuit_opens_after_repeated_failures_then_probes_after_cooldown() -> None:
+    clock = _Clock()
+    calls = {"n": 0}
+
+    def down() -> None:
+        calls["n"] += 1
+        raise _HttpError(503)
+
+    policy = RetryPolicy(
+        attempts=2,
+        failure_threshold=3,
+        reset_seconds=60,
+        sleep=clock.sleep,
+        clock=clock,
+    )
+    endpoint = "https://api.powerbi.com/metadata"
+    for _ in range(2):
+        with pytest.raises((_HttpError, CircuitOpenError)):
+            policy.call(down, endpoint=endpoint)
+
+    assert calls["n"] == 3
+    with pytest.raises(CircuitOpenError, match="api.powerbi.com"):
+        policy.call(down, endpoint=endpoint)
+    assert calls["n"] == 3
+
+    clock.now += 60
+    assert policy.call(lambda: "up", endpoint=endpoint) == "up"
+    assert not policy.breaker(endpoint).is_open
+    assert _retry.retry_metrics()["api.powerbi.com"].circuit_opened == 1
+
+
+def test_fatal_half_open_probe_releases_the_circuit() -> None:
+    clock = _Clock()
+    policy = RetryPolicy(
+        attempts=1,
+        failure_threshold=2,
+        reset_seconds=10,
+        sleep=clock.sleep,
+        clock=clock,
+    )
+    endpoint = "https://api.fabric.microsoft.com/v1/items"
+
+    def status(code: int):
+        def call() -> None:
+            raise _HttpError(code)
+
+        return call
+
+    for _ in range(2):
+        with pytest.raises(_HttpError):
+            policy.call(status(503), endpoint=endpoint)
+    assert policy.breaker(endpoint).is_open
+
+    clock.now = 20
+    with pytest.raises(_HttpError):
+        policy.call(status(404), endpoint=endpoint)
+
+    clock.now = 1000
+    assert policy.call(lambda: "up", endpoint=endpoint) == "up"
+    assert not policy.breaker(endpoint).is_open
+
+
+def test_interrupted_half_open_probe_releases_the_circuit() -> None:
+    clock = _Clock()
+    policy = RetryPolicy(
+        attempts=1,
+        failure_threshold=1,
+        reset_seconds=10,
+        sleep=clock.sleep,
+        clock=clock,
+    )
+    endpoint = "https://api.fabric.microsoft.com/v1/items"
+
+    def down() -> None:
+        raise _HttpError(503)
+
+    def interrupted() -> None:
+        raise KeyboardInterrupt
+
+    with pytest.raises(_HttpError):
+        policy.call(down, endpoint=endpoint)
+    clock.now = 20
+    with pytest.raises(KeyboardInterrupt):
+        policy.call(interrupted, endpoint=endpoint)
+
+    assert policy.call(lambda: "up", endpoint=endpoint) == "up"
+    assert not policy.breaker(endpoint).is_open
+
+
+def test_token_bucket_paces_requests_beyond_the_burst() -> None:
+    clock = _Clock()
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.5, 1.0]
+    clock.now += 1.5
+    assert bucket.reserve() == 0.0
+
+
+def test_metrics_flush_and_merge_across_processes(tmp_path) -> None:
+    path = tmp_path / "retry-metrics.jsonl"
+    _retry.record_throttle("https://api.fabric.microsoft.com/v1/operations/1", 4.0)
+    _retry.flush_retry_metrics(path)
+    _retry.record_throttle("https://api.fabric.microsoft.com/v1/operations/2", 2.0)
+    _retry.flush_retry_metrics(path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[0])["endpoint"] == "api.fabric.microsoft.com"
+    merged = _retry.load_retry_metrics(lines)["api.fabric.microsoft.com"]
+    assert (merged.retries, merged.throttled, merged.waited_seconds) == (2, 2, 6.0)
+    assert _retry.retry_metrics() == {}
@@ -9,7 +9,7 @@ from pathlib import Path
 
 import pytest
 
-from deploy.scripts import run_pipeline
+from deploy.scripts import _job_poll, run_pipeline
 
 TENANT_ID = "aaaaaaaa-aaaa-4aaa-8aaa-aaaaaaaaaaaa"
 
@@ -134,11 +134,11 @@ def test_main_passes_selected_auth_mode_to_session(monkeypatch) -> None:
         lambda *_args: "https://api.fabric.microsoft.com/v1/jobs/instances/run-id",
     )
 
-    def fake_wait(_session, _location, **kwargs):
-        calls["pipeline_id"] = str(kwargs["pipeline_id"])
-        return "Completed"
+    def fake_wait(_session, locations, **kwargs):
+        calls["pipeline_id"] = str(kwargs["pipeline_ids"]["setup-pipeline"])
+        return {name: {"status": "Completed"} for name in locations}
 
-    monkeypatch.setattr(run_pipeline, "wait_for_pipeline_run", fake_wait)
+    monkeypatch.setattr(run_pipeline, "wait_for_pipeline_jobs", fake_wait)
 
     try:
         result = run_pipeline.main()
@@ -193,7 +193,7 @@ def test_wait_for_pipeline_run_rejects_missing_current_run_location() -> None:
 
 def test_wait_for_pipeline_run_times_out_in_progress(monkeypatch) -> None:
     times = iter([10.0, 12.0])
-    monkeypatch.setattr(run_pipeline.time, "monotonic", lambda: next(times))
+    monkeypatch.setattr(_job_poll.time, "monotonic", lambda: next(times))
     session = _StatusSession(["InProgress"])
 
     with pytest.raises(run_pipeline.PipelineRunError, match="did not complete"):
@@ -238,3 +238,83 @@ def test_wait_for_pipeline_job_rejects_mismatched_location_correlation() -> None
             timeout_seconds=1,
             poll_interval_seconds=0,
         )
+
+
+def test_wait_for_pipeline_jobs_streams_activities_and_fails_fast() -> None:
+    base = "https://api.fabric.microsoft.com/v1/workspaces/ws/items"
+    setup = f"{base}/setup-id/jobs/instances/setup-run"
+    ml = f"{base}/ml-id/jobs/instances/ml-run"
+    statuses = {
+        setup: iter(["InProgress"] * 10),
+        ml: iter(["InProgress", "Failed"]),
+    }
+    activity_runs = {
+        "setup-run": iter(
+            [[{"activityName": "dims", "status": "InProgress"}]] * 10
+        ),
+        "ml-run": iter(
+            [
+                [{"activityName": "train", "status": "InProgress"}],
+                [{"activityName": "train", "status": "Failed"}],
+            ]
+        ),
+    }
+
+    class _Response:
+        def __init__(self, payload: dict) -> None:
+            self._payload = payload
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict:
+            return self._payload
+
+    class _Session:
+        def get(self, url: str) -> _Response:
+            return _Response({"status": next(statuses[url])})
+
+        def post(self, url: str, json: dict) -> _Response:
+            job_id = url.split("/pipelineruns/", 1)[1].split("/", 1)[0]
+            return _Response({"value": next(activity_runs[job_id])})
+
+    activities: list[tuple[object, str, str]] = []
+
+    with pytest.raises(
+        run_pipeline.PipelineRunError,
+        match="'ml' reached terminal status 'Failed'; still running: 'setup'",
+    ):
+        run_pipeline.wait_for_pipeline_jobs(
+            _Session(),
+            {"setup": setup, "ml": ml},
+            pipeline_ids={"setup": "setup-id", "ml": "ml-id"},
+            poll_interval_seconds=0,
+            on_activity=lambda u: activities.append((u.key, u.activity, u.status)),
+        )
+
+    assert activities == [
+        ("setup", "dims", "InProgress"),
+        ("ml", "train", "InProgress"),
+        ("ml", "train", "Failed"),
+    ]
+
+
+def test_wait_for_pipeline_jobs_timeout_names_the_unfinished_runs() -> None:
+    clock = iter([0.0, 0.0, 5.0])
+    base = "https://api.fabric.microsoft.com/v1/jobs/instances"
+
+    class _Session:
+        def get(self, url: str) -> _StatusResponse:
+            return _StatusResponse("Completed" if url.endswith("setup") else "InProgress")
+
+    with pytest.raises(
+        run_pipeline.PipelineRunError,
+        match=r"run\(s\) 'ml' did not complete within 1 seconds",
+    ):
+        run_pipeline.wait_for_pipeline_jobs(
+            _Session(),
+            {"setup": f"{base}/setup", "ml": f"{base}/ml"},
+            timeout_seconds=1,
+            poll_interval_seconds=0,
+            clock=lambda: next(clock),
+        )
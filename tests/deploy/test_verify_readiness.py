@@ -5,6 +5,8 @@ from __future__ import annotations
 import base64
 import json
 import os
+import sys
+import threading
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from types import SimpleNamespace
@@ -378,6 +380,172 @@ def test_sql_signals_normalize_driver_datetimes_without_credentials() -> None:
     assert watermark["updated_at"] == "2026-07-21T09:58:00+00:00"
 
 
+def test_kql_inventory_is_read_in_two_batched_round_trips() -> None:
+    adapter = object.__new__(FabricReadinessAdapter)
+    adapter._query_uri = "https://cluster.kusto.fabric.microsoft.com"
+    adapter._database_name = "retail_kql"
+    adapter._lock = threading.RLock()
+    schema = {
+        "Databases": {
+            "retail_kql": {
+                "Tables": {"receipt_created": {}, "payment_processed": {}},
+                "Functions": {"fn_truck_sla": {}},
+                "MaterializedViews": {"mv_store_sales_minute": {}},
+            }
+        }
+    }
+    responses = {
+        ".show database schema as json": [{"DatabaseSchema": json.dumps(schema)}],
+        ".show database ['retail_kql'] ingestion json mappings": [
+            {"Name": "EventMapping", "Kind": "Json", "Table": "receipt_created"},
+            {"Name": "EventMapping", "Kind": "Json", "Table": "other_table"},
+        ],
+    }
+    queries: list[str] = []
+
+    def execute(query: str, *, management: bool = False) -> list[dict[str, object]]:
+        assert management
+        queries.append(query)
+        return responses[query]
+
+    adapter._execute_kql = execute  # type: ignore[method-assign]
+
+    inventory = adapter.get_kql_inventory(
+        frozenset({"receipt_created", "payment_processed"})
+    )
+
+    assert len(queries) == 2
+    assert inventory.tables == frozenset({"receipt_created", "payment_processed"})
+    assert inventory.functions == frozenset({"fn_truck_sla"})
+    assert inventory.materialized_views == frozenset({"mv_store_sales_minute"})
+    assert inventory.mappings == frozenset({"receipt_created/EventMapping"})
+
+
+def test_sql_connection_and_token_are_pooled_until_expiry(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    connects: list[str] = []
+    tokens: list[str] = []
+
+    class Cursor:
+        description = (("value",),)
+
+        def execute(self, _query: str) -> None:
+            return None
+
+        def fetchall(self) -> list[tuple[int]]:
+            return [(1,)]
+
+        def close(self) -> None:
+            return None
+
+    class Connection:
+        closed = False
+
+        def cursor(self) -> Cursor:
+            return Cursor()
+
+        def close(self) -> None:
+            self.closed = True
+
+    def connect(connection: str, **_kwargs: object) -> Connection:
+        connects.append(connection)
+        return Connection()
+
+    fake_pyodbc = SimpleNamespace(
+        drivers=lambda: ["ODBC Driver 18 for SQL Server"],
+        connect=connect,
+    )
+    monkeypatch.setitem(sys.modules, "pyodbc", fake_pyodbc)
+    expires_on = [int((datetime.now(UTC) + timedelta(hours=1)).timestamp())]
+
+    class Credential:
+        def get_token(self, scope: str) -> SimpleNamespace:
+            tokens.append(scope)
+            return SimpleNamespace(token="token", expires_on=expires_on[0])
+
+    class Response:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict[str, object]:
+            return {
+                "properties": {
+                    "sqlEndpointProperties": {"connectionString": "sql.fabric"}
+                }
+            }
+
+    lookups: list[str] = []
+    adapter = object.__new__(FabricReadinessAdapter)
+    adapter.workspace_id = WORKSPACE_ID
+    adapter.outputs = {"lakehouse_id": LAKEHOUSE_ID}
+    adapter.context = SimpleNamespace(
+        config=SimpleNamespace(lakehouse=SimpleNamespace(name="retail_lakehouse"))
+    )
+    adapter.credential = Credential()
+    adapter.fabric = SimpleNamespace(
+        get=lambda url: lookups.append(url) or Response()
+    )
+    adapter._kusto_client = None
+    adapter._sql_server = None
+    adapter._sql_driver = None
+    adapter._sql_token = None
+    adapter._sql_connection = None
+    adapter._lock = threading.RLock()
+
+    for _ in range(3):
+        assert adapter._execute_sql("SELECT 1 AS value") == [{"value": 1}]
+    assert (len(lookups), len(tokens), len(connects)) == (1, 1, 1)
+
+    first = adapter._sql_connection
+    expires_on[0] = int((datetime.now(UTC) - timedelta(minutes=1)).timestamp())
+    adapter._sql_token = SimpleNamespace(token="token", expires_on=expires_on[0])
+    adapter._execute_sql("SELECT 1 AS value")
+    assert (len(lookups), len(tokens), len(connects)) == (1, 2, 2)
+    assert first.closed
+
+    adapter.close()
+    assert adapter._sql_connection is None
+
+
+def test_triggered_pipelines_are_watched_by_one_poller(monkeypatch) -> None:
+    started: list[str] = []
+    waits: list[dict[str, object]] = []
+
+    def fake_run(_session, workspace_id: str, pipeline_id: str) -> str:
+        started.append(pipeline_id)
+        return (
+            f"https://api.fabric.microsoft.com/v1/workspaces/{workspace_id}"
+            f"/items/{pipeline_id}/jobs/instances/job-{pipeline_id}"
+        )
+
+    def fake_wait(_session, locations, **kwargs):
+        waits.append({"locations": dict(locations), **kwargs})
+        return {key: {"status": "Completed"} for key in locations}
+
+    monkeypatch.setattr("deploy.scripts.verify_readiness.run_pipeline", fake_run)
+    monkeypatch.setattr(
+        "deploy.scripts.verify_readiness.wait_for_pipeline_jobs", fake_wait
+    )
+    adapter = object.__new__(FabricReadinessAdapter)
+    adapter.fabric = object()
+    adapter.workspace_id = WORKSPACE_ID
+
+    runs = adapter.trigger_pipelines(
+        ["pipe-a", "pipe-b"], timeout_seconds=60, poll_interval_seconds=1
+    )
+
+    assert started == ["pipe-a", "pipe-b"]
+    assert len(waits) == 1
+    assert list(waits[0]["locations"]) == ["pipe-a", "pipe-b"]
+    assert waits[0]["pipeline_ids"] == {"pipe-a": "pipe-a", "pipe-b": "pipe-b"}
+    assert runs["pipe-b"] == {
+        "status": "Completed",
+        "id": "job-pipe-b",
+        "itemId": "pipe-b",
+    }
+
+
 def test_terminal_pipeline_evidence_requires_complete_ordered_timestamps() -> None:
     valid = {
         "id": "job-a",
@@ -635,10 +803,7 @@ class _CoreAdapter:
         raise AssertionError(f"unselected adapter method called: {name}")
 
 
-def test_core_profile_runs_fixed_taxonomy_and_skips_unselected_capabilities(
-    monkeypatch,
-    tmp_path: Path,
-) -> None:
+def _core_context() -> tuple[ReadinessContext, datetime]:
     manifest, validation = load_repository_manifest(REPO_ROOT)
     profile = resolve_profile(manifest, validation, "core")
     now = datetime(2026, 7, 21, 10, 0, tzinfo=UTC)
@@ -682,6 +847,15 @@ def test_core_profile_runs_fixed_taxonomy_and_skips_unselected_capabilities(
         deploy_journal=None,
         observed_at=now,
     )
+    return context, now
+
+
+def test_core_profile_runs_fixed_taxonomy_and_skips_unselected_capabilities(
+    monkeypatch,
+    tmp_path: Path,
+) -> None:
+    context, now = _core_context()
+    profile = context.config.profile
 
     adapter = _CoreAdapter(now)
     checks = ReadinessRunner(context, adapter).run()
@@ -764,6 +938,75 @@ def test_core_profile_runs_fixed_taxonomy_and_skips_unselected_capabilities(
     assert aggregate_status(cleanup_failed) == "FAILED"
 
 
+class _OverlappingDefinitionAdapter(_CoreAdapter):
+    """Each fetch waits until ``parties`` fetches are in flight at once."""
+
+    def __init__(self, now: datetime, parties: int = 1) -> None:
+        super().__init__(now)
+        self.barrier = threading.Barrier(parties, timeout=10)
+        self.fetches: list[str] = []
+        self._lock = threading.Lock()
+
+    def get_definition(self, item_id: str):
+        with self._lock:
+            self.fetches.append(item_id)
+        self.barrier.wait()
+        return super().get_definition(item_id)
+
+
+def test_definitions_are_prefetched_concurrently_with_stable_report_order() -> None:
+    context, now = _core_context()
+    sequential = ReadinessRunner(
+        context, _OverlappingDefinitionAdapter(now), max_workers=1
+    ).run()
+
+    # The barrier only opens once all four notebook fetches are in flight, so
+    # a serial prefetch would break it instead of completing.
+    adapter = _OverlappingDefinitionAdapter(now, parties=4)
+    concurrent = ReadinessRunner(context, adapter, max_workers=8).run()
+
+    assert not adapter.barrier.broken
+    assert [check.to_dict() for check in concurrent] == [
+        check.to_dict() for check in sequential
+    ]
+    assert aggregate_status(concurrent) == aggregate_status(sequential)
+    assert sorted(adapter.fetches) == [f"notebook-{index}" for index in range(4)]
+
+
+def test_definition_miss_does_not_block_other_lookups() -> None:
+    context, now = _core_context()
+    held_during_fetch: list[bool] = []
+
+    class _LockProbeAdapter(_CoreAdapter):
+        def get_definition(self, item_id: str):
+            held_during_fetch.append(runner._definitions_lock.locked())
+            return super().get_definition(item_id)
+
+    adapter = _LockProbeAdapter(now)
+    runner = ReadinessRunner(context, adapter)
+    runner.items = adapter.items
+
+    definition = runner._definition("Notebook", "setup-01-seed-dictionaries")
+
+    assert definition == adapter.definitions["notebook-0"]
+    assert held_during_fetch == [False]
+    assert runner._definition("Notebook", "setup-01-seed-dictionaries") is definition
+
+
+def test_failed_definition_prefetch_is_reported_by_its_check() -> None:
+    context, now = _core_context()
+    adapter = _CoreAdapter(now)
+    adapter.definitions.pop("notebook-2")
+
+    checks = ReadinessRunner(context, adapter).run()
+
+    notebooks = next(
+        check for check in checks if check.check_id == "bindings.notebooks"
+    )
+    assert notebooks.status == "UNKNOWN"
+    assert notebooks.evidence == {"error_type": "KeyError"}
+
+
 def _profile_context(profile_name: str, now: datetime) -> ReadinessContext:
     manifest, validation = load_repository_manifest(REPO_ROOT)
     profile = resolve_profile(manifest, validation, profile_name)
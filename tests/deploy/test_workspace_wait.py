@@ -77,7 +77,8 @@ def test_wait_for_workspace_absence_returns_once_workspace_disappears(
     )
 
     assert calls["n"] == 3
-    assert sleeps == [5, 5]
+    # Re-checks back off while the name is still taken.
+    assert sleeps == [5, 7.5]
 
 
 def test_wait_for_workspace_absence_times_out_when_still_present(monkeypatch) -> None:
@@ -121,6 +121,21 @@ def test_promotion_logic_uses_exact_grain_calendar_and_correct_ols_se() -> None:
     assert "roi_category" not in source
 
 
+def test_elasticity_fit_and_pricing_summary_are_single_pass() -> None:
+    promotion_source = _source("promotion")
+    pricing_source = _source("pricing")
+
+    assert 'F.regr_sxx("log_quantity", "log_price").alias("sxx")' in promotion_source
+    assert 'F.regr_sxy("log_quantity", "log_price").alias("sxy")' in promotion_source
+    assert 'F.regr_syy("log_quantity", "log_price").alias("syy")' in promotion_source
+    assert "price_deviation" not in promotion_source
+    assert "df_elasticity_calc" not in promotion_source
+    assert "df_pricing.count()" not in pricing_source
+    assert ".filter(F.col(\"hit_min_margin\")).count()" not in pricing_source
+    assert ".filter(F.col(\"elasticity_evidence_valid\")).count()" not in pricing_source
+    assert "df_summary_source = spark.table(PRICING_RECOMMENDATIONS_TABLE_NAME)" in pricing_source
+
+
 def test_journey_receipts_require_resolved_identity_and_single_assignment() -> None:
     source = _source("journey")
 
@@ -13,6 +13,9 @@ import pytest
 ROOT = Path(__file__).resolve().parents[1]
 STREAM_TEMPLATE = ROOT / "utility" / "notebooks" / "templates" / "driver-05-stream.py"
 SILVER_NOTEBOOK = ROOT / "fabric" / "lakehouse" / "03-streaming-to-silver.ipynb"
+MIGRATION_NOTEBOOK = (
+    ROOT / "fabric" / "lakehouse" / "90-augment-and-dedupe-receipts.ipynb"
+)
 
 
 def _function(tree: ast.Module, name: str) -> ast.FunctionDef:
@@ -225,3 +228,38 @@ def test_silver_transforms_preserve_contract_trace_id(function_name: str) -> Non
 
     assert function_source is not None
     assert 'F.col("trace_id")' in function_source
+
+
+def test_every_silver_write_derives_the_month_partition() -> None:
+    code = _notebook_code(SILVER_NOTEBOOK)
+    tree = ast.parse(code)
+    sources = {
+        node.name: ast.get_source_segment(code, node) or ""
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef)
+    }
+    writers = {
+        name: source
+        for name, source in sources.items()
+        if "saveAsTable" in source or "MERGE INTO {target_name}" in source
+    }
+
+    assert set(writers) == {"merge_new_rows", "process_truck_lifecycles"}
+    for name, source in writers.items():
+        assert "with_partition_columns(" in source, name
+        assert source.index("with_partition_columns(") < source.index(
+            "saveAsTable"
+        ), name
+
+
+def test_receipt_migration_rewrites_keep_the_month_partition() -> None:
+    code = _notebook_code(MIGRATION_NOTEBOOK)
+    tree = ast.parse(code)
+    overwrite = ast.get_source_segment(code, _function(tree, "overwrite_fact"))
+
+    assert overwrite is not None
+    assert 'partitionBy("event_month")' in overwrite
+    # Every rewrite goes through overwrite_fact: its own definition, its one
+    # saveAsTable and the five table rewrites.
+    assert code.count("saveAsTable") == 1
+    assert code.count("overwrite_fact(") == 6
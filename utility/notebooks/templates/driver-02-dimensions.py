@@ -75,7 +75,12 @@ cfg = GenerationConfig(
     gold_db=GOLD_DB,
     dictionary_root="/lakehouse/default/Files/setup/dictionaries",
 )
-dicts = load_dictionaries(cfg.resolved_dictionary_root, cfg.store_type)
+# The compiled snapshot ("_" prefix: not a store type) skips re-validating
+# the dictionary JSON on every run; it is rebuilt when any source file changes.
+dicts = load_dictionaries(
+    cfg.resolved_dictionary_root, cfg.store_type,
+    cache_dir=cfg.resolved_dictionary_root / "_compiled",
+)
 
 dims = generate_dimensions(spark, dicts, cfg)
 # dim_date is padded ±5 years — the semantic model's date relationships
@@ -76,7 +76,12 @@ cfg = GenerationConfig(
     gold_db=GOLD_DB,
     dictionary_root="/lakehouse/default/Files/setup/dictionaries",
 )
-dicts = load_dictionaries(cfg.resolved_dictionary_root, cfg.store_type)
+# The compiled snapshot ("_" prefix: not a store type) skips re-validating
+# the dictionary JSON on every run; it is rebuilt when any source file changes.
+dicts = load_dictionaries(
+    cfg.resolved_dictionary_root, cfg.store_type,
+    cache_dir=cfg.resolved_dictionary_root / "_compiled",
+)
 
 # Dimensions are regenerated in-memory rather than read back from the
 # catalog: generation is fully deterministic (same seed => identical dims,
@@ -100,6 +105,12 @@ print("all invariants passed")
 # %%
 attempt_ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 run_id = f"setup-{STORE_TYPE}-{SEED}-{attempt_ts}-{uuid4().hex[:8]}"
+# setup-04 reads inventory_state_snapshot whenever it exists, so a run with
+# snapshots off drops the one an earlier run left; it would not match the
+# inventory txns published below.
+if "inventory_state_snapshot" not in result.tables:
+    spark.sql(
+        f"DROP TABLE IF EXISTS {LAKEHOUSE_NAME}.{SILVER_DB}.inventory_state_snapshot")
 # Gold is built in setup-04 from the persisted tables — pass an empty dict.
 written = write_all(result.tables, {}, cfg, run_id, lakehouse=LAKEHOUSE_NAME)
 print(f"wrote {len(written)} tables to {LAKEHOUSE_NAME}.{SILVER_DB} (run_id={run_id})")
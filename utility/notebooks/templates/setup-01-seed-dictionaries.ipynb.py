@@ -52,7 +52,13 @@ REQUIRED = [
 # tags.json is optional per store type — a 404 upstream is tolerated.
 OPTIONAL = [f"{STORE_TYPE}/tags.json"]
 
-if all(mssparkutils.fs.exists(f"{FS_ROOT}/{rel}") for rel in REQUIRED):
+def _present(rel: str) -> bool:
+    # An uploaded scale catalog (products.jsonl) stands in for products.json.
+    streamed = rel.removesuffix(".json") + ".jsonl"
+    return any(mssparkutils.fs.exists(f"{FS_ROOT}/{r}") for r in (rel, streamed))
+
+
+if all(_present(rel) for rel in REQUIRED):
     print(f"All required dictionaries already present under {FS_ROOT} — skipping download.")
 else:
     print(f"Fetching dictionaries from {BASE_URL}")
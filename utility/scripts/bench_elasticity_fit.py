@@ -0,0 +1,142 @@
+"""Compare notebook 10's grouped elasticity fit with the old two-pass fit.
+
+Builds a synthetic product-day sales frame (log-log demand with noise, plus
+one constant-price product), runs the notebook's single-pass ``regr_*`` fit
+and the previous means-joined-back fit, checks that every product's
+coefficient, standard error and R^2 agree, and reports the best wall time of
+each over ``--repeat`` runs.
+
+    python scripts/bench_elasticity_fit.py --products 300 --days 120
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import math
+import random
+import time
+from pathlib import Path
+
+from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import functions as F
+
+NOTEBOOK = (
+    Path(__file__).resolve().parents[2]
+    / "fabric" / "lakehouse" / "10-ml-promotion-effectiveness.ipynb"
+)
+KEYS = ["product_id", "product_name", "product_category"]
+FIT_COLUMNS = ("sxx", "sxy", "syy", "elasticity_coefficient", "standard_error",
+               "r_squared")
+
+
+def daily_sales(spark: SparkSession, products: int, days: int,
+                seed: int = 7) -> DataFrame:
+    """Product-day rows shaped like notebook 10's ``df_daily_sales``."""
+    rng = random.Random(seed)
+    rows = []
+    for p in range(1, products + 1):
+        elasticity = -rng.uniform(0.2, 2.5)
+        # The last product never changes price, so its Sxx is zero; at 1.0 its
+        # log price is exactly 0, so the two-pass mean has no rounding either.
+        constant = p == products
+        base = 1.0 if constant else rng.uniform(1.0, 20.0)
+        for t in range(days):
+            price = base if constant else base * rng.uniform(0.7, 1.1)
+            quantity = max(1.0, round(50 * (price / base) ** elasticity
+                                      * rng.lognormvariate(0, 0.2)))
+            rows.append((p, f"product {p}", f"category {p % 7}", t, quantity,
+                         price, base, math.log(quantity), math.log(price)))
+    return spark.createDataFrame(
+        rows,
+        "product_id long, product_name string, product_category string, "
+        "date int, daily_quantity double, avg_price double, regular_price double, "
+        "log_quantity double, log_price double")
+
+
+def notebook_fit(df_daily_sales: DataFrame) -> DataFrame:
+    """Run the notebook's own fit cells (``df_ols_sums``) on ``df_daily_sales``."""
+    notebook = json.loads(NOTEBOOK.read_text(encoding="utf-8"))
+    code = "\n".join("".join(cell["source"]) for cell in notebook["cells"]
+                     if cell["cell_type"] == "code")
+    wanted = {"elasticity_key_cols", "df_elasticity_stats", "df_ols_sums"}
+    nodes = [node for node in ast.parse(code).body
+             if isinstance(node, ast.Assign)
+             and any(isinstance(t, ast.Name) and t.id in wanted for t in node.targets)]
+    namespace = {"F": F, "df_daily_sales": df_daily_sales}
+    exec(compile(ast.Module(body=nodes, type_ignores=[]), str(NOTEBOOK), "exec"),  # noqa: S102 — repo notebook
+         namespace)
+    return namespace["df_ols_sums"]
+
+
+def two_pass_fit(df_daily_sales: DataFrame) -> DataFrame:
+    """The fit notebook 10 used before: per-product means joined back per row."""
+    means = df_daily_sales.groupBy(*KEYS).agg(
+        F.count("*").alias("n_observations"),
+        F.avg("log_price").alias("mean_log_price"),
+        F.avg("log_quantity").alias("mean_log_quantity"))
+    sums = (
+        df_daily_sales.join(means, KEYS)
+        .withColumn("dp", F.col("log_price") - F.col("mean_log_price"))
+        .withColumn("dq", F.col("log_quantity") - F.col("mean_log_quantity"))
+        .groupBy(*KEYS)
+        .agg(F.first("n_observations").alias("n_observations"),
+             F.sum(F.col("dp") * F.col("dp")).alias("sxx"),
+             F.sum(F.col("dp") * F.col("dq")).alias("sxy"),
+             F.sum(F.col("dq") * F.col("dq")).alias("syy"))
+    )
+    sxx, sxy, syy, n = (F.col(c) for c in ("sxx", "sxy", "syy", "n_observations"))
+    sse = F.greatest(F.lit(0.0), syy - sxy * sxy / sxx)
+    return (
+        sums
+        .withColumn("elasticity_coefficient", F.when(sxx > 0, sxy / sxx))
+        .withColumn("standard_error",
+                    F.when((n > 2) & (sxx > 0), F.sqrt(sse / (n - F.lit(2.0)) / sxx)))
+        .withColumn("r_squared",
+                    F.when((sxx > 0) & (syy > 0), sxy * sxy / (sxx * syy)))
+    )
+
+
+def max_difference(left: DataFrame, right: DataFrame) -> float:
+    """Largest absolute difference in any fit column; NULL must match NULL."""
+    worst = 0.0
+    a = {r["product_id"]: r for r in left.select("product_id", *FIT_COLUMNS).collect()}
+    b = {r["product_id"]: r for r in right.select("product_id", *FIT_COLUMNS).collect()}
+    if a.keys() != b.keys():
+        raise AssertionError("fits cover different products")
+    for key, row in a.items():
+        for name in FIT_COLUMNS:
+            x, y = row[name], b[key][name]
+            if (x is None) != (y is None):
+                raise AssertionError(f"product {key}: {name} {x!r} != {y!r}")
+            if x is not None:
+                worst = max(worst, abs(x - y))
+    return worst
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--products", type=int, default=300)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spark = (SparkSession.builder.master("local[2]")
+             .config("spark.sql.shuffle.partitions", "4").getOrCreate())
+    sales = daily_sales(spark, args.products, args.days).cache()
+    sales.count()
+    print(f"max |grouped - two-pass|: "
+          f"{max_difference(notebook_fit(sales), two_pass_fit(sales)):.3g}")
+    for label, fit in (("two-pass", two_pass_fit), ("grouped", notebook_fit)):
+        timings = []
+        for _ in range(args.repeat):
+            began = time.perf_counter()
+            fit(sales).collect()
+            timings.append(time.perf_counter() - began)
+        print(f"{label}: best {min(timings) * 1000:.1f} ms of {args.repeat}")
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
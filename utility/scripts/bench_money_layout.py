@@ -0,0 +1,83 @@
+"""Compare stored size and scan time of the legacy vs compact money layouts.
+
+Generates a small grocery dataset locally, publishes the MONEY_STRINGS tables
+in both layouts (parquet, path mode) and reports bytes on disk plus the time of
+a revenue scan per layout: ``sum(cast(total_amount as double))`` over the
+legacy strings vs ``sum(total_cents / 100.0)`` over the compact cents.
+
+    python scripts/bench_money_layout.py --stores 5 --days 14
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from pyspark.sql import SparkSession
+from pyspark.sql import functions as F
+
+from retail_setup.config.generation import GenerationConfig
+from retail_setup.dictionaries.loader import default_dictionary_root, load_dictionaries
+from retail_setup.generation.engine import generate_all
+from retail_setup.generation.schemas import MONEY_STRINGS
+from retail_setup.generation.writer import write_all
+
+_SCANS = {
+    "legacy": F.sum(F.col("total_amount").cast("double")),
+    "compact": F.sum(F.col("total_cents") / F.lit(100.0)),
+}
+
+
+def _bytes(root: Path) -> int:
+    return sum(f.stat().st_size for f in root.rglob("*.parquet"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--stores", type=int, default=5)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    spark = (SparkSession.builder.master("local[2]")
+             .config("spark.sql.session.timeZone", "UTC").getOrCreate())
+    start = date(2025, 3, 3)
+    cfg = GenerationConfig(store_type="grocery", start_date=start,
+                           end_date=start + timedelta(days=args.days - 1),
+                           store_count=args.stores, seed=1)
+    tables = {
+        name: df
+        for name, df in generate_all(
+            spark, load_dictionaries(default_dictionary_root(), "grocery"), cfg
+        ).tables.items()
+        if name in MONEY_STRINGS
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        roots = {}
+        for layout in _SCANS:
+            roots[layout] = Path(tmp) / layout
+            write_all(tables, {}, cfg.model_copy(update={"money_layout": layout}),
+                      run_id=f"bench-{layout}", base_path=str(roots[layout]),
+                      fmt="parquet")
+        print(f"{'table':28} {'legacy B':>12} {'compact B':>12} {'ratio':>6}")
+        for name in sorted(tables):
+            legacy = _bytes(roots["legacy"] / cfg.silver_db / name)
+            compact = _bytes(roots["compact"] / cfg.silver_db / name)
+            print(f"{name:28} {legacy:12,} {compact:12,} {compact / legacy:6.2f}")
+        for layout, agg in _SCANS.items():
+            path = str(roots[layout] / cfg.silver_db / "fact_receipts")
+            timings = []
+            for _ in range(args.repeat):
+                began = time.perf_counter()
+                spark.read.parquet(path).agg(agg).collect()
+                timings.append(time.perf_counter() - began)
+            print(f"revenue scan ({layout}): best {min(timings) * 1000:.1f} ms "
+                  f"of {args.repeat}")
+    spark.stop()
+
+
+if __name__ == "__main__":
+    main()
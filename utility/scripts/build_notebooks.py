@@ -11,18 +11,27 @@ concatenation IS the package, one flat namespace).
 Output is nbformat-4 (minor 5) JSON with a python3 kernelspec, written with a
 stable key order and a trailing newline so rebuilds are byte-identical.
 
+Builds are incremental: ``.build-manifest.json`` in the output directory
+records, per notebook, a SHA-256 over its inputs (template, engine modules for
+engine notebooks, and this script) and over the notebook it produced. A
+notebook whose inputs and output still match is skipped, the engine cell is
+assembled at most once and only when an engine notebook needs it, and the
+remaining notebooks render on a small thread pool.
+
 Usage:
-    python scripts/build_notebooks.py [--output-dir DIR] [--check]
+    python scripts/build_notebooks.py [--output-dir DIR] [--check] [--force]
 
-``--check`` rebuilds into a temp dir and byte-diffs against the committed
-notebooks in ``utility/notebooks/``; exits 1 listing any drifted files.
+``--check`` compares the committed notebooks in ``utility/notebooks/`` with
+their inputs by hash, rendering in memory only the notebooks whose recorded
+hashes no longer match; exits 1 listing any drifted files.
 """
 
 import argparse
+import hashlib
 import json
 import re
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 UTILITY = Path(__file__).resolve().parents[1]
@@ -82,6 +91,8 @@ TEMPLATE_FOR = {
 # Notebooks that do NOT embed the batch engine cell (self-contained logic).
 NO_ENGINE = {"setup-01-seed-dictionaries", "stream-events"}
 
+BUILD_MANIFEST = ".build-manifest.json"
+
 _PKG_IMPORT = re.compile(r"^\s*(from retail_setup|import retail_setup)")
 
 
@@ -230,33 +241,114 @@ def notebook_json(nb: dict) -> str:
     return json.dumps(nb, indent=1, ensure_ascii=False) + "\n"
 
 
-def build_all(output_dir: Path) -> dict[str, str]:
-    engine_source = build_engine_source()
+def _sha256(*chunks: bytes) -> str:
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(len(chunk).to_bytes(8, "big"))
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def input_fingerprints() -> dict[str, str]:
+    """Hash each notebook's inputs without assembling or rendering anything."""
+    builder = Path(__file__).read_bytes()
+    engine = _sha256(*((SRC / rel).read_bytes() for rel in ENGINE_MODULES))
+    return {
+        name: _sha256(
+            builder,
+            (TEMPLATES / template).read_bytes(),
+            b"" if name in NO_ENGINE else engine.encode("ascii"),
+        )
+        for name, template in TEMPLATE_FOR.items()
+    }
+
+
+def _load_manifest(output_dir: Path) -> dict[str, dict[str, str]]:
+    try:
+        data = json.loads((output_dir / BUILD_MANIFEST).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    notebooks = data.get("notebooks") if isinstance(data, dict) else None
+    return notebooks if isinstance(notebooks, dict) else {}
+
+
+def _is_current(path: Path, recorded: object, inputs: str) -> bool:
+    if not isinstance(recorded, dict) or recorded.get("inputs") != inputs:
+        return False
+    try:
+        return _sha256(path.read_bytes()) == recorded.get("output")
+    except OSError:
+        return False
+
+
+def render_payloads(names: list[str]) -> dict[str, str]:
+    """Render the named notebooks in memory, in parallel, in input order."""
+    engine_source = (
+        build_engine_source() if any(name not in NO_ENGINE for name in names) else None
+    )
+
+    def render(name: str) -> str:
+        source = None if name in NO_ENGINE else engine_source
+        return notebook_json(render_notebook(TEMPLATES / TEMPLATE_FOR[name], source))
+
+    with ThreadPoolExecutor(max_workers=max(1, min(len(names), 4))) as pool:
+        return dict(zip(names, pool.map(render, names), strict=True))
+
+
+def build_all(output_dir: Path, *, force: bool = False) -> dict[str, str | None]:
+    """Build every notebook; unchanged ones map to ``None`` and are not rewritten."""
+    inputs = input_fingerprints()
+    recorded = {} if force else _load_manifest(output_dir)
+    stale = [
+        name
+        for name in TEMPLATE_FOR
+        if not _is_current(output_dir / f"{name}.ipynb", recorded.get(name), inputs[name])
+    ]
+    payloads = render_payloads(stale) if stale else {}
     output_dir.mkdir(parents=True, exist_ok=True)
-    built: dict[str, str] = {}
-    for name, template in TEMPLATE_FOR.items():
-        needs_engine = name not in NO_ENGINE
-        nb = render_notebook(TEMPLATES / template, engine_source if needs_engine else None)
-        payload = notebook_json(nb)
-        (output_dir / f"{name}.ipynb").write_text(payload, encoding="utf-8", newline="\n")
-        built[name] = payload
-    return built
-
-
-def check() -> int:
-    with tempfile.TemporaryDirectory() as tmp:
-        built = build_all(Path(tmp))
+    manifest: dict[str, dict[str, str]] = {}
+    for name in TEMPLATE_FOR:
+        payload = payloads.get(name)
+        if payload is not None:
+            encoded = payload.encode("utf-8")
+            (output_dir / f"{name}.ipynb").write_bytes(encoded)
+            manifest[name] = {"inputs": inputs[name], "output": _sha256(encoded)}
+        else:
+            manifest[name] = dict(recorded[name])
+    if manifest != recorded:
+        (output_dir / BUILD_MANIFEST).write_text(
+            json.dumps({"notebooks": manifest}, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+            newline="\n",
+        )
+    return {name: payloads.get(name) for name in TEMPLATE_FOR}
+
+
+def check(notebooks_dir: Path = NOTEBOOKS_DIR) -> int:
+    inputs = input_fingerprints()
+    recorded = _load_manifest(notebooks_dir)
+    suspect = [
+        name
+        for name in TEMPLATE_FOR
+        if not _is_current(notebooks_dir / f"{name}.ipynb", recorded.get(name), inputs[name])
+    ]
     drifted = []
-    for name, payload in built.items():
-        committed = NOTEBOOKS_DIR / f"{name}.ipynb"
+    for name, payload in (render_payloads(suspect) if suspect else {}).items():
+        committed = notebooks_dir / f"{name}.ipynb"
         if not committed.exists() or committed.read_text(encoding="utf-8") != payload:
             drifted.append(committed)
     if drifted:
         print("notebook drift detected — re-run `python scripts/build_notebooks.py`:")
         for path in drifted:
-            print(f"  {path.relative_to(UTILITY)}")
+            print(f"  {path.relative_to(UTILITY) if path.is_relative_to(UTILITY) else path}")
         return 1
-    print(f"{len(built)} notebooks in sync")
+    if suspect:
+        print(
+            f"{len(TEMPLATE_FOR)} notebooks in sync "
+            f"(build manifest is stale for {len(suspect)}; re-run the build to refresh it)"
+        )
+    else:
+        print(f"{len(TEMPLATE_FOR)} notebooks in sync")
     return 0
 
 
@@ -265,13 +357,21 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--output-dir", type=Path, default=NOTEBOOKS_DIR,
                         help="directory to write the .ipynb files (default: utility/notebooks)")
     parser.add_argument("--check", action="store_true",
-                        help="rebuild to a temp dir and diff against committed notebooks")
+                        help="compare committed notebooks with their inputs; write nothing")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every notebook, ignoring the build manifest")
     args = parser.parse_args(argv)
     if args.check:
         return check()
-    built = build_all(args.output_dir)
-    for name in built:
-        print(f"built {args.output_dir / f'{name}.ipynb'}")
+    built = build_all(args.output_dir, force=args.force)
+    unchanged = 0
+    for name, payload in built.items():
+        if payload is None:
+            unchanged += 1
+        else:
+            print(f"built {args.output_dir / f'{name}.ipynb'}")
+    if unchanged:
+        print(f"{unchanged} notebook(s) unchanged")
     return 0
 
 
@@ -19,14 +19,30 @@ Tree schema (per store type, see catalogs/*.py):
 Products are "{modifier} {noun}" (optionally "{brand} {modifier} {noun}");
 price drawn uniformly in the subcategory band, rounded to .x9.
 
+Scale catalogs (``--products N``) walk the full grid instead: every
+subcategory's brand (or none) x modifier x noun x variant combination, where
+variants are pack sizes and product lines (a tree may set its own
+``"variants"`` list). Each subcategory takes its share of N as one vectorized
+draw of grid indices and prices, names are deduplicated through a hash set (the
+rows a collision drops are topped up from undrawn cells), and rows are streamed
+to ``products.jsonl`` (JSON Lines) so 500k SKUs never sit in memory as one
+array. ``load_dictionaries`` prefers ``products.jsonl`` over
+``products.json`` when both exist.
+
 Usage:
     python scripts/catalog_builder.py            # builds all three new types
+    python scripts/catalog_builder.py --products 200000 --out /tmp/dicts grocery
 """
 
+import argparse
 import json
 import random
+import shutil
+from collections.abc import Iterator
 from pathlib import Path
 
+import numpy as np
+
 UTILITY_ROOT = Path(__file__).resolve().parents[1]
 OUT = UTILITY_ROOT / "data" / "dictionaries"
 
@@ -71,6 +87,144 @@ def build_catalog(tree: dict, seed: int) -> dict:
     return {"products": products, "brands": brands}
 
 
+# Suffixes for scale catalogs; "" keeps the plain product in the grid.
+DEFAULT_VARIANTS = (
+    "", "Mini", "Large", "XL", "Travel Size", "Value Size", "Bulk",
+    "2-Pack", "3-Pack", "4-Pack", "6-Pack", "8-Pack", "12-Pack", "24-Pack",
+    "Select", "Classic", "Premium", "Pro", "Plus", "Max", "Lite", "Original",
+    "Essentials", "Reserve", "Limited", "Heritage", "Studio", "Signature Line",
+    "Series II", "Series III", "Collector", "Anniversary",
+)
+
+
+def _unique_brands(tree: dict) -> list[str]:
+    return list(dict.fromkeys(tree["brand_styles"]))
+
+
+def catalog_capacity(tree: dict) -> int:
+    """Number of distinct grid cells ``iter_scaled_products`` can draw from."""
+    axes = (len(_unique_brands(tree)) + 1) * len(tree.get("variants", DEFAULT_VARIANTS))
+    return axes * sum(
+        len(sub["modifiers"]) * len(sub["nouns"])
+        for dept in tree["departments"]
+        for cat in dept["categories"]
+        for sub in cat["subcategories"]
+    )
+
+
+def _grid_rows(
+    rng: np.random.Generator, brands: list[str], variants: list[str],
+    dept: str, cat: str, sub: dict, cells: np.ndarray,
+) -> Iterator[dict]:
+    """Decode grid cell indices of one subcategory into priced product rows."""
+    nouns, mods = sub["nouns"], sub["modifiers"]
+    brand_i, rest = np.divmod(cells, len(variants) * len(mods) * len(nouns))
+    variant_i, rest = np.divmod(rest, len(mods) * len(nouns))
+    mod_i, noun_i = np.divmod(rest, len(nouns))
+    lo, hi = sub["price_min"], sub["price_max"]
+    prices = np.clip(np.round(rng.uniform(lo, hi, len(cells))) - 0.01, lo, hi)
+    for b, v, m, n, price in zip(
+        brand_i.tolist(), variant_i.tolist(), mod_i.tolist(), noun_i.tolist(),
+        prices.tolist(), strict=True,
+    ):
+        yield {
+            "ProductName": " ".join(filter(None, (brands[b], mods[m], nouns[n], variants[v]))),
+            "BasePrice": f"{price:.2f}",
+            "Department": dept,
+            "Category": cat,
+            "Subcategory": sub["name"],
+        }
+
+
+def iter_scaled_products(tree: dict, seed: int, target: int) -> Iterator[dict]:
+    """Yield exactly ``target`` unique products drawn from the full product grid.
+
+    Each subcategory contributes in proportion to its grid size. Grid cells
+    and prices are drawn per subcategory with numpy, and a name set drops
+    cross-subcategory collisions (two subcategories sharing a noun and
+    modifier). When those drops leave the draw short, the undrawn cells are
+    walked in a seeded order until the target is met; a ``ValueError`` is
+    raised if the grid holds fewer distinct names than ``target``.
+    Deterministic for a given seed.
+    """
+    capacity = catalog_capacity(tree)
+    if not 0 < target <= capacity:
+        raise ValueError(
+            f"{tree['store_type']}: target must be in 1..{capacity:,} products, got {target:,}"
+        )
+    rng = np.random.default_rng(seed)
+    brands = [""] + _unique_brands(tree)
+    variants = list(tree.get("variants", DEFAULT_VARIANTS))
+    subs = [
+        (dept["name"], cat["category"], sub)
+        for dept in tree["departments"]
+        for cat in dept["categories"]
+        for sub in cat["subcategories"]
+    ]
+    sizes = np.array(
+        [len(brands) * len(variants) * len(s["modifiers"]) * len(s["nouns"]) for *_, s in subs]
+    )
+    # Round quotas up so most collisions are covered without the top-up pass.
+    quotas = np.minimum(sizes, np.ceil(sizes * (target / capacity)).astype(int) + 1)
+
+    seen: set[str] = set()
+    drawn: list[np.ndarray] = []
+    for (dept, cat, sub), size, quota in zip(subs, sizes.tolist(), quotas.tolist(), strict=True):
+        cells = rng.choice(size, size=quota, replace=False)
+        drawn.append(cells)
+        for row in _grid_rows(rng, brands, variants, dept, cat, sub, cells):
+            if row["ProductName"] in seen:
+                continue
+            seen.add(row["ProductName"])
+            yield row
+            if len(seen) == target:
+                return
+
+    for (dept, cat, sub), size, cells in zip(subs, sizes.tolist(), drawn, strict=True):
+        undrawn = rng.permutation(np.setdiff1d(np.arange(size), cells, assume_unique=True))
+        for row in _grid_rows(rng, brands, variants, dept, cat, sub, undrawn):
+            if row["ProductName"] in seen:
+                continue
+            seen.add(row["ProductName"])
+            yield row
+            if len(seen) == target:
+                return
+    raise ValueError(
+        f"{tree['store_type']}: the grid holds only {len(seen):,} distinct product names, "
+        f"fewer than the {target:,} requested"
+    )
+
+
+def write_scaled_store_type(tree: dict, seed: int, target: int, out: Path) -> Path:
+    """Stream a ``target``-product catalog to ``out/<store_type>/products.jsonl``.
+
+    Brands and the profile are written alongside; the profile and any tags
+    are copied from the committed dictionaries so the folder loads on its own.
+    """
+    out_dir = out / tree["store_type"]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    path = out_dir / "products.jsonl"
+    count = 0
+    try:
+        with path.open("w", encoding="utf-8") as fh:
+            for row in iter_scaled_products(tree, seed, target):
+                fh.write(json.dumps(row, sort_keys=True) + "\n")
+                count += 1
+    except ValueError:
+        # Never leave a short catalog behind for load_dictionaries to pick up.
+        path.unlink()
+        raise
+    (out_dir / "brands.json").write_text(
+        json.dumps(build_catalog(tree, seed)["brands"], indent=1, sort_keys=True) + "\n"
+    )
+    committed = OUT / tree["store_type"]
+    for name in ("profile.json", "tags.json"):
+        if (committed / name).exists():
+            shutil.copyfile(committed / name, out_dir / name)
+    print(f"wrote {path} ({count:,} rows)")
+    return path
+
+
 def write_store_type(tree: dict, seed: int) -> None:
     out_dir = OUT / tree["store_type"]
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -87,6 +241,21 @@ if __name__ == "__main__":
     from catalogs.hardware import HARDWARE_TREE
     from catalogs.luxury import LUXURY_TREE
 
-    write_store_type(GROCERY_TREE, seed=DEFAULT_SEED)
-    write_store_type(HARDWARE_TREE, seed=DEFAULT_SEED)
-    write_store_type(LUXURY_TREE, seed=DEFAULT_SEED)
+    trees = {t["store_type"]: t for t in (GROCERY_TREE, HARDWARE_TREE, LUXURY_TREE)}
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("store_types", nargs="*", default=list(trees), metavar="store_type")
+    parser.add_argument("--products", type=int, help="build a scale catalog of N products")
+    parser.add_argument("--out", type=Path, help="output root for --products (required)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+    if unknown := sorted(set(args.store_types) - trees.keys()):
+        parser.error(f"unknown store type(s) {unknown}; choose from {sorted(trees)}")
+    if args.products is not None and args.out is None:
+        # Never shadow the committed catalogs with a products.jsonl by accident.
+        parser.error("--products requires --out")
+
+    for store_type in args.store_types:
+        if args.products is None:
+            write_store_type(trees[store_type], seed=args.seed)
+        else:
+            write_scaled_store_type(trees[store_type], args.seed, args.products, args.out)
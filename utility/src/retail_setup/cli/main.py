@@ -14,29 +14,16 @@ import shutil
 import subprocess
 import sys
 import time
-from collections.abc import Callable, Mapping
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
-import yaml
-from pydantic import ValidationError
 
 from retail_setup.cli import _deploy_journal
-from retail_setup.config.generation import GenerationConfig, load_generation_config
-from retail_setup.dictionaries.loader import (
-    available_store_types,
-    default_dictionary_root,
-)
-from retail_setup.contracts import (
-    ResolvedProfile,
-    deployment_profile_names,
-    load_repository_manifest,
-    load_solution_manifest,
-    resolve_profile,
-)
-from retail_setup.contracts.models import Profile
 from retail_setup.notebooks.inject import (
     NOTEBOOKS,
     SETUP_NOTEBOOKS,
@@ -44,6 +31,11 @@ from retail_setup.notebooks.inject import (
     render_notebooks,
 )
 
+if TYPE_CHECKING:
+    from retail_setup.config.generation import GenerationConfig
+    from retail_setup.contracts import ResolvedProfile
+    from retail_setup.contracts.models import Profile
+
 app = typer.Typer(no_args_is_help=True)
 
 
@@ -63,9 +55,10 @@ _RENDER_MANIFEST = "render-manifest.json"
 # After a recreate destroy, Fabric needs time to release the workspace name and
 # capacity before the same name can be created again. Rather than a blind
 # fixed-duration sleep, the deploy polls Fabric for the workspace's absence,
-# bounded by this timeout, checking every `_DELETION_WAIT_INTERVAL_SECONDS`.
+# bounded by this timeout, checking after `_DELETION_WAIT_INTERVAL_SECONDS` and
+# then backing off while the name is still taken.
 _DELETION_WAIT_TIMEOUT_SECONDS = 180
-_DELETION_WAIT_INTERVAL_SECONDS = 10
+_DELETION_WAIT_INTERVAL_SECONDS = 5
 
 # The setup pipeline runs asynchronously in Fabric; the CLI only needs to start
 # it. Retry the start a few times so a single transient failure (e.g. a cold az
@@ -73,6 +66,10 @@ _DELETION_WAIT_INTERVAL_SECONDS = 10
 _PIPELINE_TRIGGER_ATTEMPTS = 3
 _PIPELINE_TRIGGER_RETRY_WAIT = 10
 _PROVIDER_TENANT_VARIABLES = ("FABRIC_TENANT_ID", "ARM_TENANT_ID")
+
+# Deploy steps whose declared dependencies are satisfied run concurrently, up
+# to this many at a time (`--max-parallel 1` restores the linear order).
+_DEPLOY_MAX_PARALLEL = 4
 _POST_ONTOLOGY_ACKNOWLEDGEMENT = "ack.full-demo.ontology-created"
 
 
@@ -100,6 +97,8 @@ def _set_by_path(data: dict[str, Any], dotted: str, value: Any) -> None:
 
 def _update_yaml_file(path: Path, updates: dict[str, Any]) -> str:
     """Apply dotted-path updates to a YAML file; return the original text."""
+    import yaml
+
     original = path.read_text() if path.is_file() else ""
     data = yaml.safe_load(original) or {}
     for dotted, value in updates.items():
@@ -135,6 +134,8 @@ def _validate_deploy_config(repo_root: Path, env: str) -> None:
 
 
 def _load_yaml_mapping(path: Path) -> dict[str, Any]:
+    import yaml
+
     data = yaml.safe_load(path.read_text()) or {}
     if not isinstance(data, dict):
         raise ValueError(f"Config file must contain a YAML mapping: {path}")
@@ -198,6 +199,8 @@ def _prompt_bool(name: str, value: bool | None, *, default: bool) -> bool:
 
 
 def _available_store_types() -> list[str]:
+    from retail_setup.dictionaries.loader import available_store_types, default_dictionary_root
+
     try:
         return available_store_types(default_dictionary_root())
     except RuntimeError:
@@ -237,6 +240,8 @@ def _load_deploy_environment(repo_root: Path, env: str):
 def _available_deployment_profiles(repo_root: Path) -> tuple[str, ...]:
     """Return profile names from the shared typed manifest."""
 
+    from retail_setup.contracts import deployment_profile_names, load_solution_manifest
+
     manifest = load_solution_manifest(repo_root / "contracts" / "retail-demo.json")
     return deployment_profile_names(manifest)
 
@@ -244,6 +249,8 @@ def _available_deployment_profiles(repo_root: Path) -> tuple[str, ...]:
 def _default_deployment_profile(repo_root: Path) -> ResolvedProfile:
     """Resolve the manifest default for plan-only callers without an environment."""
 
+    from retail_setup.contracts import load_repository_manifest, resolve_profile
+
     manifest, validation = load_repository_manifest(repo_root)
     return resolve_profile(manifest, validation)
 
@@ -253,6 +260,8 @@ def _manifest_deployment_profile(
 ) -> Profile:
     """Read one profile without requiring deployable sources to exist yet."""
 
+    from retail_setup.contracts import load_solution_manifest
+
     manifest = load_solution_manifest(repo_root / "contracts" / "retail-demo.json")
     return next(
         profile
@@ -538,6 +547,11 @@ def configure(
     seed: Optional[int] = typer.Option(None, "--seed", help="Random seed."),
 ) -> None:
     """Configure one workspace-scoped deployment and local generation settings."""
+    import yaml
+    from pydantic import ValidationError
+
+    from retail_setup.config.generation import GenerationConfig
+
     repo_root = repo_root.resolve()
     deploy_yml = repo_root / "deploy" / "config" / "deploy.yml"
     if not deploy_yml.is_file():
@@ -736,6 +750,8 @@ def _get_by_path(data: Any, dotted: str) -> Any:
 
 def _lakehouse_name(repo_root: Path, env: str) -> str:
     """Resolve lakehouse.name from deploy config; the environment overlay wins."""
+    import yaml
+
     base = yaml.safe_load((repo_root / "deploy" / "config" / "deploy.yml").read_text()) or {}
     env_path = repo_root / "deploy" / "config" / "environments" / f"{env}.yml"
     overlay = yaml.safe_load(env_path.read_text()) or {} if env_path.is_file() else {}
@@ -751,6 +767,8 @@ def _lakehouse_name(repo_root: Path, env: str) -> str:
 def _auth_mode(repo_root: Path, env: str) -> str:
     """Resolve auth.mode from deploy config; the environment overlay wins."""
 
+    import yaml
+
     base = yaml.safe_load((repo_root / "deploy" / "config" / "deploy.yml").read_text()) or {}
     env_path = repo_root / "deploy" / "config" / "environments" / f"{env}.yml"
     overlay = yaml.safe_load(env_path.read_text()) or {} if env_path.is_file() else {}
@@ -777,6 +795,8 @@ def _kql_database_name(repo_root: Path, env: str) -> str:
 
 def _workspace_name(repo_root: Path, env: str) -> str:
     """Resolve the target workspace.name from deploy config (overlay wins)."""
+    import yaml
+
     base = yaml.safe_load((repo_root / "deploy" / "config" / "deploy.yml").read_text()) or {}
     env_path = repo_root / "deploy" / "config" / "environments" / f"{env}.yml"
     overlay = yaml.safe_load(env_path.read_text()) or {} if env_path.is_file() else {}
@@ -886,6 +906,11 @@ def render(
     ),
 ) -> None:
     """Render the setup notebooks with configured values."""
+    import yaml
+    from pydantic import ValidationError
+
+    from retail_setup.config.generation import load_generation_config
+
     repo_root = repo_root.resolve()
 
     gen_path = repo_root / "utility" / "config.yaml"
@@ -1026,6 +1051,12 @@ class DeployStep:
     deploy (FAILED) or only degrades it (DEGRADED); `step_id` is a stable
     identifier used by the durable deploy journal and defaults to a slug of
     `description` when not given explicitly.
+
+    `depends_on` names the step ids that must succeed before this step starts;
+    `None` means "the previous step in the plan", so an undeclared plan stays
+    strictly linear. `produces` lists the repo-root-relative artifacts the step
+    writes; `_plan_dependencies` rejects a plan where two steps writing the
+    same artifact could run concurrently.
     """
 
     cmd: list[str] = field(default_factory=list)
@@ -1038,6 +1069,8 @@ class DeployStep:
     process_environment: dict[str, str] = field(default_factory=dict)
     failure_message: str | None = None
     evidence_path: str | None = None
+    depends_on: tuple[str, ...] | None = None
+    produces: tuple[str, ...] = ()
 
     def __post_init__(self) -> None:
         if not self.step_id:
@@ -1064,6 +1097,7 @@ def _deploy_plan(
     profile = profile or _default_deployment_profile(repo_root)
     py = sys.executable
     tf_output = f"deploy/.generated/{env}/terraform-output.json"
+    fabric_config = f"deploy/.generated/{env}/fabric-cicd"
     tenant_args = ["--tenant-id", tenant_id] if tenant_id else []
     generate_config_command = [
         py,
@@ -1099,6 +1133,7 @@ def _deploy_plan(
             cmd=generate_config_command,
             description="Generate deployment configs",
             step_id="generate-configs",
+            produces=(fabric_config,),
         )
     ]
     if not skip_terraform:
@@ -1177,6 +1212,7 @@ def _deploy_plan(
                 description="Capture Terraform outputs",
                 output_file=tf_output,
                 step_id="terraform-output",
+                produces=(tf_output,),
                 process_environment=terraform_environment,
             ),
             DeployStep(
@@ -1191,8 +1227,13 @@ def _deploy_plan(
                 ],
                 description="Regenerate configs with Terraform outputs",
                 step_id="regenerate-configs",
+                produces=(fabric_config,),
             ),
         ]
+    # Everything after this point needs the final configs (and, with
+    # Terraform, its outputs); later steps name their real prerequisites so
+    # independent work such as the KQL apply overlaps artifact publication.
+    configs_step_id = steps[-1].step_id
     steps.append(
         DeployStep(
             cmd=[
@@ -1207,6 +1248,7 @@ def _deploy_plan(
             ],
             description="Render setup notebooks and deployment manifest",
             step_id="render-notebooks",
+            produces=(f"utility/out/{_RENDER_MANIFEST}",),
         )
     )
     reporting_is_gated = profile.reporting_gate_pipeline_ref is not None
@@ -1241,6 +1283,10 @@ def _deploy_plan(
             evidence_path=(
                 f"deploy/.generated/{env}/artifact-inventory-{phase}.json"
             ),
+            produces=(
+                "deploy/workspace",
+                f"deploy/.generated/{env}/artifact-inventory-{phase}.json",
+            ),
         )
 
     def publish_step(step_id: str, description: str) -> DeployStep:
@@ -1262,6 +1308,7 @@ def _deploy_plan(
         )
 
     initial_phase = "infrastructure" if reporting_is_gated else "all"
+    publish_step_id = "deploy-infrastructure" if reporting_is_gated else "deploy-items"
     steps.extend(
         [
             build_step(
@@ -1274,7 +1321,7 @@ def _deploy_plan(
                 ),
             ),
             publish_step(
-                "deploy-infrastructure" if reporting_is_gated else "deploy-items",
+                publish_step_id,
                 (
                     "Deploy infrastructure, notebooks, and pipelines"
                     if reporting_is_gated
@@ -1283,7 +1330,9 @@ def _deploy_plan(
             ),
         ]
     )
+    validation_prerequisites = [publish_step_id]
     if profile.provisions_eventhouse:
+        validation_prerequisites.append("apply-kql")
         steps.append(
             DeployStep(
                 cmd=[
@@ -1303,6 +1352,8 @@ def _deploy_plan(
                 ],
                 description="Apply KQL database script",
                 step_id="apply-kql",
+                depends_on=(configs_step_id,),
+                produces=(f"deploy/.generated/{env}/database.kql",),
             )
         )
     steps.append(
@@ -1318,6 +1369,7 @@ def _deploy_plan(
                 if reporting_is_gated
                 else "validate-deployment"
             ),
+            depends_on=tuple(validation_prerequisites),
         )
     )
     if reporting_is_gated:
@@ -1332,6 +1384,7 @@ def _deploy_plan(
             description: str,
             required: bool,
             failure_message: str,
+            depends_on: tuple[str, ...] | None = None,
         ) -> DeployStep:
             return DeployStep(
                 cmd=[
@@ -1351,6 +1404,7 @@ def _deploy_plan(
                 step_id=step_id,
                 required=required,
                 failure_message=failure_message,
+                depends_on=depends_on,
             )
 
         steps.extend(
@@ -1402,6 +1456,7 @@ def _deploy_plan(
                         f"Optional pipeline {pipeline_name!r} failed after Reporting "
                         "publication; required Reporting remains published."
                     ),
+                    depends_on=("deploy-reporting",),
                 )
             )
         steps.append(
@@ -1415,6 +1470,7 @@ def _deploy_plan(
                 ],
                 description="Validate gated Reporting publication",
                 step_id="validate-reporting",
+                depends_on=("deploy-reporting",),
             )
         )
     return steps
@@ -1582,6 +1638,43 @@ def _cleanup_destroy_step(env: str) -> DeployStep:
     )
 
 
+@contextmanager
+def _retry_metrics_scope(repo_root: Path, env: str) -> Iterator[None]:
+    """Collect every deploy step's retry counts and print them at the end.
+
+    Sub-scripts inherit `RETRY_METRICS_ENV` and append their per-endpoint
+    counts to one file when they exit; in-process actions are flushed to the
+    same file before the summary is printed, even when a step aborts the
+    deploy.
+    """
+
+    from deploy.scripts import _output as console
+    from deploy.scripts._retry import (
+        RETRY_METRICS_ENV,
+        flush_retry_metrics,
+        load_retry_metrics,
+    )
+
+    metrics_path = repo_root / "deploy" / ".generated" / env / "retry-metrics.jsonl"
+    metrics_path.unlink(missing_ok=True)
+    previous = os.environ.get(RETRY_METRICS_ENV)
+    os.environ[RETRY_METRICS_ENV] = str(metrics_path)
+    try:
+        yield
+    finally:
+        flush_retry_metrics(metrics_path)
+        if previous is None:
+            os.environ.pop(RETRY_METRICS_ENV, None)
+        else:
+            os.environ[RETRY_METRICS_ENV] = previous
+        if metrics_path.exists():
+            console.retry_summary(
+                load_retry_metrics(
+                    metrics_path.read_text(encoding="utf-8").splitlines()
+                )
+            )
+
+
 def _journal_abort(
     repo_root: Path,
     journal: _deploy_journal.DeployJournal,
@@ -1600,7 +1693,126 @@ def _journal_abort(
     _deploy_journal.write(repo_root, journal)
 
 
-def _run_plan_plain(
+def _plan_dependencies(plan: list[DeployStep]) -> dict[str, tuple[str, ...]]:
+    """Resolve every step's prerequisites and validate the deploy graph.
+
+    A step without `depends_on` depends on the step before it. Dependencies
+    must name an earlier step (so the plan order is always a valid
+    topological order), and two steps that write the same artifact must be
+    ordered by the graph rather than left to race.
+    """
+
+    dependencies: dict[str, tuple[str, ...]] = {}
+    ancestors: dict[str, set[str]] = {}
+    writers: dict[str, list[str]] = {}
+    previous: str | None = None
+    for step in plan:
+        if step.step_id in dependencies:
+            raise ValueError(f"Duplicate deploy step id: {step.step_id!r}")
+        if step.depends_on is None:
+            required = (previous,) if previous is not None else ()
+        else:
+            required = tuple(step.depends_on)
+        unknown = [step_id for step_id in required if step_id not in dependencies]
+        if unknown:
+            raise ValueError(
+                f"Deploy step {step.step_id!r} depends on unknown or later "
+                f"step(s): {', '.join(unknown)}"
+            )
+        dependencies[step.step_id] = required
+        ancestors[step.step_id] = set(required).union(
+            *(ancestors[step_id] for step_id in required)
+        )
+        for artifact in step.produces:
+            for writer in writers.setdefault(artifact, []):
+                if writer not in ancestors[step.step_id]:
+                    raise ValueError(
+                        f"Deploy steps {writer!r} and {step.step_id!r} both write "
+                        f"{artifact!r} but are not ordered by dependencies"
+                    )
+            writers[artifact].append(step.step_id)
+        previous = step.step_id
+    return dependencies
+
+
+def _execute_step(
+    repo_root: Path, step: DeployStep, *, capture: bool = False
+) -> subprocess.CompletedProcess[Any] | None:
+    """Run one deploy step's action or command (called on a worker thread).
+
+    With ``capture`` a command's stdout and stderr are collected (merged, in
+    order) on the result instead of streamed, so concurrent steps never
+    interleave on the console; ``_run_plan`` prints them when the step ends.
+    """
+
+    process_environment: dict[str, str] | None = None
+    if step.process_environment:
+        process_environment = os.environ.copy()
+        process_environment.update(step.process_environment)
+        terraform_data_dir = process_environment.get("TF_DATA_DIR")
+        if terraform_data_dir and not Path(terraform_data_dir).is_absolute():
+            process_environment["TF_DATA_DIR"] = str((repo_root / terraform_data_dir).resolve())
+    if step.action is not None:
+        step.action(repo_root)
+        return None
+    if step.output_file:
+        out_path = repo_root / step.output_file
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        if process_environment is None:
+            result = subprocess.run(
+                step.cmd,
+                cwd=repo_root,
+                capture_output=True,
+                text=True,
+            )
+        else:
+            result = subprocess.run(
+                step.cmd,
+                cwd=repo_root,
+                capture_output=True,
+                text=True,
+                env=process_environment,
+            )
+        if result.returncode == 0:
+            out_path.write_text(result.stdout)
+        return result
+    streams: dict[str, Any] = (
+        {"stdout": subprocess.PIPE, "stderr": subprocess.STDOUT, "text": True}
+        if capture
+        else {}
+    )
+    if process_environment is None:
+        return subprocess.run(step.cmd, cwd=repo_root, **streams)
+    return subprocess.run(step.cmd, cwd=repo_root, env=process_environment, **streams)
+
+
+def _echo_progress(
+    plan: list[DeployStep],
+    finished: int,
+    running: list[DeployStep],
+    waiting: int,
+) -> None:
+    """Print a one-line view of the concurrent deploy's state."""
+
+    active = ", ".join(step.step_id for step in running) or "(none)"
+    typer.echo(
+        f"  Progress: {finished}/{len(plan)} finished; running: {active}; "
+        f"waiting: {waiting}"
+    )
+
+
+def _echo_step_output(
+    index: int, total: int, step: DeployStep, output: str | None
+) -> None:
+    """Print a finished step's captured output as one uninterrupted block."""
+
+    if not output:
+        return
+    _command_divider(f"Output of step {index}/{total}: {step.description}")
+    typer.echo(output.rstrip("\n"))
+
+
+def _run_plan(
     repo_root: Path,
     env: str,
     plan: list[DeployStep],
@@ -1608,16 +1820,40 @@ def _run_plan_plain(
     *,
     yes: bool,
     journal: _deploy_journal.DeployJournal,
+    max_parallel: int = _DEPLOY_MAX_PARALLEL,
 ) -> None:
-    """Execute the deploy plan linearly with clear command dividers.
-
-    Journals each step's RUNNING/SUCCEEDED/FAILED transition (never the raw
+    """Execute the deploy plan as a dependency graph with bounded parallelism.
+
+    A step starts once every step it depends on has succeeded, so the deploy
+    takes as long as its critical path rather than the sum of its steps. Steps
+    run on worker threads; prompts, console output and journal writes stay on
+    this thread. When steps can overlap (``max_parallel > 1``) each command's
+    output is captured and printed as one block when the step ends. Python
+    action steps print directly, so a step that needs confirmation waits only
+    while an action is running; steps that do not depend on it keep starting
+    meanwhile. Journals
+    each step's RUNNING/SUCCEEDED/FAILED/SKIPPED transition (never the raw
     command output) so a durable record survives even an interrupted process.
+
+    A required failure stops new steps from starting, lets running steps
+    finish and be journaled, then exits with the first failure's code. An
+    optional failure skips only the steps that depend on it.
     """
     _ = env
-    for i, step in enumerate(plan, start=1):
-        _echo_step(i, total, step)
-        _command_divider(f"Running step {i}/{total}: {step.description}", step.cmd)
+    if max_parallel < 1:
+        raise ValueError("max_parallel must be >= 1")
+    dependencies = _plan_dependencies(plan)
+    index_of = {step.step_id: index for index, step in enumerate(plan, start=1)}
+    outcome: dict[str, str] = {}
+    waiting = list(plan)
+    running: dict[Future[subprocess.CompletedProcess[Any] | None], DeployStep] = {}
+    exit_code: int | None = None
+    capture = max_parallel > 1
+
+    def start(step: DeployStep) -> None:
+        index = index_of[step.step_id]
+        _echo_step(index, total, step)
+        _command_divider(f"Running step {index}/{total}: {step.description}", step.cmd)
         if step.needs_confirmation and not yes:
             if not typer.confirm(f"Proceed with: {step.description}?"):
                 typer.echo("Aborted by user.")
@@ -1625,57 +1861,29 @@ def _run_plan_plain(
                 raise typer.Exit(code=1)
         _deploy_journal.mark_running(journal, step.step_id)
         _deploy_journal.write(repo_root, journal)
-        result: subprocess.CompletedProcess[Any] | None = None
-        process_environment: dict[str, str] | None = None
-        if step.process_environment:
-            process_environment = os.environ.copy()
-            process_environment.update(step.process_environment)
-            terraform_data_dir = process_environment.get("TF_DATA_DIR")
-            if terraform_data_dir and not Path(terraform_data_dir).is_absolute():
-                process_environment["TF_DATA_DIR"] = str((repo_root / terraform_data_dir).resolve())
+        running[pool.submit(_execute_step, repo_root, step, capture=capture)] = step
+
+    def finish(
+        step: DeployStep, future: Future[subprocess.CompletedProcess[Any] | None]
+    ) -> int | None:
+        """Journal a finished step; return an exit code if it must stop the deploy."""
+
+        index = index_of[step.step_id]
         try:
-            if step.action is not None:
-                step.action(repo_root)
-            elif step.output_file:
-                out_path = repo_root / step.output_file
-                out_path.parent.mkdir(parents=True, exist_ok=True)
-                if process_environment is None:
-                    result = subprocess.run(
-                        step.cmd,
-                        cwd=repo_root,
-                        capture_output=True,
-                        text=True,
-                    )
-                else:
-                    result = subprocess.run(
-                        step.cmd,
-                        cwd=repo_root,
-                        capture_output=True,
-                        text=True,
-                        env=process_environment,
-                    )
-                if result.returncode == 0:
-                    out_path.write_text(result.stdout)
-                    typer.echo(f"Wrote output to {step.output_file}")
-                elif result.stderr:
-                    typer.echo(result.stderr, err=True)
-            else:
-                if process_environment is None:
-                    result = subprocess.run(step.cmd, cwd=repo_root)
-                else:
-                    result = subprocess.run(step.cmd, cwd=repo_root, env=process_environment)
+            result = future.result()
         except FileNotFoundError:
             executable = step.cmd[0] if step.cmd else "<unknown>"
             typer.echo(
-                f"Deploy failed at step {i}/{total}: {step.description}",
+                f"Deploy failed at step {index}/{total}: {step.description}",
                 err=True,
             )
             typer.echo(_missing_executable_message(executable), err=True)
             _journal_abort(
                 repo_root, journal, step.step_id, error=f"executable not found: {executable}"
             )
-            raise typer.Exit(code=127) from None
-        except Exception as exc:
+            outcome[step.step_id] = "FAILED"
+            return 127
+        except Exception as exc:  # noqa: BLE001 — journaled and exits the deploy
             # Action-based steps (e.g. the deletion-wait poll) call into the
             # Azure/Fabric SDKs, which can raise varied exception types (auth
             # failures, network errors, our own deletion timeout); any of them
@@ -1683,15 +1891,23 @@ def _run_plan_plain(
             # nonzero subprocess exit rather than left to crash with a
             # traceback.
             typer.echo(
-                f"Deploy failed at step {i}/{total}: {step.description}",
+                f"Deploy failed at step {index}/{total}: {step.description}",
                 err=True,
             )
             typer.echo(str(exc), err=True)
             _journal_abort(repo_root, journal, step.step_id, error=str(exc))
-            raise typer.Exit(code=1) from exc
+            outcome[step.step_id] = "FAILED"
+            return 1
+        if capture and not step.output_file and result is not None:
+            _echo_step_output(index, total, step, getattr(result, "stdout", None))
+        if step.output_file and result is not None:
+            if result.returncode == 0:
+                typer.echo(f"Wrote output to {step.output_file}")
+            elif result.stderr:
+                typer.echo(result.stderr, err=True)
         if result is not None and result.returncode != 0:
             typer.echo(
-                f"Deploy failed at step {i}/{total} "
+                f"Deploy failed at step {index}/{total} "
                 f"(exit {result.returncode}): {_display_command(step.cmd)}",
                 err=True,
             )
@@ -1702,17 +1918,75 @@ def _run_plan_plain(
                 error=step.failure_message,
             )
             _deploy_journal.write(repo_root, journal)
+            outcome[step.step_id] = "FAILED"
             if step.required:
-                raise typer.Exit(code=result.returncode)
+                return result.returncode
             typer.echo(
                 "Continuing because this post-Reporting step is optional.",
                 err=True,
             )
-            continue
+            return None
         _deploy_journal.mark_succeeded(
             journal, step.step_id, exit_code=result.returncode if result is not None else 0
         )
         _deploy_journal.write(repo_root, journal)
+        outcome[step.step_id] = "SUCCEEDED"
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        try:
+            while waiting or running:
+                for step in list(waiting) if exit_code is None else []:
+                    if len(running) >= max_parallel:
+                        break
+                    states = [outcome.get(step_id) for step_id in dependencies[step.step_id]]
+                    if None in states:
+                        continue
+                    ready = all(state == "SUCCEEDED" for state in states)
+                    if (
+                        ready
+                        and step.needs_confirmation
+                        and not yes
+                        and any(other.action is not None for other in running.values())
+                    ):
+                        # An action prints as it runs; prompt once it is done,
+                        # but keep starting the steps that do not need this one.
+                        continue
+                    waiting.remove(step)
+                    if not ready:
+                        _deploy_journal.mark_skipped(
+                            journal,
+                            step.step_id,
+                            reason="A step it depends on did not succeed.",
+                        )
+                        _deploy_journal.write(repo_root, journal)
+                        outcome[step.step_id] = "SKIPPED"
+                        continue
+                    start(step)
+                if not running:
+                    if exit_code is not None or not waiting:
+                        break
+                    if any(
+                        None not in (outcome.get(d) for d in dependencies[step.step_id])
+                        for step in waiting
+                    ):
+                        continue
+                    raise RuntimeError("Deploy plan stalled with no runnable step.")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in sorted(done, key=lambda f: index_of[running[f].step_id]):
+                    step = running.pop(future)
+                    code = finish(step, future)
+                    if code is not None and exit_code is None:
+                        exit_code = code
+                if max_parallel > 1:
+                    _echo_progress(plan, len(outcome), list(running.values()), len(waiting))
+        except BaseException:
+            # An aborted prompt or Ctrl-C: let running steps finish, but start
+            # nothing new.
+            waiting.clear()
+            raise
+    if exit_code is not None:
+        raise typer.Exit(code=exit_code)
 
 
 @app.command()
@@ -1738,6 +2012,12 @@ def deploy(
         "--acknowledge",
         help="Repeat for each profile boundary acknowledgement required by full-demo.",
     ),
+    max_parallel: int = typer.Option(
+        _DEPLOY_MAX_PARALLEL,
+        "--max-parallel",
+        min=1,
+        help="Run up to this many independent deploy steps at once (1 = linear).",
+    ),
 ) -> None:
     """Run the full deployment: configs, Terraform, artifacts, Fabric items, KQL.
 
@@ -1750,6 +2030,8 @@ def deploy(
     detects an existing workspace and offers to reset it, so the flag is
     optional.
     """
+    import yaml
+
     repo_root = repo_root.resolve()
     acknowledgements = tuple(acknowledge or ())
     if recreate and skip_terraform:
@@ -1968,25 +2250,34 @@ def deploy(
         )
     _deploy_journal.write(repo_root, run_journal)
 
-    _run_plan_plain(repo_root, env, plan, total, yes=yes, journal=run_journal)
-
-    if profile.post_deploy_pipeline_ref is not None:
-        report_path = f"deploy/.generated/{env}/readiness-report.json"
-        _deploy_journal.add_step(
-            run_journal,
-            "verify-readiness",
-            "Verify live readiness and freshness",
-            required=True,
-            evidence_path=report_path,
-        )
-        _deploy_journal.write(repo_root, run_journal)
-        _verify_readiness_after_deploy(
+    with _retry_metrics_scope(repo_root, env):
+        _run_plan(
             repo_root,
             env,
+            plan,
+            total,
+            yes=yes,
             journal=run_journal,
-            defer_post_ontology=profile.selects("asset.data-agents"),
+            max_parallel=max_parallel,
         )
 
+        if profile.post_deploy_pipeline_ref is not None:
+            report_path = f"deploy/.generated/{env}/readiness-report.json"
+            _deploy_journal.add_step(
+                run_journal,
+                "verify-readiness",
+                "Verify live readiness and freshness",
+                required=True,
+                evidence_path=report_path,
+            )
+            _deploy_journal.write(repo_root, run_journal)
+            _verify_readiness_after_deploy(
+                repo_root,
+                env,
+                journal=run_journal,
+                defer_post_ontology=profile.selects("asset.data-agents"),
+            )
+
     _deploy_journal.write(repo_root, run_journal)
     if profile.selects("asset.data-agents"):
         _print_ontology_relink_hint(
@@ -2151,6 +2442,8 @@ def post_ontology(
 ) -> None:
     """Publish Data Agents and task flow after ontology creation."""
 
+    import yaml
+
     repo_root = repo_root.resolve()
     acknowledgements = tuple(acknowledge or ())
     if acknowledgements != (_POST_ONTOLOGY_ACKNOWLEDGEMENT,):
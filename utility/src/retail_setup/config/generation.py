@@ -3,6 +3,7 @@
 import calendar
 from datetime import date, timedelta
 from pathlib import Path
+from typing import Literal
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
@@ -66,6 +67,21 @@ class GenerationConfig(BaseModel):
     # truck load capacity in units; a store-day shipment exceeding this is split
     # across multiple truck legs (datagen multi-truck shipments)
     truck_capacity: int = Field(default=15000, gt=0)
+    # migration flag: derive each receipt's and receipt line's draws from one
+    # key hash (runtime.DrawStream) instead of re-hashing the key per draw.
+    # Statistically equivalent but not bit-identical, so it is opt-in.
+    draw_streams: bool = False
+    # build each receipt's lines as an array inside the receipt row and total
+    # the header in-row, instead of exploding lines, joining products at line
+    # grain and re-aggregating headers (two fewer shuffles). Output is identical.
+    inline_receipt_lines: bool = False
+    # cadence of the inventory_state_snapshot table (end-of-period balance per
+    # node/product); None disables it and Gold falls back to scanning all txns
+    inventory_snapshot_interval: Literal["day", "week", "month"] | None = "month"
+    # "compact" stores only the cents columns for money (schemas.MONEY_STRINGS)
+    # and publishes <table>_legacy views with the "%.2f" strings; opt-in because
+    # the semantic model and ML notebooks still read the strings from the tables
+    money_layout: Literal["legacy", "compact"] = "legacy"
 
     @model_validator(mode="after")
     def _known_store_type(self) -> "GenerationConfig":
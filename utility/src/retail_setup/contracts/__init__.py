@@ -20,6 +20,11 @@ from .profiles import (
     deployment_profile_names,
     resolve_profile,
 )
+from .source_cache import (
+    SourceParseTiming,
+    reset_source_parse_timings,
+    source_parse_timings,
+)
 from .sources import ManifestSourceError
 from .validation import (
     InventoryDrift,
@@ -41,13 +46,16 @@ __all__ = [
     "ResolvedAsset",
     "ResolvedProfile",
     "SolutionManifest",
+    "SourceParseTiming",
     "derive_manifest_inventories",
     "derive_data_contract_snapshot",
     "load_repository_manifest",
     "load_solution_manifest",
     "manifest_sha256",
     "deployment_profile_names",
+    "reset_source_parse_timings",
     "resolve_profile",
+    "source_parse_timings",
     "validate_manifest_repository",
     "validate_manifest_sources",
     "validate_data_contracts",
@@ -8,6 +8,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+from .source_cache import cached_source_parser
+
 _SCENARIO_ID = re.compile(r"^[a-z][a-z0-9]*(?:-[a-z0-9]+)*$")
 
 
@@ -29,6 +31,7 @@ class EventFixtureScenario:
     events: tuple[EventFixture, ...]
 
 
+@cached_source_parser()
 def load_event_fixture_scenarios(path: Path) -> tuple[EventFixtureScenario, ...]:
     """Load fixtures without executing code or accepting undeclared metadata."""
 
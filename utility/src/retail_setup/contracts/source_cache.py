@@ -0,0 +1,226 @@
+"""Persistent, content-addressed cache for repository source parsers.
+
+Manifest validation parses the stream driver, notebooks, KQL scripts,
+``schemas.py``, the TMDL model, and fixture documents on every call, and runs in
+``retail-setup deploy``, readiness verification, profile preflight, and many
+tests. Each parser decorated with ``cached_source_parser`` stores its result
+under a key made from the SHA-256 of every file it reads, the SHA-256 of the
+module that defines the parser (the parser version), and its arguments. An
+unchanged repository therefore re-validates from cached results, and a changed
+file only re-parses the sources that read it.
+
+Results are pickled under ``$RETAIL_SETUP_CACHE_DIR`` (default
+``$XDG_CACHE_HOME/retail-setup/contracts`` or ``~/.cache/retail-setup/contracts``);
+setting the variable to an empty string keeps the cache in memory only. The
+directory is a private, per-user cache: never point it at a shared or
+untrusted location. Failed parses are never cached, and an unreadable cache
+entry is treated as a miss.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+CACHE_DIR_ENV = "RETAIL_SETUP_CACHE_DIR"
+# Bump when the key or entry layout changes.
+_FORMAT_VERSION = "1"
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True)
+class SourceParseTiming:
+    """Wall time spent resolving one parser call, from cache or by parsing."""
+
+    parser: str
+    path: str
+    seconds: float
+    cached: bool
+
+
+_lock = threading.Lock()
+_memory: dict[str, bytes] = {}
+_timings: list[SourceParseTiming] = []
+
+
+def source_cache_dir() -> Path | None:
+    """Return the persistent cache directory, or ``None`` when disabled."""
+
+    configured = os.environ.get(CACHE_DIR_ENV)
+    if configured is not None:
+        return Path(configured) if configured else None
+    base = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(base) / "retail-setup" / "contracts"
+
+
+def source_parse_timings() -> tuple[SourceParseTiming, ...]:
+    """Return every parser call recorded since the last reset, in call order."""
+
+    with _lock:
+        return tuple(_timings)
+
+
+def reset_source_parse_timings() -> None:
+    """Forget recorded timings (the cached results are kept)."""
+
+    with _lock:
+        _timings.clear()
+
+
+def clear_source_cache_memory() -> None:
+    """Drop in-process entries so the next call reads the persistent cache."""
+
+    with _lock:
+        _memory.clear()
+
+
+def use_memory_only_source_cache() -> Callable[[], None]:
+    """Stop this process persisting parses; return a callable that undoes it.
+
+    Test suites call this before collection so cached parses stay out of the
+    developer's real cache directory.
+    """
+
+    previous = os.environ.get(CACHE_DIR_ENV)
+    os.environ[CACHE_DIR_ENV] = ""
+
+    def restore() -> None:
+        if previous is None:
+            os.environ.pop(CACHE_DIR_ENV, None)
+        else:
+            os.environ[CACHE_DIR_ENV] = previous
+
+    return restore
+
+
+def cached_source_parser(
+    dependencies: Callable[[Path], Iterable[Path]] | None = None,
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Cache a parser whose first argument is the source file it reads.
+
+    ``dependencies`` lists any further files the parser reads for a given
+    source (for example the per-table TMDL files behind ``model.tmdl``); their
+    names and contents join the key.
+    """
+
+    def decorate(parser: Callable[..., R]) -> Callable[..., R]:
+        name = f"{parser.__module__}.{parser.__qualname__}"
+        version = hashlib.sha256(
+            Path(inspect.getfile(parser)).read_bytes()
+        ).hexdigest()
+
+        @functools.wraps(parser)
+        def wrapper(path: Path, *args: Any, **kwargs: Any) -> R:
+            started = time.perf_counter()
+            try:
+                key = _cache_key(name, version, path, dependencies, args, kwargs)
+            except OSError:
+                # Let the parser raise its own, more specific error.
+                return parser(path, *args, **kwargs)
+            hit, value = _load(_read(key))
+            if hit:
+                _record(name, path, started, cached=True)
+                return value
+            value = parser(path, *args, **kwargs)
+            try:
+                payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+                payload = None
+            if payload is not None:
+                _write(key, payload)
+            _record(name, path, started, cached=False)
+            return value
+
+        wrapper.uncached = parser  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorate
+
+
+def _cache_key(
+    name: str,
+    version: str,
+    path: Path,
+    dependencies: Callable[[Path], Iterable[Path]] | None,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+) -> str:
+    digest = hashlib.sha256()
+    for part in (_FORMAT_VERSION, name, version, repr(args), repr(sorted(kwargs.items()))):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    digest.update(hashlib.sha256(path.read_bytes()).digest())
+    if dependencies is not None:
+        for dependency in sorted(dependencies(path)):
+            digest.update(dependency.name.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(dependency.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _read(key: str) -> bytes | None:
+    with _lock:
+        payload = _memory.get(key)
+    if payload is not None:
+        return payload
+    directory = source_cache_dir()
+    if directory is None:
+        return None
+    try:
+        payload = (directory / f"{key}.pickle").read_bytes()
+    except OSError:
+        return None
+    with _lock:
+        _memory[key] = payload
+    return payload
+
+
+def _load(payload: bytes | None) -> tuple[bool, Any]:
+    if payload is None:
+        return False, None
+    try:
+        return True, pickle.loads(payload)
+    except Exception:  # noqa: BLE001 — a corrupt entry is a cache miss
+        return False, None
+
+
+def _write(key: str, payload: bytes) -> None:
+    with _lock:
+        _memory[key] = payload
+    directory = source_cache_dir()
+    if directory is None:
+        return
+    handle = None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=directory, suffix=".tmp", delete=False
+        ) as handle:
+            handle.write(payload)
+        os.replace(handle.name, directory / f"{key}.pickle")
+    except OSError:
+        # The cache is an optimisation; an unwritable directory only costs speed.
+        if handle is not None:
+            Path(handle.name).unlink(missing_ok=True)
+
+
+def _record(name: str, path: Path, started: float, *, cached: bool) -> None:
+    timing = SourceParseTiming(
+        parser=name.rsplit(".", 1)[-1],
+        path=str(path),
+        seconds=time.perf_counter() - started,
+        cached=cached,
+    )
+    with _lock:
+        _timings.append(timing)
@@ -10,6 +10,10 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import yaml
+
+from .source_cache import cached_source_parser
+
 KQL_TYPES = frozenset({"bool", "datetime", "dynamic", "int", "long", "real", "string"})
 SPARK_TYPES = frozenset(
     {"boolean", "date", "double", "int", "long", "string", "timestamp"}
@@ -84,6 +88,13 @@ class TmdlTableSchema:
     fields: tuple[PhysicalField, ...]
 
 
+def _tmdl_table_files(model_path: Path) -> list[Path]:
+    """Per-table TMDL files read alongside ``model.tmdl``."""
+
+    return sorted((model_path.parent / "tables").glob("*.tmdl"))
+
+
+@cached_source_parser()
 def notebook_ml_output_schemas(
     path: Path,
     *,
@@ -356,6 +367,7 @@ def _nested_statement_bodies(statement: ast.stmt) -> tuple[list[ast.stmt], ...]:
     return tuple(bodies)
 
 
+@cached_source_parser()
 def notebook_ml_source_tables(path: Path) -> tuple[str, ...]:
     """Parse the producer's declared physical input-table inventory."""
 
@@ -366,6 +378,7 @@ def notebook_ml_source_tables(path: Path) -> tuple[str, ...]:
     )
 
 
+@cached_source_parser()
 def notebook_ml_validation_rules(path: Path) -> dict[str, MlValidationRule]:
     """Parse exact required-output semantics enforced by the runtime gate."""
 
@@ -459,6 +472,7 @@ def _ml_rule_columns(
     return values
 
 
+@cached_source_parser()
 def python_symbol(path: Path, name: str) -> Any:
     """Return a literal top-level assignment or a matching definition node."""
 
@@ -482,6 +496,13 @@ def _python_symbol_from_tree(tree: ast.Module, name: str) -> Any:
     raise KeyError(name)
 
 
+@cached_source_parser()
+def yaml_document(path: Path) -> Any:
+    """Load a YAML source with the safe loader."""
+
+    return yaml.safe_load(path.read_text(encoding="utf-8"))
+
+
 def nested_value(document: Any, dotted_path: str) -> Any:
     """Resolve a dot-separated path through mapping values."""
 
@@ -515,6 +536,7 @@ def flatten_sequences(values: Iterable[Any]) -> list[Any]:
     return flattened
 
 
+@cached_source_parser()
 def kql_table_schemas(path: Path) -> dict[str, dict[str, str]]:
     """Parse table and field/type mappings from KQL create-merge statements."""
 
@@ -547,6 +569,7 @@ def kql_table_schemas(path: Path) -> dict[str, dict[str, str]]:
     return schemas
 
 
+@cached_source_parser()
 def kql_mapping_schemas(path: Path) -> dict[str, dict[str, tuple[str, str]]]:
     """Parse table and column type/path mappings from KQL mapping scripts."""
 
@@ -593,6 +616,7 @@ def kql_mapping_schemas(path: Path) -> dict[str, dict[str, tuple[str, str]]]:
     return schemas
 
 
+@cached_source_parser()
 def tmdl_tables(path: Path) -> list[str]:
     """Parse active table references from model.tmdl."""
 
@@ -604,6 +628,7 @@ def tmdl_tables(path: Path) -> list[str]:
     return tables
 
 
+@cached_source_parser()
 def driver_event_schemas(path: Path) -> DriverEventSchemas:
     """Parse driver envelope/payload definitions with a strict tuple schema."""
 
@@ -640,6 +665,7 @@ def driver_event_schemas(path: Path) -> DriverEventSchemas:
     return DriverEventSchemas(envelope=envelope, payloads=payloads)
 
 
+@cached_source_parser()
 def python_table_schemas(
     path: Path,
     symbol: str = "TABLES",
@@ -708,6 +734,7 @@ def notebook_python_source(path: Path) -> str:
     return "\n".join(code)
 
 
+@cached_source_parser()
 def streaming_silver_contract(path: Path) -> StreamingSilverContract:
     """Parse declared streaming transformations and dedupe keys from the notebook."""
 
@@ -770,6 +797,7 @@ def streaming_silver_contract(path: Path) -> StreamingSilverContract:
     )
 
 
+@cached_source_parser()
 def gold_output_contract(path: Path) -> dict[str, GoldRoute]:
     """Parse Gold outputs and their Silver inputs from known notebook calls."""
 
@@ -806,6 +834,7 @@ def gold_output_contract(path: Path) -> dict[str, GoldRoute]:
     return {name: routes[name] for name in expected}
 
 
+@cached_source_parser(dependencies=_tmdl_table_files)
 def tmdl_active_table_schemas(path: Path) -> dict[str, TmdlTableSchema]:
     """Parse active model tables, physical bindings, columns, and TMDL types."""
 
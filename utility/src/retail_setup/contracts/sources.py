@@ -7,8 +7,6 @@ import tomllib
 from collections.abc import Iterable
 from pathlib import Path
 
-import yaml
-
 from .models import InventoryDeclaration, SourceAgreement, SourcePointer
 from .source_parsers import (
     flatten_sequences as _flatten_sequences,
@@ -49,6 +47,9 @@ from .source_parsers import (
 from .source_parsers import (
     tmdl_tables as _tmdl_tables,
 )
+from .source_parsers import (
+    yaml_document as _yaml_document,
+)
 
 
 class ManifestSourceError(ValueError):
@@ -67,10 +68,7 @@ def validate_source_pointer(pointer: SourcePointer, repo_root: Path) -> None:
         if selector.kind == "python_symbol":
             _python_symbol(path, _selector_value(pointer))
         elif selector.kind == "yaml_path":
-            _nested_value(
-                yaml.safe_load(path.read_text(encoding="utf-8")),
-                _selector_value(pointer),
-            )
+            _nested_value(_yaml_document(path), _selector_value(pointer))
         elif selector.kind == "toml_path":
             _nested_value(
                 tomllib.loads(path.read_text(encoding="utf-8")),
@@ -148,7 +146,7 @@ def derive_inventory(
         elif declaration.derivation == "python_sequence":
             items = _python_symbol(path, selector_value)
         elif declaration.derivation == "yaml_sequence":
-            document = yaml.safe_load(path.read_text(encoding="utf-8"))
+            document = _yaml_document(path)
             items = _nested_value(document, selector_value)
         elif declaration.derivation == "directory_glob":
             items = _glob_values(path, selector_value)
@@ -1,9 +1,26 @@
-"""Load and validate dictionary JSON sets (shared + one store type)."""
+"""Load and validate dictionary JSON sets (shared + one store type).
 
+Validating every row through pydantic is the slow part of a load, and each
+notebook run repeats it. Pass ``cache_dir`` to ``load_dictionaries`` to keep a
+compiled snapshot per store type: one ``.npy`` file per dictionary column
+under ``<cache_dir>/<store_type>-<hash>/``, where the hash covers the source
+JSON files. A matching snapshot is memory-mapped instead of re-validated; any
+edit to a source file changes the hash and the snapshot is rebuilt. Row models
+are then only materialized for rows a caller actually indexes, while
+generators sample from ``DictionarySet.column`` arrays directly.
+"""
+
+import hashlib
 import json
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
+from decimal import Decimal
 from pathlib import Path
 
+import numpy as np
 from pydantic import BaseModel, ValidationError
 
 from retail_setup.dictionaries.models import (
@@ -16,18 +33,93 @@ from retail_setup.dictionaries.models import (
     TaxJurisdictionEntry,
 )
 
+# Bump when the snapshot layout (or a model's field set) changes.
+_COMPILED_VERSION = 1
+
+# DictionarySet field -> (row model, source file relative to the root, required).
+# ``{type}`` is the store type folder.
+_SOURCES: dict[str, tuple[type[BaseModel], str, bool]] = {
+    "first_names": (NameEntry, "_shared/first_names.json", True),
+    "last_names": (NameEntry, "_shared/last_names.json", True),
+    "geographies": (GeographyEntry, "_shared/geographies.json", True),
+    "tax_rates": (TaxJurisdictionEntry, "_shared/tax_rates.json", True),
+    "products": (ProductEntry, "{type}/products.json", True),
+    "brands": (ProductBrandEntry, "{type}/brands.json", True),
+    "tags": (ProductTagEntry, "{type}/tags.json", False),
+}
+
+
+class CompiledRows(Sequence):
+    """Read-only rows backed by compiled column arrays.
+
+    Behaves like the validated list it replaces; each row model is built
+    (without re-validation) the first time it is indexed.
+    """
+
+    def __init__(self, model: type[BaseModel], columns: dict[str, np.ndarray]) -> None:
+        self._model = model
+        self._columns = columns
+        self._length = len(next(iter(columns.values()))) if columns else 0
+        self._rows: dict[int, BaseModel] = {}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        i = int(index)
+        if i < 0:
+            i += self._length
+        if not 0 <= i < self._length:
+            raise IndexError("dictionary row index out of range")
+        row = self._rows.get(i)
+        if row is None:
+            row = self._model.model_construct(
+                **{name: _from_column(self._model, name, values[i])
+                   for name, values in self._columns.items()}
+            )
+            self._rows[i] = row
+        return row
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        return (self[i] for i in range(self._length))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
 
 @dataclass
 class DictionarySet:
     store_type: str
     profile: StoreTypeProfile
-    first_names: list[NameEntry] = field(default_factory=list)
-    last_names: list[NameEntry] = field(default_factory=list)
-    geographies: list[GeographyEntry] = field(default_factory=list)
-    tax_rates: list[TaxJurisdictionEntry] = field(default_factory=list)
-    products: list[ProductEntry] = field(default_factory=list)
-    brands: list[ProductBrandEntry] = field(default_factory=list)
-    tags: list[ProductTagEntry] = field(default_factory=list)
+    first_names: Sequence[NameEntry] = field(default_factory=list)
+    last_names: Sequence[NameEntry] = field(default_factory=list)
+    geographies: Sequence[GeographyEntry] = field(default_factory=list)
+    tax_rates: Sequence[TaxJurisdictionEntry] = field(default_factory=list)
+    products: Sequence[ProductEntry] = field(default_factory=list)
+    brands: Sequence[ProductBrandEntry] = field(default_factory=list)
+    tags: Sequence[ProductTagEntry] = field(default_factory=list)
+    columns: dict[str, dict[str, np.ndarray]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    def column(self, table: str, name: str) -> np.ndarray:
+        """Return one dictionary column as an array (e.g. ``"first_names", "Name"``).
+
+        Memory-mapped when loaded from a compiled snapshot, otherwise built
+        from the validated rows on first use. Decimal fields come back as
+        their string form; absent optional values are ``None``.
+        """
+        table_columns = self.columns.setdefault(table, {})
+        values = table_columns.get(name)
+        if values is None:
+            model = _SOURCES[table][0]
+            values = _to_column(model, name, [getattr(row, name) for row in getattr(self, table)])
+            table_columns[name] = values
+        return values
 
 
 def default_dictionary_root() -> Path:
@@ -61,10 +153,16 @@ def available_store_types(root: Path) -> list[str]:
 def load_list(path: Path, model: type[BaseModel]) -> list:
     """Load and validate a JSON array file, returning a list of model instances.
 
-    Raises ValueError with filename and row index on validation failure.
+    A ``.jsonl`` path is read as JSON Lines (one object per line), the format
+    scale catalogs are streamed in. Raises ValueError with filename and row
+    index on validation failure.
     """
     try:
-        raw = json.loads(path.read_text())
+        if path.suffix == ".jsonl":
+            with path.open(encoding="utf-8") as fh:
+                raw = [json.loads(line) for line in fh if line.strip()]
+        else:
+            raw = json.loads(path.read_text())
     except FileNotFoundError:
         raise ValueError(f"missing dictionary file: {path}") from None
     if not isinstance(raw, list):
@@ -78,17 +176,48 @@ def load_list(path: Path, model: type[BaseModel]) -> list:
     return result
 
 
+def _source_path(root: Path, relative: str) -> Path:
+    """Resolve a dictionary file, preferring a streamed ``.jsonl`` sibling."""
+    path = root / relative
+    lines = path.with_suffix(".jsonl")
+    return lines if lines.exists() else path
+
+
 # Keep the private alias for any callers that haven't migrated yet.
 _load_list = load_list
 
 
-def load_dictionaries(root: Path, store_type: str) -> DictionarySet:
+def load_dictionaries(
+    root: Path, store_type: str, *, cache_dir: Path | None = None
+) -> DictionarySet:
+    """Load the shared dictionaries plus one store type's, validated.
+
+    With ``cache_dir``, reuse (or write) the compiled snapshot for the current
+    source files; the result is equivalent to a fresh load. If the snapshot
+    cannot be written, the freshly validated set is returned instead.
+    """
     type_dir = root / store_type
     if not (type_dir / "profile.json").exists():
         raise ValueError(
             f"unknown store type {store_type!r}; available: {available_store_types(root)}"
         )
-    shared = root / "_shared"
+    if cache_dir is None:
+        return _validate_dictionaries(root, store_type)
+
+    target = Path(cache_dir) / f"{store_type}-{_source_fingerprint(root, store_type)[:16]}"
+    if (target / "profile.json").exists():
+        return _read_compiled(target, store_type)
+    dicts = _validate_dictionaries(root, store_type)
+    try:
+        _write_compiled(dicts, target)
+    except OSError:
+        # A read-only or unusual filesystem only costs the speed-up.
+        return dicts
+    return _read_compiled(target, store_type)
+
+
+def _validate_dictionaries(root: Path, store_type: str) -> DictionarySet:
+    type_dir = root / store_type
 
     try:
         profile = StoreTypeProfile.model_validate(
@@ -101,15 +230,89 @@ def load_dictionaries(root: Path, store_type: str) -> DictionarySet:
             f"profile.json store_type {profile.store_type!r} does not match folder {store_type!r}"
         )
 
-    tags_path = type_dir / "tags.json"
-    return DictionarySet(
-        store_type=store_type,
-        profile=profile,
-        first_names=load_list(shared / "first_names.json", NameEntry),
-        last_names=load_list(shared / "last_names.json", NameEntry),
-        geographies=load_list(shared / "geographies.json", GeographyEntry),
-        tax_rates=load_list(shared / "tax_rates.json", TaxJurisdictionEntry),
-        products=load_list(type_dir / "products.json", ProductEntry),
-        brands=load_list(type_dir / "brands.json", ProductBrandEntry),
-        tags=load_list(tags_path, ProductTagEntry) if tags_path.exists() else [],
-    )
+    rows = {}
+    for table, (model, relative, required) in _SOURCES.items():
+        path = _source_path(root, relative.format(type=store_type))
+        rows[table] = load_list(path, model) if required or path.exists() else []
+    return DictionarySet(store_type=store_type, profile=profile, **rows)
+
+
+def _source_fingerprint(root: Path, store_type: str) -> str:
+    """Hash every source file a load reads, plus the snapshot layout version."""
+    digest = hashlib.sha256(f"compiled-v{_COMPILED_VERSION}".encode())
+    relative = [f"{store_type}/profile.json"] + [
+        path.format(type=store_type) for _, path, _ in _SOURCES.values()
+    ]
+    for rel in relative:
+        path = _source_path(root, rel)
+        digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes() if path.exists() else b"<absent>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _is_decimal(model: type[BaseModel], name: str) -> bool:
+    return model.model_fields[name].annotation is Decimal
+
+
+def _to_column(model: type[BaseModel], name: str, values: list) -> np.ndarray:
+    if _is_decimal(model, name):
+        values = [str(v) for v in values]
+    if any(v is None for v in values):
+        return np.array(values, dtype=object)
+    return np.array(values, dtype=str) if values else np.array([], dtype="<U1")
+
+
+def _from_column(model: type[BaseModel], name: str, value):
+    if value is None:
+        return None
+    value = str(value)
+    return Decimal(value) if _is_decimal(model, name) else value
+
+
+def _write_compiled(dicts: DictionarySet, target: Path) -> None:
+    """Write ``dicts`` as a snapshot directory, atomically.
+
+    Nullable columns are stored as a string array plus a ``.null`` mask so
+    every file stays memory-mappable (no pickled object arrays).
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{target.name}-", dir=target.parent))
+    try:
+        for table, (model, _, _) in _SOURCES.items():
+            for name in model.model_fields:
+                values = dicts.column(table, name)
+                if values.dtype == object:
+                    nulls = np.array([v is None for v in values], dtype=bool)
+                    np.save(staging / f"{table}.{name}.null.npy", nulls)
+                    values = np.array(["" if v is None else v for v in values], dtype=str)
+                np.save(staging / f"{table}.{name}.npy", values)
+        (staging / "profile.json").write_text(dicts.profile.model_dump_json())
+        try:
+            os.replace(staging, target)
+        except OSError:
+            # A concurrent load published the same snapshot first.
+            if not (target / "profile.json").exists():
+                raise
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _read_compiled(target: Path, store_type: str) -> DictionarySet:
+    profile = StoreTypeProfile.model_validate_json((target / "profile.json").read_text())
+    tables: dict[str, dict[str, np.ndarray]] = {}
+    rows: dict[str, CompiledRows] = {}
+    for table, (model, _, _) in _SOURCES.items():
+        columns: dict[str, np.ndarray] = {}
+        for name in model.model_fields:
+            values = np.load(target / f"{table}.{name}.npy", mmap_mode="r", allow_pickle=False)
+            null_path = target / f"{table}.{name}.null.npy"
+            if null_path.exists():
+                nulls = np.load(null_path, allow_pickle=False)
+                values = np.array(
+                    [None if null else str(v) for v, null in zip(values, nulls)], dtype=object
+                )
+            columns[name] = values
+        tables[table] = columns
+        rows[table] = CompiledRows(model, columns)
+    return DictionarySet(store_type=store_type, profile=profile, columns=tables, **rows)
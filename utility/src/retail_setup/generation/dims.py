@@ -5,10 +5,13 @@ pricing rules); column names/types from schemas.TABLES, which the TMDL
 contract test guards.
 """
 
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta
 
 import numpy as np
-from pyspark.sql import DataFrame, SparkSession
+from pyspark.sql import Column, DataFrame, SparkSession
+from pyspark.sql import functions as F
 
 from retail_setup.config.generation import GenerationConfig
 from retail_setup.dictionaries.loader import DictionarySet
@@ -95,19 +98,119 @@ def _addr(rng: np.random.Generator) -> str:
     )
 
 
+@dataclass(frozen=True)
+class DimensionContext:
+    """Driver-side facts about the generated dimensions that fact generators
+    need as Python values: ids, store hours, each store's nearest DC and each
+    DC's truck fleet.
+
+    ``build_dimensions`` fills it from the rows it already holds, so the fact
+    stage neither ``collect()``s the dim tables nor cross-joins stores x DCs.
+    Routing and fleets are applied as literal map lookups (``nearest_dc``,
+    ``fleet``), so they need no join either.
+    """
+
+    store_ids: tuple[int, ...]
+    dc_ids: tuple[int, ...]
+    store_hours: tuple[str, ...]
+    n_products: int
+    store_dc: Mapping[int, int]
+    dc_fleet: Mapping[int, tuple[int, ...]]
+
+    @classmethod
+    def from_rows(
+        cls,
+        stores: Iterable[tuple[int, str, str, str]],
+        dcs: Iterable[tuple[int, str, str]],
+        trucks: Iterable[tuple[int, int | None]],
+        n_products: int,
+    ) -> "DimensionContext":
+        """Build from (store_id, operating_hours, state, region),
+        (dc_id, state, region) and (truck_id, dc_id or None) rows.
+
+        Stores route to the nearest DC by geography: same state > same region
+        > lowest dc_id. A DC's fleet is its assigned trucks in id order; a DC
+        with none falls back to the shared pool (``DCID IS NULL``).
+        """
+        stores, dcs = sorted(stores), sorted(dcs)
+
+        def nearest(state: str, region: str) -> int:
+            return min(dcs, key=lambda dc: (
+                0 if dc[1] == state else 1 if dc[2] == region else 2, dc[0]))[0]
+
+        assigned: dict[int, list[int]] = {}
+        pool: list[int] = []
+        for tid, dcid in sorted(trucks):
+            if dcid is None:
+                pool.append(tid)
+            else:
+                assigned.setdefault(dcid, []).append(tid)
+        return cls(
+            store_ids=tuple(sid for sid, *_ in stores),
+            dc_ids=tuple(dc_id for dc_id, *_ in dcs),
+            store_hours=tuple(sorted({hours for _, hours, *_ in stores})),
+            n_products=n_products,
+            store_dc={sid: nearest(state, region) for sid, _, state, region in stores},
+            dc_fleet={dc_id: tuple(assigned.get(dc_id) or pool) for dc_id, *_ in dcs},
+        )
+
+    @classmethod
+    def from_tables(cls, dims: dict[str, DataFrame]) -> "DimensionContext":
+        """Rebuild from published dim tables (one small collect per table).
+
+        For callers that only hold the tables, e.g. tests or a driver reading
+        dims back from Silver; the engine uses ``build_dimensions``' copy.
+        """
+        geo = {r.ID: (r.State, r.Region)
+               for r in dims["dim_geographies"].select("ID", "State", "Region").collect()}
+        stores = [(r.ID, r.operating_hours, *geo[r.GeographyID])
+                  for r in dims["dim_stores"]
+                  .select("ID", "operating_hours", "GeographyID").collect()]
+        dcs = [(r.ID, *geo[r.GeographyID])
+               for r in dims["dim_distribution_centers"].select("ID", "GeographyID").collect()]
+        trucks = [(r.ID, None if r.DCID is None else int(r.DCID))
+                  for r in dims["dim_trucks"].select("ID", "DCID").collect()]
+        return cls.from_rows(stores, dcs, trucks, dims["dim_products"].count())
+
+    def nearest_dc(self, store_id: Column) -> Column:
+        """The routed DC id (long) for a store id column."""
+        pairs = [F.lit(v).cast("long")
+                 for sid, dc in self.store_dc.items() for v in (sid, dc)]
+        return F.element_at(F.create_map(*pairs), store_id)
+
+    def fleet(self, dc_id: Column) -> Column:
+        """The DC's truck ids (array<long>, possibly empty) for a DC id column."""
+        pairs = []
+        for dc, trucks in self.dc_fleet.items():
+            pairs += [F.lit(dc).cast("long"),
+                      F.array(*[F.lit(t) for t in trucks]).cast("array<long>")]
+        return F.element_at(F.create_map(*pairs), dc_id)
+
+
 def generate_dimensions(
     spark: SparkSession, dicts: DictionarySet, cfg: GenerationConfig
 ) -> dict[str, DataFrame]:
+    return build_dimensions(spark, dicts, cfg)[0]
+
+
+def build_dimensions(
+    spark: SparkSession, dicts: DictionarySet, cfg: GenerationConfig
+) -> tuple[dict[str, DataFrame], DimensionContext]:
+    """The dimension tables plus their ``DimensionContext``."""
     rng = np.random.default_rng(derive_seed(cfg.seed, "dims", 0, cfg.start_date))
     out: dict[str, DataFrame] = {}
 
     # --- geographies: sample from dictionary, sequential IDs
     n_geo = min(len(dicts.geographies), max(cfg.store_count * 2, cfg.dc_count * 2, 20))
     geo_idx = rng.choice(len(dicts.geographies), size=n_geo, replace=False)
-    geos = [dicts.geographies[i] for i in geo_idx]
+    # Sample straight from the dictionary columns; no row models are built.
+    geo_cols = {
+        name: dicts.column("geographies", name)[geo_idx].tolist()
+        for name in ("City", "State", "Zip", "District", "Region")
+    }
     geo_rows = [
-        (i + 1, g.City, g.State, g.Zip, g.District, g.Region)
-        for i, g in enumerate(geos)
+        (i + 1, *row)
+        for i, row in enumerate(zip(*geo_cols.values(), strict=True))
     ]
     out["dim_geographies"] = spark.createDataFrame(geo_rows, spark_schema("dim_geographies"))
 
@@ -119,12 +222,16 @@ def generate_dimensions(
     city_county: dict[tuple[str, str], str] = {}
     county_acc: dict[tuple[str, str], list[float]] = {}
     state_rates: dict[str, list[float]] = {}
-    for t in dicts.tax_rates:
-        rate = float(t.CombinedRate)
-        city_acc.setdefault((t.StateCode, t.City), []).append(rate)
-        city_county[(t.StateCode, t.City)] = t.County
-        county_acc.setdefault((t.StateCode, t.County), []).append(rate)
-        state_rates.setdefault(t.StateCode, []).append(rate)
+    for state, city, county, rate_text in zip(
+        *(dicts.column("tax_rates", name).tolist()
+          for name in ("StateCode", "City", "County", "CombinedRate")),
+        strict=True,
+    ):
+        rate = float(rate_text)
+        city_acc.setdefault((state, city), []).append(rate)
+        city_county[(state, city)] = county
+        county_acc.setdefault((state, county), []).append(rate)
+        state_rates.setdefault(state, []).append(rate)
     by_city = {k: float(np.mean(v)) for k, v in city_acc.items()}
     by_county = {k: float(np.mean(v)) for k, v in county_acc.items()}
 
@@ -149,14 +256,14 @@ def generate_dimensions(
     )
 
     # --- stores in DC states
-    dc_states = {geos[int(g)].State for g in dc_geo_idx}
-    eligible = [i for i, g in enumerate(geos) if g.State in dc_states] or list(range(n_geo))
+    geo_state, geo_city = geo_cols["State"], geo_cols["City"]
+    dc_states = {geo_state[int(g)] for g in dc_geo_idx}
+    eligible = [i for i, st in enumerate(geo_state) if st in dc_states] or list(range(n_geo))
     store_rows = []
     store_geo_indices: list[int] = []
     for sid in range(1, cfg.store_count + 1):
         gi = int(rng.choice(eligible))
         store_geo_indices.append(gi)
-        g = geos[gi]
         classes, probs = zip(*[(c, p) for c, p, _ in VOLUME_CLASSES])
         vc = str(rng.choice(classes, p=probs))
         lo, hi = next(r for c, _, r in VOLUME_CLASSES if c == vc)
@@ -165,7 +272,7 @@ def generate_dimensions(
             f"S{sid:06d}",
             _addr(rng),
             gi + 1,
-            tax_for(g.State, g.City),
+            tax_for(geo_state[gi], geo_city[gi]),
             vc,
             str(rng.choice(STORE_FORMATS)),
             str(rng.choice(OPERATING_HOURS)),
@@ -186,8 +293,9 @@ def generate_dimensions(
 
     # --- customers; ~70% placed in a store's geography (datagen home-store
     #     locality) so receipts can resolve a same-geography "local" shopper.
-    first = [n.Name for n in dicts.first_names]
-    last = [n.Name for n in dicts.last_names]
+    # Arrays, not lists: rng.choice would otherwise re-convert the list per draw.
+    first = dicts.column("first_names", "Name")
+    last = dicts.column("last_names", "Name")
     cust_rows = []
     for cid in range(1, cfg.customer_count + 1):
         if store_geo_indices and rng.random() < CUSTOMER_HOME_AFFINITY:
@@ -210,11 +318,19 @@ def generate_dimensions(
     # --- products: each base product is offered by up to brands_per_product
     #     category-matched brands (datagen combinatorial SKUs). Pricing/launch
     #     are re-rolled per branded variant for realistic price spread.
+    #     Everything below reads dictionary columns, so a 500k-SKU scale
+    #     catalog never materializes per-row models. Brand pools hold indices.
+    brand_name = dicts.column("brands", "Brand").tolist()
+    brand_company = dicts.column("brands", "Company").tolist()
     brands_by_cat: dict[str, list] = {}
-    for b in dicts.brands:
-        brands_by_cat.setdefault(b.Category.strip().lower(), []).append(b)
-    all_brands = list(dicts.brands)
-    tags_by_product = {t.ProductName: t.Tags for t in dicts.tags}
+    for i, category in enumerate(dicts.column("brands", "Category").tolist()):
+        brands_by_cat.setdefault(category.strip().lower(), []).append(i)
+    all_brands = list(range(len(brand_name)))
+    tags_by_product = dict(zip(
+        dicts.column("tags", "ProductName").tolist(),
+        dicts.column("tags", "Tags").tolist(),
+        strict=True,
+    ))
     # Use naive UTC datetimes — Spark session timezone is UTC (set in conftest fixture)
     hist_start = datetime.combine(cfg.start_date, datetime.min.time())
     # Guarantee every department has at least one product available from the
@@ -226,44 +342,50 @@ def generate_dimensions(
     dept_covered: set[str] = set()
     prod_rows = []
     pid = 0
-    for p in dicts.products:
-        pool = (_match_brand_category(p.Department, brands_by_cat)
-                or _match_brand_category(p.Category, brands_by_cat)
+    product_columns = zip(
+        *(dicts.column("products", name).tolist()
+          for name in ("ProductName", "BasePrice", "Department", "Category",
+                       "Subcategory", "Tags")),
+        strict=True,
+    )
+    for name, base_price, department, category, subcategory, own_tags in product_columns:
+        pool = (_match_brand_category(department, brands_by_cat)
+                or _match_brand_category(category, brands_by_cat)
                 or all_brands)
         k = min(cfg.brands_per_product, len(pool))
         brand_idx = rng.choice(len(pool), size=k, replace=False)
         taxability = (
-            "NON_TAXABLE" if p.Department in {"Fresh", "Grocery"} and "Candy" not in p.Category
-            else "REDUCED_RATE" if p.Department in {"Clothing", "Apparel"}
+            "NON_TAXABLE" if department in {"Fresh", "Grocery"} and "Candy" not in category
+            else "REDUCED_RATE" if department in {"Clothing", "Apparel"}
             else "TAXABLE"
         )
-        refrigerated = bool(p.Category in REFRIGERATED_CATEGORIES)
-        tags = p.Tags or tags_by_product.get(p.ProductName)
+        refrigerated = bool(category in REFRIGERATED_CATEGORIES)
+        tags = own_tags or tags_by_product.get(name)
         for j in brand_idx:
             pid += 1
             chosen = pool[int(j)]
             launch_r = float(rng.random())  # 60% before history, 30% first half, 10% later
-            if p.Department not in dept_covered:
+            if department not in dept_covered:
                 # First product seen for this department: pin pre-history so the
                 # department is sale-eligible on day one. Draw the RNG regardless
                 # (above) to keep every other product's launch stream unchanged.
                 launch = hist_start - timedelta(days=int(rng.integers(30, 1500)))
-                dept_covered.add(p.Department)
+                dept_covered.add(department)
             elif launch_r < 0.6:
                 launch = hist_start - timedelta(days=int(rng.integers(30, 1500)))
             elif launch_r < 0.9:
                 launch = hist_start + timedelta(days=int(rng.integers(0, 183)))
             else:
                 launch = hist_start + timedelta(days=int(rng.integers(183, 366)))
-            cost, msrp, sale = compute_pricing(float(p.BasePrice), rng)
+            cost, msrp, sale = compute_pricing(float(base_price), rng)
             prod_rows.append((
                 pid,
-                p.ProductName,
-                chosen.Brand,
-                chosen.Company,
-                p.Department,
-                p.Category,
-                p.Subcategory,
+                name,
+                brand_name[chosen],
+                brand_company[chosen],
+                department,
+                category,
+                subcategory,
                 cost,
                 msrp,
                 sale,
@@ -273,7 +395,15 @@ def generate_dimensions(
                 tags,
             ))
     out["dim_products"] = spark.createDataFrame(prod_rows, spark_schema("dim_products"))
-    return out
+
+    geo_region = geo_cols["Region"]
+    ctx = DimensionContext.from_rows(
+        stores=[(r[0], r[7], geo_state[r[3] - 1], geo_region[r[3] - 1]) for r in store_rows],
+        dcs=[(r[0], geo_state[r[3] - 1], geo_region[r[3] - 1]) for r in dc_rows],
+        trucks=[(r[0], None if r[3] is None else int(r[3])) for r in truck_rows],
+        n_products=len(prod_rows),
+    )
+    return out, ctx
 
 
 def generate_dim_date(spark: SparkSession, start: date, end: date) -> DataFrame:
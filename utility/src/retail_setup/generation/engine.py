@@ -35,14 +35,25 @@ def _shift_year(d: date, years: int) -> date:
 
 
 def generate_all(
-    spark: SparkSession, dicts: DictionarySet, cfg: GenerationConfig
+    spark: SparkSession,
+    dicts: DictionarySet,
+    cfg: GenerationConfig,
+    *,
+    inventory_state: DataFrame | None = None,
 ) -> GenerationResult:
+    """Generate every Silver table. ``inventory_state`` is a persisted
+    ``inventory_state_snapshot``; inventory balances resume from it (see
+    ``inventory.generate_inventory_chain``). The setup notebooks always
+    regenerate the full window and do not pass it. Fact generators share the
+    ``dims.DimensionContext`` built with the dimensions."""
     t: dict[str, DataFrame] = {}
-    t.update(dims_mod.generate_dimensions(spark, dicts, cfg))
+    dims, ctx = dims_mod.build_dimensions(spark, dicts, cfg)
+    t.update(dims)
     t["dim_date"] = dims_mod.generate_dim_date(
         spark, _shift_year(cfg.start_date, -5), _shift_year(cfg.end_date, 5))
 
-    sales = receipts_mod.generate_receipts_group(spark, t, dicts.profile, cfg)
+    sales = receipts_mod.generate_receipts_group(
+        spark, t, dicts.profile, cfg, ctx=ctx)
     # fact_receipts/lines (SALE-only) each feed several independent builders —
     # returns, promotions, foot traffic, BLE, inventory — plus the SALE/RETURN
     # unions below. Persist them so this shared, expensive lineage (xxhash draws
@@ -56,7 +67,8 @@ def generate_all(
     t["fact_receipt_lines"] = sales["fact_receipt_lines"].unionByName(
         rets["fact_receipt_lines"])
 
-    online = online_orders.generate_online_orders(spark, t, dicts.profile, cfg)
+    online = online_orders.generate_online_orders(
+        spark, t, dicts.profile, cfg, ctx=ctx)
     t["fact_online_order_headers"] = online["fact_online_order_headers"]
     t["fact_online_order_lines"] = online["fact_online_order_lines"]
     # single-writer union for the shared payments table (2a carry-note)
@@ -78,12 +90,13 @@ def generate_all(
     t["fact_promotions"] = attr["fact_promotions"]
     t["fact_marketing"] = attr["fact_marketing"]
     t["fact_marketing_attribution"] = attr["fact_marketing_attribution"]
-    t["fact_store_ops"] = store_activity.generate_store_ops(spark, t, cfg)
+    t["fact_store_ops"] = store_activity.generate_store_ops(spark, t, cfg, ctx=ctx)
     t["fact_foot_traffic"] = store_activity.generate_foot_traffic(
-        spark, sales["fact_receipts"], t, cfg)
+        spark, sales["fact_receipts"], t, cfg, ctx=ctx)
     pings, zc = sensors.generate_ble(spark, sales["fact_receipts"], t, cfg)
     t["fact_ble_pings"], t["fact_customer_zone_changes"] = pings, zc
-    t.update(inventory.generate_inventory_chain(spark, sales, rets, t, cfg))
+    t.update(inventory.generate_inventory_chain(
+        spark, sales, rets, t, cfg, inventory_state, ctx=ctx))
     # Downstream the driver runs run_invariants (50+ count/join/distinct actions
     # over these frames) and then write_all (one write + count per table).
     # Without caching, every one of those actions re-executes the full generation
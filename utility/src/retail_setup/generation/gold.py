@@ -7,14 +7,19 @@ replaces the legacy ``read_silver(...)``). Definitions are identical in
 Deliberate decisions (vs the legacy notebooks):
 - Money sums: legacy summed the formatted STRING columns (total_amount,
   subtotal_amount, tax_amount, ext_price, cost) relying on Spark's implicit
-  cast — here we cast explicitly to double. Identical results, honest types.
+  cast — here we sum ``*_cents / 100.0`` (the strings are formatted from
+  those cents, so each value is the same double), which also works on the
+  compact money layout where the strings are not stored. ``cost`` has no
+  cents source and is cast explicitly to double.
 - ``computed_at`` (top_products_15m) and ``as_of`` (both inventory positions)
   are produced exactly as the legacy code does, even though the TMDL doesn't
   bind them — extra columns are allowed.
 - Legacy quirks preserved: truck_dwell_daily derives ``site`` as
-  ``STORE_<id>`` / ``DC_<id>`` and filters ``dwell_min > 0``; the two
-  inventory positions take the latest balance per key via a row_number
-  window over ``event_ts`` descending.
+  ``STORE_<id>`` / ``DC_<id>`` and filters ``dwell_min > 0``.
+- The two inventory positions take the latest balance per key. Given an
+  ``inventory_state_snapshot`` table they read the latest snapshot plus the
+  txns after it; otherwise a row_number window over ``event_ts`` descending
+  (``trace_id`` breaks ties, matching the running-balance order).
 """
 
 from pyspark.sql import DataFrame, SparkSession
@@ -42,6 +47,59 @@ def _money(col: str):
     return F.col(col).cast("double")
 
 
+def _dollars(cents_col: str):
+    """Dollars as double from a cents column (same value as the %.2f string)."""
+    return F.col(cents_col) / F.lit(100.0)
+
+
+def _inventory_position(
+    txns: DataFrame,
+    node_col: str,
+    snapshots: DataFrame | None,
+    node_type: str,
+) -> DataFrame:
+    """Latest balance per (node, product) as ``on_hand``/``as_of``.
+
+    Without snapshots every txn is ranked (the legacy row_number). With
+    ``inventory_state_snapshot`` each pair's latest snapshot is topped up with
+    the txns dated after the newest snapshot (the tail), so only the tail is
+    scanned. Both agree: a snapshot is the running balance at its period's
+    last txn, and no pair has txns inside the window after its last snapshot.
+    """
+    if snapshots is None:
+        latest = Window.partitionBy(node_col, "product_id").orderBy(
+            F.desc("event_ts"), F.desc("trace_id"))
+        return (
+            txns.withColumn("rn", F.row_number().over(latest))
+            .filter(F.col("rn") == 1)
+            .select(
+                node_col, "product_id",
+                F.col("balance").alias("on_hand"),
+                F.col("event_ts").alias("as_of"),
+            )
+        )
+    snaps = (snapshots.filter(F.col("node_type") == node_type)
+             .withColumnRenamed("node_id", node_col))
+    keys = [node_col, "product_id"]
+    latest = snaps.groupBy(*keys).agg(
+        F.max_by("balance", "snapshot_date").alias("_snap"),
+        F.max_by("as_of", "snapshot_date").alias("_snap_as_of"),
+    )
+    cutoff = snaps.agg(F.max("snapshot_date").alias("_cutoff"))
+    tail = (
+        txns.crossJoin(F.broadcast(cutoff))
+        .filter(F.col("event_date") > F.col("_cutoff"))
+        .groupBy(*keys)
+        .agg(F.sum("quantity").alias("_tail"), F.max("event_ts").alias("_tail_as_of"))
+    )
+    return latest.join(tail, keys, "full").select(
+        *keys,
+        (F.coalesce("_snap", F.lit(0)) + F.coalesce("_tail", F.lit(0)))
+        .cast("long").alias("on_hand"),
+        F.coalesce("_tail_as_of", "_snap_as_of").alias("as_of"),
+    )
+
+
 def generate_campaign_performance(
     fact_marketing: DataFrame,
     fact_marketing_attribution: DataFrame,
@@ -114,9 +172,9 @@ def generate_gold(
         .withColumn("ts", F.date_trunc("minute", F.col("event_ts")))
         .groupBy("store_id", "ts")
         .agg(
-            F.sum(_money("total_amount")).alias("total_sales"),
+            F.sum(_dollars("total_cents")).alias("total_sales"),
             F.count("*").alias("receipts"),
-            F.avg(_money("total_amount")).alias("avg_basket"),
+            F.avg(_dollars("total_cents")).alias("avg_basket"),
         )
         .select(*column_names("sales_minute_store"))
     )
@@ -127,7 +185,7 @@ def generate_gold(
         .withColumn("window_15m", F.window(F.col("event_ts"), "15 minutes"))
         .groupBy("product_id", "window_15m")
         .agg(
-            F.sum(_money("ext_price")).alias("revenue"),
+            F.sum(_dollars("ext_cents")).alias("revenue"),
             F.sum("quantity").alias("units"),
         )
         .withColumn("computed_at", F.col("window_15m.end"))
@@ -135,35 +193,14 @@ def generate_gold(
         .select(*column_names("top_products_15m"))
     )
 
-    # Current store inventory position (latest balance per store/product)
-    store_pos_window = Window.partitionBy("store_id", "product_id").orderBy(
-        F.desc("event_ts"))
-    gold["inventory_position_current"] = (
-        tables["fact_store_inventory_txn"]
-        .withColumn("rn", F.row_number().over(store_pos_window))
-        .filter(F.col("rn") == 1)
-        .select(
-            "store_id", "product_id",
-            F.col("balance").alias("on_hand"),
-            F.col("event_ts").alias("as_of"),
-        )
-        .select(*column_names("inventory_position_current"))
-    )
-
-    # DC inventory position (latest balance per dc/product)
-    dc_pos_window = Window.partitionBy("dc_id", "product_id").orderBy(
-        F.desc("event_ts"))
-    gold["dc_inventory_position_current"] = (
-        tables["fact_dc_inventory_txn"]
-        .withColumn("rn", F.row_number().over(dc_pos_window))
-        .filter(F.col("rn") == 1)
-        .select(
-            "dc_id", "product_id",
-            F.col("balance").alias("on_hand"),
-            F.col("event_ts").alias("as_of"),
-        )
-        .select(*column_names("dc_inventory_position_current"))
-    )
+    # Current store / DC inventory position (latest balance per node/product)
+    snapshots = tables.get("inventory_state_snapshot")
+    gold["inventory_position_current"] = _inventory_position(
+        tables["fact_store_inventory_txn"], "store_id", snapshots, "STORE"
+    ).select(*column_names("inventory_position_current"))
+    gold["dc_inventory_position_current"] = _inventory_position(
+        tables["fact_dc_inventory_txn"], "dc_id", snapshots, "DC"
+    ).select(*column_names("dc_inventory_position_current"))
 
     # Truck dwell time daily
     gold["truck_dwell_daily"] = (
@@ -195,10 +232,10 @@ def generate_gold(
         .groupBy("day")
         .agg(
             F.count("*").alias("orders"),
-            F.sum(_money("subtotal_amount")).alias("subtotal"),
-            F.sum(_money("tax_amount")).alias("tax"),
-            F.sum(_money("total_amount")).alias("total"),
-            F.avg(_money("total_amount")).alias("avg_order_value"),
+            F.sum(_dollars("subtotal_cents")).alias("subtotal"),
+            F.sum(_dollars("tax_cents")).alias("tax"),
+            F.sum(_dollars("total_cents")).alias("total"),
+            F.avg(_dollars("total_cents")).alias("avg_order_value"),
         )
         .select(*column_names("online_sales_daily"))
     )
@@ -238,7 +275,7 @@ def generate_gold(
         .groupBy("day", "payment_method")
         .agg(
             F.count("*").alias("transactions"),
-            F.sum(_money("total_amount")).alias("total_amount"),
+            F.sum(_dollars("total_cents")).alias("total_amount"),
         )
         .select(*column_names("tender_mix_daily"))
     )
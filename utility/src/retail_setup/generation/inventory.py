@@ -6,7 +6,8 @@ Eight internal stages produce six fact tables from the sales/returns groups:
    RETURN add-backs mirror return lines (positive quantity).
 2. Reorders: per (store, day), the day's top-5 demanded products gated at
    ``u < 0.4`` each emit one reorder. Stores route to the nearest DC by
-   state/region and high-volume store-days split across truck-capacity legs.
+   state/region (``dims.DimensionContext``, precomputed with the dimensions)
+   and high-volume store-days split across truck-capacity legs.
 3. Shipments: one per (store, day, leg) with reorders. The truck is chosen
    round-robin by day number from that DC's assigned trucks in ``dim_trucks``
    (``DCID == dc``); a DC with no assigned trucks falls back to the shared
@@ -25,12 +26,14 @@ Eight internal stages produce six fact tables from the sales/returns groups:
 6. Store INBOUND_SHIPMENT rows mirroring truck UNLOADs (positive quantity,
    source = shipment_id, UNLOADING ts).
 7. Balances: a day-0 INITIAL seed txn per (node, product) seen in that
-   node's stream (store 40-120, DC 500-2000, source 'SEED'), then a running
-   ``sum(quantity)`` window ordered by (event_ts, trace_id). Negatives are
-   not clamped — they become stockout signals.
+   node's stream (store 40-120, DC 500-2000, source 'SEED'), then the running
+   ``sum(quantity)`` balance ordered by (event_ts, trace_id), computed in two
+   levels: each day's opening balance from a prefix sum over daily net
+   quantities, then an intra-day window per (node, product, day). Negatives
+   are not clamped — they become stockout signals.
 8. Stockouts: txns where the running balance crosses to <= 0 (previous
-   balance > 0), deduped to one per (node, product, day). StoreID/DCID are
-   mutually exclusive doubles per the TMDL contract.
+   balance, ``balance - quantity``, > 0), deduped to one per (node, product,
+   day). StoreID/DCID are mutually exclusive doubles per the TMDL contract.
 
 All randomness flows through ``runtime.seeded_draws`` so output is
 deterministic per (config, seed). Stage 7-8 helpers (balances, stockouts)
@@ -42,9 +45,12 @@ from pyspark.sql import functions as F
 from pyspark.sql.window import Window
 
 from retail_setup.config.generation import GenerationConfig
+from retail_setup.generation.dims import DimensionContext
 from retail_setup.generation.inventory_balances import (
     TXN_COLS,
     draw_int,
+    opening_state,
+    state_snapshots,
     stockouts,
     with_balances,
 )
@@ -114,33 +120,7 @@ def _sale_txns(sales: dict[str, DataFrame], rets: dict[str, DataFrame],
 # Stage 2: reorders
 # ---------------------------------------------------------------------------
 
-def _store_dc_map(dims: dict[str, DataFrame]) -> DataFrame:
-    """Route each store to its nearest DC by geography (same state > same region
-    > lowest dc_id), restoring datagen's geography-aware assignment in place of a
-    ``store_id % dc_count`` modulo. Returns one (store_id, dc_id) row per store."""
-    geo = dims["dim_geographies"].select(
-        F.col("ID").alias("geo_id"), "State", "Region")
-    stores = (dims["dim_stores"].select(F.col("ID").alias("store_id"), "GeographyID")
-              .join(geo, F.col("GeographyID") == F.col("geo_id"))
-              .select("store_id", F.col("State").alias("s_state"),
-                      F.col("Region").alias("s_region")))
-    dcs = (dims["dim_distribution_centers"]
-           .select(F.col("ID").alias("dc_id"), "GeographyID")
-           .join(geo, F.col("GeographyID") == F.col("geo_id"))
-           .select("dc_id", F.col("State").alias("d_state"),
-                   F.col("Region").alias("d_region")))
-    scored = stores.crossJoin(dcs).withColumn(
-        "_score",
-        F.when(F.col("s_state") == F.col("d_state"), 0)
-        .when(F.col("s_region") == F.col("d_region"), 1)
-        .otherwise(2))
-    nearest = Window.partitionBy("store_id").orderBy("_score", "dc_id")
-    return (scored.withColumn("_r", F.row_number().over(nearest))
-            .filter(F.col("_r") == 1)
-            .select("store_id", F.col("dc_id").cast("long").alias("dc_id")))
-
-
-def _reorders(store_txns: DataFrame, store_dc: DataFrame, d: seeded_draws,
+def _reorders(store_txns: DataFrame, ctx: DimensionContext, d: seeded_draws,
               cfg: GenerationConfig) -> DataFrame:
     demand = (store_txns.filter(F.col("txn_type") == "SALE")
               .groupBy(F.col("node_id").alias("store_id"),
@@ -175,7 +155,7 @@ def _reorders(store_txns: DataFrame, store_dc: DataFrame, d: seeded_draws,
                         .otherwise("NORMAL"))
             .withColumn("event_ts", _at(F.col("event_date"), "23:00:00"))
             # Geography-aware store->DC routing (nearest DC by state/region).
-            .join(store_dc, "store_id")
+            .withColumn("dc_id", ctx.nearest_dc(F.col("store_id")))
             .withColumn("trace_id", F.concat(
                 F.lit("TRC-RO-"), F.col("store_id").cast("string"), F.lit("-"),
                 F.col("event_date").cast("string"), F.lit("-"),
@@ -187,28 +167,7 @@ def _reorders(store_txns: DataFrame, store_dc: DataFrame, d: seeded_draws,
 # Stage 3: shipments (one per store-day with reorders) + truck assignment
 # ---------------------------------------------------------------------------
 
-def _truck_lookup(spark: SparkSession, dims: dict[str, DataFrame],
-                  cfg: GenerationConfig) -> DataFrame:
-    """(dc_id, slot, truck_id, n_trucks) rows for round-robin-by-day joins."""
-    trucks = dims["dim_trucks"].select("ID", "DCID").collect()
-    assigned: dict[int, list[int]] = {}
-    pool: list[int] = []
-    for r in trucks:
-        if r.DCID is None:
-            pool.append(int(r.ID))
-        else:
-            assigned.setdefault(int(r.DCID), []).append(int(r.ID))
-    rows = []
-    for dc in range(1, cfg.dc_count + 1):
-        # Fall back to pool trucks for DCs with no assigned trucks (documented).
-        fleet = sorted(assigned.get(dc) or pool)
-        rows.extend((dc, slot, tid, len(fleet)) for slot, tid in enumerate(fleet))
-    return spark.createDataFrame(
-        rows, "dc_id long, slot long, truck_id long, n_trucks long")
-
-
-def _shipments(spark: SparkSession, reorders: DataFrame,
-               dims: dict[str, DataFrame], d: seeded_draws,
+def _shipments(reorders: DataFrame, ctx: DimensionContext, d: seeded_draws,
                cfg: GenerationConfig) -> DataFrame:
     """One row per shipment leg with truck assignment and the full timing model.
 
@@ -226,13 +185,12 @@ def _shipments(spark: SparkSession, reorders: DataFrame,
                 F.lpad(F.col("leg").cast("string"), 2, "0")))
             .withColumn("_day_num", F.datediff(
                 F.col("event_date"), F.lit(cfg.start_date))))
-    lookup = _truck_lookup(spark, dims, cfg)
-    sizes = lookup.select("dc_id", "n_trucks").distinct()
+    # round-robin by day over the DC's fleet; a DC without trucks ships nothing
     timed = (base
-             .join(sizes, "dc_id")
-             .withColumn("slot", F.pmod(
-                 F.col("_day_num") + F.col("leg"), F.col("n_trucks")))
-             .join(lookup, ["dc_id", "slot", "n_trucks"])
+             .withColumn("_fleet", ctx.fleet(F.col("dc_id")))
+             .filter(F.size("_fleet") > 0)
+             .withColumn("truck_id", F.element_at("_fleet", (F.pmod(
+                 F.col("_day_num") + F.col("leg"), F.size("_fleet")) + 1).cast("int")))
              .withColumn("_travel_h",
                          F.lit(2.0) + d.u(keys, "ship-travel") * F.lit(10.0))
              .withColumn("_unload_h",
@@ -250,7 +208,7 @@ def _shipments(spark: SparkSession, reorders: DataFrame,
             .withColumn("etd", _plus_hours(F.col("eta"), F.col("_unload_h")))
             .withColumn("unload_minutes",
                         F.round(F.col("_unload_h") * F.lit(60.0), 1))
-            .drop("_day_num", "slot", "n_trucks", "_travel_h", "_unload_h"))
+            .drop("_day_num", "_fleet", "_travel_h", "_unload_h"))
 
 
 def _truck_moves(shipments: DataFrame) -> DataFrame:
@@ -389,22 +347,35 @@ def generate_inventory_chain(
     rets: dict[str, DataFrame],
     dims: dict[str, DataFrame],
     cfg: GenerationConfig,
+    state: DataFrame | None = None,
+    *,
+    ctx: DimensionContext | None = None,
 ) -> dict[str, DataFrame]:
-    """Generate the six inventory/logistics fact tables (see module docstring)."""
+    """Generate the six inventory/logistics fact tables (see module docstring),
+    plus ``inventory_state_snapshot`` unless snapshots are disabled.
+
+    ``state`` is a persisted ``inventory_state_snapshot``; pairs it covers
+    resume from their latest balance before ``cfg.start_date``. ``ctx``
+    carries store->DC routing and DC fleets; it is rebuilt from ``dims``
+    when omitted."""
     d = seeded_draws(cfg.seed)
+    ctx = ctx or DimensionContext.from_tables(dims)
 
     demand_txns = _sale_txns(sales, rets, d)
-    reorders = _reorders(demand_txns, _store_dc_map(dims), d, cfg)
-    shipments = _shipments(spark, reorders, dims, d, cfg)
+    reorders = _reorders(demand_txns, ctx, d, cfg)
+    shipments = _shipments(reorders, ctx, d, cfg)
     truck_moves = _truck_moves(shipments)
     truck_inv = _truck_inventory(shipments, reorders)
 
-    n_products = dims["dim_products"].count()
-    dc_raw = _dc_txns(spark, truck_inv, n_products, d, cfg)
+    dc_raw = _dc_txns(spark, truck_inv, ctx.n_products, d, cfg)
     store_raw = demand_txns.unionByName(_store_inbound(truck_inv))
 
-    store_bal = with_balances(store_raw, 40, 120, "ST", d, cfg)
-    dc_bal = with_balances(dc_raw, 500, 2000, "DC", d, cfg)
+    store_state = dc_state = None
+    if state is not None:
+        store_state = opening_state(state, "STORE", cfg.start_date)
+        dc_state = opening_state(state, "DC", cfg.start_date)
+    store_bal = with_balances(store_raw, 40, 120, "ST", d, cfg, store_state)
+    dc_bal = with_balances(dc_raw, 500, 2000, "DC", d, cfg, dc_state)
 
     fact_store_txn = _with_index(
         store_bal.withColumnRenamed("node_id", "store_id"),
@@ -419,7 +390,7 @@ def generate_inventory_chain(
     stockouts_df = (stockouts(store_bal, "ST", "StoreID")
                     .unionByName(stockouts(dc_bal, "DC", "DCID")))
 
-    return {
+    out = {
         "fact_store_inventory_txn": fact_store_txn,
         "fact_dc_inventory_txn": fact_dc_txn,
         "fact_truck_moves": _with_index(truck_moves, "fact_truck_moves"),
@@ -427,3 +398,8 @@ def generate_inventory_chain(
         "fact_reorders": _with_index(reorders, "fact_reorders"),
         "fact_stockouts": _with_index(stockouts_df, "fact_stockouts"),
     }
+    if cfg.inventory_snapshot_interval is not None:
+        out["inventory_state_snapshot"] = (
+            state_snapshots(store_bal, "STORE", cfg)
+            .unionByName(state_snapshots(dc_bal, "DC", cfg)))
+    return out
@@ -7,6 +7,8 @@ both modules live here to keep the import direction one-way
 (``inventory`` -> ``inventory_balances``).
 """
 
+from datetime import date, timedelta
+
 from pyspark.sql import Column, DataFrame
 from pyspark.sql import functions as F
 from pyspark.sql.window import Window
@@ -29,11 +31,19 @@ def draw_int(u: Column, lo: int, hi: int) -> Column:
 # ---------------------------------------------------------------------------
 
 def with_balances(txns: DataFrame, lo: int, hi: int, tag: str,
-                  d: seeded_draws, cfg: GenerationConfig) -> DataFrame:
+                  d: seeded_draws, cfg: GenerationConfig,
+                  state: DataFrame | None = None) -> DataFrame:
     """Fold a day-0 INITIAL seed txn per (node, product) into the stream and
     compute the running balance ordered by (event_ts, trace_id). Negative
-    balances are not clamped — they become stockout signals."""
-    seeds = (txns.select("node_id", "product_id").distinct()
+    balances are not clamped — they become stockout signals.
+
+    ``state`` (node_id, product_id, balance; see ``opening_state``) resumes
+    pairs from a persisted balance instead of seeding them; ``txns`` must then
+    start after the state's snapshot date."""
+    pairs = txns.select("node_id", "product_id").distinct()
+    if state is not None:
+        pairs = pairs.join(state, ["node_id", "product_id"], "left_anti")
+    seeds = (pairs
              .withColumn("quantity",
                          draw_int(d.u(["node_id", "product_id"],
                                       f"seed-stock-{tag}"), lo, hi))
@@ -49,11 +59,83 @@ def with_balances(txns: DataFrame, lo: int, hi: int, tag: str,
                  F.lit(f"TRC-INIT-{tag}-"), F.col("node_id").cast("string"),
                  F.lit("-"), F.col("product_id").cast("string")))
              .select(*TXN_COLS))
-    run_w = (Window.partitionBy("node_id", "product_id")
+    stream = txns.unionByName(seeds).withColumn("_day", F.to_date("event_ts"))
+    # Level 1: net quantity per (node, product, day), prefix-summed over that
+    # compact daily series into each day's opening balance.
+    day_keys = ["node_id", "product_id", "_day"]
+    before_w = (Window.partitionBy("node_id", "product_id").orderBy("_day")
+                .rowsBetween(Window.unboundedPreceding, -1))
+    opening = (stream.groupBy(*day_keys).agg(F.sum("quantity").alias("_net"))
+               .withColumn("_open", F.coalesce(
+                   F.sum("_net").over(before_w), F.lit(0)).cast("long"))
+               .drop("_net"))
+    if state is not None:
+        opening = (opening.join(state.withColumnRenamed("balance", "_base"),
+                                ["node_id", "product_id"], "left")
+                   .withColumn("_open", F.col("_open") + F.coalesce(
+                       F.col("_base"), F.lit(0)).cast("long"))
+                   .drop("_base"))
+    # Level 2: running balance within the day. The sort only spans one
+    # (node, product, day); ordering by (event_ts, trace_id) inside calendar
+    # days is the same as over the whole history.
+    run_w = (Window.partitionBy(*day_keys)
              .orderBy("event_ts", "trace_id")
              .rowsBetween(Window.unboundedPreceding, Window.currentRow))
-    return (txns.unionByName(seeds)
-            .withColumn("balance", F.sum("quantity").over(run_w).cast("long")))
+    return (stream.join(opening, day_keys)
+            .withColumn("balance",
+                        (F.col("_open") + F.sum("quantity").over(run_w)).cast("long"))
+            .select(*TXN_COLS, "balance"))
+
+
+# ---------------------------------------------------------------------------
+# State snapshots
+# ---------------------------------------------------------------------------
+
+_PERIOD_END = {
+    "day": lambda day: day,
+    "week": lambda day: F.next_day(F.date_sub(day, 1), "Sun"),
+    "month": F.last_day,
+}
+
+
+def state_snapshots(balanced: DataFrame, node_type: str,
+                    cfg: GenerationConfig) -> DataFrame:
+    """End-of-period balance per (node, product) at
+    ``cfg.inventory_snapshot_interval``, for periods with txns.
+
+    The last period is cut at ``cfg.end_date`` and later-dated txns (next-day
+    truck legs) are left out, so a snapshot never claims a state past the
+    generated window; readers add txns dated after it (the tail)."""
+    day = F.col("event_date")
+    end = F.lit(cfg.end_date)
+    period_end = _PERIOD_END[cfg.inventory_snapshot_interval](day)
+    return (balanced.filter(day <= end)
+            .withColumn("snapshot_date", F.least(period_end, end))
+            .groupBy("snapshot_date", "node_id", "product_id")
+            .agg(F.max_by("balance", F.struct("event_ts", "trace_id")).alias("balance"),
+                 F.max("event_ts").alias("as_of"))
+            .select("snapshot_date", F.lit(node_type).alias("node_type"),
+                    "node_id", "product_id", "balance", "as_of"))
+
+
+def opening_state(snapshots: DataFrame, node_type: str, before: date) -> DataFrame:
+    """Each pair's latest snapshotted balance dated before ``before``.
+
+    A snapshot covers every txn up to its date, so resuming is only exact when
+    the snapshots reach the day before ``before``; pairs without a snapshot on
+    that day had no txns since their latest one. Raises ``ValueError`` when no
+    ``node_type`` snapshot is dated ``before - 1 day``, rather than silently
+    dropping the txns of the gap."""
+    last_day = before - timedelta(days=1)
+    of_type = snapshots.filter(F.col("node_type") == node_type)
+    if not of_type.filter(F.col("snapshot_date") == F.lit(last_day)).limit(1).count():
+        raise ValueError(
+            f"inventory_state_snapshot has no {node_type} snapshot dated {last_day}; "
+            f"a run starting {before} can only resume from the day before it")
+    return (of_type
+            .filter(F.col("snapshot_date") < F.lit(before))
+            .groupBy("node_id", "product_id")
+            .agg(F.max_by("balance", "snapshot_date").alias("balance")))
 
 
 # ---------------------------------------------------------------------------
@@ -63,15 +145,17 @@ def with_balances(txns: DataFrame, lo: int, hi: int, tag: str,
 def stockouts(balanced: DataFrame, tag: str, node_as: str) -> DataFrame:
     """Balance crossings to <=0 (previous balance > 0); deduped to one per
     (node, product, day). ``node_as`` is 'StoreID' or 'DCID' — the other
-    contract column stays NULL (double, per the TMDL contract)."""
-    order_w = Window.partitionBy("node_id", "product_id").orderBy(
-        "event_ts", "trace_id")
+    contract column stays NULL (double, per the TMDL contract).
+
+    The previous balance is ``balance - quantity``, so crossings are a plain
+    filter over the balanced stream; only the (few) crossings are sorted for
+    the per-day dedupe."""
     day_w = Window.partitionBy("node_id", "product_id", "event_date").orderBy(
         "event_ts", "trace_id")
     other = "DCID" if node_as == "StoreID" else "StoreID"
     return (balanced
-            .withColumn("_prev", F.lag("balance").over(order_w))
-            .filter((F.col("balance") <= 0) & (F.col("_prev") > 0))
+            .filter((F.col("balance") <= 0)
+                    & (F.col("balance") - F.col("quantity") > 0))
             .withColumn("_dup", F.row_number().over(day_w))
             .filter(F.col("_dup") == 1)
             .select(
@@ -24,7 +24,12 @@ from pyspark.sql import DataFrame, SparkSession
 from pyspark.sql import functions as F
 
 from retail_setup.config.generation import GenerationConfig
-from retail_setup.generation.runtime import legacy_index, seeded_draws
+from retail_setup.generation.runtime import (
+    day_grid,
+    explode_seq,
+    legacy_index,
+    seeded_draws,
+)
 from retail_setup.generation.schemas import column_names
 
 # (archetype, channels, base impressions/day at the legacy 86-store fleet,
@@ -64,21 +69,21 @@ def generate_marketing(
     d = seeded_draws(cfg.seed)
     scale = cfg.store_count / LEGACY_FLEET_SIZE
 
-    # --- day x archetype grid (driver-side; days x 4 rows)
-    rows = [
-        (idx + 1, name, channels, base, dur)
+    # --- day x archetype grid: executor-side day range x literal archetypes
+    archetypes = F.array(*[
+        F.struct(
+            F.lit(idx + 1).alias("archetype_idx"),
+            F.lit(name).alias("archetype"),
+            F.array(*[F.lit(c) for c in channels]).alias("channels"),
+            F.lit(base).alias("base_impressions"),
+            F.lit(dur).alias("duration"),
+        )
         for idx, (name, channels, base, dur) in enumerate(ARCHETYPES)
-    ]
-    grid = spark.createDataFrame(
-        [
-            (day_offset, idx, name, channels, base, dur)
-            for day_offset in range((cfg.end_date - cfg.start_date).days + 1)
-            for (idx, name, channels, base, dur) in rows
-        ],
-        "day_offset int, archetype_idx int, archetype string, "
-        "channels array<string>, base_impressions int, duration int",
-    ).withColumn(
-        "day", F.date_add(F.lit(cfg.start_date), F.col("day_offset"))
+    ])
+    grid = (
+        day_grid(spark, cfg.start_date, cfg.end_date)
+        .select("day_offset", "day", F.explode(archetypes).alias("_a"))
+        .select("day_offset", "day", "_a.*")
     ).withColumn(
         # campaigns span their archetype duration: the day's impressions belong
         # to the campaign window [start + k*duration, ...) it falls in.
@@ -102,10 +107,9 @@ def generate_marketing(
     ).cast("int")
     grid = grid.withColumn("n_impressions", n_imps)
 
-    # --- explode to impressions; build IDs
+    # --- explode to impressions (sliced across tasks per day); build IDs
     imps = (
-        grid
-        .withColumn("seq", F.explode(F.sequence(F.lit(1), F.col("n_impressions"))))
+        explode_seq(grid, "n_impressions", ["day", "archetype"])
         .withColumn(
             # campaign_id keyed on the campaign window so it spans multiple days
             "campaign_id",
@@ -17,16 +17,20 @@ Documented decisions (per plan 2b, Task 5):
   the `payment.amount == header.total` invariant.
 """
 
-from datetime import timedelta
-
 from pyspark.sql import Column, DataFrame, SparkSession
 from pyspark.sql import functions as F
 from pyspark.sql.window import Window
 
 from retail_setup.config.generation import GenerationConfig
 from retail_setup.dictionaries.models import StoreTypeProfile
+from retail_setup.generation.dims import DimensionContext
 from retail_setup.generation.receipts import BASE_DECLINE, DECLINE_REASONS, _fmt
-from retail_setup.generation.runtime import legacy_index, seeded_draws
+from retail_setup.generation.runtime import (
+    day_grid,
+    explode_seq,
+    legacy_index,
+    seeded_draws,
+)
 from retail_setup.generation.schemas import column_names
 
 # Online tender mix per plan: 60% CC / 25% DC / 10% PAYPAL / 5% OTHER.
@@ -49,6 +53,10 @@ BACKORDER_RATE = 0.08
 # basket-size buckets: 60% -> 1-3 lines, 30% -> 2-5, 10% -> 5-8
 BASKET_BUCKETS = [("S", 0.60, 1, 3), ("M", 0.30, 2, 5), ("L", 0.10, 5, 8)]
 
+# order_id_ext seq width: 8 digits keeps ids unique up to 99,999,999 orders/day
+ORDER_SEQ_DIGITS = 8
+MAX_ORDERS_PER_DAY = 10**ORDER_SEQ_DIGITS - 1
+
 # promo codes with matching percentage discounts (5/10/20%)
 PROMOS = [("PROMO05", 5), ("PROMO10", 10), ("PROMO20", 20)]
 
@@ -58,13 +66,23 @@ def generate_online_orders(
     dims: dict[str, DataFrame],
     profile: StoreTypeProfile,
     cfg: GenerationConfig,
+    *,
+    ctx: DimensionContext | None = None,
 ) -> dict[str, DataFrame]:
     """Generate fact_online_order_headers, fact_online_order_lines, payments.
 
     Payments are returned under the "payments" key for the orchestrator to
     union with the in-store stream before writing fact_payments.
     """
+    mw = profile.monthly_weights
+    m_mean = sum(mw) / 12.0
+    peak = float(cfg.online_orders_per_day) * max(mw) / m_mean
+    if peak > MAX_ORDERS_PER_DAY:
+        raise ValueError(
+            f"online_orders_per_day={cfg.online_orders_per_day:,} peaks at {peak:,.0f} "
+            f"orders/day; order_id_ext holds at most {MAX_ORDERS_PER_DAY:,}")
     d = seeded_draws(cfg.seed)
+    ctx = ctx or DimensionContext.from_tables(dims)
 
     # Destination-based tax: per-customer-geography rate (mean store tax_rate in
     # that geography), with the network mean as the fallback for geographies
@@ -83,23 +101,17 @@ def generate_online_orders(
         )
     )
 
-    dc_ids = sorted(r.ID for r in dims["dim_distribution_centers"].select("ID").collect())
-    store_ids = sorted(r.ID for r in dims["dim_stores"].select("ID").collect())
+    dc_ids, store_ids = ctx.dc_ids, ctx.store_ids
     dc_arr = F.array(*[F.lit(int(i)).cast("long") for i in dc_ids])
     st_arr = F.array(*[F.lit(int(i)).cast("long") for i in store_ids])
 
     # --- day grid: network-wide daily volume, monthly-weight scaled, clamped normal
-    mw = profile.monthly_weights
-    m_mean = sum(mw) / 12.0
-    day_list = [
-        cfg.start_date + timedelta(days=i)
-        for i in range((cfg.end_date - cfg.start_date).days + 1)
-    ]
-    days = spark.createDataFrame([(day,) for day in day_list], "day date")
+    days = day_grid(spark, cfg.start_date, cfg.end_date).select("day")
     monthly_w = F.element_at(F.array(*[F.lit(w / m_mean) for w in mw]), F.month("day"))
     lam = F.lit(float(cfg.online_orders_per_day)) * monthly_w
-    n_orders = F.greatest(
-        F.lit(1), F.round(lam + d.gauss(["day"], "onl_n") * F.sqrt(lam))).cast("int")
+    # capped so the noise tail can never overflow the seq digits of the id
+    n_orders = F.least(F.lit(MAX_ORDERS_PER_DAY), F.greatest(
+        F.lit(1), F.round(lam + d.gauss(["day"], "onl_n") * F.sqrt(lam)))).cast("int")
 
     # --- orders: ids, timestamps, customer, tender, cancellation, basket size
     bucket = d.pick_by_weights(
@@ -111,9 +123,9 @@ def generate_online_orders(
             (d.h64(["day", "seq"], f"onl_size_{name}") % (hi - lo + 1) + lo).cast("int"),
         ).otherwise(basket_n)
 
+    # each day's orders are split into slices spread across tasks
     orders = (
-        days.withColumn("n_orders", n_orders)
-        .withColumn("seq", F.explode(F.sequence(F.lit(1), F.col("n_orders"))))
+        explode_seq(days.withColumn("n_orders", n_orders), "n_orders", ["day"])
         .withColumn("hour", (d.h64(["day", "seq"], "onl_hour") % 24).cast("int"))
         .withColumn("minute", (d.h64(["day", "seq"], "onl_min") % 60).cast("int"))
         .withColumn("second", (d.h64(["day", "seq"], "onl_sec") % 60).cast("int"))
@@ -121,12 +133,12 @@ def generate_online_orders(
             F.year("day"), F.month("day"), F.dayofmonth("day"),
             F.col("hour"), F.col("minute"), F.col("second")))
         .withColumn("event_date", F.col("day"))
-        # ONL + yyyyMMdd + 5-digit seq + 3-digit draw; unique because (day, seq)
-        # is a key within the grid.
-        # NOTE: lpad(seq, 5) collides above 99,999 orders/day; config max ~16k so safe.
+        # ONL + yyyyMMdd + 8-digit seq + 3-digit draw; unique because (day, seq)
+        # is a key within the grid (lpad truncates; n_orders is capped so seq
+        # fits ORDER_SEQ_DIGITS).
         .withColumn("order_id_ext", F.concat(
             F.lit("ONL"), F.date_format("day", "yyyyMMdd"),
-            F.lpad(F.col("seq").cast("string"), 5, "0"),
+            F.lpad(F.col("seq").cast("string"), ORDER_SEQ_DIGITS, "0"),
             F.lpad((d.h64(["day", "seq"], "onl_rand") % 1000).cast("string"), 3, "0")))
         .withColumn("customer_id", (d.h64(["order_id_ext"], "onl_cust")
                                     % F.lit(cfg.customer_count) + 1).cast("long"))
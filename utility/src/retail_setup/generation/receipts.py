@@ -16,15 +16,28 @@ integer formula exactly:
     rate_bps = round(rate * 10000); mult = 100/50/0 by taxability;
     tax = (ext_cents * rate_bps * mult + 500_000) // 1_000_000
 implemented with Spark integer `DIV` so no float rounding is involved.
+
+Keys: draws are keyed on the 25-char ``receipt_id_ext`` string, but every join
+and the header rollup run on ``_rk``, a packed 64-bit (day, store, seq) key.
+All line draws are taken before the first line join, the string is dropped,
+and ``receipt_id_ext``/``trace_id`` are re-formatted from ``_rk`` and the
+receipt timestamp only in the final selects (``_receipt_id_ext``).
 """
 
-from pyspark.sql import Column, DataFrame, SparkSession
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable, Iterable
+from datetime import date, timedelta
+from itertools import accumulate
+from math import isqrt
+
+from pyspark.sql import Column, DataFrame, Row, SparkSession
 from pyspark.sql import functions as F
 from pyspark.sql.window import Window
 
 from retail_setup.config.generation import GenerationConfig
 from retail_setup.dictionaries.models import StoreTypeProfile
-from retail_setup.generation.runtime import seeded_draws, store_day_grid
+from retail_setup.generation.dims import DimensionContext
+from retail_setup.generation.runtime import DrawStream, seeded_draws, store_day_grid
 from retail_setup.generation.schemas import column_names
 
 # (method, mix weight, decline multiplier, processing_ms lo, processing_ms hi)
@@ -94,6 +107,34 @@ SEGMENT_WEIGHTS: list[tuple[str, float]] = [
     ("BUDGET", 0.35), ("CONVENIENCE", 0.25), ("QUALITY", 0.20), ("BRAND_LOYAL", 0.20),
 ]
 
+# Packed receipt key ``_rk`` = days since epoch | store_id | seq. receipt_id_ext
+# pads seq to 6 digits and store_id to 4 (store_count is capped at 2000), so
+# both fit their fields; the day field leaves ~30 bits of headroom.
+_SEQ_BITS = 20
+_STORE_BITS = 14
+
+
+def _pack_receipt_key(day: Column, store_id: Column, seq: Column) -> Column:
+    """Pack (day, store_id, seq) into one long; unique per in-store receipt."""
+    days = F.datediff(day, F.lit("1970-01-01").cast("date")).cast("long")
+    return (F.shiftleft(days, _STORE_BITS + _SEQ_BITS)
+            .bitwiseOR(F.shiftleft(store_id.cast("long"), _SEQ_BITS))
+            .bitwiseOR(seq.cast("long")))
+
+
+def _receipt_id_ext(rk: Column, event_ts: Column) -> Column:
+    """Format receipt_id_ext from a packed key and the receipt's timestamp.
+
+    RCP(3) + yyyyMMddHHmm(12) + store(4) + seq(6) = 25 chars, unique by
+    construction since (store_id, day, seq) is a key.
+    """
+    store_id = F.shiftright(rk, _SEQ_BITS).bitwiseAND(F.lit((1 << _STORE_BITS) - 1))
+    seq = rk.bitwiseAND(F.lit((1 << _SEQ_BITS) - 1))
+    return F.concat(
+        F.lit("RCP"), F.date_format(event_ts, "yyyyMMddHHmm"),
+        F.lpad(store_id.cast("string"), 4, "0"),
+        F.lpad(seq.cast("string"), 6, "0"))
+
 
 def _segment_price_skew(u: Column, seg: Column) -> Column:
     """Skew a uniform draw toward cheaper/pricier products by customer segment.
@@ -167,16 +208,18 @@ def _seasonal_factor(dept_name: str, month_col: Column) -> Column:
     return expr.otherwise(F.lit(1.0))
 
 
-def _with_seasonal_department(df: DataFrame, u_col: Column,
-                              dept_weights: dict[str, float]) -> DataFrame:
-    """Pick a department per row via inverse-CDF over base weights scaled by the
-    seasonal lift for the row's month.
+def _seasonal_department_cdf(
+    df: DataFrame, dept_weights: dict[str, float],
+) -> tuple[DataFrame, Callable[[Column], Column], list[str]]:
+    """Materialize the month-scaled department CDF on each row.
+
+    Returns the frame, a ``pick(u)`` building the inverse-CDF department
+    expression over those columns, and the helper columns to drop afterwards.
 
     Intermediate per-department weight (``_w*``) and cumulative-CDF (``_c*``)
     columns are materialized so Catalyst codegen stays small even for store
     types with many departments (an inline single expression overflows the
-    64 KB JVM method limit and forces interpreted fallback). They are dropped
-    before returning.
+    64 KB JVM method limit and forces interpreted fallback).
     """
     depts = list(dept_weights)
     month = F.month(F.col("event_date"))
@@ -193,15 +236,25 @@ def _with_seasonal_department(df: DataFrame, u_col: Column,
         term = F.col(f"_w{i}") / F.col("_wt")
         out = out.withColumn(f"_c{i}", term if prev is None else F.col(prev) + term)
         prev = f"_c{i}"
-    expr: Column | None = None
-    for i, dn in enumerate(depts[:-1]):
-        cond = u_col < F.col(f"_c{i}")
-        expr = F.when(cond, F.lit(dn)) if expr is None else expr.when(cond, F.lit(dn))
-    dept_col = expr.otherwise(F.lit(depts[-1])) if expr is not None else F.lit(depts[0])
-    out = out.withColumn("department", dept_col)
+
+    def pick(u_col: Column) -> Column:
+        expr: Column | None = None
+        for i, dn in enumerate(depts[:-1]):
+            cond = u_col < F.col(f"_c{i}")
+            expr = F.when(cond, F.lit(dn)) if expr is None else expr.when(cond, F.lit(dn))
+        return expr.otherwise(F.lit(depts[-1])) if expr is not None else F.lit(depts[0])
+
     drop_cols = ([f"_w{i}" for i in range(len(depts))] + ["_wt"]
                  + [f"_c{i}" for i in range(len(depts) - 1)])
-    return out.drop(*drop_cols)
+    return out, pick, drop_cols
+
+
+def _with_seasonal_department(df: DataFrame, u_col: Column,
+                              dept_weights: dict[str, float]) -> DataFrame:
+    """Pick a department per row via inverse-CDF over base weights scaled by the
+    seasonal lift for the row's month (helper CDF columns are dropped)."""
+    out, pick, drop_cols = _seasonal_department_cdf(df, dept_weights)
+    return out.withColumn("department", pick(u_col)).drop(*drop_cols)
 
 
 def _promo_eligible_expr(idx_col: Column, month_col: Column,
@@ -220,8 +273,151 @@ def _promo_eligible_expr(idx_col: Column, month_col: Column,
     return expr.otherwise(F.lit(False))
 
 
+def _line_pricing(c: Callable[[str], Column]) -> list[list[tuple[str, Column]]]:
+    """Per-line pricing, promo and tax columns, grouped into dependency layers.
+
+    ``c(name)`` resolves an input: a line column in the exploded frame, or a
+    struct field / outer receipt column inside a ``transform`` lambda. Each
+    layer only reads columns from earlier layers, so the inline path can add a
+    whole layer with one ``transform`` pass.
+    """
+    def pick(values: list, idx: str) -> Column:
+        return F.element_at(F.array(*[F.lit(v) for v in values]), c(idx) + 1)
+
+    return [
+        [
+            ("unit_cents", F.round(c("SalePrice") * 100).cast("long")),
+            # named promo code + matching discount (datagen promotion_utils
+            # parity): a seasonal/min-purchase/BOGO code if eligible, else an
+            # evergreen code.
+            ("_pcode", pick([t[0] for t in PROMO_CATALOG], "_pidx")),
+            ("_ppct", pick([t[1] for t in PROMO_CATALOG], "_pidx")),
+            ("_pkind", pick([t[4] for t in PROMO_CATALOG], "_pidx")),
+            ("_evcode", pick([code for code, _ in EVERGREEN], "_evidx")),
+            ("_evpct", pick([pct for _, pct in EVERGREEN], "_evidx")),
+            # tax: integer basis-point math, replicating datagen _tax_cents exactly
+            ("rate_bps", F.round(c("tax_rate") * 10000).cast("long")),
+            ("tax_mult", F.when(c("taxability") == "TAXABLE", 100)
+             .when(c("taxability") == "REDUCED_RATE", 50)
+             .otherwise(0).cast("long")),
+        ],
+        [("ext_before", c("unit_cents") * c("quantity"))],
+        [("_pelig", _promo_eligible_expr(
+            c("_pidx"), F.month(c("event_date")), c("ext_before"), c("quantity")))],
+        [
+            ("promo_code", F.when(c("has_promo"), F.when(
+                c("_pelig"), c("_pcode")).otherwise(c("_evcode")))),
+            ("_disc_pct", F.when(c("_pelig"), c("_ppct")).otherwise(c("_evpct"))),
+            ("_disc_kind", F.when(c("_pelig"), c("_pkind")).otherwise(F.lit("PCT"))),
+        ],
+        [("discount_cents", F.when(c("has_promo"),
+            F.when(c("_disc_kind") == "BOGO",
+                   # buy-one-get-one: every 2nd item discounted at _disc_pct
+                   F.floor(F.floor(c("quantity") / F.lit(2))
+                           * c("unit_cents") * c("_disc_pct")
+                           / F.lit(100.0) + F.lit(0.5)).cast("long"))
+            .otherwise(F.floor(
+                c("ext_before") * c("_disc_pct") / F.lit(100.0)
+                + F.lit(0.5)).cast("long")))
+            .otherwise(F.lit(0).cast("long")))],
+        [("ext_cents", F.greatest(F.lit(0).cast("long"),
+                                  c("ext_before") - c("discount_cents")))],
+        [("line_tax_cents", F.floor(
+            (c("ext_cents") * c("rate_bps") * c("tax_mult")
+             + F.lit(500_000)) / F.lit(1_000_000)).cast("long"))],
+    ]
+
+
+def _dept_rank(pskew: Column, dept_size: Column) -> Column:
+    """Price-tier rank within a department of ``dept_size`` launched products."""
+    return F.least(dept_size, F.greatest(
+        F.lit(1), (F.floor(pskew * dept_size) + 1).cast("int")))
+
+
+# Struct fields of a ``_product_index`` row that ``_pick_product`` reads.
+_INDEX_FIELDS = ("items", "counts", "day_version", "bucket")
+
+
+def _index_rows(products: Iterable[Row], start: date, end: date) -> list[tuple]:
+    """Build the ``_product_index`` rows (one per department) from product rows.
+
+    ``items`` holds the department's products by (SalePrice, product_id), each
+    tagged with the ``version`` it launches in. The launched set only changes
+    on a launch day: version 1 is "nothing launched yet" and version ``v + 1``
+    the set launched by the v-th in-history launch day, and ``day_version[t]``
+    maps sale day ``start + t`` to its version. ``items`` is cut into buckets of
+    ``bucket`` (about sqrt of the department size) consecutive products, and
+    ``counts[v][b]`` is how many products in buckets ``0..b`` have launched by
+    version ``v``. That is versions times sqrt(products) integers rather than a
+    launched-position list per version, which is versions times products.
+    """
+    by_dept: dict[str, list] = {}
+    for r in products:
+        if r.launch_date <= end:
+            by_dept.setdefault(r.department, []).append(r)
+    n_days = (end - start).days + 1
+    rows = []
+    for dept, prods in by_dept.items():
+        prods.sort(key=lambda r: (r.SalePrice, r.product_id))
+        launch = [max(r.launch_date, start) for r in prods]
+        changes = sorted(set(launch))
+        version = [bisect_left(changes, ld) + 2 for ld in launch]
+        bucket = isqrt(len(prods) - 1) + 1
+        per_bucket = [0] * -(-len(prods) // bucket)
+        by_version: dict[int, list[int]] = {}
+        for i, v in enumerate(version):
+            by_version.setdefault(v, []).append(i // bucket)
+        counts = [list(per_bucket)]
+        for v in range(2, len(changes) + 2):
+            for b in by_version[v]:
+                per_bucket[b] += 1
+            counts.append(list(accumulate(per_bucket)))
+        day_version = [bisect_right(changes, start + timedelta(days=t)) + 1
+                       for t in range(n_days)]
+        rows.append((
+            dept,
+            [(r.product_id, r.SalePrice, r.taxability, v) for r, v in zip(prods, version, strict=True)],
+            counts, day_version, bucket))
+    return rows
+
+
+def _product_index(spark: SparkSession, products: DataFrame,
+                   start: date, end: date) -> DataFrame:
+    """Launch-aware, price-ordered product index: one row per department.
+
+    See ``_index_rows`` for the layout. Products launched before ``start``
+    share the first launch version and ones launching after ``end`` are never
+    sold, so the index is bounded by the catalog and its in-history launch
+    days, not sale days times products.
+    """
+    return spark.createDataFrame(
+        _index_rows(products.collect(), start, end),
+        "department string, "
+        "items array<struct<product_id:long,SalePrice:double,taxability:string,version:int>>, "
+        "counts array<array<int>>, day_version array<int>, bucket int")
+
+
+def _pick_product(index: Column, day_off: Column, pskew: Column) -> Column:
+    """The product at ``pskew``'s price tier among those launched by the sale
+    day (``day_off`` days after the index start), or NULL if none.
+
+    The bucket holding the tier is found from the version's cumulative counts;
+    only that bucket's products are then filtered by launch version.
+    """
+    version = F.element_at(index["day_version"], day_off + 1)
+    counts = F.element_at(index["counts"], version)
+    n = F.element_at(counts, -1)
+    rank = _dept_rank(pskew, n)
+    b = F.size(F.filter(counts, lambda c: c < rank))
+    before = F.when(b > 0, F.element_at(counts, F.greatest(b, F.lit(1)))).otherwise(0)
+    launched = F.filter(
+        F.slice(index["items"], b * index["bucket"] + 1, index["bucket"]),
+        lambda x: x["version"] <= version)
+    return F.when(n > 0, F.element_at(launched, rank - before))
+
+
 def _assign_customers(receipts: DataFrame, dims: dict[str, DataFrame],
-                      d: seeded_draws, cfg: GenerationConfig) -> DataFrame:
+                      rd: DrawStream, cfg: GenerationConfig) -> DataFrame:
     """Resolve each receipt's customer_id with store-geography affinity.
 
     With probability ``GEO_AFFINITY`` the customer is drawn from those living
@@ -240,14 +436,14 @@ def _assign_customers(receipts: DataFrame, dims: dict[str, DataFrame],
         .join(geo_sizes, receipts["store_geo_id"] == geo_sizes["cust_geo_id"], "left")
         .drop("cust_geo_id")
         .withColumn("geo_cust_count", F.coalesce(F.col("geo_cust_count"), F.lit(0)))
-        .withColumn("global_customer", (d.h64(["receipt_id_ext"], "cust")
+        .withColumn("global_customer", (rd.h64("cust")
                                         % F.lit(cfg.customer_count) + 1).cast("long"))
         .withColumn("want_local",
-                    (d.u(["receipt_id_ext"], "affinity") < F.lit(GEO_AFFINITY))
+                    (rd.u("affinity") < F.lit(GEO_AFFINITY))
                     & (F.col("geo_cust_count") > 0))
         .withColumn("local_rank_target", F.when(
             F.col("geo_cust_count") > 0,
-            (d.h64(["receipt_id_ext"], "localcust") % F.col("geo_cust_count") + 1))
+            (rd.h64("localcust") % F.col("geo_cust_count") + 1))
             .cast("long"))
     )
     local = cust_ranked.select(
@@ -331,22 +527,162 @@ def _pick_hour(u: Column, hourly_weights: list[float],
     return F.lit(12) if expr is None else expr.otherwise(F.lit(12))
 
 
+# Columns produced by ``_line_draws``, in order.
+_LINE_DRAW_COLUMNS = ("_pskew", "quantity", "has_promo", "_pidx", "_evidx")
+
+
+def _line_draws(ld: DrawStream, profile: StoreTypeProfile,
+                seg: Column) -> list[tuple[str, Column]]:
+    """Every per-line draw after the department pick (shared by both paths)."""
+    return list(zip(_LINE_DRAW_COLUMNS, (
+        _segment_price_skew(ld.u("prod"), seg),
+        F.greatest(F.lit(1), F.least(F.lit(5), F.round(
+            ld.u("qty") * 3 + 0.7).cast("int"))),
+        ld.u("promo") < F.lit(profile.promo_rate),
+        (ld.h64("pcode") % F.lit(len(PROMO_CATALOG))).cast("int"),
+        (ld.h64("pcodeev") % F.lit(len(EVERGREEN))).cast("int"),
+    ), strict=True))
+
+
+def _joined_lines(receipts: DataFrame, index: DataFrame, start: date,
+                  profile: StoreTypeProfile, ld: DrawStream,
+                  rd: DrawStream) -> tuple[DataFrame, DataFrame]:
+    """Explode baskets to line rows, bind products from the index, roll headers up.
+
+    Returns (receipts with header totals, priced line rows).
+    """
+    exploded = ld.attach(
+        receipts.select("_rk", "receipt_id_ext", "event_ts", "event_date", "store_id",
+                        "tax_rate", "basket_n", "_seg")
+        .withColumn("line_num", F.explode(F.sequence(F.lit(1), F.col("basket_n"))))
+    )
+    exploded = _with_seasonal_department(
+        exploded, ld.u("dept"),
+        profile.department_weights)
+    # Take every per-line draw now so only the packed key rides through the
+    # joins and the header rollup below.
+    for name, expr in _line_draws(ld, profile, F.col("_seg")):
+        exploded = exploded.withColumn(name, expr)
+    exploded = exploded.drop("receipt_id_ext", ld.key_col)
+
+    # The index is bounded by the catalog, so it is broadcast explicitly
+    # (conftest disables auto broadcast: autoBroadcastJoinThreshold=-1) and the
+    # lookup itself is in-row; no line-grain shuffle.
+    lines = (
+        exploded
+        .join(F.broadcast(index), "department")
+        .withColumn("_p", _pick_product(
+            F.struct(*_INDEX_FIELDS), F.datediff("event_date", F.lit(start)), F.col("_pskew")))
+        # a department with nothing launched yet drops the line
+        .filter(F.col("_p").isNotNull())
+        .withColumn("product_id", F.col("_p.product_id"))
+        .withColumn("SalePrice", F.col("_p.SalePrice"))
+        .withColumn("taxability", F.col("_p.taxability"))
+        .drop("_p", *_INDEX_FIELDS)
+    )
+    for layer in _line_pricing(F.col):
+        for name, expr in layer:
+            lines = lines.withColumn(name, expr)
+
+    hdr = lines.groupBy("_rk").agg(
+        F.sum("ext_cents").alias("subtotal_cents"),
+        F.sum("discount_cents").alias("discount_cents"),
+        F.sum("line_tax_cents").alias("tax_cents"))
+    return receipts.drop("receipt_id_ext", rd.key_col).join(hdr, "_rk"), lines
+
+
+def _inline_lines(receipts: DataFrame, index: DataFrame, start: date,
+                  profile: StoreTypeProfile, d: seeded_draws,
+                  rd: DrawStream) -> tuple[DataFrame, DataFrame]:
+    """Build each receipt's lines as an array column and total them in-row.
+
+    The product index is broadcast as a single department -> index map; lines
+    are then drawn, bound and priced with ``transform`` over
+    ``sequence(1, basket_n)``, so header totals need no groupBy or join-back
+    and both tables project from the same rows. Draws use the joined path's
+    keys (``line_num`` is the lambda variable), so output is identical.
+    """
+    catalog = index.agg(F.map_from_entries(F.collect_list(F.struct(
+        "department", F.struct(*_INDEX_FIELDS)))).alias("_catalog"))
+    r, pick_dept, cdf_cols = _seasonal_department_cdf(
+        receipts.crossJoin(F.broadcast(catalog))
+        .withColumn("_day_off", F.datediff("event_date", F.lit(start))),
+        profile.department_weights)
+
+    def draw_line(i: Column) -> Column:
+        ld = d.stream([F.col("receipt_id_ext"), i], "line", None)
+        return F.struct(
+            i.alias("line_num"), pick_dept(ld.u("dept")).alias("department"),
+            *[expr.alias(name) for name, expr in _line_draws(ld, profile, F.col("_seg"))])
+
+    def bind_product(x: Column) -> Column:
+        p = _pick_product(F.try_element_at(F.col("_catalog"), x["department"]),
+                          F.col("_day_off"), x["_pskew"])
+        return (x.withField("product_id", p["product_id"])
+                .withField("SalePrice", p["SalePrice"])
+                .withField("taxability", p["taxability"]))
+
+    arr = F.transform(F.sequence(F.lit(1), F.col("basket_n")), draw_line)
+    # a department with nothing launched that day drops the line, as on the
+    # joined path
+    arr = F.filter(F.transform(arr, bind_product), lambda x: x["product_id"].isNotNull())
+
+    # one transform pass per pricing layer; inputs resolve to line fields
+    # already on the struct, else to receipt columns (tax_rate, event_date)
+    known = {"line_num", "department", "product_id", "SalePrice", "taxability",
+             *_LINE_DRAW_COLUMNS}
+
+    def add_layer(k: int, fields: frozenset[str]) -> Callable[[Column], Column]:
+        def add(x: Column) -> Column:
+            layer = _line_pricing(lambda n: x[n] if n in fields else F.col(n))[k]
+            for name, expr in layer:
+                x = x.withField(name, expr)
+            return x
+        return add
+
+    for k, layer in enumerate(_line_pricing(F.col)):
+        arr = F.transform(arr, add_layer(k, frozenset(known)))
+        known.update(name for name, _ in layer)
+
+    def total(field: str) -> Column:
+        return F.aggregate("_lines", F.lit(0).cast("long"), lambda acc, x: acc + x[field])
+
+    inline = (
+        r.withColumn("_lines", arr)
+        .drop("_catalog", "_day_off", *cdf_cols)
+        .filter(F.size("_lines") > 0)
+        .withColumn("subtotal_cents", total("ext_cents"))
+        .withColumn("discount_cents", total("discount_cents"))
+        .withColumn("tax_cents", total("line_tax_cents"))
+    )
+    lines = (
+        inline.select("_rk", "event_ts", "event_date", F.explode("_lines").alias("_l"))
+        .select("_rk", "event_ts", "event_date", "_l.*")
+    )
+    return inline.drop("_lines", "receipt_id_ext", rd.key_col), lines
+
+
 def generate_receipts_group(
     spark: SparkSession,
     dims: dict[str, DataFrame],
     profile: StoreTypeProfile,
     cfg: GenerationConfig,
+    *,
+    ctx: DimensionContext | None = None,
 ) -> dict[str, DataFrame]:
     """Generate fact_receipts, fact_receipt_lines, fact_payments (in-store only)."""
 
-    d = seeded_draws(cfg.seed)
+    d = seeded_draws(cfg.seed, streams=cfg.draw_streams)
+    # Draws keyed on one receipt / one receipt line share a hashed key when
+    # cfg.draw_streams is set (see runtime.DrawStream).
+    rd = d.stream(["receipt_id_ext"], "receipt", "_rcpt_key")
+    ld = d.stream(["receipt_id_ext", "line_num"], "line", "_line_key")
 
     stores = dims["dim_stores"].select(
         F.col("ID").alias("store_id"), "tax_rate", "daily_traffic_multiplier",
         "operating_hours", F.col("GeographyID").alias("store_geo_id"))
-    store_ids = [r.store_id for r in stores.select("store_id").collect()]
-    hour_patterns = [r.operating_hours
-                     for r in stores.select("operating_hours").distinct().collect()]
+    ctx = ctx or DimensionContext.from_tables(dims)
+    store_ids, hour_patterns = list(ctx.store_ids), list(ctx.store_hours)
     grid = store_day_grid(
         spark, store_ids, cfg.start_date, cfg.end_date, cfg.seed, "receipts"
     ).join(stores, "store_id")
@@ -383,17 +719,13 @@ def generate_receipts_group(
             F.year("day"), F.month("day"), F.dayofmonth("day"),
             F.col("hour"), F.col("minute"), F.col("second")))
         .withColumn("event_date", F.col("day"))
-        # RCP(3) + yyyyMMddHHmm(12) + store(4) + seq(6) = 25 chars, unique by
-        # construction (store_id, day, seq) is a key
-        .withColumn("receipt_id_ext", F.concat(
-            F.lit("RCP"), F.date_format("event_ts", "yyyyMMddHHmm"),
-            F.lpad(F.col("store_id").cast("string"), 4, "0"),
-            F.lpad(F.col("seq").cast("string"), 6, "0")))
-        .withColumn("trace_id", F.concat(F.lit("TRC"), F.col("receipt_id_ext")))
+        .withColumn("_rk", _pack_receipt_key(F.col("day"), F.col("store_id"), F.col("seq")))
+        # the string key only feeds draws; it is dropped before any line join
+        .withColumn("receipt_id_ext", _receipt_id_ext(F.col("_rk"), F.col("event_ts")))
     )
 
     # geography affinity: resolve each receipt's customer (local vs network-wide)
-    receipts = _assign_customers(receipts, dims, d, cfg)
+    receipts = _assign_customers(rd.attach(receipts), dims, rd, cfg)
 
     # per-customer shopping segment (datagen CustomerJourney): drives basket size
     # and price-tier preference, so a customer behaves consistently across trips.
@@ -403,14 +735,14 @@ def generate_receipts_group(
                   .otherwise(1.0))
     # trip archetype gives multi-modal basket sizes (quick vs bulk stock-up)
     lam_b = (F.lit(float(profile.basket_lambda)) * seg_basket
-             * _trip_basket_mult(d.u(["receipt_id_ext"], "trip")))
+             * _trip_basket_mult(rd.u("trip")))
     receipts = (
         receipts
         .withColumn("_seg", d.pick_by_weights(["customer_id"], "seg", SEGMENT_WEIGHTS))
         .withColumn("basket_n", F.greatest(F.lit(1), F.round(
-            lam_b + d.gauss(["receipt_id_ext"], "basket") * F.sqrt(lam_b))).cast("int"))
-        .withColumn("tender_type", d.pick_by_weights(
-            ["receipt_id_ext"], "tender", [(n, w) for n, w, _, _, _ in TENDERS]))
+            lam_b + rd.gauss("basket") * F.sqrt(lam_b))).cast("int"))
+        .withColumn("tender_type", rd.pick_by_weights(
+            "tender", [(n, w) for n, w, _, _, _ in TENDERS]))
     )
 
     # --- lines: explode baskets, weighted department -> price-tiered product
@@ -428,109 +760,31 @@ def generate_receipts_group(
             f"profile department_weights reference departments missing from the catalog: {sorted(unknown)}"
         )
 
-    # Per sale day, the eligible product set is those launched on or before that
-    # day. Rank them by price within department so the segment skew can still
-    # target a cheap/pricey tier over the *launched* catalog. Bounded by
-    # (distinct sale days x products); products broadcast into a nested-loop
-    # inequality join. dims guarantees >=1 launched product per department per
-    # day, so no basket line is ever left without a product to bind.
-    sale_dates = receipts.select("event_date").distinct()
-    elig = sale_dates.join(F.broadcast(products),
-                           products["launch_date"] <= sale_dates["event_date"])
-    ew = Window.partitionBy("event_date", "department").orderBy("SalePrice", "product_id")
-    elig_ranked = elig.withColumn("dept_rank", F.row_number().over(ew)).select(
-        "event_date", "department", "dept_rank", "product_id", "SalePrice", "taxability")
-    dept_sizes = elig.groupBy("event_date", "department").agg(
-        F.count("*").alias("dept_size"))
-
-    exploded = (
-        receipts.select("receipt_id_ext", "event_ts", "event_date", "store_id",
-                        "tax_rate", "basket_n", "_seg")
-        .withColumn("line_num", F.explode(F.sequence(F.lit(1), F.col("basket_n"))))
-    )
-    exploded = _with_seasonal_department(
-        exploded, d.u(["receipt_id_ext", "line_num"], "dept"),
-        profile.department_weights)
+    # The eligible product set on a sale day is those launched on or before
+    # it, ranked by price within department so the segment skew can still
+    # target a cheap/pricey tier over the *launched* catalog. The index answers
+    # that per line from arrays keyed by the day offset, so no
+    # (sale days x products) frame is built. dims guarantees >=1 launched
+    # product per department per day, so no basket line is left unbound.
+    index = _product_index(spark, products, cfg.start_date, cfg.end_date)
 
-    # Broadcast only provably-small frames: `products` (bounded catalog) and
-    # `dept_sizes` (distinct days x departments). conftest disables auto
-    # broadcast (autoBroadcastJoinThreshold=-1); `elig_ranked` can be large in
-    # production (days x launched products) so it is left to a normal join.
-    lines = (
-        exploded
-        .join(F.broadcast(dept_sizes), ["event_date", "department"])
-        .withColumn("_pskew", _segment_price_skew(
-            d.u(["receipt_id_ext", "line_num"], "prod"), F.col("_seg")))
-        .withColumn("dept_rank", F.least(F.col("dept_size"), F.greatest(F.lit(1),
-            (F.floor(F.col("_pskew") * F.col("dept_size")) + 1).cast("int"))))
-        .join(elig_ranked, ["event_date", "department", "dept_rank"])
-        .withColumn("quantity", F.greatest(F.lit(1), F.least(F.lit(5), F.round(
-            d.u(["receipt_id_ext", "line_num"], "qty") * 3 + 0.7).cast("int"))))
-        .withColumn("unit_cents", F.round(F.col("SalePrice") * 100).cast("long"))
-        .withColumn("ext_before", F.col("unit_cents") * F.col("quantity"))
-        .withColumn("has_promo", d.u(["receipt_id_ext", "line_num"], "promo")
-                    < F.lit(profile.promo_rate))
-        # named promo code + matching discount (datagen promotion_utils parity):
-        # a seasonal/min-purchase/BOGO code if eligible, else an evergreen code.
-        .withColumn("_pidx", (d.h64(["receipt_id_ext", "line_num"], "pcode")
-                              % F.lit(len(PROMO_CATALOG))).cast("int"))
-        .withColumn("_pcode", F.element_at(
-            F.array(*[F.lit(t[0]) for t in PROMO_CATALOG]), F.col("_pidx") + 1))
-        .withColumn("_ppct", F.element_at(
-            F.array(*[F.lit(t[1]) for t in PROMO_CATALOG]), F.col("_pidx") + 1))
-        .withColumn("_pkind", F.element_at(
-            F.array(*[F.lit(t[4]) for t in PROMO_CATALOG]), F.col("_pidx") + 1))
-        .withColumn("_pelig", _promo_eligible_expr(
-            F.col("_pidx"), F.month(F.col("event_date")),
-            F.col("ext_before"), F.col("quantity")))
-        .withColumn("_evidx", (d.h64(["receipt_id_ext", "line_num"], "pcodeev")
-                               % F.lit(len(EVERGREEN))).cast("int"))
-        .withColumn("_evcode", F.element_at(
-            F.array(*[F.lit(c) for c, _ in EVERGREEN]), F.col("_evidx") + 1))
-        .withColumn("_evpct", F.element_at(
-            F.array(*[F.lit(p) for _, p in EVERGREEN]), F.col("_evidx") + 1))
-        .withColumn("promo_code", F.when(F.col("has_promo"), F.when(
-            F.col("_pelig"), F.col("_pcode")).otherwise(F.col("_evcode"))))
-        .withColumn("_disc_pct", F.when(
-            F.col("_pelig"), F.col("_ppct")).otherwise(F.col("_evpct")))
-        .withColumn("_disc_kind", F.when(
-            F.col("_pelig"), F.col("_pkind")).otherwise(F.lit("PCT")))
-        .withColumn("discount_cents", F.when(F.col("has_promo"),
-            F.when(F.col("_disc_kind") == "BOGO",
-                   # buy-one-get-one: every 2nd item discounted at _disc_pct
-                   F.floor(F.floor(F.col("quantity") / F.lit(2))
-                           * F.col("unit_cents") * F.col("_disc_pct")
-                           / F.lit(100.0) + F.lit(0.5)).cast("long"))
-            .otherwise(F.floor(
-                F.col("ext_before") * F.col("_disc_pct") / F.lit(100.0)
-                + F.lit(0.5)).cast("long")))
-            .otherwise(F.lit(0).cast("long")))
-        .withColumn("ext_cents",
-                    F.greatest(F.lit(0).cast("long"),
-                               F.col("ext_before") - F.col("discount_cents")))
-        # tax: integer basis-point math, replicating datagen _tax_cents exactly
-        .withColumn("rate_bps", F.round(F.col("tax_rate") * 10000).cast("long"))
-        .withColumn("tax_mult", F.when(F.col("taxability") == "TAXABLE", 100)
-                    .when(F.col("taxability") == "REDUCED_RATE", 50)
-                    .otherwise(0).cast("long"))
-        .withColumn("line_tax_cents", F.floor(
-            (F.col("ext_cents") * F.col("rate_bps") * F.col("tax_mult")
-             + F.lit(500_000)) / F.lit(1_000_000)).cast("long"))
-    )
+    if cfg.inline_receipt_lines:
+        header_src, lines = _inline_lines(receipts, index, cfg.start_date, profile, d, rd)
+    else:
+        header_src, lines = _joined_lines(
+            receipts, index, cfg.start_date, profile, ld, rd)
 
     fact_receipt_lines = lines.select(
-        "receipt_id_ext", "event_ts", "event_date", "line_num", "product_id",
+        _receipt_id_ext(F.col("_rk"), F.col("event_ts")).alias("receipt_id_ext"),
+        "event_ts", "event_date", "line_num", "product_id",
         "quantity", _fmt(F.col("unit_cents")).alias("unit_price"), "unit_cents",
         _fmt(F.col("ext_cents")).alias("ext_price"), "ext_cents", "promo_code",
     ).select(*column_names("fact_receipt_lines"))
 
-    # --- header rollup
-    hdr = lines.groupBy("receipt_id_ext").agg(
-        F.sum("ext_cents").alias("subtotal_cents"),
-        F.sum("discount_cents").alias("discount_cents"),
-        F.sum("line_tax_cents").alias("tax_cents"))
     fact_receipts = (
-        receipts.join(hdr, "receipt_id_ext")
+        header_src
+        .withColumn("receipt_id_ext", _receipt_id_ext(F.col("_rk"), F.col("event_ts")))
+        .withColumn("trace_id", F.concat(F.lit("TRC"), F.col("receipt_id_ext")))
         .withColumn("total_cents", F.col("subtotal_cents") + F.col("tax_cents"))
         .withColumn("receipt_type", F.lit("SALE"))
         .withColumn("payment_method", F.col("tender_type"))
@@ -558,7 +812,7 @@ def generate_receipts_group(
     )
 
     # --- payments (one per receipt; in-store, so order_id_ext is NULL)
-    u_dec = d.u(["receipt_id_ext"], "decline")
+    u_dec = rd.u("decline")
     decline_p: Column = F.lit(0.0)
     for name, _, mult, _, _ in TENDERS:
         decline_p = F.when(
@@ -569,14 +823,14 @@ def generate_receipts_group(
     for name, _, _, lo, hi in TENDERS[:-1]:
         proc_lo = F.when(F.col("payment_method") == name, F.lit(lo)).otherwise(proc_lo)
         proc_hi = F.when(F.col("payment_method") == name, F.lit(hi)).otherwise(proc_hi)
-    reason_idx = (d.h64(["receipt_id_ext"], "reason") % len(DECLINE_REASONS)).cast("int")
+    reason_idx = (rd.h64("reason") % len(DECLINE_REASONS)).cast("int")
     fact_payments = (
-        fact_receipts
+        rd.attach(fact_receipts)
         .withColumn("order_id_ext", F.lit(None).cast("string"))
         .withColumn("amount_cents", F.col("total_cents"))
         .withColumn("transaction_id", F.concat(
             F.lit("TXN_"), F.unix_timestamp("event_ts").cast("string"), F.lit("_"),
-            F.lpad((d.h64(["receipt_id_ext"], "txn") % 1_000_000).cast("string"), 6, "0")))
+            F.lpad((rd.h64("txn") % 1_000_000).cast("string"), 6, "0")))
         .withColumn("status",
                     F.when(u_dec < decline_p, "DECLINED").otherwise("APPROVED"))
         .withColumn("decline_reason", F.when(
@@ -584,7 +838,7 @@ def generate_receipts_group(
             F.element_at(F.array(*[F.lit(r) for r in DECLINE_REASONS]),
                          reason_idx + 1)))
         .withColumn("processing_time_ms",
-                    (proc_lo + d.u(["receipt_id_ext"], "proc")
+                    (proc_lo + rd.u("proc")
                      * (proc_hi - proc_lo)).cast("long"))
         .withColumn("amount", _fmt(F.col("amount_cents")))
         .select(*column_names("fact_payments"))
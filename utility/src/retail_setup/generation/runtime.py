@@ -13,12 +13,17 @@ class seeded_draws:
     gauss(cols, salt)    -> ~N(0,1) (Irwin-Hall of 3 uniforms, scaled)
     h64(cols, salt)      -> non-negative long hash
     pick_by_weights(cols, salt, [(value, weight), ...]) -> weighted categorical
+    stream(cols, salt, key_col) -> DrawStream: many draws from one key hash
+
+    ``streams=True`` switches ``DrawStream`` draws to the single-hash scheme;
+    the default keeps every draw bit-identical to the per-call hashes.
     """
 
     _U_MOD = 10**12
 
-    def __init__(self, seed: int):
+    def __init__(self, seed: int, *, streams: bool = False):
         self.seed = seed
+        self.streams = streams
 
     def h64(self, cols: list, salt: str):
         from pyspark.sql import functions as F
@@ -26,26 +31,103 @@ class seeded_draws:
         return F.pmod(F.xxhash64(*cols, F.lit(f"{salt}|{self.seed}")), F.lit(2**62))
 
     def u(self, cols: list, salt: str):
-        from pyspark.sql import functions as F
-
-        return (self.h64(cols, salt) % F.lit(self._U_MOD)) / F.lit(float(self._U_MOD))
+        return _uniform(self.h64(cols, salt))
 
     def gauss(self, cols: list, salt: str):
+        return _irwin_hall(lambda part: self.u(cols, f"{salt}|{part}"))
+
+    def pick_by_weights(self, cols: list, salt: str, weighted: list[tuple[str, float]]):
+        return _pick(self.u(cols, salt), weighted)
+
+    def stream(self, cols: list, salt: str, key_col: str | None) -> "DrawStream":
+        return DrawStream(self, cols, salt, key_col)
+
+
+class DrawStream:
+    """Named draws that share one key, e.g. every draw of a receipt line.
+
+    ``attach(df)`` adds ``key_col``: the key columns hashed once with the
+    stream's salt. Each named draw then mixes that 64-bit key with a fixed
+    per-name counter (``xxhash64(key, counter)``: two longs rather than a
+    25-char receipt id plus a salt string), so a line's six draws cost one
+    string hash instead of six. The counter mix stays in native Spark hashing,
+    which also keeps it overflow-safe under ANSI arithmetic. Draws depend only
+    on row values, so partition independence is unchanged.
+
+    When the owning ``seeded_draws`` has ``streams=False``, ``attach`` is a
+    no-op and ``u(name)`` is exactly ``seeded_draws.u(cols, name)``: switching
+    a generator to streams changes no output until the flag is set.
+
+    ``key_col=None`` keeps the key as an inline expression instead of a column,
+    for draws inside higher-order-function lambdas (where ``cols`` may hold the
+    lambda variable); the draws are the same as with an attached key.
+    """
+
+    def __init__(self, draws: seeded_draws, cols: list, salt: str, key_col: str | None):
+        self._draws = draws
+        self._cols = cols
+        self._salt = salt
+        self.key_col = key_col
+        self._counters: dict[int, str] = {}
+
+    def attach(self, df: DataFrame) -> DataFrame:
+        if not self._draws.streams or self.key_col is None:
+            return df
+        return df.withColumn(self.key_col, self._key_hash())
+
+    def _key_hash(self):
         from pyspark.sql import functions as F
 
-        s = self.u(cols, f"{salt}|g1") + self.u(cols, f"{salt}|g2") + self.u(cols, f"{salt}|g3")
-        return (s - F.lit(1.5)) * F.lit(2.0)
+        return F.xxhash64(*self._cols, F.lit(f"{self._salt}|{self._draws.seed}"))
 
-    def pick_by_weights(self, cols: list, salt: str, weighted: list[tuple[str, float]]):
+    def _counter(self, name: str) -> int:
+        digest = hashlib.sha256(f"{self._salt}|{name}".encode()).digest()
+        counter = int.from_bytes(digest[:8], "big") % (2**63)
+        if self._counters.setdefault(counter, name) != name:
+            raise ValueError(f"draw names {name!r} and {self._counters[counter]!r} collide")
+        return counter
+
+    def h64(self, name: str):
+        if not self._draws.streams:
+            return self._draws.h64(self._cols, name)
         from pyspark.sql import functions as F
 
-        total = sum(w for _, w in weighted)
-        uu = self.u(cols, salt)
-        expr, acc = None, 0.0
-        for value, w in weighted[:-1]:
-            acc += w / total
-            expr = expr.when(uu < acc, value) if expr is not None else F.when(uu < acc, value)
-        return expr.otherwise(weighted[-1][0]) if expr is not None else F.lit(weighted[0][0])
+        key = self._key_hash() if self.key_col is None else F.col(self.key_col)
+        return F.pmod(F.xxhash64(key, F.lit(self._counter(name))), F.lit(2**62))
+
+    def u(self, name: str):
+        return _uniform(self.h64(name))
+
+    def gauss(self, name: str):
+        return _irwin_hall(lambda part: self.u(f"{name}|{part}"))
+
+    def pick_by_weights(self, name: str, weighted: list[tuple[str, float]]):
+        return _pick(self.u(name), weighted)
+
+
+def _uniform(h64):
+    from pyspark.sql import functions as F
+
+    mod = seeded_draws._U_MOD
+    return (h64 % F.lit(mod)) / F.lit(float(mod))
+
+
+def _irwin_hall(u_part):
+    from pyspark.sql import functions as F
+
+    s = u_part("g1") + u_part("g2") + u_part("g3")
+    return (s - F.lit(1.5)) * F.lit(2.0)
+
+
+def _pick(uu, weighted: list[tuple[str, float]]):
+    from pyspark.sql import functions as F
+
+    total = sum(w for _, w in weighted)
+    expr, acc = None, 0.0
+    for value, w in weighted[:-1]:
+        acc += w / total
+        expr = expr.when(uu < acc, value) if expr is not None else F.when(uu < acc, value)
+    return expr.otherwise(weighted[-1][0]) if expr is not None else F.lit(weighted[0][0])
 
 
 def derive_seed(global_seed: int, section: str, key: int, day: date) -> int:
@@ -95,3 +177,52 @@ def store_day_grid(
     ]
     # the rows ARE the full grid — no crossJoin/join round-trip needed
     return spark.createDataFrame(rows, "store_id long, day date")
+
+
+# Largest sequence one row explodes in a single step; see explode_seq.
+SEQ_CHUNK = 50_000
+
+
+def day_grid(spark: SparkSession, start: date, end: date) -> DataFrame:
+    """One row per day in [start, end]: ``day_offset`` (int) and ``day`` (date).
+
+    Built from ``spark.range`` so the rows are generated on executors; a
+    ten-year window never round-trips through the driver.
+    """
+    from pyspark.sql import functions as F
+
+    n_days = (end - start).days + 1
+    return spark.range(n_days).select(
+        F.col("id").cast("int").alias("day_offset"),
+        F.date_add(F.lit(start), F.col("id").cast("int")).alias("day"),
+    )
+
+
+def explode_seq(
+    df: DataFrame,
+    count_col: str,
+    keys: list[str],
+    out_col: str = "seq",
+    chunk: int = SEQ_CHUNK,
+) -> DataFrame:
+    """Explode each row into ``out_col`` = 1..``count_col`` (rows with a
+    count below 1 are dropped).
+
+    Equivalent to ``explode(sequence(1, count))``, but a row is first split
+    into ``chunk``-sized slices that are shuffled on ``keys`` + slice, so a
+    day carrying hundreds of thousands of orders is generated by many tasks
+    instead of one array in one task.
+    """
+    from pyspark.sql import functions as F
+
+    n = F.col(count_col)
+    start = F.col("_slice") * F.lit(chunk) + F.lit(1)
+    return (
+        df.filter(n >= 1)
+        .withColumn("_slice", F.explode(F.sequence(
+            F.lit(0), ((n - F.lit(1)) / F.lit(chunk)).cast("int"))))
+        .repartition(*keys, "_slice")
+        .withColumn(out_col, F.explode(F.sequence(
+            start, F.least(n, start + F.lit(chunk - 1)))))
+        .drop("_slice")
+    )
@@ -85,6 +85,8 @@ Columns in plan but NOT in TMDL (allowed — Direct Lake ignores extra columns):
     (lowercase source is renamed to Source in the final select; not an extra)
 """
 
+from dataclasses import dataclass
+
 # table -> list of (column, spark_type)
 TABLES: dict[str, list[tuple[str, str]]] = {
     "dim_geographies": [
@@ -440,6 +442,102 @@ TABLES: dict[str, list[tuple[str, str]]] = {
     ],
 }
 
+# Engine state tables: persisted to silver alongside TABLES but outside the
+# historical/semantic contract (TABLES must match the semantic model 1:1).
+STATE_TABLES: dict[str, list[tuple[str, str]]] = {
+    # End-of-period balance per (node, product), written only for periods in
+    # which the pair had txns, so a pair's latest row at or before a date is
+    # its state then. node_type is 'STORE' or 'DC'.
+    "inventory_state_snapshot": [
+        ("snapshot_date", "date"), ("node_type", "string"), ("node_id", "long"),
+        ("product_id", "long"), ("balance", "long"), ("as_of", "timestamp"),
+    ],
+}
+
+
+# Legacy "%.2f" money strings per table -> the cents column each is formatted
+# from. The compact layout (GenerationConfig.money_layout) stores only the
+# cents and re-derives these via ``legacy_money_view_sql``. Not listed, so
+# always stored: fact_receipts.discount_amount (RETURN rows hold "0.00" against
+# a negated discount_cents) and fact_marketing.cost (formatted from dollars).
+MONEY_STRINGS: dict[str, dict[str, str]] = {
+    "fact_receipts": {
+        "subtotal_amount": "subtotal_cents", "tax_amount": "tax_cents",
+        "total_amount": "total_cents", "Subtotal": "subtotal_cents",
+    },
+    "fact_receipt_lines": {"unit_price": "unit_cents", "ext_price": "ext_cents"},
+    "fact_payments": {"amount": "amount_cents"},
+    "fact_online_order_headers": {
+        "subtotal_amount": "subtotal_cents", "tax_amount": "tax_cents",
+        "total_amount": "total_cents",
+    },
+    "fact_online_order_lines": {"unit_price": "unit_cents", "ext_price": "ext_cents"},
+    "fact_promotions": {"discount_amount": "discount_cents"},
+    "fact_promo_lines": {
+        "discount_amount": "discount_cents", "DiscountAmount": "DiscountCents",
+    },
+}
+
+
+@dataclass(frozen=True)
+class TableLayout:
+    """Physical layout of a published table.
+
+    ``partition_by`` names columns from ``DERIVED_PARTITIONS`` (added by the
+    writer, so they are physical-only and not in TABLES). Rows are range-
+    distributed and sorted by ``cluster_by`` inside each partition, so file
+    min/max statistics prune store/product filters; 05-maintain-delta-tables
+    Z-orders by the same keys. ``target_file_mb`` is the Delta target file
+    size for writes and OPTIMIZE.
+    """
+
+    partition_by: tuple[str, ...] = ()
+    cluster_by: tuple[str, ...] = ()
+    target_file_mb: int = 128
+
+
+# Physical-only partition columns -> (source date column, trunc unit).
+DERIVED_PARTITIONS: dict[str, tuple[str, str]] = {
+    "event_month": ("event_date", "month"),
+}
+
+
+def _fact(*cluster_by: str) -> TableLayout:
+    """Month-partitioned fact, clustered by event_date then ``cluster_by``."""
+    return TableLayout(partition_by=("event_month",),
+                       cluster_by=("event_date", *cluster_by))
+
+
+# Tables not listed (dims, gold, run log) are written unpartitioned and
+# unclustered; they are small enough that one compacted file set is cheapest.
+LAYOUTS: dict[str, TableLayout] = {
+    "fact_receipts": _fact("store_id"),
+    "fact_receipt_lines": _fact("product_id"),
+    "fact_payments": _fact("store_id"),
+    "fact_store_ops": _fact("store_id"),
+    "fact_foot_traffic": _fact("store_id"),
+    "fact_ble_pings": _fact("store_id"),
+    "fact_customer_zone_changes": _fact("store_id"),
+    "fact_marketing": _fact("campaign_id"),
+    "fact_marketing_attribution": _fact("campaign_id"),
+    "fact_promotions": _fact("store_id"),
+    "fact_promo_lines": _fact("product_id"),
+    "fact_online_order_headers": _fact("customer_id"),
+    "fact_online_order_lines": _fact("product_id"),
+    "fact_reorders": _fact("dc_id", "product_id"),
+    "fact_truck_moves": _fact("truck_id"),
+    "fact_truck_inventory": _fact("truck_id", "product_id"),
+    "fact_dc_inventory_txn": _fact("dc_id", "product_id"),
+    "fact_store_inventory_txn": _fact("store_id", "product_id"),
+    "fact_stockouts": _fact("StoreID", "ProductID"),
+    "inventory_state_snapshot": TableLayout(
+        cluster_by=("node_type", "node_id", "product_id")),
+}
+
+
+def table_layout(table: str) -> TableLayout:
+    return LAYOUTS.get(table, TableLayout())
+
 
 _SPARK_TYPE_MAP = None
 
@@ -471,10 +569,35 @@ def spark_schema(table: str):
     tmap = _type_map()
     fields = [
         StructField(name, tmap[typ], nullable=True)
-        for name, typ in TABLES[table]
+        for name, typ in _columns(table)
     ]
     return StructType(fields)
 
 
 def column_names(table: str) -> list[str]:
-    return [name for name, _ in TABLES[table]]
+    return [name for name, _ in _columns(table)]
+
+
+def physical_column_names(table: str, money_layout: str = "legacy") -> list[str]:
+    """Columns stored for ``table``; the compact layout drops MONEY_STRINGS."""
+    if money_layout == "legacy":
+        return column_names(table)
+    strings = MONEY_STRINGS.get(table, {})
+    return [name for name in column_names(table) if name not in strings]
+
+
+def legacy_money_view_sql(table: str, source: str) -> str:
+    """SELECT over a compact ``source`` that restores ``table``'s full column
+    list, formatting each money string from its cents column like
+    ``receipts._fmt``."""
+    strings = MONEY_STRINGS[table]
+    cols = [
+        f"format_string('%.2f', `{strings[name]}` / 100D) AS `{name}`"
+        if name in strings else f"`{name}`"
+        for name in column_names(table)
+    ]
+    return f"SELECT {', '.join(cols)} FROM {source}"
+
+
+def _columns(table: str) -> list[tuple[str, str]]:
+    return TABLES[table] if table in TABLES else STATE_TABLES[table]
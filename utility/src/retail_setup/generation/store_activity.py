@@ -17,6 +17,7 @@ from pyspark.sql import DataFrame, SparkSession
 from pyspark.sql import functions as F
 
 from retail_setup.config.generation import GenerationConfig
+from retail_setup.generation.dims import DimensionContext
 from retail_setup.generation.runtime import seeded_draws, store_day_grid
 from retail_setup.generation.schemas import column_names
 
@@ -55,12 +56,14 @@ def generate_store_ops(
     spark: SparkSession,
     dims: dict[str, DataFrame],
     cfg: GenerationConfig,
+    *,
+    ctx: DimensionContext | None = None,
 ) -> DataFrame:
     """Two rows (opened/closed) per store-day, skipping Dec 25 of any year."""
 
     stores = dims["dim_stores"].select(
         F.col("ID").alias("store_id"), "operating_hours")
-    store_ids = [r.store_id for r in stores.select("store_id").collect()]
+    store_ids = list((ctx or DimensionContext.from_tables(dims)).store_ids)
 
     grid = (
         store_day_grid(spark, store_ids, cfg.start_date, cfg.end_date,
@@ -112,6 +115,8 @@ def generate_foot_traffic(
     receipts: DataFrame,
     dims: dict[str, DataFrame],
     cfg: GenerationConfig,
+    *,
+    ctx: DimensionContext | None = None,
 ) -> DataFrame:
     """Per store-hour-zone sensor counts.
 
@@ -127,7 +132,7 @@ def generate_foot_traffic(
     stores = dims["dim_stores"].select(
         F.col("ID").alias("store_id"), "store_format", "operating_hours",
         "daily_traffic_multiplier")
-    store_ids = [r.store_id for r in stores.select("store_id").collect()]
+    store_ids = list((ctx or DimensionContext.from_tables(dims)).store_ids)
 
     # operating_hours -> open/close hour via a F.when chain over known formats
     open_hour, close_hour = None, None
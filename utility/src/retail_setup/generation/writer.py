@@ -26,6 +26,13 @@ from retail_setup.generation.publication import (
     TableTarget,
     TargetState,
 )
+from retail_setup.generation.schemas import (
+    DERIVED_PARTITIONS,
+    MONEY_STRINGS,
+    legacy_money_view_sql,
+    physical_column_names,
+    table_layout,
+)
 
 _UNSAFE_IDENTIFIER = re.compile(r"[^0-9A-Za-z_]")
 
@@ -49,6 +56,23 @@ def write_to_lakehouse(df: DataFrame, lakehouse: str, schema: str, table: str) -
     df.write.format("delta").mode("overwrite").saveAsTable(f"{lakehouse}.{schema}.{table}")
 
 
+def lay_out(name: str, df: DataFrame) -> DataFrame:
+    """Shape ``df`` for the physical layout ``schemas.LAYOUTS`` gives ``name``.
+
+    Derived partition columns (e.g. ``event_month``) are appended, then rows
+    are range-distributed and sorted by partition + cluster keys so each
+    written file covers a narrow date/store/product range.
+    """
+    layout = table_layout(name)
+    for column in layout.partition_by:
+        source, unit = DERIVED_PARTITIONS[column]
+        df = df.withColumn(column, F.trunc(F.col(source), unit))
+    keys = [*layout.partition_by, *layout.cluster_by]
+    if not keys:
+        return df
+    return df.repartitionByRange(*keys).sortWithinPartitions(*keys)
+
+
 def _schema_signature(df: DataFrame) -> list[tuple[str, str]]:
     return [(f.name, f.dataType.simpleString()) for f in df.schema.fields]
 
@@ -88,7 +112,10 @@ class _LakehouseBackend:
     def stage(self, target: TableTarget) -> int:
         df = self.sources[(target.db, target.name)]
         self._ensure_staging_db(target.db)
-        df.write.format("delta").mode("overwrite").saveAsTable(target.staging_name)
+        layout = table_layout(target.name)
+        df.write.format("delta").mode("overwrite").partitionBy(
+            *layout.partition_by
+        ).saveAsTable(target.staging_name)
         return self.spark.table(target.staging_name).count()
 
     def validate(self, target: TableTarget, staged_row_count: int) -> None:
@@ -117,8 +144,14 @@ class _LakehouseBackend:
 
     def promote(self, target: TableTarget) -> int:
         final = self._final(target)
+        layout = table_layout(target.name)
+        partitioned = (
+            f" PARTITIONED BY ({', '.join(layout.partition_by)})" if layout.partition_by else ""
+        )
         self.spark.sql(
-            f"CREATE OR REPLACE TABLE {final} USING DELTA AS SELECT * FROM {target.staging_name}"
+            f"CREATE OR REPLACE TABLE {final} USING DELTA{partitioned} "
+            f"TBLPROPERTIES ('delta.targetFileSize' = '{layout.target_file_mb}mb') "
+            f"AS SELECT * FROM {target.staging_name}"
         )
         return self.spark.table(final).count()
 
@@ -136,7 +169,9 @@ class _LakehouseBackend:
 class _FilesystemBackend:
     """PublicationBackend for local path/parquet test mode.
 
-    No Delta dependency: staging writes to a run-scoped directory under
+    No Delta dependency: staging writes (partitioned per
+    ``schemas.LAYOUTS``; the target file size is Delta-only) to a run-scoped
+    directory under
     ``<base_path>/.setup_staging/<run_token>/``, promotion replaces the final
     directory outright, and rollback restores from a pre-promotion backup
     copy (pre-existing targets, backed up under ``.setup_backup/<run_token>/``
@@ -167,7 +202,9 @@ class _FilesystemBackend:
     def stage(self, target: TableTarget) -> int:
         df = self.sources[(target.db, target.name)]
         path = self._staging_path(target)
-        df.write.format(self.fmt).mode("overwrite").save(str(path))
+        df.write.format(self.fmt).mode("overwrite").partitionBy(
+            *table_layout(target.name).partition_by
+        ).save(str(path))
         return self.spark.read.format(self.fmt).load(str(path)).count()
 
     def validate(self, target: TableTarget, staged_row_count: int) -> None:
@@ -254,6 +291,16 @@ def write_all(
     Returns the list of written table names (silver + gold); the
     setup_run_log table itself is not included in the returned list.
 
+    With ``cfg.money_layout == "compact"`` the silver tables listed in
+    ``schemas.MONEY_STRINGS`` are stored without their "%.2f" string
+    columns; in catalog mode each also gets a ``<table>_legacy`` view that
+    re-derives them from the cents columns.
+
+    Silver tables are then shaped by ``lay_out``: facts gain the physical
+    ``event_month`` partition column and are clustered by their
+    ``schemas.LAYOUTS`` keys, so date- and store/product-filtered reads
+    prune partitions and files.
+
     The Spark session is derived from the first DataFrame in ``tables`` or
     ``gold`` (``df.sparkSession``) — no explicit session parameter is needed.
     """
@@ -314,6 +361,14 @@ def write_all(
     if _log_exists() and _read_log().filter(F.col("run_id") == run_id).limit(1).count():
         raise ValueError(f"setup run_id already exists: {run_id!r}")
 
+    if cfg.money_layout == "compact":
+        tables = {
+            name: df.select(*physical_column_names(name, cfg.money_layout))
+            if name in MONEY_STRINGS else df
+            for name, df in tables.items()
+        }
+    tables = {name: lay_out(name, df) for name, df in tables.items()}
+
     run_token = sanitize_identifier(run_id)
     sources: dict[tuple[str, str], DataFrame] = {}
     targets: list[TableTarget] = []
@@ -346,4 +401,10 @@ def write_all(
             f"setup publication {outcome.state} for run_id={run_id!r}: {outcome.error}"
         )
 
+    if lakehouse is not None and cfg.money_layout == "compact":
+        for name in tables.keys() & MONEY_STRINGS.keys():
+            final = f"{lakehouse}.{cfg.silver_db}.{name}"
+            spark.sql(f"CREATE OR REPLACE VIEW {final}_legacy AS "
+                      f"{legacy_money_view_sql(name, final)}")
+
     return outcome.promoted
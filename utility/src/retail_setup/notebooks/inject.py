@@ -7,6 +7,7 @@ passed (typo guard).
 """
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 _TOKEN_RE = re.compile(r"\{\{(\w+)\}\}")
@@ -32,8 +33,9 @@ def render_notebooks(
 ) -> list[Path]:
     """Render all setup notebooks by substituting token values.
 
-    All notebooks are rendered in memory first; files are written only after
-    every notebook renders cleanly (no partial renders).
+    All notebooks are rendered in memory first (concurrently — each is an
+    independent read and substitution); files are written only after every
+    notebook renders cleanly (no partial renders).
 
     Args:
         values: Mapping of token name to replacement value. Must contain
@@ -67,15 +69,18 @@ def render_notebooks(
     if unknown_notebooks:
         raise ValueError(f"unknown render notebooks: {unknown_notebooks}")
 
-    rendered: list[tuple[Path, str]] = []
-    for name in selected:
+    def render(name: str) -> tuple[Path, str]:
         src = (src_dir / f"{name}.ipynb").read_text(encoding="utf-8")
         for token, value in values.items():
             src = src.replace("{{" + token + "}}", str(value))
         remaining = _TOKEN_RE.findall(src)
         if remaining:
             raise ValueError(f"{name}: unrendered tokens remain after injection: {remaining}")
-        rendered.append((Path(output_dir) / f"{name}.ipynb", src))
+        return Path(output_dir) / f"{name}.ipynb", src
+
+    # map() yields in input order and re-raises the first failing notebook's error.
+    with ThreadPoolExecutor(max_workers=max(1, min(len(selected), 4))) as pool:
+        rendered = list(pool.map(render, selected))
 
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
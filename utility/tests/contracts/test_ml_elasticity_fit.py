@@ -0,0 +1,17 @@
+"""Notebook 10's grouped elasticity fit against the two-pass fit it replaced."""
+
+from __future__ import annotations
+
+from bench_elasticity_fit import daily_sales, max_difference, notebook_fit, two_pass_fit
+
+
+def test_grouped_fit_matches_the_two_pass_fit(spark) -> None:
+    sales = daily_sales(spark, products=12, days=30)
+
+    grouped = notebook_fit(sales)
+    reference = two_pass_fit(sales)
+
+    assert max_difference(grouped, reference) < 1e-9
+    constant = grouped.filter("product_id = 12").first()
+    assert constant["sxx"] == 0
+    assert constant["elasticity_coefficient"] is None
@@ -0,0 +1,155 @@
+"""Persistent source-parser cache used by manifest validation."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from retail_setup.contracts import source_cache
+from retail_setup.contracts.source_parsers import (
+    kql_table_schemas,
+    tmdl_active_table_schemas,
+)
+
+TMDL_DEFINITION = (
+    Path(__file__).resolve().parents[3]
+    / "fabric"
+    / "powerbi"
+    / "retail_model.SemanticModel"
+    / "definition"
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    directory = tmp_path / "cache"
+    monkeypatch.setenv(source_cache.CACHE_DIR_ENV, str(directory))
+    source_cache.clear_source_cache_memory()
+    source_cache.reset_source_parse_timings()
+    yield directory
+    source_cache.clear_source_cache_memory()
+    source_cache.reset_source_parse_timings()
+
+
+def _cached_flags() -> list[bool]:
+    return [timing.cached for timing in source_cache.source_parse_timings()]
+
+
+def _write_kql(path: Path, column: str) -> None:
+    path.write_text(
+        f".create-merge table orders (\n    {column}: string\n)\n",
+        encoding="utf-8",
+    )
+
+
+def test_unchanged_source_is_served_from_the_persistent_cache(
+    tmp_path: Path, cache_dir: Path
+) -> None:
+    source = tmp_path / "tables.kql"
+    _write_kql(source, "order_id")
+
+    first = kql_table_schemas(source)
+    source_cache.clear_source_cache_memory()
+    second = kql_table_schemas(source)
+
+    assert first == second == {"orders": {"order_id": "string"}}
+    assert _cached_flags() == [False, True]
+    assert len(list(cache_dir.glob("*.pickle"))) == 1
+
+
+def test_changed_source_is_parsed_again(tmp_path: Path, cache_dir: Path) -> None:
+    source = tmp_path / "tables.kql"
+    _write_kql(source, "order_id")
+    kql_table_schemas(source)
+
+    _write_kql(source, "receipt_id")
+
+    assert kql_table_schemas(source) == {"orders": {"receipt_id": "string"}}
+    assert _cached_flags() == [False, False]
+
+
+def test_tmdl_table_files_are_part_of_the_key(tmp_path: Path, cache_dir: Path) -> None:
+    definition = tmp_path / "definition"
+    shutil.copytree(TMDL_DEFINITION, definition)
+    model = definition / "model.tmdl"
+    tables = tmdl_active_table_schemas(model)
+    table = definition / "tables" / f"{next(iter(tables))}.tmdl"
+    lines = table.read_text(encoding="utf-8").splitlines(keepends=True)
+    table.write_text("table renamed_table\n" + "".join(lines[1:]), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="ref/file table mismatch"):
+        tmdl_active_table_schemas(model)
+
+
+def test_failed_and_corrupt_entries_are_never_served(
+    tmp_path: Path, cache_dir: Path
+) -> None:
+    source = tmp_path / "tables.kql"
+    source.write_text("// no tables\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="no .create-merge"):
+        kql_table_schemas(source)
+    assert not list(cache_dir.glob("*.pickle"))
+
+    _write_kql(source, "order_id")
+    kql_table_schemas(source)
+    (entry,) = cache_dir.glob("*.pickle")
+    entry.write_bytes(b"not a pickle")
+    source_cache.clear_source_cache_memory()
+
+    assert kql_table_schemas(source) == {"orders": {"order_id": "string"}}
+    assert _cached_flags() == [False, False]
+
+
+def test_empty_cache_dir_setting_keeps_results_in_memory_only(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cache_dir: Path
+) -> None:
+    monkeypatch.setenv(source_cache.CACHE_DIR_ENV, "")
+    source = tmp_path / "tables.kql"
+    _write_kql(source, "order_id")
+
+    kql_table_schemas(source)
+    kql_table_schemas(source)
+
+    assert source_cache.source_cache_dir() is None
+    assert _cached_flags() == [False, True]
+    assert not cache_dir.exists()
+
+
+def test_hits_come_from_the_configured_directory_on_disk(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cache_dir: Path
+) -> None:
+    source = tmp_path / "tables.kql"
+    _write_kql(source, "order_id")
+    kql_table_schemas(source)
+
+    monkeypatch.setenv(source_cache.CACHE_DIR_ENV, str(tmp_path / "other"))
+    source_cache.clear_source_cache_memory()
+    kql_table_schemas(source)
+
+    monkeypatch.setenv(source_cache.CACHE_DIR_ENV, str(cache_dir))
+    source_cache.clear_source_cache_memory()
+    kql_table_schemas(source)
+
+    assert _cached_flags() == [False, False, True]
+    assert [path.name for path in (tmp_path / "other").glob("*.pickle")] == [
+        path.name for path in cache_dir.glob("*.pickle")
+    ]
+
+
+def test_memory_only_switch_restores_the_previous_setting(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv(source_cache.CACHE_DIR_ENV, str(tmp_path))
+    restore = source_cache.use_memory_only_source_cache()
+    assert source_cache.source_cache_dir() is None
+    restore()
+    assert source_cache.source_cache_dir() == tmp_path
+
+    monkeypatch.delenv(source_cache.CACHE_DIR_ENV)
+    restore = source_cache.use_memory_only_source_cache()
+    restore()
+    assert source_cache.CACHE_DIR_ENV not in os.environ
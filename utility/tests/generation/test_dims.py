@@ -4,7 +4,12 @@ import pytest
 
 from retail_setup.config.generation import GenerationConfig
 from retail_setup.dictionaries.loader import default_dictionary_root, load_dictionaries
-from retail_setup.generation.dims import generate_dim_date, generate_dimensions
+from retail_setup.generation.dims import (
+    DimensionContext,
+    build_dimensions,
+    generate_dim_date,
+    generate_dimensions,
+)
 from retail_setup.generation.schemas import column_names
 
 
@@ -72,6 +77,27 @@ def test_trucks_dc_assignment(dims):
     assert {r.DCID for r in assigned} <= dc_ids
 
 
+def test_dimension_context_routes_and_fleets():
+    ctx = DimensionContext.from_rows(
+        stores=[(2, "24h", "TX", "South"), (1, "7-22", "CA", "West"),
+                (3, "7-22", "NY", "Northeast")],
+        dcs=[(2, "TX", "South"), (1, "OK", "South"), (3, "CA", "West")],
+        trucks=[(5, 1), (4, None), (1, 1), (2, 3)],
+        n_products=10,
+    )
+    assert ctx.store_ids == (1, 2, 3) and ctx.dc_ids == (1, 2, 3)
+    assert ctx.store_hours == ("24h", "7-22")
+    # same state > same region > lowest dc_id
+    assert ctx.store_dc == {1: 3, 2: 2, 3: 1}
+    # a DC without assigned trucks falls back to the pool
+    assert ctx.dc_fleet == {1: (1, 5), 2: (4,), 3: (2,)}
+
+
+def test_dimension_context_matches_the_tables(spark, small_cfg, dicts):
+    dims, ctx = build_dimensions(spark, dicts, small_cfg)
+    assert ctx == DimensionContext.from_tables(dims)
+
+
 def test_determinism(spark, small_cfg, dicts):
     a = generate_dimensions(spark, dicts, small_cfg)
     b = generate_dimensions(spark, dicts, small_cfg)
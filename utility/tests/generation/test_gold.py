@@ -56,7 +56,8 @@ def test_inventory_position_is_latest(setup):
     tables, gold = setup
     txn = tables["fact_store_inventory_txn"]
     latest = (txn.withColumn("rn", F.row_number().over(
-        Window.partitionBy("store_id", "product_id").orderBy(F.desc("event_ts"))))
+        Window.partitionBy("store_id", "product_id")
+        .orderBy(F.desc("event_ts"), F.desc("trace_id"))))
         .filter("rn = 1"))
     pos = gold["inventory_position_current"]
     assert pos.count() == latest.count()
@@ -66,6 +67,16 @@ def test_inventory_position_is_latest(setup):
     assert j.filter(F.col("on_hand") != F.col("b")).count() == 0
 
 
+def test_inventory_position_snapshot_path_matches_full_scan(spark, setup):
+    tables, gold = setup
+    assert "inventory_state_snapshot" in tables
+    legacy = generate_gold(spark, {k: v for k, v in tables.items()
+                                   if k != "inventory_state_snapshot"})
+    for name in ("inventory_position_current", "dc_inventory_position_current"):
+        assert legacy[name].exceptAll(gold[name]).count() == 0, name
+        assert gold[name].exceptAll(legacy[name]).count() == 0, name
+
+
 def test_tender_mix_partitions_receipts(setup):
     tables, gold = setup
     assert gold["tender_mix_daily"].agg(F.sum("transactions")).first()[0] == \
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, timedelta
 
 import pytest
 from pyspark.sql import functions as F
@@ -92,3 +92,87 @@ def test_stockouts_mutually_exclusive(setup):
     both = so.filter(F.col("StoreID").isNotNull() & F.col("DCID").isNotNull())
     neither = so.filter(F.col("StoreID").isNull() & F.col("DCID").isNull())
     assert both.count() == 0 and neither.count() == 0
+
+
+def test_two_level_balances_match_the_full_history_sum(spark):
+    from retail_setup.generation.inventory_balances import TXN_COLS, stockouts, with_balances
+    from retail_setup.generation.runtime import seeded_draws
+
+    cfg = GenerationConfig(store_type="grocery", start_date=date(2025, 8, 4),
+                           end_date=date(2025, 8, 7), store_count=1, dc_count=1,
+                           customer_count=100, seed=5)
+    qty = [-30, -25, 10, -40, -5, 60, -90, -3, 20, -1]
+    rows = [
+        (1, 7, q, "SALE", "POS", f"2025-08-0{4 + i // 3} 1{i % 3}:00:00", f"T{i:02d}")
+        for i, q in enumerate(qty)
+    ] + [(1, 7, -2, "SALE", "POS", "2025-08-05 10:00:00", "T03a")]  # same-ts tie
+    txns = (spark.createDataFrame(
+        rows, "node_id long, product_id long, quantity long, txn_type string, "
+              "source string, ts string, trace_id string")
+            .withColumn("event_ts", F.to_timestamp("ts"))
+            .withColumn("event_date", F.to_date("event_ts"))
+            .select(*TXN_COLS))
+
+    bal = with_balances(txns, 50, 50, "ST", seeded_draws(cfg.seed), cfg)
+    seq = bal.orderBy("event_ts", "trace_id").collect()
+    assert seq[0].txn_type == "INITIAL" and seq[0].balance == 50
+    running = 0
+    for r in seq:
+        running += r.quantity
+        assert r.balance == running, (r.trace_id, r.balance, running)
+
+    prev, expected = 0, {}
+    for r in seq:
+        if r.balance <= 0 < prev:
+            expected.setdefault(r.event_date, r.trace_id)
+        prev = r.balance
+    got = stockouts(bal, "ST", "StoreID").collect()
+    assert sorted(r.event_date for r in got) == sorted(expected)
+    assert {r.event_date: r.LastKnownQuantity for r in got} == {
+        day: abs(next(r.quantity for r in seq if r.trace_id == tid))
+        for day, tid in expected.items()}
+
+
+def test_state_snapshots_resume_to_the_full_replay(spark):
+    from retail_setup.generation.inventory_balances import (
+        TXN_COLS,
+        opening_state,
+        state_snapshots,
+        with_balances,
+    )
+    from retail_setup.generation.runtime import seeded_draws
+
+    full = GenerationConfig(store_type="grocery", start_date=date(2025, 8, 25),
+                            end_date=date(2025, 9, 12), store_count=1, dc_count=1,
+                            customer_count=100, seed=5, inventory_snapshot_interval="week")
+    resumed = full.model_copy(update={"start_date": date(2025, 9, 1)})
+    rows = [
+        (node, 7, (-1) ** day * (day + node), "SALE", "POS",
+         f"{date(2025, 8, 24) + timedelta(days=day)} 10:00:00",
+         f"T{node}{day:02d}")
+        for node in (1, 2) for day in range(1, 20) if (day + node) % 4
+    ]
+    txns = (spark.createDataFrame(
+        rows, "node_id long, product_id long, quantity long, txn_type string, "
+              "source string, ts string, trace_id string")
+            .withColumn("event_ts", F.to_timestamp("ts"))
+            .withColumn("event_date", F.to_date("event_ts"))
+            .select(*TXN_COLS))
+    d = seeded_draws(full.seed)
+
+    bal = with_balances(txns, 50, 50, "ST", d, full)
+    snaps = state_snapshots(bal, "STORE", full)
+    # weekly snapshots land on Sundays, the last one is cut at end_date
+    assert {r.snapshot_date for r in snaps.collect()} <= {
+        date(2025, 8, 31), date(2025, 9, 7), date(2025, 9, 12)}
+    state = opening_state(snaps, "STORE", resumed.start_date)
+    tail = txns.filter(F.col("event_date") >= F.lit(resumed.start_date))
+    again = with_balances(tail, 50, 50, "ST", d, resumed, state)
+
+    expected = {r.trace_id: r.balance for r in bal.collect()}
+    got = again.collect()
+    assert got and all(r.balance == expected[r.trace_id] for r in got)
+
+    # 2025-09-03 follows no snapshot: resuming would skip Sep 1-2's txns.
+    with pytest.raises(ValueError, match="no STORE snapshot dated 2025-09-02"):
+        opening_state(snaps, "STORE", date(2025, 9, 3))
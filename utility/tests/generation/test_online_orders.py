@@ -34,6 +34,8 @@ def test_volume_and_ids(setup):
     assert 0.4 * 7 * cfg.online_orders_per_day < n < 2.0 * 7 * cfg.online_orders_per_day
     assert h.select("order_id_ext").distinct().count() == n
     assert h.filter(~F.col("order_id_ext").startswith("ONL")).count() == 0
+    # ONL + yyyyMMdd + 8-digit seq + 3-digit draw: room for 10M+ orders/day
+    assert h.filter(F.length("order_id_ext") != 22).count() == 0
 
 
 def test_lines_link_and_money(setup):
@@ -114,3 +116,16 @@ def test_cancellations_zeroed_no_payment(setup):
     # payments basics
     assert pay.filter(F.col("receipt_id_ext").isNotNull()).count() == 0
     assert pay.filter(F.col("store_id").isNotNull()).count() == 0
+
+
+def test_volume_beyond_the_order_id_width_is_rejected(spark):
+    from retail_setup.generation.online_orders import MAX_ORDERS_PER_DAY
+
+    cfg = GenerationConfig(store_type="grocery", start_date=date(2025, 4, 7),
+                           end_date=date(2025, 4, 13), store_count=3, dc_count=2,
+                           customer_count=300, seed=13,
+                           online_orders_per_day=MAX_ORDERS_PER_DAY)
+    profile = load_dictionaries(default_dictionary_root(), "grocery").profile
+    # Rejected before any dimension is read; the peak month exceeds the mean.
+    with pytest.raises(ValueError, match="order_id_ext holds at most 99,999,999"):
+        generate_online_orders(spark, {}, profile, cfg)
@@ -107,6 +107,152 @@ def test_determinism(spark, cfg, dicts):
            sorted(r.receipt_id_ext for r in b["fact_receipts"].collect())
 
 
+def test_packed_receipt_key_formats_the_original_receipt_id(spark):
+    from datetime import datetime
+
+    from pyspark.sql import functions as F
+
+    from retail_setup.generation.receipts import _pack_receipt_key, _receipt_id_ext
+
+    rows = [
+        (datetime(2025, 3, 3, 0, 0, 0), 1, 1),
+        (datetime(2024, 2, 29, 23, 59, 59), 2000, 999_999),
+        (datetime(1969, 12, 31, 12, 5, 0), 17, 4321),
+        (datetime(2099, 1, 1, 7, 30, 0), 1234, 65_536),
+    ]
+    df = spark.createDataFrame(rows, "event_ts timestamp, store_id long, seq int")
+    out = df.select(
+        F.concat(
+            F.lit("RCP"), F.date_format("event_ts", "yyyyMMddHHmm"),
+            F.lpad(F.col("store_id").cast("string"), 4, "0"),
+            F.lpad(F.col("seq").cast("string"), 6, "0")).alias("original"),
+        _receipt_id_ext(
+            _pack_receipt_key(F.to_date("event_ts"), F.col("store_id"), F.col("seq")),
+            F.col("event_ts")).alias("formatted"),
+        _pack_receipt_key(F.to_date("event_ts"), F.col("store_id"), F.col("seq")).alias("rk"),
+    ).collect()
+
+    assert [r.formatted for r in out] == [r.original for r in out]
+    assert len({r.rk for r in out}) == len(rows)
+
+
+def test_product_index_picks_the_launched_price_tier(spark):
+    from datetime import timedelta
+
+    from pyspark.sql import functions as F
+
+    from retail_setup.generation.receipts import _dept_rank, _pick_product, _product_index
+
+    start, end = date(2025, 3, 3), date(2025, 3, 9)
+    rows = [
+        (1, 5.0, "TAXABLE", "A", start - timedelta(days=40)),
+        (2, 3.0, "TAXABLE", "A", start + timedelta(days=2)),
+        (3, 5.0, "NON_TAXABLE", "A", start + timedelta(days=4)),
+        (4, 9.0, "TAXABLE", "A", end + timedelta(days=1)),
+        (5, 1.0, "TAXABLE", "B", start + timedelta(days=1)),
+    ]
+    products = spark.createDataFrame(
+        rows, "product_id long, SalePrice double, taxability string, "
+              "department string, launch_date date")
+    index = _product_index(spark, products, start, end)
+    skews = [0.0, 0.4, 0.7, 0.99]
+    probe = spark.createDataFrame(
+        [(t, k) for t in range((end - start).days + 1) for k in skews],
+        "day_off int, pskew double")
+    got = {
+        (r.department, r.day_off, r.pskew): r.product_id
+        for r in probe.crossJoin(index).select(
+            "department", "day_off", "pskew",
+            _pick_product(F.struct("items", "counts", "day_version", "bucket"),
+                          F.col("day_off"), F.col("pskew"))["product_id"].alias("product_id"),
+        ).collect()
+    }
+
+    ranks = spark.createDataFrame([(k, n) for k in skews for n in range(1, 4)],
+                                  "pskew double, n int")
+    rank = {(r.pskew, r.n): r.rank for r in ranks.select(
+        "pskew", "n", _dept_rank(F.col("pskew"), F.col("n")).alias("rank")).collect()}
+    for (dept, day_off, pskew), product_id in got.items():
+        day = start + timedelta(days=day_off)
+        launched = sorted((price, pid) for pid, price, _, d, launch in rows
+                          if d == dept and launch <= day)
+        expected = launched[rank[pskew, len(launched)] - 1][1] if launched else None
+        assert product_id == expected, (dept, day_off, pskew)
+
+
+def test_product_index_grows_with_sqrt_of_the_catalog_per_launch_day():
+    from datetime import timedelta
+    from types import SimpleNamespace
+
+    from retail_setup.generation.receipts import _index_rows
+
+    start, end = date(2025, 1, 1), date(2025, 12, 31)
+    n_products = 20_000
+    products = [
+        SimpleNamespace(product_id=i, SalePrice=float(i % 997), taxability="TAXABLE",
+                        department="A", launch_date=start + timedelta(days=i % 400 - 30))
+        for i in range(n_products)
+    ]
+
+    [(_, items, counts, day_version, bucket)] = _index_rows(products, start, end)
+
+    launch_days = len(counts) - 1
+    assert launch_days == 365
+    assert len(items) == n_products - sum(1 for p in products if p.launch_date > end)
+    assert (bucket - 1) ** 2 < len(items) <= bucket ** 2
+    # One count per bucket per version: ~52k integers where a launched-position
+    # list per version would hold ~3.6M.
+    assert sum(map(len, counts)) <= (launch_days + 1) * (len(items) // bucket + 1)
+    assert len(day_version) == 365
+
+
+def test_lines_and_payments_carry_the_header_receipt_ids(group):
+    receipts = {r.receipt_id_ext for r in group["fact_receipts"].collect()}
+    assert {r.receipt_id_ext for r in group["fact_receipt_lines"].collect()} == receipts
+    assert {r.receipt_id_ext for r in group["fact_payments"].collect()} == receipts
+    traces = group["fact_receipts"].select("receipt_id_ext", "trace_id").collect()
+    assert all(r.trace_id == "TRC" + r.receipt_id_ext for r in traces)
+
+
+def test_draw_streams_keep_receipt_invariants(spark, cfg, dicts, group):
+    from pyspark.sql import functions as F
+
+    streamed_cfg = cfg.model_copy(update={"draw_streams": True})
+    dims = generate_dimensions(spark, dicts, streamed_cfg)
+    a = generate_receipts_group(spark, dims, dicts.profile, streamed_cfg)
+    b = generate_receipts_group(spark, dims, dicts.profile, streamed_cfg)
+
+    for t in ["fact_receipts", "fact_receipt_lines", "fact_payments"]:
+        assert a[t].columns == column_names(t), t
+    lines, receipts = a["fact_receipt_lines"], a["fact_receipts"]
+    assert sorted(lines.collect()) == sorted(b["fact_receipt_lines"].collect())
+    sums = lines.groupBy("receipt_id_ext").agg(F.sum("ext_cents").alias("line_sum"))
+    assert receipts.join(sums, "receipt_id_ext").filter(
+        F.col("subtotal_cents") != F.col("line_sum")).count() == 0
+    # Same receipt grid; basket sizes and promo share match the per-call draws.
+    assert receipts.count() == group["fact_receipts"].count()
+    legacy_lines = group["fact_receipt_lines"]
+    ratio = lines.count() / legacy_lines.count()
+    assert 0.9 < ratio < 1.1
+    promo = lines.filter(F.col("promo_code").isNotNull()).count() / lines.count()
+    legacy_promo = (legacy_lines.filter(F.col("promo_code").isNotNull()).count()
+                    / legacy_lines.count())
+    assert abs(promo - legacy_promo) < 0.05
+
+
+@pytest.mark.parametrize("draw_streams", [False, True])
+def test_inline_lines_match_the_joined_path(spark, cfg, dicts, draw_streams):
+    base = cfg.model_copy(update={"draw_streams": draw_streams})
+    inline = base.model_copy(update={"inline_receipt_lines": True})
+    dims = generate_dimensions(spark, dicts, base)
+    joined = generate_receipts_group(spark, dims, dicts.profile, base)
+    built = generate_receipts_group(spark, dims, dicts.profile, inline)
+
+    for t in ["fact_receipts", "fact_receipt_lines", "fact_payments"]:
+        assert built[t].columns == column_names(t), t
+        assert sorted(built[t].collect()) == sorted(joined[t].collect()), t
+
+
 def test_different_seeds_differ(spark, dicts):
     def gen(seed):
         cfg = GenerationConfig(
@@ -1,6 +1,13 @@
 from datetime import date
 
-from retail_setup.generation.runtime import derive_seed, store_day_grid
+from retail_setup.generation.runtime import (
+    day_grid,
+    derive_seed,
+    explode_seq,
+    legacy_index,
+    seeded_draws,
+    store_day_grid,
+)
 
 
 def test_derive_seed_deterministic_and_distinct():
@@ -29,9 +36,25 @@ def test_store_day_grid(spark):
     assert "partition_seed" not in cols
 
 
+def test_day_grid(spark):
+    grid = day_grid(spark, date(2024, 12, 30), date(2025, 1, 2))
+    assert [(r.day_offset, r.day) for r in grid.orderBy("day").collect()] == [
+        (0, date(2024, 12, 30)), (1, date(2024, 12, 31)),
+        (2, date(2025, 1, 1)), (3, date(2025, 1, 2)),
+    ]
+
+
+def test_explode_seq_matches_a_plain_sequence(spark):
+    df = spark.createDataFrame([("a", 0), ("b", 1), ("c", 5), ("d", 12)], "k string, n int")
+    out = explode_seq(df, "n", ["k"], chunk=5)
+    assert out.columns == ["k", "n", "seq"]
+    got = sorted((r.k, r.seq) for r in out.collect())
+    assert got == sorted((k, s) for k, n in [("b", 1), ("c", 5), ("d", 12)]
+                         for s in range(1, n + 1))
+
+
 def test_seeded_draws_uniform_properties(spark):
     from pyspark.sql import functions as F
-    from retail_setup.generation.runtime import seeded_draws
 
     d = seeded_draws(seed=42)
     df = spark.range(2000).withColumn("u", d.u(["id"], "test"))
@@ -45,8 +68,6 @@ def test_seeded_draws_uniform_properties(spark):
 
 
 def test_seeded_draws_seed_sensitivity(spark):
-    from retail_setup.generation.runtime import seeded_draws
-
     a = seeded_draws(seed=1)
     b = seeded_draws(seed=2)
     df = spark.range(100)
@@ -56,8 +77,6 @@ def test_seeded_draws_seed_sensitivity(spark):
 
 
 def test_pick_by_weights(spark):
-    from retail_setup.generation.runtime import seeded_draws
-
     d = seeded_draws(seed=42)
     df = spark.range(5000).withColumn(
         "pick", d.pick_by_weights(["id"], "p", [("A", 0.7), ("B", 0.2), ("C", 0.1)])
@@ -68,8 +87,6 @@ def test_pick_by_weights(spark):
 
 
 def test_legacy_index_deterministic_and_distinct(spark):
-    from retail_setup.generation.runtime import legacy_index
-
     df = spark.createDataFrame([(f"K{i}",) for i in range(500)], "k string")
     out = df.withColumn("idx", legacy_index("k"))
     rows = out.collect()
@@ -77,3 +94,57 @@ def test_legacy_index_deterministic_and_distinct(spark):
     assert all(r.idx >= 0 for r in rows)
     again = {r.k: r.idx for r in df.withColumn("idx", legacy_index("k")).collect()}
     assert all(again[r.k] == r.idx for r in rows)  # stable
+
+
+def test_draw_stream_defaults_to_the_per_call_hashes(spark):
+    d = seeded_draws(seed=42)
+    line = d.stream(["k", "n"], "line", "_line_key")
+    df = spark.createDataFrame([(f"RCP{i:022d}", i % 7) for i in range(500)], "k string, n int")
+
+    out = line.attach(df)
+    assert out.columns == df.columns
+    same = out.filter(
+        (line.u("qty") == d.u(["k", "n"], "qty"))
+        & (line.h64("pcode") == d.h64(["k", "n"], "pcode"))
+        & (line.gauss("basket") == d.gauss(["k", "n"], "basket"))
+    )
+    assert same.count() == 500
+
+
+def test_draw_stream_is_statistically_equivalent(spark):
+    from pyspark.sql import functions as F
+
+    n = 20_000
+    df = spark.createDataFrame([(f"RCP{i:022d}", i % 9) for i in range(n)], "k string, n int")
+
+    def stats(streams: bool):
+        d = seeded_draws(seed=42, streams=streams)
+        line = d.stream(["k", "n"], "line", "_line_key")
+        drawn = line.attach(df).select(
+            "k", "n", line.u("a").alias("a"), line.u("b").alias("b"),
+            line.gauss("g").alias("g"))
+        row = drawn.agg(
+            F.avg("a"), F.variance("a"), F.corr("a", "b"), F.avg("g"), F.variance("g"),
+        ).first()
+        deciles = [r[1] for r in drawn.groupBy(F.floor(F.col("a") * 10)).count().collect()]
+        return drawn, row, deciles
+
+    legacy, legacy_row, _ = stats(False)
+    streamed, row, deciles = stats(True)
+
+    for moments in (legacy_row, row):
+        assert abs(moments[0] - 0.5) < 0.01
+        assert abs(moments[1] - 1 / 12) < 0.004
+        assert abs(moments[2]) < 0.03  # named draws are independent
+        assert abs(moments[3]) < 0.03
+        assert abs(moments[4] - 1.0) < 0.05
+    assert len(deciles) == 10 and all(abs(c - n / 10) < 0.1 * n / 10 for c in deciles)
+    # Not bit-identical to the per-call hashes, but keyed on row values only.
+    paired = streamed.select("k", "a").join(
+        legacy.select("k", F.col("a").alias("legacy_a")), "k")
+    assert paired.filter("a = legacy_a").count() < n // 100
+    again = {
+        r.k: r.a for r in stats(True)[0].repartition(7, "n").select("k", "a").collect()
+    }
+    assert all(again[r.k] == r.a for r in streamed.select("k", "a").collect())
+
@@ -5,17 +5,29 @@ exist in our schema with a compatible type. (Our schema MAY have extra columns
 the model doesn't bind — Direct Lake ignores them.)
 """
 
+import ast
+import json
 import re
 from pathlib import Path
 
 import pytest
 
-from retail_setup.generation.schemas import TABLES
+from retail_setup.generation.schemas import (
+    DERIVED_PARTITIONS,
+    LAYOUTS,
+    TABLES,
+    TableLayout,
+    column_names,
+)
 
 TMDL_DIR = (
     Path(__file__).resolve().parents[3]
     / "fabric" / "powerbi" / "retail_model.SemanticModel" / "definition" / "tables"
 )
+MAINTAIN_NOTEBOOK = (
+    Path(__file__).resolve().parents[3]
+    / "fabric" / "lakehouse" / "05-maintain-delta-tables.ipynb"
+)
 
 # TMDL dataType -> acceptable spark types in schemas.py
 TYPE_COMPAT = {
@@ -87,3 +99,36 @@ def test_no_case_insensitive_duplicate_columns():
             f"{table}: case-insensitive duplicate column names detected: "
             f"{[n for n in names if lower_names.count(n.lower()) > 1]}"
         )
+
+
+def test_layouts_reference_real_columns():
+    for table, layout in LAYOUTS.items():
+        columns = set(column_names(table))
+        assert set(layout.cluster_by) <= columns, table
+        for partition in layout.partition_by:
+            assert partition not in columns, f"{table}: {partition} must be derived"
+            assert DERIVED_PARTITIONS[partition][0] in columns, table
+
+
+def _maintain_source() -> str:
+    cells = json.loads(MAINTAIN_NOTEBOOK.read_text(encoding="utf-8"))["cells"]
+    return "\n".join(
+        "".join(cell["source"]) for cell in cells if cell["cell_type"] == "code"
+    )
+
+
+def test_maintenance_zorders_by_the_layout_cluster_keys():
+    """05-maintain-delta-tables cannot import schemas.py; keep its ZORDER
+    lists and target file size in step with LAYOUTS."""
+    tree = ast.parse(_maintain_source())
+    assigned = {
+        node.targets[0].id: node.value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Assign) and isinstance(node.targets[0], ast.Name)
+    }
+    zorder = dict(ast.literal_eval(assigned["silver_tables"]))
+    for table, layout in LAYOUTS.items():
+        assert zorder.get(table) == list(layout.cluster_by), table
+    default_mb = int(ast.literal_eval(assigned["TARGET_FILE_MB"].args[0].args[1]))
+    assert {layout.target_file_mb for layout in LAYOUTS.values()} == {default_mb}
+    assert TableLayout().target_file_mb == default_mb
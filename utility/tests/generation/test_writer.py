@@ -110,3 +110,68 @@ def test_write_all_lakehouse_mode_signature():
 
     params = inspect.signature(write_all).parameters
     assert "lakehouse" in params  # catalog mode for notebooks
+
+
+def test_compact_money_layout_is_smaller_and_restores_the_strings(spark, tmp_path):
+    from retail_setup.config.generation import GenerationConfig
+    from retail_setup.dictionaries.loader import default_dictionary_root, load_dictionaries
+    from retail_setup.generation.engine import generate_all
+    from retail_setup.generation.schemas import MONEY_STRINGS, legacy_money_view_sql
+    from retail_setup.generation.writer import write_all
+
+    cfg = GenerationConfig(
+        store_type="grocery",
+        start_date=date(2025, 11, 3),
+        end_date=date(2025, 11, 4),
+        store_count=2,
+        dc_count=1,
+        customer_count=100,
+        seed=3,
+        transactions_per_store_day=40,
+        online_orders_per_day=8,
+    )
+    dicts = load_dictionaries(default_dictionary_root(), "grocery")
+    tables = {
+        name: df
+        for name, df in generate_all(spark, dicts, cfg).tables.items()
+        if name in MONEY_STRINGS
+    }
+    compact = cfg.model_copy(update={"money_layout": "compact"})
+    write_all(tables, {}, cfg, run_id="legacy", base_path=str(tmp_path / "l"), fmt="parquet")
+    write_all(tables, {}, compact, run_id="compact", base_path=str(tmp_path / "c"),
+              fmt="parquet")
+
+    def size(root):
+        return sum(f.stat().st_size for f in root.rglob("*.parquet"))
+
+    for name, df in tables.items():
+        stored = spark.read.parquet(str(tmp_path / "c" / "ag" / name))
+        assert not set(MONEY_STRINGS[name]) & set(stored.columns), name
+        assert size(tmp_path / "c" / "ag" / name) < size(tmp_path / "l" / "ag" / name), name
+        stored.createOrReplaceTempView(f"compact_{name}")
+        restored = spark.sql(legacy_money_view_sql(name, f"compact_{name}"))
+        assert restored.columns == df.columns
+        assert restored.exceptAll(df).count() == 0, name
+
+
+def test_write_all_partitions_facts_by_month_and_clusters_by_store(spark, tmp_path):
+    from retail_setup.config.generation import GenerationConfig
+    from retail_setup.generation.writer import write_all
+
+    cfg = GenerationConfig(store_type="grocery", start_date=date(2025, 10, 30),
+                           end_date=date(2025, 11, 2))
+    rows = [(i, date(2025, 10, 30 + i) if i < 2 else date(2025, 11, i - 1), i % 3)
+            for i in range(4)]
+    df = spark.createDataFrame(rows, "receipt_id long, event_date date, store_id long")
+
+    write_all({"fact_receipts": df}, {}, cfg, run_id="layout",
+              base_path=str(tmp_path), fmt="parquet")
+
+    root = tmp_path / "ag" / "fact_receipts"
+    assert sorted(p.name for p in root.glob("event_month=*")) == [
+        "event_month=2025-10-01", "event_month=2025-11-01",
+    ]
+    back = spark.read.parquet(str(root))
+    assert back.columns == [*df.columns, "event_month"]
+    assert back.drop("event_month").exceptAll(df).count() == 0
+    assert back.filter("event_month = DATE'2025-11-01'").count() == 2
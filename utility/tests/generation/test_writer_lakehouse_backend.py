@@ -47,7 +47,9 @@ def test_lakehouse_backend_stage_creates_staging_db_once_and_writes_delta():
     spark.sql.assert_called_once_with("CREATE DATABASE IF NOT EXISTS lh.ag_stage")
     df.write.format.assert_called_once_with("delta")
     df.write.format.return_value.mode.assert_called_once_with("overwrite")
-    df.write.format.return_value.mode.return_value.saveAsTable.assert_called_once_with(
+    writer = df.write.format.return_value.mode.return_value
+    writer.partitionBy.assert_called_once_with("event_month")
+    writer.partitionBy.return_value.saveAsTable.assert_called_once_with(
         target.staging_name
     )
     spark.table.assert_called_once_with(target.staging_name)
@@ -129,8 +131,10 @@ def test_lakehouse_backend_promote_uses_create_or_replace_table():
     count = backend.promote(target)
 
     spark.sql.assert_called_once_with(
-        "CREATE OR REPLACE TABLE lh.ag.fact_receipts USING DELTA AS "
-        "SELECT * FROM lh.ag_stage.run1__fact_receipts"
+        "CREATE OR REPLACE TABLE lh.ag.fact_receipts USING DELTA "
+        "PARTITIONED BY (event_month) "
+        "TBLPROPERTIES ('delta.targetFileSize' = '128mb') "
+        "AS SELECT * FROM lh.ag_stage.run1__fact_receipts"
     )
     assert count == 7
 
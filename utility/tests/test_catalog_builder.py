@@ -1,3 +1,4 @@
+import pytest
 from catalog_builder import build_catalog
 from catalogs.grocery import GROCERY_TREE
 
@@ -31,3 +32,48 @@ def test_prices_fall_in_band():
     for p in cat["products"]:
         lo, hi = bands[(p["Category"], p["Subcategory"])]
         assert lo <= float(p["BasePrice"]) <= hi, p["ProductName"]
+
+
+def test_scaled_catalog_streams_unique_valid_products_in_band():
+    from catalog_builder import catalog_capacity, iter_scaled_products
+
+    target = 30_000
+    rows = list(iter_scaled_products(GROCERY_TREE, seed=7, target=target))
+    assert rows == list(iter_scaled_products(GROCERY_TREE, seed=7, target=target))
+    assert len(rows) == target > catalog_capacity(GROCERY_TREE) // 100
+    assert len({r["ProductName"] for r in rows}) == target
+    bands = {
+        s["name"]: (s["price_min"], s["price_max"])
+        for d in GROCERY_TREE["departments"]
+        for c in d["categories"]
+        for s in c["subcategories"]
+    }
+    for r in rows[::97]:
+        ProductEntry.model_validate(r)
+        lo, hi = bands[r["Subcategory"]]
+        assert lo <= float(r["BasePrice"]) <= hi
+
+
+def test_scaled_catalog_rejects_targets_beyond_the_grid():
+    from catalog_builder import catalog_capacity, iter_scaled_products
+
+    with pytest.raises(ValueError, match="target must be"):
+        next(iter_scaled_products(GROCERY_TREE, seed=7, target=catalog_capacity(GROCERY_TREE) + 1))
+
+
+def test_scaled_catalog_tops_up_collisions_to_the_exact_target():
+    from catalog_builder import iter_scaled_products
+
+    # At this size cross-subcategory name collisions drop ~80 rows from the
+    # proportional draw; the top-up pass must still land on the target.
+    target = 500_000
+    names = [r["ProductName"] for r in iter_scaled_products(GROCERY_TREE, seed=2026, target=target)]
+    assert len(names) == len(set(names)) == target
+
+
+def test_scaled_catalog_raises_when_distinct_names_run_out(tmp_path):
+    from catalog_builder import catalog_capacity, write_scaled_store_type
+
+    with pytest.raises(ValueError, match="distinct product names"):
+        write_scaled_store_type(GROCERY_TREE, 2026, catalog_capacity(GROCERY_TREE), tmp_path)
+    assert not (tmp_path / "grocery" / "products.jsonl").exists()
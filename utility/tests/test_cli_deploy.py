@@ -720,7 +720,7 @@ def test_run_setup_pipeline_warns_takes_a_while_and_retries(monkeypatch, capsys)
     attempts = {"n": 0}
     commands = []
 
-    def fake_run(cmd, cwd=None):
+    def fake_run(cmd, cwd=None, **_kwargs):
         commands.append(cmd)
         attempts["n"] += 1
         # Fail the first trigger, succeed on the retry.
@@ -922,7 +922,7 @@ def test_run_setup_pipeline_gives_up_after_max_attempts(monkeypatch, capsys):
     monkeypatch.setattr(cli.time, "sleep", lambda *_a: None)
     runs = {"n": 0}
 
-    def fake_run(_cmd, cwd=None):
+    def fake_run(_cmd, cwd=None, **_kwargs):
         runs["n"] += 1
         return SimpleNamespace(returncode=1)
 
@@ -1378,7 +1378,7 @@ def test_initial_full_deploy_defers_taskflow_until_post_ontology(
 
     commands = []
 
-    def fake_run(cmd, cwd=None):
+    def fake_run(cmd, cwd=None, **_kwargs):
         commands.append(cmd)
         if "deploy.scripts.taskflow" in cmd:
             return SimpleNamespace(returncode=3)
@@ -1412,7 +1412,7 @@ def test_setup_pipeline_failure_is_required_and_raises_nonzero(
     monkeypatch.setattr("retail_setup.cli.main._validate_azure_cli_tenant", lambda *_: None)
     monkeypatch.setattr(cli.time, "sleep", lambda *_a: None)
 
-    def fake_run(cmd, cwd=None):
+    def fake_run(cmd, cwd=None, **_kwargs):
         if "deploy.scripts.run_pipeline" in cmd:
             return SimpleNamespace(returncode=5)
         return SimpleNamespace(returncode=0)
@@ -1447,7 +1447,7 @@ def test_required_ml_failure_leaves_reporting_unpublished(monkeypatch, tmp_path)
     monkeypatch.setattr("retail_setup.cli.main._validate_azure_cli_tenant", lambda *_: None)
     commands = []
 
-    def fake_run(cmd, cwd=None):
+    def fake_run(cmd, cwd=None, **_kwargs):
         commands.append(cmd)
         if (
             "deploy.scripts.run_pipeline" in cmd
@@ -1560,7 +1560,7 @@ def test_optional_ml_failure_does_not_block_published_reporting(
         "retail_setup.cli.main._validate_azure_cli_tenant", lambda *_: None
     )
 
-    def fake_run(cmd, cwd=None):
+    def fake_run(cmd, cwd=None, **_kwargs):
         if (
             "deploy.scripts.run_pipeline" in cmd
             and "--pipeline" in cmd
@@ -1629,6 +1629,188 @@ def test_no_premature_complete_banner_on_required_step_failure(monkeypatch, tmp_
         s for s in journal["steps"] if s["step_id"] == "build-infrastructure"
     )
     assert build_step["status"] == "FAILED"
-    # Steps after the failed one were never reached (still PENDING).
+    # Steps that depend on the failed one were never reached (still PENDING).
+    for step_id in ("deploy-infrastructure", "validate-infrastructure"):
+        dependent = next(s for s in journal["steps"] if s["step_id"] == step_id)
+        assert dependent["status"] == "PENDING"
+
+
+def test_plan_declares_independent_kql_apply_and_post_reporting_fan_out():
+    plan = _deploy_plan(
+        "dev", skip_terraform=False, profile=_profile("full-demo"), repo_root=REPO_ROOT
+    )
+    dependencies = cli._plan_dependencies(plan)
+
+    assert dependencies["apply-kql"] == ("regenerate-configs",)
+    assert dependencies["validate-infrastructure"] == (
+        "deploy-infrastructure",
+        "apply-kql",
+    )
+    assert dependencies["build-infrastructure"] == ("render-notebooks",)
+    assert dependencies["validate-reporting"] == ("deploy-reporting",)
+    assert dependencies["post-reporting-ml-optional"] == ("deploy-reporting",)
+    assert dependencies["terraform-apply"] == ("terraform-init",)
+
+
+def test_plan_dependencies_reject_forward_references_and_racing_writers():
+    with pytest.raises(ValueError, match="unknown or later"):
+        cli._plan_dependencies(
+            [
+                cli.DeployStep(step_id="a", depends_on=("b",)),
+                cli.DeployStep(step_id="b"),
+            ]
+        )
+    with pytest.raises(ValueError, match="both write"):
+        cli._plan_dependencies(
+            [
+                cli.DeployStep(step_id="root"),
+                cli.DeployStep(step_id="a", depends_on=("root",), produces=("x",)),
+                cli.DeployStep(step_id="b", depends_on=("root",), produces=("x",)),
+            ]
+        )
+
+
+def test_deploy_overlaps_kql_apply_with_artifact_publication(monkeypatch, tmp_path):
+    import threading
+
+    _seed_deploy_config(tmp_path, profile="full-demo")
+    monkeypatch.setattr("retail_setup.cli.main._validate_azure_cli_tenant", lambda *_: None)
+    kql_started = threading.Event()
+
+    def fake_run(cmd, cwd=None, **kwargs):
+        if "deploy.scripts.apply_kql" in cmd:
+            kql_started.set()
+        if "deploy.scripts.build_artifacts" in cmd:
+            # In the old linear order the build ran before the KQL apply, so
+            # this only succeeds when the apply starts without waiting for it.
+            return SimpleNamespace(returncode=0 if kql_started.wait(5) else 9)
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    result = runner.invoke(
+        app,
+        ["deploy", "--repo-root", str(tmp_path), "--env", "dev", "--yes", "--skip-terraform"],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Progress:" in result.output
+    journal = json.loads(_deploy_journal.journal_path(tmp_path, "dev").read_text())
     kql_step = next(s for s in journal["steps"] if s["step_id"] == "apply-kql")
-    assert kql_step["status"] == "PENDING"
+    assert kql_step["status"] == "SUCCEEDED"
+    assert journal["status"] == "SUCCEEDED"
+
+
+def test_max_parallel_one_runs_the_plan_in_order(monkeypatch, tmp_path):
+    _seed_deploy_config(tmp_path)
+    monkeypatch.setattr("retail_setup.cli.main._validate_azure_cli_tenant", lambda *_: None)
+    modules: list[str] = []
+
+    def fake_run(cmd, cwd=None, **kwargs):
+        modules.append(cmd[2] if len(cmd) > 2 and cmd[1] == "-m" else cmd[0])
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    result = runner.invoke(
+        app,
+        [
+            "deploy",
+            "--repo-root",
+            str(tmp_path),
+            "--env",
+            "dev",
+            "--yes",
+            "--skip-terraform",
+            "--max-parallel",
+            "1",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Progress:" not in result.output
+    assert modules == [
+        "deploy.scripts.profile_preflight",
+        "deploy.scripts.generate_configs",
+        "retail_setup.cli.main",
+        "deploy.scripts.build_artifacts",
+        "deploy.scripts.deploy_items",
+        "deploy.scripts.validate_deployment",
+    ]
+
+
+def _graph_journal(plan):
+    journal = _deploy_journal.start_run("dev", targets={})
+    for step in plan:
+        _deploy_journal.add_step(journal, step.step_id, step.description, required=True)
+    return journal
+
+
+def test_parallel_steps_print_their_captured_output_as_whole_blocks(
+    monkeypatch, tmp_path, capsys
+):
+    import threading
+
+    both_started = threading.Barrier(2, timeout=5)
+    captured_kwargs = []
+
+    def fake_run(cmd, cwd=None, **kwargs):
+        captured_kwargs.append(kwargs)
+        both_started.wait()
+        return SimpleNamespace(returncode=0, stdout=f"{cmd[0]} line 1\n{cmd[0]} line 2\n")
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    plan = [
+        cli.DeployStep(cmd=["alpha"], description="Alpha", step_id="alpha", depends_on=()),
+        cli.DeployStep(cmd=["beta"], description="Beta", step_id="beta", depends_on=()),
+    ]
+
+    cli._run_plan(
+        tmp_path, "dev", plan, len(plan), yes=True, journal=_graph_journal(plan), max_parallel=2
+    )
+
+    output = capsys.readouterr().out
+    assert all(kwargs["stdout"] == subprocess.PIPE for kwargs in captured_kwargs)
+    for name, index in (("alpha", 1), ("beta", 2)):
+        block = (
+            f"Output of step {index}/2: {name.title()}\n"
+            + "=" * 60
+            + f"\n{name} line 1\n{name} line 2\n"
+        )
+        assert block in output
+
+
+def test_gated_step_does_not_hold_back_independent_steps(monkeypatch, tmp_path):
+    import threading
+
+    independent_started = threading.Event()
+    prompts = []
+
+    def fake_run(cmd, cwd=None, **kwargs):
+        if cmd == ["slow"]:
+            # Before, the gated step stopped scheduling until this finished, so
+            # the independent step could never start while it was running.
+            return SimpleNamespace(returncode=0 if independent_started.wait(5) else 9)
+        if cmd == ["independent"]:
+            independent_started.set()
+        return SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr(typer, "confirm", lambda message: prompts.append(message) or True)
+    plan = [
+        cli.DeployStep(cmd=["slow"], description="Slow", step_id="slow", depends_on=()),
+        cli.DeployStep(
+            cmd=["gated"],
+            description="Gated",
+            step_id="gated",
+            depends_on=(),
+            needs_confirmation=True,
+        ),
+        cli.DeployStep(
+            cmd=["independent"], description="Independent", step_id="independent", depends_on=()
+        ),
+    ]
+    journal = _graph_journal(plan)
+
+    cli._run_plan(tmp_path, "dev", plan, len(plan), yes=False, journal=journal, max_parallel=3)
+
+    assert prompts == ["Proceed with: Gated?"]
+    assert {step.status for step in journal.steps} == {"SUCCEEDED"}
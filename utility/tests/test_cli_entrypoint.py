@@ -1,14 +1,78 @@
 """Smoke test for the retail-setup CLI entry point."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 from typer.testing import CliRunner
 
 from retail_setup.cli.main import app
 
 runner = CliRunner()
 
+_SRC = Path(__file__).resolve().parents[1] / "src"
+# Cumulative `-X importtime` budget for `retail_setup.cli.main`, in microseconds.
+# A cold import is ~80 ms locally; eagerly importing the manifest contracts,
+# generation config, pydantic and yaml again pushes it past ~400 ms.
+_IMPORT_BUDGET_US = 250_000
+# Modules that only specific commands need; none may load for `--help`.
+_DEFERRED_MODULES = (
+    "azure",
+    "deploy",
+    "pydantic",
+    "retail_setup.config",
+    "retail_setup.contracts",
+    "retail_setup.dictionaries",
+    "yaml",
+)
+
 
 def test_help_lists_three_commands():
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     for cmd in ["configure", "render", "deploy"]:
         assert cmd in result.output
+
+
+def _importtime(code: str) -> dict[str, int]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(_SRC), os.environ.get("PYTHONPATH", "")]),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _self, total, name = line.removeprefix("import time:").split("|")
+        if total.strip().isdigit():
+            cumulative[name.strip()] = int(total)
+    return cumulative
+
+
+def test_cli_cold_start_stays_within_import_budget():
+    imported = _importtime(
+        "from retail_setup.cli.main import app\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+
+    loaded = sorted(
+        name
+        for name in imported
+        if any(
+            name == module or name.startswith(f"{module}.")
+            for module in _DEFERRED_MODULES
+        )
+    )
+    assert loaded == []
+    assert imported["retail_setup.cli.main"] < _IMPORT_BUDGET_US
@@ -1,6 +1,7 @@
 import json
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from retail_setup.dictionaries.loader import DictionarySet, available_store_types, load_dictionaries
@@ -94,3 +95,52 @@ def test_bad_row_error_includes_row_index(dict_root: Path):
                                 "Department": "D", "Category": "C", "Subcategory": "S"}]))
     with pytest.raises(ValueError, match=r"products\.json\[0\]"):
         load_dictionaries(dict_root, "toytown")
+
+
+def test_compiled_snapshot_matches_fresh_load(dict_root: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+    fresh = load_dictionaries(dict_root, "toytown")
+
+    first = load_dictionaries(dict_root, "toytown", cache_dir=cache)
+    (snapshot,) = cache.iterdir()
+    assert snapshot.name.startswith("toytown-")
+    again = load_dictionaries(dict_root, "toytown", cache_dir=cache)
+
+    for ds in (first, again):
+        assert ds.profile == fresh.profile
+        assert ds.products == fresh.products
+        assert ds.tax_rates[0].CombinedRate == fresh.tax_rates[0].CombinedRate
+        assert ds.products[0].Tags is None
+        assert ds.tags == []
+        assert ds.column("first_names", "Name").tolist() == ["Avery", "Blake"]
+    assert isinstance(again.column("geographies", "City"), np.memmap)
+    assert fresh.column("products", "BasePrice").tolist() == ["19.99"]
+
+
+def test_compiled_snapshot_is_rebuilt_when_a_source_changes(dict_root: Path, tmp_path: Path):
+    cache = tmp_path / "cache"
+    load_dictionaries(dict_root, "toytown", cache_dir=cache)
+    (dict_root / "_shared" / "first_names.json").write_text(json.dumps([{"Name": "Casey"}]))
+
+    ds = load_dictionaries(dict_root, "toytown", cache_dir=cache)
+
+    assert [n.Name for n in ds.first_names] == ["Casey"]
+    assert len(list(cache.iterdir())) == 2
+    # The snapshot is keyed on the sources, so invalid edits still fail loudly.
+    (dict_root / "toytown" / "brands.json").write_text(json.dumps([{"Brand": ""}]))
+    with pytest.raises(ValueError, match="brands.json"):
+        load_dictionaries(dict_root, "toytown", cache_dir=cache)
+
+
+def test_streamed_products_jsonl_takes_precedence(dict_root: Path, tmp_path: Path):
+    row = {"ProductName": "Kite", "BasePrice": "9.99", "Department": "Toys",
+           "Category": "Outdoor", "Subcategory": "Kites"}
+    (dict_root / "toytown" / "products.jsonl").write_text(
+        "\n".join(json.dumps(dict(row, ProductName=f"Kite {i}")) for i in range(3)) + "\n"
+    )
+
+    fresh = load_dictionaries(dict_root, "toytown")
+    cached = load_dictionaries(dict_root, "toytown", cache_dir=tmp_path / "cache")
+
+    assert [p.ProductName for p in fresh.products] == ["Kite 0", "Kite 1", "Kite 2"]
+    assert cached.column("products", "ProductName").tolist() == ["Kite 0", "Kite 1", "Kite 2"]
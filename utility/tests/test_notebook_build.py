@@ -1,6 +1,8 @@
 import ast
+import importlib.util
 import json
 import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
@@ -115,3 +117,62 @@ def test_setup03_is_the_single_silver_publication_boundary():
     assert "write_to_lakehouse(df" not in dimensions
     assert "Dimension validation complete" in dimensions
     assert "write_all(result.tables, {}, cfg, run_id" in facts
+
+
+def _build_module():
+    spec = importlib.util.spec_from_file_location(
+        "build_notebooks", UTILITY / "scripts" / "build_notebooks.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_incremental_build_rebuilds_only_notebooks_whose_inputs_changed(
+    tmp_path, monkeypatch
+):
+    build = _build_module()
+    templates = tmp_path / "templates"
+    shutil.copytree(UTILITY / "notebooks" / "templates", templates)
+    monkeypatch.setattr(build, "TEMPLATES", templates)
+    out = tmp_path / "out"
+    assert all(payload is not None for payload in build.build_all(out).values())
+    first = {name: (out / f"{name}.ipynb").stat().st_mtime_ns for name in NOTEBOOKS}
+
+    assert set(build.build_all(out).values()) == {None}
+
+    stream = templates / build.TEMPLATE_FOR["stream-events"]
+    stream.write_text(stream.read_text() + "\n# %%\nprint('changed')\n")
+    (out / "setup-01-seed-dictionaries.ipynb").write_text("{}", encoding="utf-8")
+    rebuilt = build.build_all(out)
+
+    assert sorted(name for name, payload in rebuilt.items() if payload) == [
+        "setup-01-seed-dictionaries",
+        "stream-events",
+    ]
+    for name in ("setup-02-generate-dimensions", "setup-03-generate-facts"):
+        assert (out / f"{name}.ipynb").stat().st_mtime_ns == first[name]
+    assert "print('changed')" in (out / "stream-events.ipynb").read_text()
+
+
+def test_check_compares_hashes_and_renders_only_suspect_notebooks(
+    tmp_path, monkeypatch, capsys
+):
+    build = _build_module()
+    notebooks = tmp_path / "notebooks"
+    build.build_all(notebooks)
+    rendered: list[list[str]] = []
+    render = build.render_payloads
+    monkeypatch.setattr(
+        build, "render_payloads", lambda names: rendered.append(names) or render(names)
+    )
+
+    assert build.check(notebooks) == 0
+    assert rendered == []
+
+    drifted = notebooks / "setup-04-build-gold.ipynb"
+    drifted.write_text(drifted.read_text().replace("cell-0", "cell-x"))
+
+    assert build.check(notebooks) == 1
+    assert rendered == [["setup-04-build-gold"]]
+    assert "setup-04-build-gold.ipynb" in capsys.readouterr().out